@@ -21,9 +21,18 @@ __version__ = "1.0.0"
 __all__ = [
     "AttachmentsApi",
     "ConversationsApi",
+    "AsyncAttachmentsApi",
+    "AsyncConversationsApi",
     "ApiResponse",
     "ApiClient",
+    "AsyncApiClient",
     "Configuration",
+    "JsonCodec",
+    "OrjsonCodec",
+    "MsgspecCodec",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "CircuitOpenError",
     "OpenApiException",
     "ApiTypeError",
     "ApiValueError",
@@ -106,93 +115,210 @@ __all__ = [
     "VideoCard",
 ]
 
-# import apis into sdk package
-from bot_connector.api.attachments_api import AttachmentsApi
-from bot_connector.api.conversations_api import ConversationsApi
-
-# import ApiClient
-from bot_connector.api_response import ApiResponse
-from bot_connector.api_client import ApiClient
-from bot_connector.configuration import Configuration
-from bot_connector.exceptions import OpenApiException
-from bot_connector.exceptions import ApiTypeError
-from bot_connector.exceptions import ApiValueError
-from bot_connector.exceptions import ApiKeyError
-from bot_connector.exceptions import ApiAttributeError
-from bot_connector.exceptions import ApiException
-
-# import models into sdk package
-from bot_connector.models.action_types import ActionTypes
-from bot_connector.models.activity import Activity
-from bot_connector.models.activity_importance import ActivityImportance
-from bot_connector.models.activity_types import ActivityTypes
-from bot_connector.models.animation_card import AnimationCard
-from bot_connector.models.attachment import Attachment
-from bot_connector.models.attachment_data import AttachmentData
-from bot_connector.models.attachment_info import AttachmentInfo
-from bot_connector.models.attachment_layout_types import AttachmentLayoutTypes
-from bot_connector.models.attachment_view import AttachmentView
-from bot_connector.models.audio_card import AudioCard
-from bot_connector.models.basic_card import BasicCard
-from bot_connector.models.card_action import CardAction
-from bot_connector.models.card_image import CardImage
-from bot_connector.models.channel_account import ChannelAccount
-from bot_connector.models.contact_relation_update_action_types import ContactRelationUpdateActionTypes
-from bot_connector.models.conversation_account import ConversationAccount
-from bot_connector.models.conversation_members import ConversationMembers
-from bot_connector.models.conversation_parameters import ConversationParameters
-from bot_connector.models.conversation_reference import ConversationReference
-from bot_connector.models.conversation_resource_response import ConversationResourceResponse
-from bot_connector.models.conversations_result import ConversationsResult
-from bot_connector.models.delivery_modes import DeliveryModes
-from bot_connector.models.end_of_conversation_codes import EndOfConversationCodes
-from bot_connector.models.entity import Entity
-from bot_connector.models.error import Error
-from bot_connector.models.error_response import ErrorResponse
-from bot_connector.models.fact import Fact
-from bot_connector.models.geo_coordinates import GeoCoordinates
-from bot_connector.models.hero_card import HeroCard
-from bot_connector.models.inner_http_error import InnerHttpError
-from bot_connector.models.input_hints import InputHints
-from bot_connector.models.installation_update_action_types import InstallationUpdateActionTypes
-from bot_connector.models.media_card import MediaCard
-from bot_connector.models.media_event_value import MediaEventValue
-from bot_connector.models.media_url import MediaUrl
-from bot_connector.models.mention import Mention
-from bot_connector.models.message_reaction import MessageReaction
-from bot_connector.models.message_reaction_types import MessageReactionTypes
-from bot_connector.models.microsoft_pay_method_data import MicrosoftPayMethodData
-from bot_connector.models.o_auth_card import OAuthCard
-from bot_connector.models.paged_members_result import PagedMembersResult
-from bot_connector.models.payment_address import PaymentAddress
-from bot_connector.models.payment_currency_amount import PaymentCurrencyAmount
-from bot_connector.models.payment_details import PaymentDetails
-from bot_connector.models.payment_details_modifier import PaymentDetailsModifier
-from bot_connector.models.payment_item import PaymentItem
-from bot_connector.models.payment_method_data import PaymentMethodData
-from bot_connector.models.payment_options import PaymentOptions
-from bot_connector.models.payment_request import PaymentRequest
-from bot_connector.models.payment_request_complete import PaymentRequestComplete
-from bot_connector.models.payment_request_complete_result import PaymentRequestCompleteResult
-from bot_connector.models.payment_request_update import PaymentRequestUpdate
-from bot_connector.models.payment_request_update_result import PaymentRequestUpdateResult
-from bot_connector.models.payment_response import PaymentResponse
-from bot_connector.models.payment_shipping_option import PaymentShippingOption
-from bot_connector.models.place import Place
-from bot_connector.models.receipt_card import ReceiptCard
-from bot_connector.models.receipt_item import ReceiptItem
-from bot_connector.models.resource_response import ResourceResponse
-from bot_connector.models.role_types import RoleTypes
-from bot_connector.models.semantic_action import SemanticAction
-from bot_connector.models.semantic_action_states import SemanticActionStates
-from bot_connector.models.signin_card import SigninCard
-from bot_connector.models.suggested_actions import SuggestedActions
-from bot_connector.models.text_format_types import TextFormatTypes
-from bot_connector.models.text_highlight import TextHighlight
-from bot_connector.models.thing import Thing
-from bot_connector.models.thumbnail_card import ThumbnailCard
-from bot_connector.models.thumbnail_url import ThumbnailUrl
-from bot_connector.models.token_request import TokenRequest
-from bot_connector.models.token_response import TokenResponse
-from bot_connector.models.transcript import Transcript
-from bot_connector.models.video_card import VideoCard
+from typing import TYPE_CHECKING
+
+from bot_connector.lazy_imports import lazy_exports
+
+# Exports are imported on first use rather than with the package
+__getattr__, __dir__ = lazy_exports(__name__, {
+    # import apis into sdk package
+    "AttachmentsApi": "bot_connector.api.attachments_api",
+    "ConversationsApi": "bot_connector.api.conversations_api",
+    "AsyncAttachmentsApi": "bot_connector.api.async_attachments_api",
+    "AsyncConversationsApi": "bot_connector.api.async_conversations_api",
+
+    # import ApiClient
+    "ApiResponse": "bot_connector.api_response",
+    "ApiClient": "bot_connector.api_client",
+    "AsyncApiClient": "bot_connector.async_api_client",
+    "Configuration": "bot_connector.configuration",
+    "JsonCodec": "bot_connector.json_codec",
+    "OrjsonCodec": "bot_connector.json_codec",
+    "MsgspecCodec": "bot_connector.json_codec",
+    "RetryPolicy": "bot_connector.resilience",
+    "CircuitBreaker": "bot_connector.resilience",
+    "CircuitOpenError": "bot_connector.resilience",
+    "OpenApiException": "bot_connector.exceptions",
+    "ApiTypeError": "bot_connector.exceptions",
+    "ApiValueError": "bot_connector.exceptions",
+    "ApiKeyError": "bot_connector.exceptions",
+    "ApiAttributeError": "bot_connector.exceptions",
+    "ApiException": "bot_connector.exceptions",
+
+    # import models into sdk package
+    "ActionTypes": "bot_connector.models.action_types",
+    "Activity": "bot_connector.models.activity",
+    "ActivityImportance": "bot_connector.models.activity_importance",
+    "ActivityTypes": "bot_connector.models.activity_types",
+    "AnimationCard": "bot_connector.models.animation_card",
+    "Attachment": "bot_connector.models.attachment",
+    "AttachmentData": "bot_connector.models.attachment_data",
+    "AttachmentInfo": "bot_connector.models.attachment_info",
+    "AttachmentLayoutTypes": "bot_connector.models.attachment_layout_types",
+    "AttachmentView": "bot_connector.models.attachment_view",
+    "AudioCard": "bot_connector.models.audio_card",
+    "BasicCard": "bot_connector.models.basic_card",
+    "CardAction": "bot_connector.models.card_action",
+    "CardImage": "bot_connector.models.card_image",
+    "ChannelAccount": "bot_connector.models.channel_account",
+    "ContactRelationUpdateActionTypes": "bot_connector.models.contact_relation_update_action_types",
+    "ConversationAccount": "bot_connector.models.conversation_account",
+    "ConversationMembers": "bot_connector.models.conversation_members",
+    "ConversationParameters": "bot_connector.models.conversation_parameters",
+    "ConversationReference": "bot_connector.models.conversation_reference",
+    "ConversationResourceResponse": "bot_connector.models.conversation_resource_response",
+    "ConversationsResult": "bot_connector.models.conversations_result",
+    "DeliveryModes": "bot_connector.models.delivery_modes",
+    "EndOfConversationCodes": "bot_connector.models.end_of_conversation_codes",
+    "Entity": "bot_connector.models.entity",
+    "Error": "bot_connector.models.error",
+    "ErrorResponse": "bot_connector.models.error_response",
+    "Fact": "bot_connector.models.fact",
+    "GeoCoordinates": "bot_connector.models.geo_coordinates",
+    "HeroCard": "bot_connector.models.hero_card",
+    "InnerHttpError": "bot_connector.models.inner_http_error",
+    "InputHints": "bot_connector.models.input_hints",
+    "InstallationUpdateActionTypes": "bot_connector.models.installation_update_action_types",
+    "MediaCard": "bot_connector.models.media_card",
+    "MediaEventValue": "bot_connector.models.media_event_value",
+    "MediaUrl": "bot_connector.models.media_url",
+    "Mention": "bot_connector.models.mention",
+    "MessageReaction": "bot_connector.models.message_reaction",
+    "MessageReactionTypes": "bot_connector.models.message_reaction_types",
+    "MicrosoftPayMethodData": "bot_connector.models.microsoft_pay_method_data",
+    "OAuthCard": "bot_connector.models.o_auth_card",
+    "PagedMembersResult": "bot_connector.models.paged_members_result",
+    "PaymentAddress": "bot_connector.models.payment_address",
+    "PaymentCurrencyAmount": "bot_connector.models.payment_currency_amount",
+    "PaymentDetails": "bot_connector.models.payment_details",
+    "PaymentDetailsModifier": "bot_connector.models.payment_details_modifier",
+    "PaymentItem": "bot_connector.models.payment_item",
+    "PaymentMethodData": "bot_connector.models.payment_method_data",
+    "PaymentOptions": "bot_connector.models.payment_options",
+    "PaymentRequest": "bot_connector.models.payment_request",
+    "PaymentRequestComplete": "bot_connector.models.payment_request_complete",
+    "PaymentRequestCompleteResult": "bot_connector.models.payment_request_complete_result",
+    "PaymentRequestUpdate": "bot_connector.models.payment_request_update",
+    "PaymentRequestUpdateResult": "bot_connector.models.payment_request_update_result",
+    "PaymentResponse": "bot_connector.models.payment_response",
+    "PaymentShippingOption": "bot_connector.models.payment_shipping_option",
+    "Place": "bot_connector.models.place",
+    "ReceiptCard": "bot_connector.models.receipt_card",
+    "ReceiptItem": "bot_connector.models.receipt_item",
+    "ResourceResponse": "bot_connector.models.resource_response",
+    "RoleTypes": "bot_connector.models.role_types",
+    "SemanticAction": "bot_connector.models.semantic_action",
+    "SemanticActionStates": "bot_connector.models.semantic_action_states",
+    "SigninCard": "bot_connector.models.signin_card",
+    "SuggestedActions": "bot_connector.models.suggested_actions",
+    "TextFormatTypes": "bot_connector.models.text_format_types",
+    "TextHighlight": "bot_connector.models.text_highlight",
+    "Thing": "bot_connector.models.thing",
+    "ThumbnailCard": "bot_connector.models.thumbnail_card",
+    "ThumbnailUrl": "bot_connector.models.thumbnail_url",
+    "TokenRequest": "bot_connector.models.token_request",
+    "TokenResponse": "bot_connector.models.token_response",
+    "Transcript": "bot_connector.models.transcript",
+    "VideoCard": "bot_connector.models.video_card",
+})
+
+if TYPE_CHECKING:
+    # import apis into sdk package
+    from bot_connector.api.attachments_api import AttachmentsApi
+    from bot_connector.api.conversations_api import ConversationsApi
+    from bot_connector.api.async_attachments_api import AsyncAttachmentsApi
+    from bot_connector.api.async_conversations_api import AsyncConversationsApi
+
+    # import ApiClient
+    from bot_connector.api_response import ApiResponse
+    from bot_connector.api_client import ApiClient
+    from bot_connector.async_api_client import AsyncApiClient
+    from bot_connector.configuration import Configuration
+    from bot_connector.json_codec import JsonCodec
+    from bot_connector.json_codec import OrjsonCodec
+    from bot_connector.json_codec import MsgspecCodec
+    from bot_connector.resilience import RetryPolicy
+    from bot_connector.resilience import CircuitBreaker
+    from bot_connector.resilience import CircuitOpenError
+    from bot_connector.exceptions import OpenApiException
+    from bot_connector.exceptions import ApiTypeError
+    from bot_connector.exceptions import ApiValueError
+    from bot_connector.exceptions import ApiKeyError
+    from bot_connector.exceptions import ApiAttributeError
+    from bot_connector.exceptions import ApiException
+
+    # import models into sdk package
+    from bot_connector.models.action_types import ActionTypes
+    from bot_connector.models.activity import Activity
+    from bot_connector.models.activity_importance import ActivityImportance
+    from bot_connector.models.activity_types import ActivityTypes
+    from bot_connector.models.animation_card import AnimationCard
+    from bot_connector.models.attachment import Attachment
+    from bot_connector.models.attachment_data import AttachmentData
+    from bot_connector.models.attachment_info import AttachmentInfo
+    from bot_connector.models.attachment_layout_types import AttachmentLayoutTypes
+    from bot_connector.models.attachment_view import AttachmentView
+    from bot_connector.models.audio_card import AudioCard
+    from bot_connector.models.basic_card import BasicCard
+    from bot_connector.models.card_action import CardAction
+    from bot_connector.models.card_image import CardImage
+    from bot_connector.models.channel_account import ChannelAccount
+    from bot_connector.models.contact_relation_update_action_types import ContactRelationUpdateActionTypes
+    from bot_connector.models.conversation_account import ConversationAccount
+    from bot_connector.models.conversation_members import ConversationMembers
+    from bot_connector.models.conversation_parameters import ConversationParameters
+    from bot_connector.models.conversation_reference import ConversationReference
+    from bot_connector.models.conversation_resource_response import ConversationResourceResponse
+    from bot_connector.models.conversations_result import ConversationsResult
+    from bot_connector.models.delivery_modes import DeliveryModes
+    from bot_connector.models.end_of_conversation_codes import EndOfConversationCodes
+    from bot_connector.models.entity import Entity
+    from bot_connector.models.error import Error
+    from bot_connector.models.error_response import ErrorResponse
+    from bot_connector.models.fact import Fact
+    from bot_connector.models.geo_coordinates import GeoCoordinates
+    from bot_connector.models.hero_card import HeroCard
+    from bot_connector.models.inner_http_error import InnerHttpError
+    from bot_connector.models.input_hints import InputHints
+    from bot_connector.models.installation_update_action_types import InstallationUpdateActionTypes
+    from bot_connector.models.media_card import MediaCard
+    from bot_connector.models.media_event_value import MediaEventValue
+    from bot_connector.models.media_url import MediaUrl
+    from bot_connector.models.mention import Mention
+    from bot_connector.models.message_reaction import MessageReaction
+    from bot_connector.models.message_reaction_types import MessageReactionTypes
+    from bot_connector.models.microsoft_pay_method_data import MicrosoftPayMethodData
+    from bot_connector.models.o_auth_card import OAuthCard
+    from bot_connector.models.paged_members_result import PagedMembersResult
+    from bot_connector.models.payment_address import PaymentAddress
+    from bot_connector.models.payment_currency_amount import PaymentCurrencyAmount
+    from bot_connector.models.payment_details import PaymentDetails
+    from bot_connector.models.payment_details_modifier import PaymentDetailsModifier
+    from bot_connector.models.payment_item import PaymentItem
+    from bot_connector.models.payment_method_data import PaymentMethodData
+    from bot_connector.models.payment_options import PaymentOptions
+    from bot_connector.models.payment_request import PaymentRequest
+    from bot_connector.models.payment_request_complete import PaymentRequestComplete
+    from bot_connector.models.payment_request_complete_result import PaymentRequestCompleteResult
+    from bot_connector.models.payment_request_update import PaymentRequestUpdate
+    from bot_connector.models.payment_request_update_result import PaymentRequestUpdateResult
+    from bot_connector.models.payment_response import PaymentResponse
+    from bot_connector.models.payment_shipping_option import PaymentShippingOption
+    from bot_connector.models.place import Place
+    from bot_connector.models.receipt_card import ReceiptCard
+    from bot_connector.models.receipt_item import ReceiptItem
+    from bot_connector.models.resource_response import ResourceResponse
+    from bot_connector.models.role_types import RoleTypes
+    from bot_connector.models.semantic_action import SemanticAction
+    from bot_connector.models.semantic_action_states import SemanticActionStates
+    from bot_connector.models.signin_card import SigninCard
+    from bot_connector.models.suggested_actions import SuggestedActions
+    from bot_connector.models.text_format_types import TextFormatTypes
+    from bot_connector.models.text_highlight import TextHighlight
+    from bot_connector.models.thing import Thing
+    from bot_connector.models.thumbnail_card import ThumbnailCard
+    from bot_connector.models.thumbnail_url import ThumbnailUrl
+    from bot_connector.models.token_request import TokenRequest
+    from bot_connector.models.token_response import TokenResponse
+    from bot_connector.models.transcript import Transcript
+    from bot_connector.models.video_card import VideoCard
@@ -1,6 +1,23 @@
 # flake8: noqa
 
-# import apis into api package
-from bot_connector.api.attachments_api import AttachmentsApi
-from bot_connector.api.conversations_api import ConversationsApi
+from typing import TYPE_CHECKING
 
+from bot_connector.lazy_imports import lazy_exports
+
+# Exports are imported on first use rather than with the package
+_exports = {
+    # import apis into api package
+    "AttachmentsApi": "bot_connector.api.attachments_api",
+    "ConversationsApi": "bot_connector.api.conversations_api",
+    "AsyncAttachmentsApi": "bot_connector.api.async_attachments_api",
+    "AsyncConversationsApi": "bot_connector.api.async_conversations_api",
+}
+__getattr__, __dir__ = lazy_exports(__name__, _exports)
+__all__ = list(_exports)
+
+if TYPE_CHECKING:
+    # import apis into api package
+    from bot_connector.api.attachments_api import AttachmentsApi
+    from bot_connector.api.conversations_api import ConversationsApi
+    from bot_connector.api.async_attachments_api import AsyncAttachmentsApi
+    from bot_connector.api.async_conversations_api import AsyncConversationsApi
@@ -17,6 +17,7 @@ import datetime
 from dateutil.parser import parse
 from enum import Enum
 import decimal
+import functools
 import json
 import mimetypes
 import os
@@ -24,8 +25,8 @@ import re
 import tempfile
 
 from urllib.parse import quote
-from typing import Tuple, Optional, List, Dict, Union
-from pydantic import SecretStr
+from typing import Any, Iterator, Tuple, Optional, List, Dict, Union
+from pydantic import BaseModel, SecretStr, TypeAdapter
 
 from bot_connector.configuration import Configuration
 from bot_connector.api_response import ApiResponse, T as ApiResponseT
@@ -43,6 +44,38 @@ from bot_connector.exceptions import (
 
 RequestSerialized = Tuple[str, str, Dict[str, str], Optional[str], List[str]]
 
+_JSON_CONTENT_TYPE = re.compile(r'^application/(json|[\w!#$&.+-^_]+\+json)\s*(;|$)', re.IGNORECASE)
+
+
+def _model_type(klass: str):
+    """Resolve a type name to a model, or a List/Dict of models; None otherwise."""
+    m = re.match(r'List\[(.*)]$', klass)
+    if m:
+        item = _model_type(m.group(1))
+        return List[item] if item else None  # type: ignore[valid-type]
+    m = re.match(r'Dict\[([^,]*), (.*)]$', klass)
+    if m:
+        item = _model_type(m.group(2))
+        return Dict[str, item] if item else None  # type: ignore[valid-type]
+    model = getattr(bot_connector.models, klass, None)
+    if isinstance(model, type) and issubclass(model, BaseModel):
+        return model
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _model_adapter(klass: str) -> Optional[TypeAdapter[Any]]:
+    """Build, once per type name, a validator for a model or a List/Dict of models.
+
+    The validator turns raw JSON (or already decoded data) into the model
+    and all its nested models in a single pass, instead of recursing
+    through every model's ``from_dict``. Returns None for other types,
+    which keep the generic deserialization.
+    """
+    model_type = _model_type(klass)
+    return TypeAdapter(Optional[model_type]) if model_type is not None else None
+
+
 class ApiClient:
     """Generic API client for OpenAPI client library builds.
 
@@ -316,8 +349,18 @@ class ApiClient:
                 if content_type is not None:
                     match = re.search(r"charset=([a-zA-Z\-\d]+)[\s;]?", content_type)
                 encoding = match.group(1) if match else "utf-8"
-                response_text = response_data.data.decode(encoding)
-                return_data = self.deserialize(response_text, response_type, content_type)
+                if (
+                    200 <= response_data.status <= 299
+                    and encoding.lower() in ("utf-8", "utf8")
+                    and content_type is not None
+                    and _JSON_CONTENT_TYPE.match(content_type)
+                ):
+                    # JSON parsers read UTF-8 bytes directly; skip the
+                    # decoded copy of the body
+                    return_data = self.deserialize(response_data.data, response_type, content_type)
+                else:
+                    response_text = response_data.data.decode(encoding)
+                    return_data = self.deserialize(response_text, response_type, content_type)
         finally:
             if not 200 <= response_data.status <= 299:
                 raise ApiException.from_response(
@@ -333,6 +376,34 @@ class ApiClient:
             raw_data = response_data.data
         )
 
+    def iter_content(self, response, chunk_size: int = 65536) -> Iterator[bytes]:
+        """Streams the body of a response without buffering it.
+
+        Use it with the ``*_without_preload_content`` methods, which return
+        the response before its body is read, to download large attachments
+        in constant memory. The connection is released once the body is
+        consumed.
+
+        :param response: response returned by a ``*_without_preload_content``
+            method.
+        :param chunk_size: maximum size of every chunk.
+        :raises ApiException: on the first iteration, if the status is not 2xx.
+        :return: iterator of body chunks.
+        """
+        if not isinstance(response, rest.RESTResponse):
+            response = rest.RESTResponse(response)
+        if not 200 <= response.status <= 299:
+            response.read()
+            raise ApiException.from_response(http_resp=response, body=None, data=None)
+        try:
+            yield from response.response.stream(chunk_size)
+        except BaseException:
+            # Stopped early; the rest of the body makes the connection unusable
+            response.response.close()
+            raise
+        finally:
+            response.response.release_conn()
+
     def sanitize_for_serialization(self, obj):
         """Builds a JSON POST object.
 
@@ -388,10 +459,11 @@ class ApiClient:
             for key, val in obj_dict.items()
         }
 
-    def deserialize(self, response_text: str, response_type: str, content_type: Optional[str]):
+    def deserialize(self, response_text: Union[str, bytes], response_type: str, content_type: Optional[str]):
         """Deserializes response into an object.
 
-        :param response: RESTResponse object to be deserialized.
+        :param response_text: response body; JSON may also be passed as
+            UTF-8 bytes.
         :param response_type: class literal for
             deserialized object, or string of class name.
         :param content_type: content type of response.
@@ -402,14 +474,18 @@ class ApiClient:
         # fetch data from response object
         if content_type is None:
             try:
-                data = json.loads(response_text)
+                data = self.configuration.json_codec.loads(response_text)
             except ValueError:
                 data = response_text
-        elif re.match(r'^application/(json|[\w!#$&.+-^_]+\+json)\s*(;|$)', content_type, re.IGNORECASE):
-            if response_text == "":
+        elif _JSON_CONTENT_TYPE.match(content_type):
+            if not response_text:
                 data = ""
             else:
-                data = json.loads(response_text)
+                adapter = _model_adapter(response_type) if isinstance(response_type, str) else None
+                if adapter is not None:
+                    # Parse and validate in one pass
+                    return adapter.validate_json(response_text)
+                data = self.configuration.json_codec.loads(response_text)
         elif re.match(r'^text\/[a-z.+-]+\s*(;|$)', content_type, re.IGNORECASE):
             data = response_text
         else:
@@ -432,6 +508,10 @@ class ApiClient:
             return None
 
         if isinstance(klass, str):
+            adapter = _model_adapter(klass)
+            if adapter is not None:
+                return adapter.validate_python(data)
+
             if klass.startswith('List['):
                 m = re.match(r'List\[(.*)]', klass)
                 assert m is not None, "Malformed List type definition"
@@ -0,0 +1,162 @@
+# coding: utf-8
+
+"""
+    Microsoft Bot Connector API - v3.0
+
+    The Bot Connector REST API allows your bot to send and receive messages to channels configured in the  [Bot Framework Developer Portal](https://dev.botframework.com). The Connector service uses industry-standard REST  and JSON over HTTPS.    Client libraries for this REST API are available. See below for a list.    Many bots will use both the Bot Connector REST API and the associated [Bot State REST API](/en-us/restapi/state). The  Bot State REST API allows a bot to store and retrieve state associated with users and conversations.    Authentication for both the Bot Connector and Bot State REST APIs is accomplished with JWT Bearer tokens, and is  described in detail in the [Connector Authentication](/en-us/restapi/authentication) document.    # Client Libraries for the Bot Connector REST API    * [Bot Builder for C#](/en-us/csharp/builder/sdkreference/)  * [Bot Builder for Node.js](/en-us/node/builder/overview/)  * Generate your own from the [Connector API Swagger file](https://raw.githubusercontent.com/Microsoft/BotBuilder/master/CSharp/Library/Microsoft.Bot.Connector.Shared/Swagger/ConnectorAPI.json)    © 2016 Microsoft
+
+    The version of the OpenAPI document: v3
+    Contact: botframework@microsoft.com
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+from typing import AsyncIterator
+
+from bot_connector.configuration import Configuration
+from bot_connector.api_client import ApiClient
+from bot_connector import async_rest
+from bot_connector.exceptions import ApiException
+
+
+class AsyncApiClient(ApiClient):
+    """Asynchronous API client for OpenAPI client library builds.
+
+    Awaitable counterpart of :class:`ApiClient`. Request serialization and
+    response deserialization are shared with the synchronous client; only
+    the transport differs. Every coroutine using an instance shares the
+    connection pool of a single `httpx.AsyncClient`, so the client should
+    be created once and closed with `await client.close()` (or used as an
+    async context manager) when no longer needed.
+
+    :param configuration: .Configuration object for this client
+    :param header_name: a header to pass when making calls to the API.
+    :param header_value: a header value to pass when making calls to
+        the API.
+    :param cookie: a cookie to include in the header when making calls
+        to the API
+    """
+
+    _default = None
+    # The async transport is not a drop-in for the sync one; the methods
+    # that use it are coroutines here.
+    rest_client: async_rest.AsyncRESTClientObject  # type: ignore[assignment]
+
+    def __init__(
+        self,
+        configuration=None,
+        header_name=None,
+        header_value=None,
+        cookie=None
+    ) -> None:
+        # use default configuration if none is provided
+        if configuration is None:
+            configuration = Configuration.get_default()
+        self.configuration = configuration
+
+        self.rest_client = async_rest.AsyncRESTClientObject(configuration)
+        self.default_headers = {}
+        if header_name is not None:
+            self.default_headers[header_name] = header_value
+        self.cookie = cookie
+        # Set default User-Agent.
+        self.user_agent = 'OpenAPI-Generator/1.0.0/python'
+        self.client_side_validation = configuration.client_side_validation
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        await self.rest_client.close()
+
+    @classmethod
+    def get_default(cls):
+        """Return new instance of AsyncApiClient.
+
+        This method returns newly created, based on default constructor,
+        object of AsyncApiClient class or returns a copy of default
+        AsyncApiClient.
+
+        :return: The AsyncApiClient object.
+        """
+        if cls._default is None:
+            cls._default = AsyncApiClient()
+        return cls._default
+
+    @classmethod
+    def set_default(cls, default):
+        """Set default instance of AsyncApiClient.
+
+        It stores default AsyncApiClient.
+
+        :param default: object of AsyncApiClient.
+        """
+        cls._default = default
+
+    async def aiter_content(self, response, chunk_size: int = 65536) -> AsyncIterator[bytes]:
+        """Streams the body of a response without buffering it.
+
+        Async counterpart of :meth:`ApiClient.iter_content`.
+
+        Use it with the ``*_without_preload_content`` methods, which return
+        the response before its body is read, to download large attachments
+        in constant memory. The response is closed once the body is
+        consumed.
+
+        :param response: response returned by a ``*_without_preload_content``
+            method.
+        :param chunk_size: maximum size of every chunk.
+        :raises ApiException: on the first iteration, if the status is not 2xx.
+        :return: async iterator of body chunks.
+        """
+        if not isinstance(response, async_rest.AsyncRESTResponse):
+            response = async_rest.AsyncRESTResponse(response)
+        try:
+            if not 200 <= response.status <= 299:
+                await response.read()
+                raise ApiException.from_response(http_resp=response, body=None, data=None)
+            async for chunk in response.response.aiter_bytes(chunk_size):
+                yield chunk
+        finally:
+            await response.response.aclose()
+
+    # Awaitable counterpart of the synchronous call_api
+    async def call_api(  # type: ignore[override]
+        self,
+        method,
+        url,
+        header_params=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ) -> async_rest.AsyncRESTResponse:
+        """Makes the HTTP request (asynchronous)
+        :param method: Method to call.
+        :param url: Path to method endpoint.
+        :param header_params: Header parameters to be
+            placed in the request header.
+        :param body: Request body.
+        :param post_params dict: Request post form parameters,
+            for `application/x-www-form-urlencoded`, `multipart/form-data`.
+        :param _request_timeout: timeout setting for this request.
+        :return: AsyncRESTResponse
+        """
+
+        try:
+            # perform request and return response
+            response_data = await self.rest_client.request(
+                method, url,
+                headers=header_params,
+                body=body, post_params=post_params,
+                _request_timeout=_request_timeout
+            )
+
+        except ApiException as e:
+            raise e
+
+        return response_data
@@ -0,0 +1,269 @@
+# coding: utf-8
+
+"""
+    Microsoft Bot Connector API - v3.0
+
+    The Bot Connector REST API allows your bot to send and receive messages to channels configured in the  [Bot Framework Developer Portal](https://dev.botframework.com). The Connector service uses industry-standard REST  and JSON over HTTPS.    Client libraries for this REST API are available. See below for a list.    Many bots will use both the Bot Connector REST API and the associated [Bot State REST API](/en-us/restapi/state). The  Bot State REST API allows a bot to store and retrieve state associated with users and conversations.    Authentication for both the Bot Connector and Bot State REST APIs is accomplished with JWT Bearer tokens, and is  described in detail in the [Connector Authentication](/en-us/restapi/authentication) document.    # Client Libraries for the Bot Connector REST API    * [Bot Builder for C#](/en-us/csharp/builder/sdkreference/)  * [Bot Builder for Node.js](/en-us/node/builder/overview/)  * Generate your own from the [Connector API Swagger file](https://raw.githubusercontent.com/Microsoft/BotBuilder/master/CSharp/Library/Microsoft.Bot.Connector.Shared/Swagger/ConnectorAPI.json)    © 2016 Microsoft
+
+    The version of the OpenAPI document: v3
+    Contact: botframework@microsoft.com
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import io
+import json
+import re
+import ssl
+from typing import TYPE_CHECKING, Any, Dict, List, Union
+from urllib.parse import urlencode
+
+import httpx
+
+from bot_connector.exceptions import ApiException, ApiValueError
+from bot_connector.resilience import is_replayable
+
+if TYPE_CHECKING:
+    from httpx._client import UseClientDefault
+
+RESTResponseType = httpx.Response
+
+
+def _is_ssl_error(exc):
+    """Walks the exception chain looking for the underlying ssl.SSLError."""
+    while exc is not None:
+        if isinstance(exc, ssl.SSLError):
+            return True
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+
+class AsyncRESTResponse(io.IOBase):
+
+    def __init__(self, resp) -> None:
+        self.response = resp
+        self.status = resp.status_code
+        self.reason = resp.reason_phrase
+        self.data = None
+
+    async def read(self):
+        if self.data is None:
+            self.data = await self.response.aread()
+        return self.data
+
+    def getheaders(self):
+        """Returns a dictionary of the response headers."""
+        return self.response.headers
+
+    def getheader(self, name, default=None):
+        """Returns a given response header."""
+        return self.response.headers.get(name, default)
+
+    async def aclose(self):
+        """Discards an unread body and returns the connection to the pool."""
+        await self.response.aclose()
+
+
+class AsyncRESTClientObject:
+
+    def __init__(self, configuration) -> None:
+        # A single httpx.AsyncClient (and therefore a single connection pool)
+        # is shared by every coroutine issuing requests through this object.
+
+        self.json_codec = configuration.json_codec
+        self.retry_policy = configuration.retry_policy
+
+        ssl_context = ssl.create_default_context(
+            cafile=configuration.ssl_ca_cert,
+            cadata=configuration.ca_cert_data,
+        )
+        if configuration.cert_file:
+            ssl_context.load_cert_chain(
+                configuration.cert_file, keyfile=configuration.key_file
+            )
+        if not configuration.verify_ssl:
+            ssl_context.check_hostname = False
+            ssl_context.verify_mode = ssl.CERT_NONE
+        elif configuration.assert_hostname is False:
+            ssl_context.check_hostname = False
+
+        maxsize = configuration.connection_pool_maxsize
+        transport_args: Dict[str, Any] = {
+            "verify": ssl_context,
+            "limits": httpx.Limits(
+                max_connections=maxsize,
+                max_keepalive_connections=maxsize,
+            ),
+        }
+
+        # httpx takes a count of connection retries, where urllib3 also takes
+        # a Retry object
+        retries = configuration.retries
+        if retries is not None and not isinstance(retries, int):
+            retries = getattr(retries, "total", None)
+        if isinstance(retries, int) and not isinstance(retries, bool):
+            transport_args["retries"] = retries
+
+        if configuration.socket_options is not None:
+            transport_args["socket_options"] = configuration.socket_options
+
+        if configuration.proxy:
+            transport_args["proxy"] = httpx.Proxy(
+                configuration.proxy,
+                headers=configuration.proxy_headers,
+            )
+
+        self.tls_server_name = configuration.tls_server_name
+
+        # urllib3 applies no timeout unless one is requested, mirror that
+        # instead of inheriting the httpx default of five seconds.
+        self.client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(**transport_args),
+            timeout=None,
+        )
+
+    async def close(self):
+        await self.client.aclose()
+
+    async def request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ):
+        """Perform requests, applying the configured retry policy.
+
+        Takes the same parameters as :meth:`_request`.
+        """
+        if self.retry_policy is None:
+            return await self._request(method, url, headers, body, post_params, _request_timeout)
+        # Each attempt gets its own headers, which _request may modify
+        return await self.retry_policy.send_async(
+            method,
+            url,
+            lambda: self._request(method, url, dict(headers or {}), body, post_params, _request_timeout),
+            replayable=is_replayable(body),
+        )
+
+    async def _request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ):
+        """Perform a request once.
+
+        :param method: http request method
+        :param url: http request url
+        :param headers: http request headers
+        :param body: request json body, for `application/json`
+        :param post_params: request post parameters,
+                            `application/x-www-form-urlencoded`
+                            and `multipart/form-data`
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        """
+        method = method.upper()
+        assert method in [
+            'GET',
+            'HEAD',
+            'DELETE',
+            'POST',
+            'PUT',
+            'PATCH',
+            'OPTIONS'
+        ]
+
+        if post_params and body:
+            raise ApiValueError(
+                "body parameter cannot be used with post_params parameter."
+            )
+
+        post_params = post_params or {}
+        headers = headers or {}
+
+        timeout: Union[httpx.Timeout, "UseClientDefault"] = httpx.USE_CLIENT_DEFAULT
+        if _request_timeout:
+            if isinstance(_request_timeout, (int, float)):
+                timeout = httpx.Timeout(_request_timeout)
+            elif (
+                    isinstance(_request_timeout, tuple)
+                    and len(_request_timeout) == 2
+                ):
+                timeout = httpx.Timeout(
+                    None,
+                    connect=_request_timeout[0],
+                    read=_request_timeout[1]
+                )
+
+        args: Dict[str, Any] = {
+            "headers": headers,
+            "timeout": timeout,
+        }
+        if self.tls_server_name:
+            args["extensions"] = {"sni_hostname": self.tls_server_name}
+
+        # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
+        if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
+
+            # no content type provided or payload is json
+            content_type = headers.get('Content-Type')
+            if (
+                not content_type
+                or re.search('json', content_type, re.IGNORECASE)
+            ):
+                if body is not None:
+                    args["content"] = self.json_codec.dumps(body)
+            elif content_type == 'application/x-www-form-urlencoded':
+                args["content"] = urlencode(post_params)
+            elif content_type == 'multipart/form-data':
+                # must del headers['Content-Type'], or the correct
+                # Content-Type which generated by httpx will be
+                # overwritten.
+                del headers['Content-Type']
+                data: Dict[str, List[Any]] = {}
+                files = []
+                for k, v in post_params:
+                    if isinstance(v, tuple):
+                        files.append((k, v))
+                    else:
+                        # Ensures that dict objects are serialized
+                        if isinstance(v, dict):
+                            v = json.dumps(v)
+                        data.setdefault(k, []).append(v)
+                args["data"] = data
+                args["files"] = files
+            # Pass a `string` parameter directly in the body to support
+            # other content types than JSON when `body` argument is
+            # provided in serialized form.
+            elif isinstance(body, str) or isinstance(body, bytes):
+                args["content"] = body
+            elif headers['Content-Type'].startswith('text/') and isinstance(body, bool):
+                args["content"] = "true" if body else "false"
+            else:
+                # Cannot generate the request from given parameters
+                msg = """Cannot prepare a request message for provided
+                         arguments. Please check that your arguments match
+                         declared content type."""
+                raise ApiException(status=0, reason=msg)
+
+        request = self.client.build_request(method, url, **args)
+        try:
+            r = await self.client.send(request, stream=True)
+        except httpx.ConnectError as e:
+            if not _is_ssl_error(e):
+                raise
+            msg = "\n".join([type(e).__name__, str(e)])
+            raise ApiException(status=0, reason=msg)
+
+        return AsyncRESTResponse(r)
@@ -19,11 +19,16 @@ import logging
 from logging import FileHandler
 import multiprocessing
 import sys
-from typing import Any, ClassVar, Dict, List, Literal, Optional, TypedDict, Union
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Literal, Optional, TypedDict, Union
 from typing_extensions import NotRequired, Self
 
 import urllib3
 
+from bot_connector.json_codec import JsonCodec, default_json_codec
+
+if TYPE_CHECKING:
+    from bot_connector.resilience import RetryPolicy
+
 
 JSON_SCHEMA_VALIDATION_KEYWORDS = {
     'multipleOf', 'maximum', 'exclusiveMaximum',
@@ -164,6 +169,11 @@ class Configuration:
     :param retries: Number of retries for API requests.
     :param ca_cert_data: verify the peer using concatenated CA certificate data
       in PEM (str) or DER (bytes) format.
+    :param json_codec: codec encoding request bodies and decoding responses.
+      Defaults to the fastest JSON library installed (orjson, msgspec, then
+      the standard library).
+    :param retry_policy: retries, circuit breaking and hedging of requests.
+      None (the default) sends each request once.
 
     :Example:
 
@@ -207,6 +217,8 @@ conf = bot_connector.Configuration(
         ca_cert_data: Optional[Union[str, bytes]] = None,
         *,
         debug: Optional[bool] = None,
+        json_codec: Optional[JsonCodec] = None,
+        retry_policy: Optional["RetryPolicy"] = None,
     ) -> None:
         """Constructor
         """
@@ -335,6 +347,14 @@ conf = bot_connector.Configuration(
         """date format
         """
 
+        self.json_codec = json_codec or default_json_codec()
+        """JSON codec for request and response bodies
+        """
+
+        self.retry_policy = retry_policy
+        """Retry, circuit breaker and hedging policy, or None
+        """
+
     def __deepcopy__(self, memo:  Dict[int, Any]) -> Self:
         cls = self.__class__
         result = cls.__new__(cls)
@@ -0,0 +1,46 @@
+# coding: utf-8
+
+"""Lazy package exports, imported on first attribute access."""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build the module ``__getattr__`` and ``__dir__`` of a package.
+
+    Importing the package then costs nothing beyond the package itself; an
+    export's module is imported when the name is first used, and the value is
+    stored on the package so later lookups are plain attribute reads.
+    Submodules resolve too, as they did when the package imported them all.
+
+    :param package: ``__name__`` of the package.
+    :param exports: export name -> module defining it.
+    """
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is not None:
+            value = getattr(importlib.import_module(module), name)
+        elif name.isidentifier() and not name.startswith("__"):
+            submodule = f"{package}.{name}"
+            try:
+                value = importlib.import_module(submodule)
+            except ModuleNotFoundError as e:
+                if e.name != submodule:
+                    raise
+                raise AttributeError(
+                    f"module {package!r} has no attribute {name!r}"
+                ) from None
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
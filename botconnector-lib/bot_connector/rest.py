@@ -21,6 +21,7 @@ import ssl
 import urllib3
 
 from bot_connector.exceptions import ApiException, ApiValueError
+from bot_connector.resilience import is_replayable
 
 SUPPORTED_SOCKS_PROXIES = {"socks5", "socks5h", "socks4", "socks4a"}
 RESTResponseType = urllib3.HTTPResponse
@@ -57,6 +58,11 @@ class RESTResponse(io.IOBase):
         """Returns a given response header."""
         return self.response.headers.get(name, default)
 
+    def release_conn(self):
+        """Discards an unread body and returns the connection to the pool."""
+        self.response.drain_conn()
+        self.response.release_conn()
+
 
 class RESTClientObject:
 
@@ -66,6 +72,9 @@ class RESTClientObject:
         # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/connectionpool.py#L680  # noqa: E501
         # Custom SSL certificates and client certificates: http://urllib3.readthedocs.io/en/latest/advanced-usage.html  # noqa: E501
 
+        self.json_codec = configuration.json_codec
+        self.retry_policy = configuration.retry_policy
+
         # cert_reqs
         if configuration.verify_ssl:
             cert_reqs = ssl.CERT_REQUIRED
@@ -86,6 +95,10 @@ class RESTClientObject:
 
         if configuration.retries is not None:
             pool_args['retries'] = configuration.retries
+        elif configuration.retry_policy is not None:
+            # urllib3 would otherwise sleep out any Retry-After itself;
+            # leave statuses to the retry policy
+            pool_args['retries'] = urllib3.Retry(3, respect_retry_after_header=False)
 
         if configuration.tls_server_name:
             pool_args['server_hostname'] = configuration.tls_server_name
@@ -122,7 +135,30 @@ class RESTClientObject:
         post_params=None,
         _request_timeout=None
     ):
-        """Perform requests.
+        """Perform requests, applying the configured retry policy.
+
+        Takes the same parameters as :meth:`_request`.
+        """
+        if self.retry_policy is None:
+            return self._request(method, url, headers, body, post_params, _request_timeout)
+        # Each attempt gets its own headers, which _request may modify
+        return self.retry_policy.send(
+            method,
+            url,
+            lambda: self._request(method, url, dict(headers or {}), body, post_params, _request_timeout),
+            replayable=is_replayable(body),
+        )
+
+    def _request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ):
+        """Perform a request once.
 
         :param method: http request method
         :param url: http request url
@@ -180,7 +216,7 @@ class RESTClientObject:
                 ):
                     request_body = None
                     if body is not None:
-                        request_body = json.dumps(body)
+                        request_body = self.json_codec.dumps(body)
                     r = self.pool_manager.request(
                         method,
                         url,
@@ -29,7 +29,11 @@ REQUIRES = [
     "python-dateutil >= 2.8.2",
     "pydantic >= 2",
     "typing-extensions >= 4.7.1",
+    "httpx >= 0.23.0",
 ]
+EXTRAS_REQUIRE = {
+    "fast-json": ["orjson >= 3.9"],
+}
 
 setup(
     name=NAME,
@@ -40,6 +44,7 @@ setup(
     url="",
     keywords=["OpenAPI", "OpenAPI-Generator", "Microsoft Bot Connector API - v3.0"],
     install_requires=REQUIRES,
+    extras_require=EXTRAS_REQUIRE,
     packages=find_packages(exclude=["test", "tests"]),
     include_package_data=True,
     license="The MIT License (MIT)",
@@ -0,0 +1,113 @@
+"""Tests for the asyncio transport of the Bot Connector SDK."""
+import asyncio
+import json
+import unittest
+from typing import Any, List, Tuple, cast
+
+import httpx
+import urllib3
+
+from bot_connector.api.async_attachments_api import AsyncAttachmentsApi
+from bot_connector.api.async_conversations_api import AsyncConversationsApi
+from bot_connector.async_api_client import AsyncApiClient
+from bot_connector.async_rest import AsyncRESTClientObject
+from bot_connector.configuration import Configuration
+from bot_connector.exceptions import ServiceException
+from bot_connector.models.activity import Activity
+from bot_connector.models.activity_types import ActivityTypes
+from bot_connector.models.resource_response import ResourceResponse
+
+
+class TestAsyncApiClient(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.requests = []
+        self.api_client = AsyncApiClient(
+            configuration=Configuration(host="https://connector.test"),
+            header_name="Authorization",
+            header_value="Bearer token",
+        )
+        await self.api_client.rest_client.client.aclose()
+        self.api_client.rest_client.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(self.handler)
+        )
+        self.api = AsyncConversationsApi(self.api_client)
+
+    async def asyncTearDown(self):
+        await self.api_client.close()
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.url.path.startswith("/v3/conversations/broken"):
+            return httpx.Response(503, text="unavailable")
+        if request.url.path.startswith("/v3/attachments/"):
+            return httpx.Response(
+                200, content=b"\x89PNG", headers={"Content-Type": "image/png"}
+            )
+        return httpx.Response(200, json={"id": "act-1"})
+
+    async def test_send_to_conversation(self):
+        response = await self.api.conversations_send_to_conversation(
+            conversation_id="abc",
+            activity=Activity(type=ActivityTypes.MESSAGE, text="hello"),
+        )
+
+        self.assertIsInstance(response, ResourceResponse)
+        self.assertEqual(response.id, "act-1")
+        request = self.requests[0]
+        self.assertEqual(request.method, "POST")
+        self.assertEqual(request.url.path, "/v3/conversations/abc/activities")
+        self.assertEqual(request.headers["Authorization"], "Bearer token")
+        self.assertEqual(
+            json.loads(request.content), {"type": "message", "text": "hello"}
+        )
+
+    async def test_reply_to_activity_fan_out(self):
+        responses = await asyncio.gather(*(
+            self.api.conversations_reply_to_activity(
+                conversation_id="abc",
+                activity_id=f"a{i}",
+                activity=Activity(type=ActivityTypes.MESSAGE, text=str(i)),
+            )
+            for i in range(50)
+        ))
+
+        self.assertEqual(len(responses), 50)
+        self.assertEqual(
+            sorted(r.url.path for r in self.requests),
+            sorted(f"/v3/conversations/abc/activities/a{i}" for i in range(50)),
+        )
+
+    async def test_error_status_raises(self):
+        with self.assertRaises(ServiceException) as context:
+            await self.api.conversations_send_to_conversation(
+                conversation_id="broken", activity=Activity(type=ActivityTypes.TYPING)
+            )
+        self.assertEqual(context.exception.status, 503)
+
+    async def test_get_attachment_bytes(self):
+        attachments_api = AsyncAttachmentsApi(self.api_client)
+
+        data = await attachments_api.attachments_get_attachment(
+            attachment_id="att", view_id="original"
+        )
+
+        self.assertEqual(bytes(data), b"\x89PNG")
+
+
+class TestAsyncRESTClientObject(unittest.IsolatedAsyncioTestCase):
+
+    async def test_connection_retries(self):
+        cases: List[Tuple[Any, int]] = [(3, 3), (urllib3.Retry(2), 2), (urllib3.Retry(False), 0)]
+        for retries, expected in cases:
+            with self.subTest(retries=retries):
+                configuration = Configuration()
+                configuration.retries = retries
+                rest_client = AsyncRESTClientObject(configuration)
+                transport = cast(httpx.AsyncHTTPTransport, rest_client.client._transport)
+                self.assertEqual(transport._pool._retries, expected)
+                await rest_client.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+"""Tests for the single-pass model deserialization of the API client."""
+import json
+import unittest
+
+from bot_connector.api_client import ApiClient
+from bot_connector.models.activity import Activity
+from bot_connector.models.channel_account import ChannelAccount
+
+ACTIVITY = {
+    "type": "message",
+    "id": "1",
+    "from": {"id": "user", "name": "User"},
+    "conversation": {"id": "abc"},
+    "attachments": [{"contentType": "text/plain", "content": {"text": "hi"}}],
+    "text": "hello",
+}
+
+
+class TestDeserialize(unittest.TestCase):
+
+    def setUp(self):
+        self.api_client = ApiClient()
+
+    def deserialize(self, data, response_type):
+        return self.api_client.deserialize(json.dumps(data), response_type, "application/json")
+
+    def test_matches_from_dict(self):
+        self.assertEqual(self.deserialize(ACTIVITY, "Activity"), Activity.from_dict(ACTIVITY))
+
+    def test_list_of_models(self):
+        members = self.deserialize([{"id": "a"}, {"id": "b", "name": "B"}], "List[ChannelAccount]")
+
+        self.assertEqual(members, [ChannelAccount(id="a"), ChannelAccount(id="b", name="B")])
+
+    def test_other_types_are_unchanged(self):
+        self.assertEqual(self.deserialize({"a": 1}, "Dict[str, int]"), {"a": 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+"""Tests for the pluggable JSON codec."""
+import copy
+import unittest
+
+from bot_connector.api_client import ApiClient
+from bot_connector.configuration import Configuration
+from bot_connector.json_codec import JsonCodec, OrjsonCodec, default_json_codec, orjson
+
+
+class RecordingCodec(JsonCodec):
+
+    name = "recording"
+
+    def __init__(self):
+        self.loaded = []
+
+    def loads(self, data):
+        self.loaded.append(data)
+        return super().loads(data)
+
+
+class TestJsonCodec(unittest.TestCase):
+
+    def test_other_responses_are_decoded_with_codec(self):
+        codec = RecordingCodec()
+        api_client = ApiClient(Configuration(json_codec=codec))
+
+        self.assertEqual(api_client.deserialize('{"a": 1}', "object", "application/json"), {"a": 1})
+        self.assertEqual(codec.loaded, ['{"a": 1}'])
+
+    def test_invalid_json_raises_value_error(self):
+        for codec in (JsonCodec(), default_json_codec()):
+            with self.subTest(codec=codec), self.assertRaises(ValueError):
+                codec.loads("{")
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_orjson_is_preferred(self):
+        self.assertIsInstance(Configuration().json_codec, OrjsonCodec)
+
+    def test_copies_share_codec(self):
+        configuration = Configuration(json_codec=JsonCodec())
+
+        self.assertIs(copy.deepcopy(configuration).json_codec, configuration.json_codec)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+"""Tests for the lazily imported package exports."""
+import subprocess
+import sys
+import unittest
+
+import bot_connector
+
+
+class TestLazyImports(unittest.TestCase):
+
+    def test_import_does_not_load_models(self):
+        code = (
+            "import sys, bot_connector; "
+            "print('bot_connector.models.activity' in sys.modules, 'bot_connector.api_client' in sys.modules)"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+
+        self.assertEqual(output.split(), ["False", "False"])
+
+    def test_all_exports_resolve(self):
+        for name in bot_connector.__all__:
+            with self.subTest(name=name):
+                self.assertEqual(getattr(bot_connector, name).__name__, name)
+        self.assertIs(bot_connector.Activity, bot_connector.models.Activity)
+
+    def test_dir_lists_exports(self):
+        self.assertTrue(set(bot_connector.__all__) <= set(dir(bot_connector)))
+
+    def test_star_import(self):
+        for package, name in (("bot_connector.models", "Activity"), ("bot_connector.api", "ConversationsApi")):
+            with self.subTest(package=package):
+                namespace = {}
+                exec(f"from {package} import *", namespace)
+                self.assertIn(name, namespace)
+
+    def test_unknown_name_raises_attribute_error(self):
+        with self.assertRaises(AttributeError):
+            bot_connector.NoSuchModel
+        with self.assertRaises(AttributeError):
+            bot_connector.models.NoSuchModel
+
+
+if __name__ == '__main__':
+    unittest.main()
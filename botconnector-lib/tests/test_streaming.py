@@ -0,0 +1,105 @@
+"""Tests for streaming response bodies."""
+import io
+import unittest
+
+import httpx
+import urllib3
+
+from bot_connector.api.async_attachments_api import AsyncAttachmentsApi
+from bot_connector.api_client import ApiClient
+from bot_connector.async_api_client import AsyncApiClient
+from bot_connector.configuration import Configuration
+from bot_connector.exceptions import NotFoundException
+from bot_connector.models.attachment_info import AttachmentInfo
+from bot_connector.rest import RESTResponse
+
+BODY = bytes(range(256)) * 1024
+
+
+def urllib3_response(body, status=200, content_type="application/octet-stream"):
+    return urllib3.HTTPResponse(
+        body=io.BytesIO(body),
+        status=status,
+        headers={"Content-Type": content_type},
+        preload_content=False,
+    )
+
+
+class TestIterContent(unittest.TestCase):
+
+    def setUp(self):
+        self.api_client = ApiClient()
+
+    def test_streams_in_chunks(self):
+        chunks = list(self.api_client.iter_content(urllib3_response(BODY), chunk_size=65536))
+
+        self.assertEqual(len(chunks), 4)
+        self.assertEqual(b"".join(chunks), BODY)
+
+    def test_error_status_raises(self):
+        response = urllib3_response(b'{"error": {"code": "NotFound"}}', status=404)
+
+        with self.assertRaises(NotFoundException) as context:
+            list(self.api_client.iter_content(response))
+        self.assertIn("NotFound", context.exception.body)
+
+
+class TestResponseDeserialize(unittest.TestCase):
+
+    def deserialize(self, body, content_type):
+        response = RESTResponse(urllib3_response(body, content_type=content_type))
+        response.read()
+        return ApiClient().response_deserialize(response, {"200": "AttachmentInfo"}).data
+
+    def test_json_bytes_are_parsed_directly(self):
+        info = self.deserialize('{"name": "café.png"}'.encode("utf-8"), "application/json")
+
+        self.assertEqual(info, AttachmentInfo(name="café.png"))
+
+    def test_other_charsets_are_decoded(self):
+        info = self.deserialize(
+            '{"name": "café.png"}'.encode("utf-16"), "application/json; charset=utf-16"
+        )
+
+        self.assertEqual(info.name, "café.png")
+
+
+class TestAsyncIterContent(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.api_client = AsyncApiClient(
+            configuration=Configuration(host="https://connector.test")
+        )
+        await self.api_client.rest_client.client.aclose()
+        self.api_client.rest_client.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(self.handler)
+        )
+        self.api = AsyncAttachmentsApi(self.api_client)
+
+    async def asyncTearDown(self):
+        await self.api_client.close()
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path.startswith("/v3/attachments/missing"):
+            return httpx.Response(404, json={"error": {"code": "NotFound"}})
+        return httpx.Response(200, content=BODY)
+
+    async def test_streams_attachment(self):
+        response = await self.api.attachments_get_attachment_without_preload_content("a1", "original")
+
+        chunks = [chunk async for chunk in self.api_client.aiter_content(response, chunk_size=65536)]
+
+        self.assertEqual(b"".join(chunks), BODY)
+        self.assertTrue(response.is_closed)
+
+    async def test_error_status_raises(self):
+        response = await self.api.attachments_get_attachment_without_preload_content("missing", "original")
+
+        with self.assertRaises(NotFoundException):
+            async for _ in self.api_client.aiter_content(response):
+                pass
+        self.assertTrue(response.is_closed)
+
+
+if __name__ == '__main__':
+    unittest.main()
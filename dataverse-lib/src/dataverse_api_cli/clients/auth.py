@@ -1,33 +1,283 @@
 """Authentication client for Microsoft services."""
 
+import base64
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, Any, Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
 import msal
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 
 from dataverse_api_cli.utils.console import console
-from dataverse_api_cli.config import config
+from dataverse_api_cli.config import get_config
+from dataverse_api_cli.constants import TOKEN_REFRESH_MARGIN
+
+def _cache_key(tenant_id: str, client_id: str, scopes: List[str]) -> str:
+    """
+    Build the cache key for a tenant, client and set of scopes
+
+    The identifiers are hashed so the cache file does not reveal them.
+
+    Args:
+        tenant_id (str): The Azure AD tenant ID
+        client_id (str): The application (client) ID
+        scopes (list): The scopes the token is requested for
+
+    Returns:
+        str: The cache key
+    """
+    identity = "|".join([tenant_id, client_id, " ".join(sorted(scopes))])
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+
+def _cipher(client_secret: str) -> Fernet:
+    """
+    Derive the cipher used to encrypt cache entries from the client secret
+
+    Args:
+        client_secret (str): The client secret of the application
+
+    Returns:
+        Fernet: The cipher
+    """
+    key = HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=None,
+        info=b"dataverse-api-cli token cache",
+    ).derive(client_secret.encode("utf-8"))
+    return Fernet(base64.urlsafe_b64encode(key))
+
+
+@contextlib.contextmanager
+def _file_lock(path: str) -> Iterator[None]:
+    """
+    Hold an exclusive lock on a lock file, across processes
+
+    Args:
+        path (str): The lock file, created if missing
+    """
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+        yield
+    finally:
+        # Closing the file releases the lock
+        os.close(fd)
+
+
+class TokenCache:
+    """
+    Persistent cache of access tokens acquired with the client credentials flow.
+
+    Entries are keyed by tenant, client and scopes and stored in a JSON file,
+    each encrypted with a key derived from the client secret, so the file is
+    useless without the secret. Processes sharing the file merge their
+    entries under a lock file. Tokens are refreshed once they come within
+    `refresh_margin` seconds, or half their lifetime if that is shorter, of
+    expiry instead of after they have expired.
+    """
+
+    def __init__(self, path: Optional[str] = None, refresh_margin: float = TOKEN_REFRESH_MARGIN):
+        """
+        Initialize the token cache
+
+        Args:
+            path (str, optional): The cache file; tokens are only kept in
+                memory when omitted
+            refresh_margin (float): Seconds before expiry at which a token
+                is replaced
+        """
+        self.path = path
+        self.refresh_margin = refresh_margin
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._apps: Dict[str, msal.ConfidentialClientApplication] = {}
+        self._lock = threading.Lock()
+
+    def get_token(
+        self,
+        tenant_id: str,
+        client_id: str,
+        client_secret: str,
+        scopes: List[str],
+        authority: Optional[str] = None
+    ) -> str:
+        """
+        Get an access token, acquiring a new one only when needed
+
+        Args:
+            tenant_id (str): The Azure AD tenant ID
+            client_id (str): The application (client) ID
+            client_secret (str): The client secret of the application
+            scopes (list): The scopes to request the token for
+            authority (str, optional): The authority URL; derived from the
+                tenant ID when omitted
+
+        Returns:
+            str: The access token
+
+        Raises:
+            Exception: If token acquisition fails
+        """
+        key = _cache_key(tenant_id, client_id, scopes)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if self._is_stale(entry):
+                entry = self._load(key, client_secret)
+            if self._is_stale(entry):
+                authority = authority or f"https://login.microsoftonline.com/{tenant_id}"
+                entry = self._acquire(key, client_id, client_secret, scopes, authority)
+                self._store(key, client_secret, entry)
+
+            self._entries[key] = entry
+            return entry["access_token"]
+
+    def _is_stale(self, entry: Optional[Dict[str, Any]]) -> bool:
+        """Whether an entry is missing or close enough to expiry to replace"""
+        if entry is None:
+            return True
+        margin = self.refresh_margin
+        if "acquired_on" in entry:
+            # A margin beyond the token's lifetime would replace it on every call
+            margin = min(margin, (entry["expires_on"] - entry["acquired_on"]) / 2)
+        return entry["expires_on"] - margin <= time.time()
+
+    def _acquire(
+        self,
+        key: str,
+        client_id: str,
+        client_secret: str,
+        scopes: List[str],
+        authority: str
+    ) -> Dict[str, Any]:
+        """Acquire a new token from Azure AD"""
+        with console.status("[bold green]Acquiring access token...[/bold green]"):
+            app = self._apps.get(key)
+            if app is None:
+                app = msal.ConfidentialClientApplication(
+                    client_id,
+                    authority=authority,
+                    client_credential=client_secret,
+                )
+                self._apps[key] = app
+
+            result = app.acquire_token_for_client(scopes=scopes)
+
+            if "access_token" in result:
+                console.print("[bold green]✓[/bold green] Successfully acquired access token")
+                acquired_on = time.time()
+                return {
+                    "access_token": result["access_token"],
+                    "acquired_on": acquired_on,
+                    "expires_on": acquired_on + int(result.get("expires_in", 0)),
+                }
+            else:
+                error_msg = f"Error acquiring token: {result.get('error_description')}"
+                console.print(f"[bold red]Error:[/bold red] {error_msg}")
+                raise Exception(error_msg)
+
+    def _read_file(self) -> Dict[str, str]:
+        """Read the encrypted entries from the cache file"""
+        if not self.path:
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def _load(self, key: str, client_secret: str) -> Optional[Dict[str, Any]]:
+        """Load and decrypt an entry from the cache file"""
+        token = self._read_file().get(key)
+        if not token:
+            return None
+        try:
+            return json.loads(_cipher(client_secret).decrypt(token.encode("ascii")))
+        except (InvalidToken, ValueError):
+            # Written with another secret or corrupted; acquire a new token
+            return None
+
+    def _store(self, key: str, client_secret: str, entry: Dict[str, Any]) -> None:
+        """Encrypt an entry and write it to the cache file"""
+        if not self.path:
+            return
+
+        token = _cipher(client_secret).encrypt(json.dumps(entry).encode("utf-8")).decode("ascii")
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        temp_path = None
+        try:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+            # Re-read under the lock so entries other processes stored since
+            # are kept
+            with _file_lock(self.path + ".lock"):
+                entries = self._read_file()
+                entries[key] = token
+                # Write to a private temporary file and swap it in atomically
+                fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".token_cache")
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entries, f)
+                os.replace(temp_path, self.path)
+                temp_path = None
+        except OSError as e:
+            # The cache is an optimisation; keep the token in memory only
+            console.print(f"[yellow]Warning:[/yellow] Could not write token cache: {e}")
+        finally:
+            if temp_path is not None:
+                with contextlib.suppress(OSError):
+                    os.remove(temp_path)
+
+
+_token_cache: Optional[TokenCache] = None
+
+def get_token_cache() -> TokenCache:
+    """
+    Get the process-wide token cache backed by the configured cache file.
+
+    Returns:
+        TokenCache: The shared token cache
+    """
+    global _token_cache
+    if _token_cache is None:
+        _token_cache = TokenCache(get_config()["token_cache_path"])
+    return _token_cache
 
 def get_access_token() -> str:
     """
     Acquire an access token for the Microsoft Dataverse API.
-    
+
+    Tokens are served from the process-wide token cache while they remain
+    valid, so this is cheap enough to call before every request.
+
     Returns:
         str: The access token
-        
+
     Raises:
         Exception: If token acquisition fails
     """
-    with console.status("[bold green]Acquiring access token...[/bold green]"):
-        app = msal.ConfidentialClientApplication(
-            config["client_id"],
-            authority=config["authority"],
-            client_credential=config["client_secret"],
-        )
-        
-        result = app.acquire_token_for_client(scopes=config["scope"])
-        
-        if "access_token" in result:
-            console.print("[bold green]✓[/bold green] Successfully acquired access token")
-            return result["access_token"]
-        else:
-            error_msg = f"Error acquiring token: {result.get('error_description')}"
-            console.print(f"[bold red]Error:[/bold red] {error_msg}")
-            raise Exception(error_msg)
\ No newline at end of file
+    config = get_config()
+    return get_token_cache().get_token(
+        config["tenant_id"],
+        config["client_id"],
+        config["client_secret"],
+        config["scope"],
+        authority=config["authority"],
+    )
@@ -0,0 +1,368 @@
+"""OData $batch request builder for the Dataverse API."""
+
+import json
+import re
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
+from urllib.parse import quote, urlencode
+
+from dataverse_api_cli.constants import MAX_BATCH_OPERATIONS
+
+@dataclass
+class BatchOperation:
+    """A single request queued in a batch"""
+
+    method: str
+    url: str
+    data: Optional[Dict[str, Any]] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class BatchResult:
+    """The response to a single operation in a batch"""
+
+    operation: BatchOperation
+    status: Optional[int]
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: Optional[Any] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the operation was executed and succeeded"""
+        return self.status is not None and 200 <= self.status < 300
+
+
+@dataclass
+class BatchPayload:
+    """One $batch HTTP request holding part of the queued operations"""
+
+    boundary: str
+    body: str
+    items: List[Union[BatchOperation, List[BatchOperation]]]
+
+    @property
+    def content_type(self) -> str:
+        return f'multipart/mixed; boundary="{self.boundary}"'
+
+    def parse_response(self, content_type: str, text: str) -> List[BatchResult]:
+        """
+        Match the parts of a $batch response to the operations in this payload
+
+        Operations the service did not execute (for example after an error
+        without continue-on-error) get a result with a status of None. When
+        a change set fails, every operation in it is rolled back, so they
+        all share the error response.
+
+        Args:
+            content_type (str): The Content-Type header of the response
+            text (str): The response body
+
+        Returns:
+            list: One BatchResult per operation, in the order they were queued
+        """
+        parts = _split_multipart(text, _get_boundary(content_type))
+        results = []
+
+        for index, item in enumerate(self.items):
+            part = parts[index] if index < len(parts) else None
+
+            if isinstance(item, BatchOperation):
+                results.append(_parse_http_part(item, part))
+                continue
+
+            if part is None or not _is_multipart(part[0]):
+                # Missing or a single error response for the whole change set
+                results.extend(_parse_http_part(operation, part) for operation in item)
+                continue
+
+            # Change set responses are matched on Content-ID
+            responses = {}
+            for headers, body in _split_multipart(part[1], _get_boundary(part[0]["content-type"])):
+                responses[headers.get("content-id")] = (headers, body)
+            for content_id, operation in enumerate(item, start=1):
+                results.append(_parse_http_part(operation, responses.get(str(content_id))))
+
+        return results
+
+
+class BatchRequest:
+    """
+    Builder collecting Dataverse operations into OData $batch requests.
+
+    Operations are queued with the same methods DataverseClient exposes and
+    sent with DataverseClient.execute_batch. Operations queued inside a
+    change_set() block are applied atomically. The builder splits the work
+    into as many $batch requests as the per-request operation limit needs.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        continue_on_error: bool = True,
+        max_operations: int = MAX_BATCH_OPERATIONS
+    ):
+        """
+        Initialize the batch request
+
+        Args:
+            base_url (str): The base URL for the Dataverse API
+            continue_on_error (bool): Keep executing after a failed operation
+                outside a change set (Prefer: odata.continue-on-error)
+            max_operations (int): Maximum number of operations per $batch request
+        """
+        self.base_url = base_url
+        self.continue_on_error = continue_on_error
+        self.max_operations = max_operations
+        self.items: List[Union[BatchOperation, List[BatchOperation]]] = []
+        self._change_set: Optional[List[BatchOperation]] = None
+
+    def __len__(self) -> int:
+        return sum(_count(item) for item in self.items)
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Extra headers to send with each $batch request"""
+        if self.continue_on_error:
+            return {"Prefer": "odata.continue-on-error"}
+        return {}
+
+    @contextmanager
+    def change_set(self) -> Iterator["BatchRequest"]:
+        """
+        Group the operations queued inside the block into an atomic change set
+
+        Only POST, PATCH, PUT and DELETE operations may be part of a change set.
+        """
+        if self._change_set is not None:
+            raise ValueError("Change sets cannot be nested")
+
+        self._change_set = []
+        try:
+            yield self
+        finally:
+            operations, self._change_set = self._change_set, None
+
+        if len(operations) > self.max_operations:
+            raise ValueError(
+                f"A change set cannot hold more than {self.max_operations} operations"
+            )
+        if operations:
+            self.items.append(operations)
+
+    def add(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, str]] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> BatchOperation:
+        """
+        Queue a request
+
+        Args:
+            method (str): The HTTP method to use
+            endpoint (str): The API endpoint to call
+            data (dict, optional): The data to send in the request body
+            params (dict, optional): The query parameters to include
+            headers (dict, optional): Extra headers for this operation
+
+        Returns:
+            BatchOperation: The queued operation
+        """
+        method = method.upper()
+        url = f"{self.base_url}/{endpoint}"
+        if params:
+            url += "?" + urlencode(params, quote_via=quote, safe="$(),'")
+
+        operation = BatchOperation(method, url, data, dict(headers or {}))
+
+        if self._change_set is not None:
+            if method == "GET":
+                raise ValueError("GET operations cannot be part of a change set")
+            self._change_set.append(operation)
+        else:
+            self.items.append(operation)
+
+        return operation
+
+    def get_entities(
+        self,
+        entity_name: str,
+        select: Optional[Union[List[str], str]] = None,
+        filter: Optional[str] = None,
+        expand: Optional[Union[Dict[str, List[str]], str]] = None,
+        top: Optional[int] = None,
+        order_by: Optional[str] = None
+    ) -> BatchOperation:
+        """Queue a query for entities; see DataverseClient.get_entities"""
+        from dataverse_api_cli.clients.dataverse import _build_query_params
+
+        params = _build_query_params(
+            select=select,
+            filter=filter,
+            expand=expand,
+            top=top,
+            order_by=order_by
+        )
+        return self.add("GET", entity_name, params=params)
+
+    def get_entity_by_id(
+        self,
+        entity_name: str,
+        entity_id: str,
+        select: Optional[str] = None,
+        expand: Optional[str] = None
+    ) -> BatchOperation:
+        """Queue a request for a specific entity; see DataverseClient.get_entity_by_id"""
+        params = {}
+        if select:
+            params["$select"] = select
+        if expand:
+            params["$expand"] = expand
+
+        return self.add("GET", f"{entity_name}({entity_id})", params=params)
+
+    def create_entity(self, entity_name: str, data: Dict[str, Any]) -> BatchOperation:
+        """Queue the creation of an entity; see DataverseClient.create_entity"""
+        return self.add("POST", entity_name, data=data)
+
+    def update_entity(self, entity_name: str, entity_id: str, data: Dict[str, Any]) -> BatchOperation:
+        """Queue an update of an entity; see DataverseClient.update_entity"""
+        return self.add("PATCH", f"{entity_name}({entity_id})", data=data)
+
+    def delete_entity(self, entity_name: str, entity_id: str) -> BatchOperation:
+        """Queue the deletion of an entity; see DataverseClient.delete_entity"""
+        return self.add("DELETE", f"{entity_name}({entity_id})")
+
+    def payloads(self) -> List[BatchPayload]:
+        """
+        Encode the queued operations as multipart $batch request bodies
+
+        Returns:
+            list: One BatchPayload per $batch request, each holding at most
+                max_operations operations
+        """
+        if self._change_set is not None:
+            raise ValueError("Cannot encode a batch while a change set is open")
+
+        chunks: List[List[Union[BatchOperation, List[BatchOperation]]]] = []
+        size = 0
+        for item in self.items:
+            count = _count(item)
+            if not chunks or size + count > self.max_operations:
+                chunks.append([])
+                size = 0
+            chunks[-1].append(item)
+            size += count
+
+        return [_encode(chunk) for chunk in chunks]
+
+
+def _count(item: Union[BatchOperation, List[BatchOperation]]) -> int:
+    return 1 if isinstance(item, BatchOperation) else len(item)
+
+
+def _encode(items: List[Union[BatchOperation, List[BatchOperation]]]) -> BatchPayload:
+    """Encode one $batch request body"""
+    boundary = f"batch_{uuid.uuid4()}"
+    lines = []
+
+    for item in items:
+        lines.append(f"--{boundary}")
+        if isinstance(item, BatchOperation):
+            lines.extend(_encode_operation(item))
+            continue
+
+        change_set_boundary = f"changeset_{uuid.uuid4()}"
+        lines.append(f'Content-Type: multipart/mixed; boundary="{change_set_boundary}"')
+        lines.append("")
+        for content_id, operation in enumerate(item, start=1):
+            lines.append(f"--{change_set_boundary}")
+            lines.extend(_encode_operation(operation, content_id))
+        lines.append(f"--{change_set_boundary}--")
+
+    lines.append(f"--{boundary}--")
+    lines.append("")
+    return BatchPayload(boundary, "\r\n".join(lines), items)
+
+
+def _encode_operation(operation: BatchOperation, content_id: Optional[int] = None) -> List[str]:
+    """Encode a single operation as an application/http part"""
+    lines = [
+        "Content-Type: application/http",
+        "Content-Transfer-Encoding: binary",
+    ]
+    if content_id is not None:
+        lines.append(f"Content-ID: {content_id}")
+    lines.append("")
+    lines.append(f"{operation.method} {operation.url} HTTP/1.1")
+
+    headers = dict(operation.headers)
+    if operation.data is not None:
+        headers.setdefault("Content-Type", "application/json; type=entry")
+    lines.extend(f"{name}: {value}" for name, value in headers.items())
+    lines.append("")
+
+    if operation.data is not None:
+        lines.append(json.dumps(operation.data))
+    return lines
+
+
+def _get_boundary(content_type: str) -> str:
+    match = re.search(r'boundary="?([^";]+)"?', content_type)
+    if not match:
+        raise ValueError(f"No multipart boundary in Content-Type: {content_type}")
+    return match.group(1)
+
+
+def _is_multipart(headers: Dict[str, str]) -> bool:
+    return headers.get("content-type", "").startswith("multipart/mixed")
+
+
+def _split_headers(text: str) -> Tuple[Dict[str, str], str]:
+    """Split a MIME part or HTTP message into lower-cased headers and body"""
+    head, _, body = text.partition("\n\n")
+    headers = {}
+    for line in head.split("\n"):
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    return headers, body
+
+
+def _split_multipart(text: str, boundary: str) -> List[Tuple[Dict[str, str], str]]:
+    """Split a multipart/mixed body into (headers, body) parts"""
+    text = text.replace("\r\n", "\n")
+    parts = []
+    for chunk in text.split(f"--{boundary}")[1:]:
+        if chunk.startswith("--"):
+            break
+        parts.append(_split_headers(chunk.strip("\n")))
+    return parts
+
+
+def _parse_http_part(
+    operation: BatchOperation,
+    part: Optional[Tuple[Dict[str, str], str]]
+) -> BatchResult:
+    """Parse the embedded HTTP response of an application/http part"""
+    if part is None:
+        return BatchResult(operation, None)
+
+    status_line, _, message = part[1].partition("\n")
+    headers, body = _split_headers(message)
+    status = int(status_line.split()[1])
+
+    body = body.strip()
+    parsed_body: Optional[Any] = None
+    if body:
+        try:
+            parsed_body = json.loads(body)
+        except ValueError:
+            parsed_body = body
+
+    return BatchResult(operation, status, headers, parsed_body)
@@ -1,64 +1,304 @@
 """Dataverse API client."""
 
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, AsyncIterator, Awaitable, Callable, Iterator, List, Optional, Union
+import asyncio
+import base64
+import json
+import time
 import httpx
 
 from dataverse_api_cli.utils.console import console
+from dataverse_api_cli.constants import DEFAULT_MAX_CONCURRENCY, TOKEN_REFRESH_MARGIN
+from dataverse_api_cli.clients.batch import BatchRequest, BatchResult
+from dataverse_api_cli.clients.throttle import RateGovernor, RetryPolicy, shared_governor
+
+def _build_query_params(
+    select: Optional[Union[List[str], str]] = None, 
+    filter: Optional[str] = None, 
+    expand: Optional[Union[Dict[str, List[str]], str]] = None, 
+    top: Optional[int] = None, 
+    order_by: Optional[str] = None
+) -> Dict[str, str]:
+    """
+    Build OData query parameters for an entity set request
+    
+    Args:
+        select (list or str, optional): Fields to select
+        filter (str, optional): OData filter expression
+        expand (dict or str, optional): Related entities to expand
+        top (int, optional): Maximum number of records to return
+        order_by (str, optional): Field to order results by
+        
+    Returns:
+        dict: The query parameters
+    """
+    params = {}
+
+    # Handle select parameter - convert list to comma-separated string
+    if select:
+        if isinstance(select, list):
+            params["$select"] = ",".join(select)
+        else:
+            params["$select"] = select
+
+    if filter:
+        params["$filter"] = filter
+
+    # Handle expand parameter - convert dict to OData format
+    if expand:
+        if isinstance(expand, dict):
+            expand_parts = []
+            for relationship, fields in expand.items():
+                if fields:
+                    expand_parts.append(f"{relationship}($select={','.join(fields)})")
+                else:
+                    expand_parts.append(relationship)
+            params["$expand"] = ",".join(expand_parts)
+        else:
+            params["$expand"] = expand
+
+    if top:
+        params["$top"] = str(top)
+
+    if order_by:
+        params["$orderby"] = order_by
+
+    return params
+
+
+def _build_url(base_url: str, endpoint: str) -> str:
+    """
+    Resolve an endpoint against the API base URL
+    
+    Args:
+        base_url (str): The base URL for the Dataverse API
+        endpoint (str): A path relative to the base URL, or an absolute URL
+        
+    Returns:
+        str: The absolute request URL
+    """
+    if endpoint.startswith(("https://", "http://")):
+        return endpoint
+    return f"{base_url}/{endpoint}"
+
+
+def _build_prefer_header(page_size: Optional[int], track_changes: bool = False) -> Optional[Dict[str, str]]:
+    """
+    Build the Prefer header asking the server for a specific page size
+    
+    Args:
+        page_size (int, optional): Maximum number of records per page
+        track_changes (bool): Also ask for a delta link to later changes
+        
+    Returns:
+        dict: The header, or None when the server default should be used
+    """
+    preferences = []
+    if track_changes:
+        preferences.append("odata.track-changes")
+    if page_size:
+        preferences.append(f"odata.maxpagesize={page_size}")
+    if not preferences:
+        return None
+    return {"Prefer": ",".join(preferences)}
+
+
+def is_deleted(entity: Dict[str, Any]) -> bool:
+    """
+    Check whether a change tracking record reports a deleted row
+    
+    Deleted rows carry only their ID, in an "id" property, and a
+    $deletedEntity context.
+    
+    Args:
+        entity (dict): A record from EntityChanges
+        
+    Returns:
+        bool: True if the row was deleted
+    """
+    return entity.get("reason") == "deleted" or "$deletedEntity" in entity.get("@odata.context", "")
+
+
+def _build_headers(access_token: str) -> Dict[str, str]:
+    """
+    Build the default headers sent with every Dataverse request
+    
+    Args:
+        access_token (str): The access token for authentication
+        
+    Returns:
+        dict: The request headers
+    """
+    return {
+        "Authorization": f"Bearer {access_token}",
+        "Accept": "application/json",
+        "OData-MaxVersion": "4.0",
+        "OData-Version": "4.0",
+        "Content-Type": "application/json"
+    }
+
+
+def _resolve_token(access_token: Union[str, Callable[[], str]]) -> str:
+    """
+    Get the current access token from a fixed token or a token provider
+    
+    Args:
+        access_token (str or callable): The token, or a function returning it
+        
+    Returns:
+        str: The access token
+    """
+    if callable(access_token):
+        return access_token()
+    return access_token
+
+
+def _token_expiry(access_token: str) -> Optional[float]:
+    """
+    Read the expiry time of a JWT access token, without verifying it
+    
+    Args:
+        access_token (str): The access token
+        
+    Returns:
+        float: The expiry as a Unix timestamp, or None if the token is not
+            a JWT with an `exp` claim
+    """
+    try:
+        payload = access_token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+def _log_http_error(error: httpx.HTTPStatusError) -> None:
+    """
+    Print an HTTP error together with any details found in its response
+    
+    Args:
+        error (httpx.HTTPStatusError): The error raised for the response
+    """
+    console.print(f"[bold red]HTTP Error:[/bold red] {error}")
+    # Try to extract more information from the response
+    if error.response.content:
+        try:
+            error_details = error.response.json()
+            console.print(f"Error details: {error_details}")
+        except Exception:
+            console.print(f"Response content: {error.response.content.decode('utf-8')}")
+
 
 class DataverseClient:
     """Client for interacting with Microsoft Dataverse API"""
     
-    def __init__(self, base_url: str, access_token: str, timeout: float = 30.0):
+    def __init__(
+        self, 
+        base_url: str, 
+        access_token: Union[str, Callable[[], str]], 
+        timeout: float = 30.0,
+        http2: bool = False,
+        governor: Optional[RateGovernor] = None,
+        retry: Optional[RetryPolicy] = None
+    ):
         """
         Initialize the Dataverse client
         
+        The client is safe to share between threads; requests reuse
+        keep-alive connections from one pool. Requests pass through a
+        RateGovernor that keeps them within the service protection limits,
+        and throttled or transiently failed requests are retried.
+        
         Args:
             base_url (str): The base URL for the Dataverse API
-            access_token (str): The access token for authentication
+            access_token (str or callable): The access token for authentication,
+                or a function returning one that is called before each request,
+                such as get_access_token
             timeout (float): Request timeout in seconds
+            http2 (bool): Negotiate HTTP/2, multiplexing concurrent requests
+                over one connection. Requires the `h2` package.
+            governor (RateGovernor, optional): The governor to use; by default
+                the one shared by all clients of base_url
+            retry (RetryPolicy, optional): When to retry; by default up to
+                5 attempts
         """
         self.base_url = base_url
-        self.headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Accept": "application/json",
-            "OData-MaxVersion": "4.0",
-            "OData-Version": "4.0",
-            "Content-Type": "application/json"
-        }
+        self.access_token = access_token
+        self.governor = governor or shared_governor(base_url)
+        self.retry = retry or RetryPolicy()
         # Create a client with default timeout
-        self.client = httpx.Client(timeout=timeout)
+        self.client = httpx.Client(timeout=timeout, http2=http2)
+    
+    @property
+    def headers(self) -> Dict[str, str]:
+        """The default headers, carrying the current access token"""
+        return _build_headers(_resolve_token(self.access_token))
+    
+    def _send(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> httpx.Response:
+        """
+        Send a request through the governor, retrying as the retry policy allows
+        
+        Args:
+            method (str): The HTTP method to use
+            url (str): The absolute URL
+            headers (dict, optional): Headers added to the default headers,
+                which are rebuilt for each attempt
+            **kwargs: Further arguments for httpx.Client.request
+            
+        Returns:
+            httpx.Response: The last response, not checked for errors
+        """
+        attempt = 1
+        while True:
+            self.governor.acquire()
+            try:
+                response = self.client.request(method, url, headers={**self.headers, **(headers or {})}, **kwargs)
+            except Exception as e:
+                self.governor.release()
+                if not self.retry.should_retry(method, attempt, error=e):
+                    raise
+                time.sleep(self.retry.delay(attempt))
+            else:
+                self.governor.release(response)
+                if not self.retry.should_retry(method, attempt, response=response):
+                    return response
+                time.sleep(self.retry.delay(attempt, response))
+            attempt += 1
     
     def request(
         self, 
         endpoint: str, 
         method: str = "GET", 
         data: Optional[Dict[str, Any]] = None, 
-        params: Optional[Dict[str, str]] = None
+        params: Optional[Dict[str, str]] = None,
+        headers: Optional[Dict[str, str]] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Make a request to the Dataverse API
         
         Args:
-            endpoint (str): The API endpoint to call
+            endpoint (str): The API endpoint to call, or an absolute URL
+                such as an @odata.nextLink
             method (str): The HTTP method to use
             data (dict, optional): The data to send in the request body
             params (dict, optional): The query parameters to include
+            headers (dict, optional): Extra headers for this request only
             
         Returns:
             dict: The JSON response from the API
             
         Raises:
-            httpx.HTTPStatusError: If the request fails
+            httpx.HTTPStatusError: If the request fails, after any retries
         """
-        url = f"{self.base_url}/{endpoint}"
+        url = _build_url(self.base_url, endpoint)
         
         try:
-            response = self.client.request(
+            response = self._send(
                 method, 
                 url, 
                 json=data, 
                 params=params,
-                headers=self.headers
+                headers=headers
             )
             response.raise_for_status()
                 
@@ -70,14 +310,7 @@ class DataverseClient:
             return response.json()
             
         except httpx.HTTPStatusError as e:
-            console.print(f"[bold red]HTTP Error:[/bold red] {e}")
-            # Try to extract more information from the response
-            if e.response.content:
-                try:
-                    error_details = e.response.json()
-                    console.print(f"Error details: {error_details}")
-                except Exception:
-                    console.print(f"Response content: {e.response.content.decode('utf-8')}")
+            _log_http_error(e)
             raise
         
         except httpx.RequestError as e:
@@ -105,41 +338,66 @@ class DataverseClient:
             order_by (str, optional): Field to order results by
             
         Returns:
-            list: List of entities matching the query
+            list: All entities matching the query, across every page
         """
-        params = {}
-        
-        # Handle select parameter - convert list to comma-separated string
-        if select:
-            if isinstance(select, list):
-                params["$select"] = ",".join(select)
-            else:
-                params["$select"] = select
-        
-        if filter:
-            params["$filter"] = filter
-        
-        # Handle expand parameter - convert dict to OData format
-        if expand:
-            if isinstance(expand, dict):
-                expand_parts = []
-                for relationship, fields in expand.items():
-                    if fields:
-                        expand_parts.append(f"{relationship}($select={','.join(fields)})")
-                    else:
-                        expand_parts.append(relationship)
-                params["$expand"] = ",".join(expand_parts)
-            else:
-                params["$expand"] = expand
+        return list(self.iter_entities(
+            entity_name,
+            select=select,
+            filter=filter,
+            expand=expand,
+            top=top,
+            order_by=order_by
+        ))
+    
+    def iter_entities(
+        self, 
+        entity_name: str, 
+        select: Optional[Union[List[str], str]] = None, 
+        filter: Optional[str] = None, 
+        expand: Optional[Union[Dict[str, List[str]], str]] = None, 
+        top: Optional[int] = None, 
+        order_by: Optional[str] = None,
+        page_size: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream entities from Dataverse, following @odata.nextLink across pages
         
-        if top:
-            params["$top"] = str(top)
+        Records are yielded as each page arrives, so only one page is held
+        in memory at a time.
         
-        if order_by:
-            params["$orderby"] = order_by
+        Args:
+            entity_name (str): The name of the entity to query
+            select (list or str, optional): Fields to select
+            filter (str, optional): OData filter expression
+            expand (dict or str, optional): Related entities to expand
+            top (int, optional): Maximum number of records to return
+            order_by (str, optional): Field to order results by
+            page_size (int, optional): Records per page, sent as
+                Prefer: odata.maxpagesize
+            
+        Yields:
+            dict: Each entity matching the query
+        """
+        params = _build_query_params(
+            select=select,
+            filter=filter,
+            expand=expand,
+            top=top,
+            order_by=order_by
+        )
+        headers = _build_prefer_header(page_size)
+        endpoint = entity_name
         
-        response = self.request(entity_name, params=params)
-        return response.get("value", []) if response else []
+        while endpoint:
+            response = self.request(endpoint, params=params, headers=headers)
+            if not response:
+                return
+            
+            yield from response.get("value", [])
+            
+            # The next link already carries every query option
+            endpoint = response.get("@odata.nextLink")
+            params = None
     
     def get_entity_by_id(
         self, 
@@ -202,6 +460,527 @@ class DataverseClient:
         """
         self.request(f"{entity_name}({entity_id})", method="DELETE")
 
+    def batch(self, continue_on_error: bool = True) -> BatchRequest:
+        """
+        Start a new $batch request against this client's API
+        
+        Args:
+            continue_on_error (bool): Keep executing after a failed operation
+                outside a change set
+            
+        Returns:
+            BatchRequest: An empty batch to queue operations on
+        """
+        return BatchRequest(self.base_url, continue_on_error=continue_on_error)
+    
+    def execute_batch(self, batch: BatchRequest) -> List[BatchResult]:
+        """
+        Send the operations queued on a batch
+        
+        The batch is sent as one $batch request per `max_operations`
+        operations; change sets are never split across requests.
+        
+        Args:
+            batch (BatchRequest): The batch to send
+            
+        Returns:
+            list: One BatchResult per queued operation, in order
+            
+        Raises:
+            httpx.HTTPStatusError: If a $batch request itself fails
+        """
+        results = []
+        for payload in batch.payloads():
+            headers = {**batch.headers, "Content-Type": payload.content_type}
+            
+            try:
+                response = self._send(
+                    "POST",
+                    _build_url(self.base_url, "$batch"),
+                    content=payload.body.encode("utf-8"),
+                    headers=headers
+                )
+                response.raise_for_status()
+                
+            except httpx.HTTPStatusError as e:
+                _log_http_error(e)
+                raise
+            
+            except httpx.RequestError as e:
+                console.print(f"[bold red]Request Error:[/bold red] {e}")
+                raise
+            
+            results.extend(payload.parse_response(response.headers["Content-Type"], response.text))
+        
+        return results
+
+    def track_changes(
+        self, 
+        entity_name: str, 
+        select: Optional[Union[List[str], str]] = None, 
+        delta_link: Optional[str] = None, 
+        page_size: Optional[int] = None
+    ) -> "EntityChanges":
+        """
+        Read the rows of an entity set changed since a delta link
+        
+        Without a delta link every row is returned, starting change
+        tracking. The table must have change tracking enabled; change
+        tracking requests accept no $filter, $orderby or $expand.
+        
+        Args:
+            entity_name (str): The name of the entity to query
+            select (list or str, optional): Fields to select
+            delta_link (str, optional): The delta link saved from the
+                previous EntityChanges
+            page_size (int, optional): Records per page, sent as
+                Prefer: odata.maxpagesize
+            
+        Returns:
+            EntityChanges: The changes, read as they are iterated
+        """
+        return EntityChanges(self, entity_name, select, delta_link, page_size)
+
     def close(self) -> None:
         """Close the httpx client"""
-        self.client.close()
\ No newline at end of file
+        self.client.close()
+
+
+class EntityChanges:
+    """
+    Rows of an entity set changed since a delta link, read page by page
+    
+    Iterating yields created and updated rows with the selected columns,
+    and a record with only the ID for each deleted row (see is_deleted).
+    Once iteration completes, delta_link holds the link that returns the
+    changes after these.
+    """
+    
+    def __init__(
+        self, 
+        client: DataverseClient, 
+        entity_name: str, 
+        select: Optional[Union[List[str], str]] = None, 
+        delta_link: Optional[str] = None, 
+        page_size: Optional[int] = None
+    ):
+        self.client = client
+        self.entity_name = entity_name
+        self.select = select
+        self.start_link = delta_link
+        self.page_size = page_size
+        self.delta_link: Optional[str] = None
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        headers = _build_prefer_header(self.page_size, track_changes=True)
+        if self.start_link:
+            # The delta link already carries every query option
+            endpoint = self.start_link
+            params = None
+        else:
+            endpoint = self.entity_name
+            params = _build_query_params(select=self.select)
+        
+        while endpoint:
+            response = self.client.request(endpoint, params=params, headers=headers)
+            if not response:
+                return
+            
+            yield from response.get("value", [])
+            
+            endpoint = response.get("@odata.nextLink")
+            params = None
+            if not endpoint:
+                self.delta_link = response.get("@odata.deltaLink")
+
+
+class AsyncDataverseClient:
+    """Asynchronous client for interacting with Microsoft Dataverse API"""
+    
+    def __init__(
+        self, 
+        base_url: str, 
+        access_token: Union[str, Callable[[], str], Callable[[], Awaitable[str]]], 
+        timeout: float = 30.0, 
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        governor: Optional[RateGovernor] = None,
+        retry: Optional[RetryPolicy] = None
+    ):
+        """
+        Initialize the asynchronous Dataverse client
+        
+        Requests issued from any number of coroutines share one connection
+        pool; at most `max_concurrency` of them are in flight at once, fewer
+        while the RateGovernor holds them back.
+        
+        Args:
+            base_url (str): The base URL for the Dataverse API
+            access_token (str or callable): The access token for authentication,
+                or a function or coroutine function returning one, such as
+                get_access_token. A function is called in a worker thread so
+                it may block; a JWT it returns is reused until it comes
+                within TOKEN_REFRESH_MARGIN seconds of expiry
+            timeout (float): Request timeout in seconds
+            max_concurrency (int): Maximum number of concurrent requests
+            governor (RateGovernor, optional): The governor to use; by default
+                the one shared by all clients of base_url
+            retry (RetryPolicy, optional): When to retry; by default up to
+                5 attempts
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        
+        self.base_url = base_url
+        self.access_token = access_token
+        self.max_concurrency = max_concurrency
+        self.governor = governor or shared_governor(base_url)
+        self.retry = retry or RetryPolicy()
+        # Created on first use so they bind to the running event loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._token_lock: Optional[asyncio.Lock] = None
+        self._token: Optional[str] = None
+        self._token_refresh_at = 0.0
+        # Create a client with default timeout, sized to the concurrency limit
+        self.client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency
+            )
+        )
+    
+    async def __aenter__(self) -> "AsyncDataverseClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+    
+    async def _get_token(self) -> str:
+        """
+        Get the current access token without blocking the event loop
+        
+        Concurrent requests share one call to the token provider.
+        
+        Returns:
+            str: The access token
+        """
+        if not callable(self.access_token):
+            return self.access_token
+        if self._token is not None and time.time() < self._token_refresh_at:
+            return self._token
+        if self._token_lock is None:
+            self._token_lock = asyncio.Lock()
+        async with self._token_lock:
+            if self._token is not None and time.time() < self._token_refresh_at:
+                return self._token
+            if asyncio.iscoroutinefunction(self.access_token):
+                token = await self.access_token()
+            else:
+                token = await asyncio.to_thread(self.access_token)
+            expiry = _token_expiry(token)
+            # Tokens of unknown lifetime are fetched again for every request
+            self._token = token
+            self._token_refresh_at = expiry - TOKEN_REFRESH_MARGIN if expiry is not None else 0.0
+            return token
+    
+    async def _send(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> httpx.Response:
+        """
+        Send a request through the governor, retrying as the retry policy allows
+        
+        Each attempt counts against `max_concurrency`; waits between
+        attempts do not.
+        
+        Args:
+            method (str): The HTTP method to use
+            url (str): The absolute URL
+            headers (dict, optional): Headers added to the default headers,
+                which are rebuilt for each attempt
+            **kwargs: Further arguments for httpx.AsyncClient.request
+            
+        Returns:
+            httpx.Response: The last response, not checked for errors
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        attempt = 1
+        while True:
+            async with self._semaphore:
+                await self.governor.acquire_async()
+                try:
+                    response = await self.client.request(
+                        method, url, headers={**_build_headers(await self._get_token()), **(headers or {})}, **kwargs
+                    )
+                except Exception as e:
+                    self.governor.release()
+                    error = e
+                else:
+                    self.governor.release(response)
+                    error = None
+            
+            if error is not None:
+                if not self.retry.should_retry(method, attempt, error=error):
+                    raise error
+                await asyncio.sleep(self.retry.delay(attempt))
+            elif self.retry.should_retry(method, attempt, response=response):
+                await asyncio.sleep(self.retry.delay(attempt, response))
+            else:
+                return response
+            attempt += 1
+    
+    async def request(
+        self, 
+        endpoint: str, 
+        method: str = "GET", 
+        data: Optional[Dict[str, Any]] = None, 
+        params: Optional[Dict[str, str]] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Make a request to the Dataverse API
+        
+        Args:
+            endpoint (str): The API endpoint to call, or an absolute URL
+                such as an @odata.nextLink
+            method (str): The HTTP method to use
+            data (dict, optional): The data to send in the request body
+            params (dict, optional): The query parameters to include
+            headers (dict, optional): Extra headers for this request only
+            
+        Returns:
+            dict: The JSON response from the API
+            
+        Raises:
+            httpx.HTTPStatusError: If the request fails, after any retries
+        """
+        url = _build_url(self.base_url, endpoint)
+        
+        try:
+            response = await self._send(
+                method, 
+                url, 
+                json=data, 
+                params=params,
+                headers=headers
+            )
+            response.raise_for_status()
+                
+            # Return None for empty responses (like 204 No Content)
+            if not response.content:
+                return None
+                
+            # Parse JSON only when there's content
+            return response.json()
+            
+        except httpx.HTTPStatusError as e:
+            _log_http_error(e)
+            raise
+        
+        except httpx.RequestError as e:
+            console.print(f"[bold red]Request Error:[/bold red] {e}")
+            raise
+    
+    async def get_entities(
+        self, 
+        entity_name: str, 
+        select: Optional[Union[List[str], str]] = None, 
+        filter: Optional[str] = None, 
+        expand: Optional[Union[Dict[str, List[str]], str]] = None, 
+        top: Optional[int] = None, 
+        order_by: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get entities from Dataverse with support for OData query parameters
+        
+        Args:
+            entity_name (str): The name of the entity to query
+            select (list or str, optional): Fields to select
+            filter (str, optional): OData filter expression
+            expand (dict or str, optional): Related entities to expand
+            top (int, optional): Maximum number of records to return
+            order_by (str, optional): Field to order results by
+            
+        Returns:
+            list: All entities matching the query, across every page
+        """
+        return [
+            entity async for entity in self.iter_entities(
+                entity_name,
+                select=select,
+                filter=filter,
+                expand=expand,
+                top=top,
+                order_by=order_by
+            )
+        ]
+    
+    async def iter_entities(
+        self, 
+        entity_name: str, 
+        select: Optional[Union[List[str], str]] = None, 
+        filter: Optional[str] = None, 
+        expand: Optional[Union[Dict[str, List[str]], str]] = None, 
+        top: Optional[int] = None, 
+        order_by: Optional[str] = None,
+        page_size: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream entities from Dataverse, following @odata.nextLink across pages
+        
+        Records are yielded as each page arrives, so only one page is held
+        in memory at a time.
+        
+        Args:
+            entity_name (str): The name of the entity to query
+            select (list or str, optional): Fields to select
+            filter (str, optional): OData filter expression
+            expand (dict or str, optional): Related entities to expand
+            top (int, optional): Maximum number of records to return
+            order_by (str, optional): Field to order results by
+            page_size (int, optional): Records per page, sent as
+                Prefer: odata.maxpagesize
+            
+        Yields:
+            dict: Each entity matching the query
+        """
+        params = _build_query_params(
+            select=select,
+            filter=filter,
+            expand=expand,
+            top=top,
+            order_by=order_by
+        )
+        headers = _build_prefer_header(page_size)
+        endpoint = entity_name
+        
+        while endpoint:
+            response = await self.request(endpoint, params=params, headers=headers)
+            if not response:
+                return
+            
+            for entity in response.get("value", []):
+                yield entity
+            
+            # The next link already carries every query option
+            endpoint = response.get("@odata.nextLink")
+            params = None
+    
+    async def get_entity_by_id(
+        self, 
+        entity_name: str, 
+        entity_id: str, 
+        select: Optional[str] = None, 
+        expand: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get a specific entity by ID
+        
+        Args:
+            entity_name (str): The name of the entity
+            entity_id (str): The ID of the entity
+            select (str, optional): The $select query parameter
+            expand (str, optional): The $expand query parameter
+            
+        Returns:
+            dict: The entity data
+        """
+        params = {}
+        if select:
+            params["$select"] = select
+        if expand:
+            params["$expand"] = expand
+            
+        return await self.request(f"{entity_name}({entity_id})", params=params)
+    
+    async def create_entity(self, entity_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create a new entity
+        
+        Args:
+            entity_name (str): The name of the entity to create
+            data (dict): The entity data
+            
+        Returns:
+            dict: The created entity
+        """
+        return await self.request(entity_name, method="POST", data=data)
+    
+    async def update_entity(self, entity_name: str, entity_id: str, data: Dict[str, Any]) -> None:
+        """
+        Update an existing entity
+        
+        Args:
+            entity_name (str): The name of the entity to update
+            entity_id (str): The ID of the entity to update
+            data (dict): The updated entity data
+        """
+        await self.request(f"{entity_name}({entity_id})", method="PATCH", data=data)
+    
+    async def delete_entity(self, entity_name: str, entity_id: str) -> None:
+        """
+        Delete an entity
+        
+        Args:
+            entity_name (str): The name of the entity to delete
+            entity_id (str): The ID of the entity to delete
+        """
+        await self.request(f"{entity_name}({entity_id})", method="DELETE")
+
+    def batch(self, continue_on_error: bool = True) -> BatchRequest:
+        """
+        Start a new $batch request against this client's API
+        
+        Args:
+            continue_on_error (bool): Keep executing after a failed operation
+                outside a change set
+            
+        Returns:
+            BatchRequest: An empty batch to queue operations on
+        """
+        return BatchRequest(self.base_url, continue_on_error=continue_on_error)
+    
+    async def execute_batch(self, batch: BatchRequest) -> List[BatchResult]:
+        """
+        Send the operations queued on a batch
+        
+        The batch is sent as one $batch request per `max_operations`
+        operations; change sets are never split across requests. Each
+        $batch request counts once against `max_concurrency`.
+        
+        Args:
+            batch (BatchRequest): The batch to send
+            
+        Returns:
+            list: One BatchResult per queued operation, in order
+            
+        Raises:
+            httpx.HTTPStatusError: If a $batch request itself fails
+        """
+        results = []
+        for payload in batch.payloads():
+            headers = {**batch.headers, "Content-Type": payload.content_type}
+            
+            try:
+                response = await self._send(
+                    "POST",
+                    _build_url(self.base_url, "$batch"),
+                    content=payload.body.encode("utf-8"),
+                    headers=headers
+                )
+                response.raise_for_status()
+                
+            except httpx.HTTPStatusError as e:
+                _log_http_error(e)
+                raise
+            
+            except httpx.RequestError as e:
+                console.print(f"[bold red]Request Error:[/bold red] {e}")
+                raise
+            
+            results.extend(payload.parse_response(response.headers["Content-Type"], response.text))
+        
+        return results
+
+    async def close(self) -> None:
+        """Close the httpx client"""
+        await self.client.aclose()
@@ -0,0 +1,57 @@
+"""Dataverse client shared by the commands of a session."""
+
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from dataverse_api_cli.clients.auth import get_access_token
+from dataverse_api_cli.clients.dataverse import DataverseClient
+from dataverse_api_cli.config import get_config
+
+# Client of the running session, if any
+_shared_client: Optional[DataverseClient] = None
+
+def get_client() -> DataverseClient:
+    """
+    Get a client for one command.
+    
+    Inside a session this is the session's shared client; otherwise a new
+    client that the command closes with release_client.
+    
+    Returns:
+        DataverseClient: The client to use
+    """
+    if _shared_client is not None:
+        return _shared_client
+    return DataverseClient(get_config()["dataverse_endpoint"], get_access_token)
+
+def release_client(client: DataverseClient) -> None:
+    """
+    Release a client obtained from get_client, closing it unless it is shared.
+    
+    Args:
+        client (DataverseClient): The client to release
+    """
+    if client is not _shared_client:
+        client.close()
+
+@contextmanager
+def shared_client(http2: bool = False) -> Iterator[DataverseClient]:
+    """
+    Share one client, and its connections and token, between commands.
+    
+    Args:
+        http2 (bool): Negotiate HTTP/2 on the shared connections
+        
+    Yields:
+        DataverseClient: The shared client
+    """
+    global _shared_client
+    if _shared_client is not None:
+        raise RuntimeError("A shared client is already active")
+    client = DataverseClient(get_config()["dataverse_endpoint"], get_access_token, http2=http2)
+    _shared_client = client
+    try:
+        yield client
+    finally:
+        _shared_client = None
+        client.close()
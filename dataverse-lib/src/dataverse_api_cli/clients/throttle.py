@@ -0,0 +1,265 @@
+"""Rate governing and retries for Dataverse service protection limits."""
+
+import asyncio
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+import httpx
+
+from dataverse_api_cli.constants import (
+    DEFAULT_MAX_CONCURRENCY, DEFAULT_REQUEST_BURST, DEFAULT_REQUEST_RATE
+)
+
+# Headers reporting what is left of the service protection limits
+BURST_REMAINING_HEADER = "x-ms-ratelimit-burst-remaining-xrm-requests"
+TIME_REMAINING_HEADER = "x-ms-ratelimit-time-remaining-xrm-requests"
+
+# Seconds of execution time left in the 5 minute window below which
+# concurrency is reduced; Dataverse allows 1200 per window
+LOW_EXECUTION_TIME = 120.0
+
+# Seconds between checks for a free request slot in async code
+SLOT_POLL_INTERVAL = 0.01
+
+def _number(value: Optional[str]) -> Optional[float]:
+    """Parse a numeric header such as "1,199.5", or return None."""
+    try:
+        return float(str(value).replace(",", "")) if value is not None else None
+    except ValueError:
+        return None
+
+def retry_after(response: httpx.Response) -> Optional[float]:
+    """
+    Read the Retry-After header of a response.
+
+    Args:
+        response (httpx.Response): The response
+
+    Returns:
+        float: Seconds to wait, or None if the header is missing or invalid
+    """
+    value = response.headers.get("Retry-After")
+    if not isinstance(value, str):
+        return None
+    seconds = _number(value)
+    if seconds is not None:
+        return max(0.0, seconds)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+class RateGovernor:
+    """
+    Token bucket and adaptive concurrency limit for requests to one endpoint.
+
+    Requests start at up to `rate` per second, with bursts of `burst`, and
+    at most `concurrency` at once. The limits adapt to the responses: a 429
+    halves the rate and concurrency and pauses every request for its
+    Retry-After, a dwindling x-ms-ratelimit-* allowance slows requests down,
+    and each success raises both limits back towards their maximum. Clients
+    sharing a governor therefore settle near the highest throughput the
+    service sustains.
+
+    A governor is safe to share between threads and event loops.
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_REQUEST_RATE,
+        burst: int = DEFAULT_REQUEST_BURST,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ):
+        """
+        Initialize the governor.
+
+        Args:
+            rate (float): Maximum requests per second
+            burst (int): Requests that may be sent at once after a lull
+            max_concurrency (int): Maximum requests in flight
+        """
+        if rate <= 0 or burst < 1 or max_concurrency < 1:
+            raise ValueError("rate, burst and max_concurrency must be positive")
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.concurrency = float(max_concurrency)
+        self.in_flight = 0
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._condition = threading.Condition()
+
+    def _reserve(self) -> float:
+        """Take a token and a slot, or return the seconds to wait before trying again."""
+        now = time.monotonic()
+        if now < self._paused_until:
+            return self._paused_until - now
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self.in_flight >= int(self.concurrency):
+            return SLOT_POLL_INTERVAL
+        if self._tokens < 1:
+            return (1 - self._tokens) / self.rate
+        self._tokens -= 1
+        self.in_flight += 1
+        return 0.0
+
+    def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        with self._condition:
+            while True:
+                delay = self._reserve()
+                if not delay:
+                    return
+                self._condition.wait(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait, without blocking the event loop, until a request may be sent."""
+        while True:
+            with self._condition:
+                delay = self._reserve()
+            if not delay:
+                return
+            await asyncio.sleep(delay)
+
+    def release(self, response: Optional[httpx.Response] = None) -> None:
+        """
+        Free the slot of a finished request and adapt to its response.
+
+        Args:
+            response (httpx.Response, optional): The response, or None if
+                the request failed without one
+        """
+        with self._condition:
+            self.in_flight -= 1
+            if response is not None:
+                self._adapt(response)
+            self._condition.notify_all()
+
+    def _adapt(self, response: httpx.Response) -> None:
+        """Adjust the limits to a response."""
+        if response.status_code == 429:
+            self.rate = max(self.max_rate / 64, self.rate / 2)
+            self.concurrency = max(1.0, self.concurrency / 2)
+            delay = retry_after(response)
+            if delay:
+                self._paused_until = max(self._paused_until, time.monotonic() + delay)
+            return
+
+        burst_remaining = _number(response.headers.get(BURST_REMAINING_HEADER))
+        if burst_remaining is not None:
+            # Never hold more tokens than the service will still accept
+            self._tokens = min(self._tokens, burst_remaining)
+        time_remaining = _number(response.headers.get(TIME_REMAINING_HEADER))
+        if time_remaining is not None and time_remaining < LOW_EXECUTION_TIME:
+            self.concurrency = max(1.0, self.concurrency * 0.9)
+            return
+
+        # Additive increase: about one more slot per round of requests
+        self.concurrency = min(self.max_concurrency, self.concurrency + 1 / self.concurrency)
+        self.rate = min(self.max_rate, self.rate + self.max_rate / 100)
+
+class RetryPolicy:
+    """
+    When and after how long to retry a failed request.
+
+    Throttled (429) requests are always retried, after their Retry-After
+    or a jittered exponential backoff. Server errors and connection
+    failures are retried only for idempotent methods, as the request may
+    already have taken effect.
+    """
+
+    # Status codes of transient server errors
+    RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+    def __init__(self, max_attempts: int = 5, backoff: float = 1.0, max_backoff: float = 60.0):
+        """
+        Initialize the policy.
+
+        Args:
+            max_attempts (int): Attempts per request, including the first
+            backoff (float): Base delay in seconds, doubled per attempt
+            max_backoff (float): Maximum delay in seconds
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+    def should_retry(
+        self,
+        method: str,
+        attempt: int,
+        response: Optional[httpx.Response] = None,
+        error: Optional[Exception] = None
+    ) -> bool:
+        """
+        Decide whether to retry a request.
+
+        Args:
+            method (str): The HTTP method
+            attempt (int): The attempt that failed, starting at 1
+            response (httpx.Response, optional): The response received
+            error (Exception, optional): The error raised instead of a response
+
+        Returns:
+            bool: True if the request should be sent again
+        """
+        if attempt >= self.max_attempts:
+            return False
+        if response is not None and response.status_code == 429:
+            return True
+        if method.upper() not in self.IDEMPOTENT_METHODS:
+            return False
+        if error is not None:
+            return isinstance(error, httpx.TransportError)
+        return response is not None and response.status_code in self.RETRY_STATUSES
+
+    def delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """
+        Get the seconds to wait before the next attempt.
+
+        Args:
+            attempt (int): The attempt that failed, starting at 1
+            response (httpx.Response, optional): The response received
+
+        Returns:
+            float: The Retry-After of the response, or a random delay up to
+                the exponential backoff ("full jitter")
+        """
+        if response is not None:
+            seconds = retry_after(response)
+            if seconds is not None:
+                return min(seconds, self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+
+# Governors shared by all clients of an endpoint in this process
+_governors: Dict[str, RateGovernor] = {}
+_governors_lock = threading.Lock()
+
+def shared_governor(base_url: str) -> RateGovernor:
+    """
+    Get the governor shared by every client of an endpoint.
+
+    Service protection limits apply per user across all of their requests,
+    so clients of the same endpoint draw from one governor by default.
+
+    Args:
+        base_url (str): The Dataverse API base URL
+
+    Returns:
+        RateGovernor: The endpoint's governor
+    """
+    key = base_url.rstrip("/").lower()
+    with _governors_lock:
+        if key not in _governors:
+            _governors[key] = RateGovernor()
+        return _governors[key]
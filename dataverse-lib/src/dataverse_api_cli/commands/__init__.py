@@ -0,0 +1 @@
+"""Command modules for Dataverse API CLI."""
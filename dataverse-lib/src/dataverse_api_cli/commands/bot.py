@@ -0,0 +1,468 @@
+"""Bot commands for Dataverse API CLI."""
+
+import sys
+import json
+import click
+import yaml
+
+from dataverse_api_cli.utils.console import console, create_table
+from dataverse_api_cli.clients.shared import get_client, release_client
+from dataverse_api_cli.models.entities import EntityManager
+from dataverse_api_cli.constants import ComponentType
+
+@click.group()
+def bot():
+    """Commands for working with Dataverse bots."""
+    pass
+
+@bot.command(name="list")
+@click.option("--filter", help="OData filter expression")
+@click.option("--format", type=click.Choice(["table", "json"]), default="table", help="Output format")
+def list_bots(filter, format):
+    """
+    List bots from Dataverse.
+    
+    Examples:
+    
+        dataverse-api bot list
+        
+        dataverse-api bot list --filter="contains(name, 'MyBot')" --format=json
+    """
+    try:
+        client = get_client()
+        
+        # Get bots
+        bots = client.get_entities(
+            entity_name="bots",
+            select=["botid", "name", "statecode"],
+            filter=filter
+        )
+        
+        if format == "json":
+            console.print_json(json.dumps(bots))
+            return
+        
+        # Display as table
+        if not bots:
+            console.print("No bots found matching the criteria.")
+            return
+            
+        # Create table
+        table = create_table(f"Bots ({len(bots)})", ["Bot ID", "Name", "State"])
+        
+        # Add rows
+        for bot in bots:
+                
+            state = "Active" if bot.get("statecode") == 0 else "Inactive"
+            
+            table.add_row(
+                bot.get("botid", ""),
+                bot.get("name", ""),
+                state
+            )
+        
+        console.print(table)
+        
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        sys.exit(1)
+    finally:
+        if 'client' in locals():
+            release_client(client)
+
+@bot.command(name="get")
+@click.argument("bot_name_or_id")
+@click.option("--format", type=click.Choice(["table", "json"]), default="table", help="Output format")
+def get_bot(bot_name_or_id, format):
+    """
+    Get a specific bot by name or ID.
+    
+    Examples:
+    
+        dataverse-api bot get "My Bot"
+        
+        dataverse-api bot get 00000000-0000-0000-0000-000000000001 --format=json
+    """
+    try:
+        client = get_client()
+        entity_manager = EntityManager(client)
+        
+        # Check if bot_name_or_id is a GUID
+        is_guid = len(bot_name_or_id) == 36 and bot_name_or_id.count('-') == 4
+        
+        if is_guid:
+            bot = entity_manager.get_by_id("bots", bot_name_or_id)
+        else:
+            # Get bot by name
+            bot = entity_manager.get_by_name("bots", bot_name_or_id)
+        
+        if not bot:
+            console.print(f"No bot found with name or ID '{bot_name_or_id}'.")
+            return
+        
+        if format == "json":
+            console.print_json(json.dumps(bot))
+            return
+        
+        # Display as table
+        table = create_table(f"Bot: {bot.get('name', 'Unknown')}", ["Field", "Value"])
+        
+        # Add rows for important fields
+        for field in ["botid", "name", "description", "statecode"]:
+            value = bot.get(field, "")
+            if field == "statecode":
+                value = "Active" if value == 0 else "Inactive"
+            table.add_row(field, str(value))
+        
+        console.print(table)
+        
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        sys.exit(1)
+    finally:
+        if 'client' in locals():
+            release_client(client)
+
+@bot.command(name="components")
+@click.argument("bot_name_or_id")
+@click.option("--component-type", type=int, help="Filter by component type (e.g., 9 for TOPIC_V2)")
+@click.option("--filter", help="Additional OData filter expression")
+@click.option("--format", type=click.Choice(["table", "json"]), default="table", help="Output format")
+def list_bot_components(bot_name_or_id, component_type, filter, format):
+    """
+    List components for a specific bot.
+    
+    Component types:
+    0=Topic, 1=Skill, 2=Bot Variable, 3=Bot Entity, 4=Dialog, 5=Trigger,
+    6=Language Understanding, 7=Language Generation, 8=Dialog Schema,
+    9=Topic V2, 10=Bot Translations V2, 11=Bot Entity V2, 12=Bot Variable V2,
+    13=Skill V2, 14=Bot File Attachment, 15=Custom GPT, 16=Knowledge Source,
+    17=External Trigger, 18=Copilot Settings
+    
+    Examples:
+    
+        dataverse-api bot components "My Bot"
+        
+        dataverse-api bot components "My Bot" --component-type=9 --format=json
+    """
+    try:
+        client = get_client()
+        entity_manager = EntityManager(client)
+        
+        # Check if bot_name_or_id is a GUID
+        is_guid = len(bot_name_or_id) == 36 and bot_name_or_id.count('-') == 4
+        
+        if is_guid:
+            bot_id = bot_name_or_id
+            # Get bot name for display
+            bot = entity_manager.get_by_id("bots", bot_id)
+            bot_name = bot["name"] if bot else "Unknown Bot"
+        else:
+            # Get bot by name
+            bot = entity_manager.get_by_name("bots", bot_name_or_id)
+            
+            if not bot:
+                console.print(f"No bot found with name or ID '{bot_name_or_id}'.")
+                return
+                
+            bot_id = bot["botid"]
+            bot_name = bot["name"]
+        
+        # Build filter for components
+        filters = [f"_parentbotid_value eq '{bot_id}'"]
+        
+        if component_type is not None:
+            filters.append(f"componenttype eq {component_type}")
+            
+        if filter:
+            filters.append(filter)
+            
+        filter_expr = " and ".join(filters)
+        
+        # Get bot components
+        components = client.get_entities(
+            entity_name="botcomponents",
+            filter=filter_expr
+        )
+        
+        if format == "json":
+            console.print_json(json.dumps(components))
+            return
+        
+        # Display as table
+        if not components:
+            console.print(f"No components found for bot '{bot_name}' matching the criteria.")
+            return
+            
+        # Create table
+        table = create_table(
+            f"Components for Bot: {bot_name} ({len(components)})", 
+            ["Component ID", "Name", "Type", "Description"]
+        )
+        
+        # Add rows
+        for component in components:
+            component_type_value = component.get("componenttype")
+            component_type_name = (
+                ComponentType.get_name(component_type_value) 
+                if component_type_value is not None 
+                else "Unknown"
+            )
+            
+            description = ""
+            # Try to extract description from data field if available
+            if "data" in component:
+                try:
+                    yaml_data = yaml.safe_load(component["data"])
+                    description = yaml_data.get("modelDescription", "")
+                except:
+                    pass
+                    
+            # Truncate long description
+            if description and len(description) > 50:
+                description = description[:47] + "..."
+            
+            table.add_row(
+                component.get("botcomponentid", ""),
+                component.get("name", ""),
+                component_type_name,
+                description
+            )
+        
+        console.print(table)
+        
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        sys.exit(1)
+    finally:
+        if 'client' in locals():
+            release_client(client)
+
+@bot.command(name="get-component-field")
+@click.argument("bot_name_or_id")
+@click.argument("component_name_or_id")
+@click.argument("field_name")
+def get_bot_component_field(bot_name_or_id, component_name_or_id, field_name):
+    """
+    Get a field from a bot component's YAML data.
+    
+    Examples:
+    
+        dataverse-api bot get-component-field "My Bot" "My Topic" modelDescription
+    """
+    try:
+        client = get_client()
+        entity_manager = EntityManager(client)
+        
+        # Get the bot
+        bot_id = bot_name_or_id
+        if not (len(bot_name_or_id) == 36 and bot_name_or_id.count('-') == 4):
+            # Get bot by name
+            bot = entity_manager.get_by_name("bots", bot_name_or_id)
+            if not bot:
+                console.print(f"[bold red]Error:[/bold red] Bot '{bot_name_or_id}' not found")
+                sys.exit(1)
+            bot_id = bot["botid"]
+        
+        # Get the component
+        component_id = component_name_or_id
+        if not (len(component_name_or_id) == 36 and component_name_or_id.count('-') == 4):
+            # Get component by name
+            components = client.get_entities(
+                entity_name="botcomponents",
+                filter=f"_parentbotid_value eq '{bot_id}' and name eq '{component_name_or_id}'"
+            )
+            if not components:
+                console.print(f"[bold red]Error:[/bold red] Component '{component_name_or_id}' not found for bot '{bot_name_or_id}'")
+                sys.exit(1)
+            component_id = components[0]["botcomponentid"]
+        
+        # Get the field value
+        field_value = entity_manager.get_yaml_field("botcomponents", component_id, field_name)
+        
+        # Print the field value
+        console.print(field_value)
+        
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        sys.exit(1)
+    finally:
+        if 'client' in locals():
+            release_client(client)
+
+
+@bot.command(name="update-component-field")
+@click.argument("bot_name_or_id")
+@click.argument("component_name_or_id")
+@click.argument("field_name")
+@click.argument("field_value")
+def update_yaml_field(self, entity_name, entity_id, field_name, field_value):
+    """
+    Update a specific field in a YAML document within an entity record.
+    Ensures proper formatting compatible with PowerApps YAML renderer.
+    """
+    # First, get the current entity data
+    entity_data = self.client.get_entity(entity_name, entity_id)
+    
+    if not entity_data:
+        raise Exception(f"Entity {entity_name} with ID {entity_id} not found")
+    
+    # Find the property containing YAML (likely 'serializeddata' or similar)
+    yaml_property = None
+    for prop in entity_data:
+        if prop.lower().endswith('data') and isinstance(entity_data[prop], str):
+            try:
+                # Try to parse as YAML to see if this is the right field
+                yaml_data = yaml.safe_load(entity_data[prop])
+                if isinstance(yaml_data, dict):  # YAML should parse to a dictionary
+                    yaml_property = prop
+                    break
+            except:
+                continue
+    
+    if not yaml_property:
+        raise Exception(f"Could not find YAML data property in entity {entity_name}")
+    
+    # Parse the YAML
+    try:
+        yaml_content = yaml.safe_load(entity_data[yaml_property])
+    except Exception as e:
+        raise Exception(f"Failed to parse YAML data: {e}")
+    
+    # Update the field - support for nested fields using dot notation
+    if '.' in field_name:
+        # Handle nested fields like 'parent.child.property'
+        parts = field_name.split('.')
+        current = yaml_content
+        for part in parts[:-1]:
+            if part not in current:
+                current[part] = {}
+            current = current[part]
+        current[parts[-1]] = field_value
+    else:
+        # Direct field update
+        yaml_content[field_name] = field_value
+    
+    # Convert back to YAML with consistent formatting
+    # Note: Using literal style (|) for multiline strings 
+    # and ensuring unix-style line endings
+    yaml_str = yaml.dump(
+        yaml_content, 
+        default_flow_style=False,  # Use block style, not JSON-like flow style
+        allow_unicode=True,        # Support unicode characters
+        sort_keys=False,           # Preserve key ordering
+        width=80,                  # Set reasonable line width
+        indent=2                   # Use 2 spaces for indentation
+    )
+    
+    # Ensure LF line endings (unix style) even if on Windows
+    yaml_str = yaml_str.replace('\r\n', '\n')
+    
+    # Update entity
+    self.client.update_entity(
+        entity_name=entity_name,
+        entity_id=entity_id,
+        data={
+            yaml_property: yaml_str
+        }
+    )
+    
+    return True
+
+
+@bot.command(name="update-component-field")
+@click.argument("bot_name_or_id")
+@click.argument("component_name_or_id")
+@click.argument("field_name")
+@click.argument("field_value")
+def update_bot_component_field(bot_name_or_id, component_name_or_id, field_name, field_value):
+    """
+    Update a field in a bot component's YAML data.
+    
+    Examples:
+    
+        dataverse-api bot update-component-field "My Bot" "My Topic" modelDescription "New description"
+    """
+    try:
+        client = get_client()
+        entity_manager = EntityManager(client)
+        
+        # Get the bot
+        bot_id = bot_name_or_id
+        if not (len(bot_name_or_id) == 36 and bot_name_or_id.count('-') == 4):
+            # Get bot by name
+            bot = entity_manager.get_by_name("bots", bot_name_or_id)
+            if not bot:
+                console.print(f"[bold red]Error:[/bold red] Bot '{bot_name_or_id}' not found")
+                sys.exit(1)
+            bot_id = bot["botid"]
+        
+        # Get the component
+        component_id = component_name_or_id
+        if not (len(component_name_or_id) == 36 and component_name_or_id.count('-') == 4):
+            # Get component by name
+            components = client.get_entities(
+                entity_name="botcomponents",
+                filter=f"_parentbotid_value eq '{bot_id}' and name eq '{component_name_or_id}'"
+            )
+            if not components:
+                console.print(f"[bold red]Error:[/bold red] Component '{component_name_or_id}' not found for bot '{bot_name_or_id}'")
+                sys.exit(1)
+            component_id = components[0]["botcomponentid"]
+        
+        # Get current component data
+        component = entity_manager.get_by_id("botcomponents", component_id)
+        
+        if not component or "data" not in component:
+            console.print(f"[bold red]Error:[/bold red] Component does not contain YAML data")
+            sys.exit(1)
+            
+        # Parse YAML data
+        try:
+            yaml_data = yaml.safe_load(component["data"])
+        except Exception as e:
+            console.print(f"[bold red]Error:[/bold red] Failed to parse YAML data: {e}")
+            sys.exit(1)
+        
+        # Update the field (support for nested fields using dot notation)
+        if '.' in field_name:
+            parts = field_name.split('.')
+            current = yaml_data
+            for i, part in enumerate(parts):
+                if i == len(parts) - 1:
+                    current[part] = field_value
+                else:
+                    if part not in current:
+                        current[part] = {}
+                    current = current[part]
+        else:
+            yaml_data[field_name] = field_value
+        
+        # Convert YAML to string with Windows line endings
+        dumped_yaml = yaml.dump(
+            yaml_data, 
+            default_flow_style=False,  # Use block style formatting
+            sort_keys=False,           # Preserve key order
+            width=80,                  # Standard line width
+            allow_unicode=True,        # Support unicode characters
+            indent=2                   # 2-space indentation
+        )
+        
+        # Always use Windows-style line endings as expected by Power Apps
+        updated_yaml = dumped_yaml.replace('\n', '\r\n')
+        
+        # Update the component
+        client.update_entity(
+            entity_name="botcomponents",
+            entity_id=component_id,
+            data={"data": updated_yaml}
+        )
+        
+        console.print(f"[bold green]✓[/bold green] Successfully updated field '{field_name}' for component '{component_name_or_id}'")
+        
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        sys.exit(1)
+    finally:
+        if 'client' in locals():
+            release_client(client)
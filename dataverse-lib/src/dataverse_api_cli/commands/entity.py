@@ -0,0 +1,258 @@
+"""Entity commands for Dataverse API CLI."""
+
+import sys
+import json
+import click
+
+from dataverse_api_cli.utils.console import console, create_table
+from dataverse_api_cli.clients.shared import get_client, release_client
+
+@click.group()
+def entity():
+    """Commands for working with Dataverse entities."""
+    pass
+
+@entity.command(name="list")
+@click.argument("entity_name")
+@click.option("--select", help="Comma-separated list of fields to select")
+@click.option("--filter", help="OData filter expression")
+@click.option("--top", type=int, help="Maximum number of records to return")
+@click.option("--order-by", help="Field to order results by")
+@click.option("--format", type=click.Choice(["table", "json"]), default="table", help="Output format")
+def list_entities(entity_name, select, filter, top, order_by, format):
+    """
+    List entities from Dataverse.
+    
+    Examples:
+    
+        dataverse-api entity list contacts --select=fullname,emailaddress1 --filter="contains(emailaddress1, 'example.com')"
+        
+        dataverse-api entity list bots --filter="contains(name, 'MyBot')" --format=json
+    """
+    try:
+        client = get_client()
+        
+        # Process select option
+        select_fields = select.split(",") if select else None
+        
+        # Get entities
+        entities = client.get_entities(
+            entity_name=entity_name,
+            select=select_fields,
+            filter=filter,
+            top=top,
+            order_by=order_by
+        )
+        
+        if format == "json":
+            console.print_json(json.dumps(entities))
+            return
+        
+        # Display as table
+        if not entities:
+            console.print(f"No {entity_name} found matching the criteria.")
+            return
+            
+        # Get fields to display
+        if select_fields:
+            display_fields = select_fields
+        else:
+            # Get fields from first entity
+            display_fields = list(entities[0].keys())
+            # Remove some common fields that are not useful for display
+            for field in ["@odata.etag", "versionnumber", "createdon", "modifiedon"]:
+                if field in display_fields:
+                    display_fields.remove(field)
+            # Limit to a reasonable number of fields
+            display_fields = display_fields[:5]
+        
+        # Create table
+        table = create_table(f"{entity_name.title()} ({len(entities)})", display_fields)
+        
+        # Add rows
+        for entity in entities:
+            row = []
+            for field in display_fields:
+                value = entity.get(field, "")
+                # Truncate long values
+                if isinstance(value, str) and len(value) > 50:
+                    value = value[:47] + "..."
+                row.append(str(value))
+            table.add_row(*row)
+        
+        console.print(table)
+        
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        sys.exit(1)
+    finally:
+        if 'client' in locals():
+            release_client(client)
+
+@entity.command(name="get")
+@click.argument("entity_name")
+@click.argument("entity_id")
+@click.option("--select", help="Comma-separated list of fields to select")
+@click.option("--expand", help="Comma-separated list of relationships to expand")
+@click.option("--format", type=click.Choice(["table", "json"]), default="table", help="Output format")
+def get_entity(entity_name, entity_id, select, expand, format):
+    """
+    Get a specific entity by ID.
+    
+    Examples:
+    
+        dataverse-api entity get contacts 00000000-0000-0000-0000-000000000001
+        
+        dataverse-api entity get bots 00000000-0000-0000-0000-000000000001 --format=json
+    """
+    try:
+        client = get_client()
+        
+        entity = client.get_entity_by_id(
+            entity_name=entity_name,
+            entity_id=entity_id,
+            select=select,
+            expand=expand
+        )
+        
+        if format == "json":
+            console.print_json(json.dumps(entity))
+            return
+        
+        # Display as table
+        if not entity:
+            console.print(f"No {entity_name} found with ID {entity_id}.")
+            return
+            
+        # Create table
+        table = create_table(f"{entity_name.title()} Details", ["Field", "Value"])
+        
+        # Add rows
+        for field, value in entity.items():
+            # Skip @odata fields
+            if field.startswith("@odata"):
+                continue
+            
+            # Format value
+            if isinstance(value, dict) or isinstance(value, list):
+                formatted_value = json.dumps(value, indent=2)
+            else:
+                formatted_value = str(value)
+                
+            # Truncate long values
+            if len(formatted_value) > 80:
+                formatted_value = formatted_value[:77] + "..."
+                
+            table.add_row(field, formatted_value)
+        
+        console.print(table)
+        
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        sys.exit(1)
+    finally:
+        if 'client' in locals():
+            release_client(client)
+
+@entity.command(name="create")
+@click.argument("entity_name")
+@click.argument("data_file", type=click.Path(exists=True, readable=True))
+def create_entity(entity_name, data_file):
+    """
+    Create a new entity.
+    
+    DATA_FILE should be a JSON file containing the entity data.
+    
+    Examples:
+    
+        dataverse-api entity create contacts contact_data.json
+        
+        dataverse-api entity create bots bot_data.json
+    """
+    try:
+        # Load data from file
+        with open(data_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        client = get_client()
+        
+        # Create entity
+        result = client.create_entity(entity_name, data)
+        
+        console.print(f"[bold green]✓[/bold green] Successfully created {entity_name} entity")
+        console.print(f"Entity ID: {result.get('id', 'Unknown')}")
+        
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        sys.exit(1)
+    finally:
+        if 'client' in locals():
+            release_client(client)
+
+@entity.command(name="update")
+@click.argument("entity_name")
+@click.argument("entity_id")
+@click.argument("data_file", type=click.Path(exists=True, readable=True))
+def update_entity(entity_name, entity_id, data_file):
+    """
+    Update an existing entity.
+    
+    DATA_FILE should be a JSON file containing the entity data to update.
+    
+    Examples:
+    
+        dataverse-api entity update contacts 00000000-0000-0000-0000-000000000001 contact_updates.json
+        
+        dataverse-api entity update bots 00000000-0000-0000-0000-000000000001 bot_updates.json
+    """
+    try:
+        # Load data from file
+        with open(data_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        client = get_client()
+        
+        # Update entity
+        client.update_entity(entity_name, entity_id, data)
+        
+        console.print(f"[bold green]✓[/bold green] Successfully updated {entity_name} entity with ID {entity_id}")
+        
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        sys.exit(1)
+    finally:
+        if 'client' in locals():
+            release_client(client)
+
+@entity.command(name="delete")
+@click.argument("entity_name")
+@click.argument("entity_id")
+@click.option("--confirm/--no-confirm", default=True, help="Confirm before deleting")
+def delete_entity(entity_name, entity_id, confirm):
+    """
+    Delete an entity.
+    
+    Examples:
+    
+        dataverse-api entity delete contacts 00000000-0000-0000-0000-000000000001
+        
+        dataverse-api entity delete bots 00000000-0000-0000-0000-000000000001 --no-confirm
+    """
+    try:
+        if confirm and not click.confirm(f"Are you sure you want to delete the {entity_name} entity with ID {entity_id}?"):
+            console.print("Deletion cancelled.")
+            return
+        
+        client = get_client()
+        
+        # Delete entity
+        client.delete_entity(entity_name, entity_id)
+        
+        console.print(f"[bold green]✓[/bold green] Successfully deleted {entity_name} entity with ID {entity_id}")
+        
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        sys.exit(1)
+    finally:
+        if 'client' in locals():
+            release_client(client)
@@ -0,0 +1,177 @@
+"""Entity definition commands for Dataverse API CLI."""
+
+import sys
+import json
+import click
+
+from dataverse_api_cli.utils.console import console, create_table
+from dataverse_api_cli.clients.shared import get_client, release_client
+
+@click.group(name="entity-definition")
+def entity_definition():
+    """Commands for working with Dataverse entity definitions."""
+    pass
+
+@entity_definition.command(name="list")
+@click.option("--filter", help="OData filter expression")
+@click.option("--format", type=click.Choice(["table", "json"]), default="table", help="Output format")
+def list_entity_definitions(filter, format):
+    """
+    List entity definitions from Dataverse.
+    
+    Examples:
+    
+        dataverse-api entity-definition list
+        
+        dataverse-api entity-definition list --filter="contains(LogicalName, 'account')" --format=json
+    """
+    try:
+        client = get_client()
+        
+        # Get entity definitions
+        entity_defs = client.get_entities(
+            entity_name="EntityDefinitions",
+            select=["LogicalName", "DisplayName", "Description", "IsCustomEntity"],
+            filter=filter,
+            order_by="LogicalName"
+        )
+        
+        if format == "json":
+            console.print_json(json.dumps(entity_defs))
+            return
+        
+        # Display as table
+        if not entity_defs:
+            console.print("No entity definitions found matching the criteria.")
+            return
+            
+        # Create table
+        table = create_table(
+            f"Entity Definitions ({len(entity_defs)})", 
+            ["Logical Name", "Display Name", "Custom Entity", "Description"]
+        )
+        
+        # Add rows
+        for entity_def in entity_defs:
+            display_name = ""
+            if "DisplayName" in entity_def:
+                display_name = entity_def["DisplayName"].get("UserLocalizedLabel", {}).get("Label", "")
+                
+            description = ""
+            if "Description" in entity_def:
+                description = entity_def["Description"].get("UserLocalizedLabel", {}).get("Label", "")
+                
+            # Truncate long description
+            if description and len(description) > 50:
+                description = description[:47] + "..."
+                
+            is_custom = "Yes" if entity_def.get("IsCustomEntity") else "No"
+            
+            table.add_row(
+                entity_def.get("LogicalName", ""),
+                display_name,
+                is_custom,
+                description
+            )
+        
+        console.print(table)
+        
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        sys.exit(1)
+    finally:
+        if 'client' in locals():
+            release_client(client)
+
+@entity_definition.command(name="get")
+@click.argument("entity_logical_name")
+@click.option("--format", type=click.Choice(["table", "json"]), default="table", help="Output format")
+def get_entity_definition(entity_logical_name, format):
+    """
+    Get a specific entity definition.
+    
+    Examples:
+    
+        dataverse-api entity-definition get account
+        
+        dataverse-api entity-definition get contact --format=json
+    """
+    try:
+        client = get_client()
+        
+        # Get entity definitions by filter
+        entity_defs = client.get_entities(
+            entity_name="EntityDefinitions",
+            filter=f"LogicalName eq '{entity_logical_name}'",
+            expand="Attributes($select=LogicalName,DisplayName,AttributeType,Description)"
+        )
+        
+        if not entity_defs:
+            console.print(f"No entity definition found with logical name '{entity_logical_name}'.")
+            return
+            
+        entity_def = entity_defs[0]
+        
+        if format == "json":
+            console.print_json(json.dumps(entity_def))
+            return
+        
+        # Display as table
+        display_name = ""
+        if "DisplayName" in entity_def:
+            display_name = entity_def["DisplayName"].get("UserLocalizedLabel", {}).get("Label", "")
+            
+        description = ""
+        if "Description" in entity_def:
+            description = entity_def["Description"].get("UserLocalizedLabel", {}).get("Label", "")
+            
+        # Create table for entity info
+        entity_table = create_table(
+            f"Entity Definition: {entity_logical_name}", 
+            ["Property", "Value"]
+        )
+        
+        entity_table.add_row("Logical Name", entity_def.get("LogicalName", ""))
+        entity_table.add_row("Display Name", display_name)
+        entity_table.add_row("Description", description)
+        entity_table.add_row("Custom Entity", "Yes" if entity_def.get("IsCustomEntity") else "No")
+        
+        console.print(entity_table)
+        
+        # Create table for attributes
+        if "Attributes" in entity_def:
+            attributes = entity_def["Attributes"]
+            
+            attr_table = create_table(
+                f"Attributes ({len(attributes)})", 
+                ["Logical Name", "Display Name", "Type", "Description"]
+            )
+            
+            for attr in attributes:
+                attr_display_name = ""
+                if "DisplayName" in attr:
+                    attr_display_name = attr["DisplayName"].get("UserLocalizedLabel", {}).get("Label", "")
+                    
+                attr_description = ""
+                if "Description" in attr:
+                    attr_description = attr["Description"].get("UserLocalizedLabel", {}).get("Label", "")
+                    
+                # Truncate long description
+                if attr_description and len(attr_description) > 50:
+                    attr_description = attr_description[:47] + "..."
+                    
+                attr_table.add_row(
+                    attr.get("LogicalName", ""),
+                    attr_display_name,
+                    attr.get("AttributeType", ""),
+                    attr_description
+                )
+                
+            console.print(attr_table)
+        
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        sys.exit(1)
+    finally:
+        if 'client' in locals():
+            release_client(client)
@@ -0,0 +1,113 @@
+"""Model description command for Dataverse API CLI."""
+
+import sys
+import click
+from typing import Optional
+import yaml
+
+from dataverse_api_cli.utils.console import console
+from dataverse_api_cli.clients.shared import get_client, release_client
+from dataverse_api_cli.models.entities import EntityManager
+from dataverse_api_cli.constants import ComponentType
+
+# Keep the original command for backward compatibility
+@click.command(name="update-model-description")
+@click.argument("bot_name")
+@click.option("--component-id", help="Specific component ID to update")
+@click.option("--component-type", type=int, default=ComponentType.TOPIC_V2, 
+              help="Component type to filter by (default: 9 - TOPIC_V2)")
+@click.option("--description", help="New model description (interactive prompt if not provided)")
+def update_model_description(
+    bot_name: str, 
+    component_id: Optional[str] = None, 
+    component_type: int = ComponentType.TOPIC_V2,
+    description: Optional[str] = None
+):
+    """
+    Update model description for a bot component.
+    
+    Examples:
+    
+        dataverse-api update-model-description "MyBot"
+        
+        dataverse-api update-model-description "MyBot" --component-type=9 --description="New description"
+    """
+    try:
+        client = get_client()
+        entity_manager = EntityManager(client)
+        
+        # Get the bot
+        bot = entity_manager.get_by_name("bots", bot_name)
+        
+        if not bot:
+            console.print(f"[bold red]Error:[/bold red] Bot '{bot_name}' not found")
+            sys.exit(1)
+            
+        # If component_id is not provided, find components by filter
+        if not component_id:
+            # Build filter for components
+            filters = [f"_parentbotid_value eq '{bot['botid']}'"]
+            filters.append(f"componenttype eq {component_type}")
+            filters.append("contains(data, 'modelDescription')")
+            
+            filter_expr = " and ".join(filters)
+            
+            # Get bot components
+            components = client.get_entities(
+                entity_name="botcomponents",
+                filter=filter_expr
+            )
+            
+            if not components:
+                console.print(
+                    f"[bold red]Error:[/bold red] No components found for bot '{bot_name}' "
+                    f"with component type {component_type}"
+                )
+                sys.exit(1)
+                
+            component = components[0]
+            component_id = component["botcomponentid"]
+        else:
+            # Get the component directly
+            component = client.get_entity_by_id("botcomponents", component_id)
+            if not component:
+                console.print(f"[bold red]Error:[/bold red] Component with ID {component_id} not found")
+                sys.exit(1)
+            
+        # If description not provided, prompt for it
+        if not description:
+            # Display current description if available
+            try:
+                yaml_data = yaml.safe_load(component["data"])
+                current_desc = yaml_data.get("modelDescription", "None")
+                console.print(f"Current model description: [italic]{current_desc}[/italic]")
+            except Exception:
+                console.print("[yellow]Could not parse current model description[/yellow]")
+            
+            description = click.prompt("Enter new model description")
+        
+        # Parse YAML data
+        yaml_data = yaml.safe_load(component["data"])
+        
+        # Update model description
+        yaml_data["modelDescription"] = description
+        
+        # Dump YAML data with Windows line endings (CRLF)
+        dumped_yaml = yaml.dump(yaml_data, default_flow_style=False)
+        updated_yaml = dumped_yaml.replace('\n', '\r\n')
+        
+        # Update the component
+        client.update_entity(
+            entity_name="botcomponents",
+            entity_id=component_id,
+            data={"data": updated_yaml}
+        )
+        
+        console.print(f"[bold green]✓[/bold green] Successfully updated model description for component {component_id}")
+        
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        sys.exit(1)
+    finally:
+        if 'client' in locals():
+            release_client(client)
@@ -0,0 +1,117 @@
+"""Session command for Dataverse API CLI."""
+
+import importlib.util
+import shlex
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Iterator, List, Optional
+
+import click
+
+from dataverse_api_cli.utils.console import console
+from dataverse_api_cli.clients.auth import get_access_token
+from dataverse_api_cli.clients.shared import shared_client
+
+# Script line that waits for the commands before it to finish
+WAIT = "wait"
+
+def read_batches(lines: IO[str], concurrent: bool = True) -> Iterator[List[List[str]]]:
+    """
+    Split a session script into batches of commands.
+
+    Each non-empty line is one command, split like a shell would; `#` starts
+    a comment. A `wait` line ends a batch.
+
+    Args:
+        lines: The script
+        concurrent (bool): Whether to batch commands at all; when False,
+            each command is yielded as soon as it is read
+
+    Yields:
+        list: The commands of each batch, as argument lists
+    """
+    batch = []
+    for line in lines:
+        args = shlex.split(line, comments=True)
+        if args == [WAIT]:
+            if batch:
+                yield batch
+            batch = []
+        elif args:
+            batch.append(args)
+            if not concurrent:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+def run_command(args: List[str]) -> int:
+    """
+    Run one command of a session.
+
+    Args:
+        args (list): The command's arguments, without the program name
+
+    Returns:
+        int: The command's exit code
+    """
+    from dataverse_api_cli.cli import cli
+
+    if args[0] == "session":
+        console.print("[bold red]Error:[/bold red] Sessions cannot be nested")
+        return 2
+    try:
+        cli.main(args=args, prog_name="dataverse-api", standalone_mode=False)
+    except click.exceptions.Abort:
+        return 1
+    except click.ClickException as e:
+        e.show()
+        return e.exit_code
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else 1
+    return 0
+
+@click.command(name="session")
+@click.argument("script", type=click.File("r"), default="-")
+@click.option("--jobs", "-j", type=click.IntRange(min=1), default=1,
+              help="Number of commands to run at once")
+@click.option("--http2/--http1", default=None,
+              help="Use HTTP/2 (default: when the h2 package is installed)")
+@click.option("--stop-on-error", is_flag=True, help="Stop at the first failing command")
+def session(script, jobs: int, http2: Optional[bool], stop_on_error: bool):
+    """
+    Run many commands over one authenticated connection.
+
+    Commands are read one per line from SCRIPT, or from stdin, and written as
+    they would follow `dataverse-api`. They share one access token and one
+    keep-alive connection pool. With --jobs, the commands between `wait` lines
+    run concurrently, so their output may interleave; --stop-on-error then
+    stops after the batch with the failure.
+
+    Examples:
+
+        printf 'bot list\\nentity list contacts --top=5\\n' | dataverse-api session
+
+        dataverse-api session commands.txt --jobs=8
+    """
+    if http2 is None:
+        http2 = importlib.util.find_spec("h2") is not None
+    failures = 0
+
+    with shared_client(http2=http2), ThreadPoolExecutor(max_workers=jobs) as executor:
+        # Authenticate once up front rather than in every command
+        try:
+            get_access_token()
+        except Exception as e:
+            console.print(f"[bold red]Error:[/bold red] {e}")
+            sys.exit(1)
+        for batch in read_batches(script, concurrent=jobs > 1):
+            for code in executor.map(run_command, batch):
+                if code:
+                    failures += 1
+            if failures and stop_on_error:
+                break
+
+    if failures:
+        console.print(f"[bold red]{failures} command(s) failed[/bold red]")
+        sys.exit(1)
@@ -0,0 +1,249 @@
+"""Transcript commands for Dataverse API CLI."""
+
+import asyncio
+import json
+import os
+import sys
+from datetime import timedelta, timezone
+from typing import Optional
+
+import click
+
+from dataverse_api_cli.utils.console import console
+from dataverse_api_cli.clients.auth import get_access_token
+from dataverse_api_cli.clients.dataverse import AsyncDataverseClient
+from dataverse_api_cli.clients.shared import get_client, release_client
+from dataverse_api_cli.config import get_config
+from dataverse_api_cli.constants import DEFAULT_MAX_CONCURRENCY
+from dataverse_api_cli.models.entities import EntityManager
+from dataverse_api_cli.models.transcript_store import TranscriptStore
+from dataverse_api_cli.models.transcripts import TranscriptExporter, TranscriptSync
+from dataverse_api_cli.utils.export import FORMATS, Checkpoint
+
+def resolve_bot_id(bot_name_or_id: str) -> Optional[str]:
+    """
+    Resolve a bot name or ID to the bot's ID.
+
+    Args:
+        bot_name_or_id (str): The bot's name or ID
+
+    Returns:
+        str: The bot ID, or None if no bot matches
+    """
+    if len(bot_name_or_id) == 36 and bot_name_or_id.count('-') == 4:
+        return bot_name_or_id
+    client = get_client()
+    try:
+        bot = EntityManager(client).get_by_name("bots", bot_name_or_id)
+        return bot["botid"] if bot else None
+    finally:
+        release_client(client)
+
+@click.group()
+def transcripts():
+    """Commands for working with conversation transcripts."""
+    pass
+
+@transcripts.command(name="export")
+@click.option("--output", "-o", "output_dir", required=True, type=click.Path(file_okay=False),
+              help="Directory for the partitioned output files")
+@click.option("--bot", "bot_name_or_id", help="Only export transcripts of this bot (name or ID)")
+@click.option("--format", type=click.Choice(list(FORMATS)), default="jsonl", help="Output format")
+@click.option("--cursor", "cursor_field", type=click.Choice(["modifiedon", "createdon"]),
+              default="modifiedon", help="Column that selects and partitions transcripts")
+@click.option("--since", type=click.DateTime(), help="Start of the export (UTC), overriding the checkpoint")
+@click.option("--until", type=click.DateTime(), help="End of the export (UTC; default: now)")
+@click.option("--window-hours", type=click.IntRange(min=1), default=24,
+              help="Hours of transcripts per output file")
+@click.option("--concurrency", type=click.IntRange(1, DEFAULT_MAX_CONCURRENCY), default=4,
+              help="Windows fetched at once")
+@click.option("--page-size", type=click.IntRange(1, 5000), default=500, help="Transcripts per page")
+@click.option("--checkpoint", "checkpoint_path", type=click.Path(dir_okay=False),
+              help="Checkpoint file (default: OUTPUT/_checkpoint.json)")
+def export_transcripts(
+    output_dir, bot_name_or_id, format, cursor_field, since, until,
+    window_hours, concurrency, page_size, checkpoint_path
+):
+    """
+    Export conversation transcripts as one row per activity.
+
+    Transcripts are fetched in time windows, several at once, and written to
+    OUTPUT/date=YYYY-MM-DD/ as JSON lines or Parquet. Progress is checkpointed,
+    so running the same command again continues where the last run stopped.
+
+    Examples:
+
+        dataverse-api transcripts export -o exports/transcripts --bot "My Bot"
+
+        dataverse-api transcripts export -o exports/transcripts --format=parquet --since=2024-05-01
+    """
+    try:
+        bot_id = None
+        if bot_name_or_id:
+            bot_id = resolve_bot_id(bot_name_or_id)
+            if not bot_id:
+                console.print(f"[bold red]Error:[/bold red] Bot '{bot_name_or_id}' not found")
+                sys.exit(1)
+
+        checkpoint = Checkpoint(checkpoint_path or os.path.join(output_dir, "_checkpoint.json"))
+        stats = asyncio.run(run_export(
+            output_dir=output_dir,
+            format=format,
+            bot_id=bot_id,
+            cursor_field=cursor_field,
+            window=timedelta(hours=window_hours),
+            page_size=page_size,
+            concurrency=concurrency,
+            checkpoint=checkpoint,
+            start=since.replace(tzinfo=timezone.utc) if since else None,
+            end=until.replace(tzinfo=timezone.utc) if until else None,
+        ))
+
+        console.print(
+            f"[bold green]✓[/bold green] Exported {stats.activities} activities from "
+            f"{stats.transcripts} transcripts into {stats.files} files"
+        )
+        if stats.skipped:
+            console.print(f"[yellow]Skipped {stats.skipped} transcripts with unreadable content[/yellow]")
+        if checkpoint.get("cursor"):
+            console.print(f"Checkpoint: {checkpoint.get('cursor')}")
+
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        sys.exit(1)
+
+async def run_export(start, end, concurrency, **options):
+    """Run a TranscriptExporter over its own async client."""
+    async with AsyncDataverseClient(
+        get_config()["dataverse_endpoint"], get_access_token, max_concurrency=concurrency
+    ) as client:
+        exporter = TranscriptExporter(client, concurrency=concurrency, **options)
+        return await exporter.run(start=start, end=end)
+
+@transcripts.command(name="sync")
+@click.option("--output", "-o", "output_dir", required=True, type=click.Path(file_okay=False),
+              help="Directory for the change files")
+@click.option("--bot", "bot_name_or_id", help="Only sync transcripts of this bot (name or ID)")
+@click.option("--format", type=click.Choice(list(FORMATS)), default="jsonl", help="Output format")
+@click.option("--page-size", type=click.IntRange(1, 5000), default=500, help="Transcripts per page")
+@click.option("--state", "state_path", type=click.Path(dir_okay=False),
+              help="Sync state file (default: OUTPUT/_sync_state.json)")
+@click.option("--full", is_flag=True, help="Discard the saved delta link and read every transcript again")
+def sync_transcripts(output_dir, bot_name_or_id, format, page_size, state_path, full):
+    """
+    Sync the conversation transcripts changed since the last sync.
+
+    Uses Dataverse change tracking: the first sync reads every transcript,
+    later ones only those created, updated or deleted since the delta link
+    saved in the state file. Changes go to OUTPUT/date=YYYY-MM-DD/ as one
+    file per sync, with a row per activity of each changed transcript and a
+    row per deleted transcript.
+
+    Examples:
+
+        dataverse-api transcripts sync -o exports/changes --bot "My Bot"
+
+        dataverse-api transcripts sync -o exports/changes --full
+    """
+    client = None
+    try:
+        bot_id = None
+        if bot_name_or_id:
+            bot_id = resolve_bot_id(bot_name_or_id)
+            if not bot_id:
+                console.print(f"[bold red]Error:[/bold red] Bot '{bot_name_or_id}' not found")
+                sys.exit(1)
+
+        state = Checkpoint(state_path or os.path.join(output_dir, "_sync_state.json"))
+        if full:
+            state.state = {}
+
+        client = get_client()
+        stats = TranscriptSync(client, state, bot_id=bot_id, page_size=page_size).run(output_dir, format)
+
+        console.print(
+            f"[bold green]✓[/bold green] Synced {stats.upserted} changed and {stats.deleted} deleted "
+            f"transcripts ({stats.activities} activities)"
+        )
+        if stats.skipped:
+            console.print(f"[yellow]Skipped {stats.skipped} transcripts with unreadable content[/yellow]")
+
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        sys.exit(1)
+    finally:
+        if client is not None:
+            release_client(client)
+
+@transcripts.command(name="index")
+@click.argument("database", type=click.Path(dir_okay=False))
+@click.option("--bot", "bot_name_or_id", help="Only store transcripts of this bot (name or ID)")
+@click.option("--page-size", type=click.IntRange(1, 5000), default=500, help="Transcripts per page")
+@click.option("--full", is_flag=True, help="Discard the stored transcripts and read every transcript again")
+def index_transcripts(database, bot_name_or_id, page_size, full):
+    """
+    Update a local SQLite store of conversation transcripts.
+
+    The store indexes transcripts by conversation, bot, user and start time,
+    so rehydration can find a previous conversation without querying
+    Dataverse. Each run applies only the changes since the last one.
+
+    Examples:
+
+        dataverse-api transcripts index transcripts.db --bot "My Bot"
+    """
+    client = None
+    try:
+        bot_id = None
+        if bot_name_or_id:
+            bot_id = resolve_bot_id(bot_name_or_id)
+            if not bot_id:
+                console.print(f"[bold red]Error:[/bold red] Bot '{bot_name_or_id}' not found")
+                sys.exit(1)
+
+        client = get_client()
+        with TranscriptStore(database) as store:
+            stats = store.sync(client, bot_id=bot_id, page_size=page_size, full=full)
+            total = store.count()
+
+        console.print(
+            f"[bold green]✓[/bold green] Stored {stats.upserted} changed and removed {stats.deleted} deleted "
+            f"transcripts ({total} in store)"
+        )
+
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        sys.exit(1)
+    finally:
+        if client is not None:
+            release_client(client)
+
+@transcripts.command(name="lookup")
+@click.argument("database", type=click.Path(exists=True, dir_okay=False))
+@click.argument("conversation_id")
+@click.option("--bot", "bot_id", help="Only match transcripts of this bot ID")
+@click.option("--content/--no-content", default=False, help="Include the transcript content")
+def lookup_transcript(database, conversation_id, bot_id, content):
+    """
+    Find the transcript of a conversation in a local transcript store.
+
+    CONVERSATION_ID may be the beginning of the conversation ID.
+
+    Examples:
+
+        dataverse-api transcripts lookup transcripts.db H4hhfErR4i81dC602xLml2-au
+    """
+    try:
+        with TranscriptStore(database) as store:
+            transcript = store.find_by_conversation_id(conversation_id, bot_id=bot_id)
+
+        if not transcript:
+            console.print(f"[bold red]Error:[/bold red] No transcript found for conversation '{conversation_id}'")
+            sys.exit(1)
+        if not content:
+            transcript.pop("content")
+        console.print_json(json.dumps(transcript))
+
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        sys.exit(1)
@@ -1,15 +1,11 @@
 """Configuration module for Dataverse API CLI."""
 
 import os
+from functools import lru_cache
 from typing import Dict, Any
-from dotenv import load_dotenv
 
-from dataverse_api_cli.utils.console import console
 from dataverse_api_cli.constants import API_VERSION
 
-# Load environment variables
-load_dotenv()
-
 # Required environment variables
 REQUIRED_ENV_VARS = ["CLIENT_ID", "TENANT_ID", "CLIENT_SECRET", "WEB_API_ENDPOINT"]
 
@@ -27,6 +23,8 @@ def load_config() -> Dict[str, Any]:
     missing = [var for var in REQUIRED_ENV_VARS if not os.getenv(var)]
     
     if missing:
+        from dataverse_api_cli.utils.console import console
+
         console.print("[bold red]Error:[/bold red] Missing required environment variables.")
         console.print(f"Missing variables: {', '.join(missing)}")
         console.print("Please check your .env file.")
@@ -38,6 +36,11 @@ def load_config() -> Dict[str, Any]:
         "tenant_id": os.getenv("TENANT_ID"),
         "client_secret": os.getenv("CLIENT_SECRET"),
         "web_api_endpoint": os.getenv("WEB_API_ENDPOINT", "").rstrip("/"),
+        # Optional: where access tokens are cached; an empty value disables the file
+        "token_cache_path": os.getenv(
+            "TOKEN_CACHE_PATH",
+            os.path.join(os.path.expanduser("~"), ".cache", "dataverse-api-cli", "token_cache.json")
+        ),
     }
     
     # Add derived configuration
@@ -47,5 +50,24 @@ def load_config() -> Dict[str, Any]:
     
     return config
 
-# Export the config
-config = load_config()
\ No newline at end of file
+@lru_cache(maxsize=None)
+def get_config() -> Dict[str, Any]:
+    """
+    Get the configuration, loading the .env file and environment on first use.
+    
+    Returns:
+        Dict[str, Any]: Configuration dictionary
+    
+    Raises:
+        SystemExit: If any required environment variables are missing
+    """
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    return load_config()
+
+def __getattr__(name: str) -> Any:
+    # `config` is resolved on first access rather than at import time
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -30,4 +30,19 @@ class ComponentType:
         return f"Unknown Component Type ({component_type})"
 
 # API Constants
-API_VERSION = "v9.2"
\ No newline at end of file
+API_VERSION = "v9.2"
+
+# Maximum number of requests AsyncDataverseClient keeps in flight at once.
+# Dataverse service protection allows 52 concurrent requests per user.
+DEFAULT_MAX_CONCURRENCY = 52
+
+# Requests per second, and the burst after a lull, that a RateGovernor starts from.
+# Dataverse service protection allows 6000 requests per user in a 5 minute window.
+DEFAULT_REQUEST_RATE = 20
+DEFAULT_REQUEST_BURST = 100
+
+# Maximum number of operations the Dataverse Web API accepts in one $batch request.
+MAX_BATCH_OPERATIONS = 1000
+
+# Seconds before expiry at which a cached access token is replaced.
+TOKEN_REFRESH_MARGIN = 300
\ No newline at end of file
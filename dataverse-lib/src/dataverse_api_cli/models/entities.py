@@ -3,8 +3,32 @@
 from typing import Dict, Any, List, Optional
 import yaml
 
+from dataverse_api_cli.clients.batch import BatchResult
 from dataverse_api_cli.clients.dataverse import DataverseClient
 
+def _set_yaml_field(data: str, field_name: str, field_value: str) -> str:
+    """
+    Set a field in a YAML document.
+    
+    Args:
+        data (str): The YAML document
+        field_name (str): The name of the field to set
+        field_value (str): The new value for the field
+        
+    Returns:
+        str: The updated YAML document with Windows line endings (CRLF)
+    """
+    # Parse YAML data
+    yaml_data = yaml.safe_load(data)
+    
+    # Update field
+    yaml_data[field_name] = field_value
+    
+    # Dump YAML data with Windows line endings (CRLF)
+    dumped_yaml = yaml.dump(yaml_data, default_flow_style=False)
+    return dumped_yaml.replace('\n', '\r\n')
+
+
 class EntityManager:
     """
     Manager class for Dataverse entity operations.
@@ -91,23 +115,54 @@ class EntityManager:
         if not entity or "data" not in entity:
             raise ValueError(f"Entity {entity_type} with ID {entity_id} not found or has no data field")
             
-        # Parse YAML data
-        yaml_data = yaml.safe_load(entity["data"])
-        
-        # Update field
-        yaml_data[field_name] = field_value
-        
-        # Dump YAML data with Windows line endings (CRLF)
-        dumped_yaml = yaml.dump(yaml_data, default_flow_style=False)
-        updated_yaml = dumped_yaml.replace('\n', '\r\n')
-        
         # Update the entity
         self.client.update_entity(
             entity_name=entity_type,
             entity_id=entity_id,
-            data={"data": updated_yaml}
+            data={"data": _set_yaml_field(entity["data"], field_name, field_value)}
         )
     
+    def update_yaml_fields(
+        self, 
+        entity_type: str, 
+        entity_ids: List[str], 
+        field_name: str, 
+        field_value: str
+    ) -> List[BatchResult]:
+        """
+        Update a YAML field in many entities using $batch requests.
+        
+        The entities are read in one batch and written back in another, so
+        the number of round trips does not grow with the number of entities.
+        
+        Args:
+            entity_type (str): The type of entity (e.g., "botcomponents")
+            entity_ids (List[str]): The IDs of the entities to update
+            field_name (str): The name of the field to update in the YAML data
+            field_value (str): The new value for the field
+            
+        Returns:
+            List[BatchResult]: The result of each update, in the order of entity_ids
+        """
+        # Get current entity data
+        reads = self.client.batch()
+        for entity_id in entity_ids:
+            reads.get_entity_by_id(entity_name=entity_type, entity_id=entity_id, select="data")
+        
+        writes = self.client.batch()
+        for entity_id, result in zip(entity_ids, self.client.execute_batch(reads)):
+            if not result.ok or not result.body or "data" not in result.body:
+                raise ValueError(f"Entity {entity_type} with ID {entity_id} not found or has no data field")
+            
+            writes.update_entity(
+                entity_name=entity_type,
+                entity_id=entity_id,
+                data={"data": _set_yaml_field(result.body["data"], field_name, field_value)}
+            )
+        
+        # Update the entities
+        return self.client.execute_batch(writes)
+    
     def get_yaml_field(self, entity_type: str, entity_id: str, field_name: str) -> Optional[str]:
         """
         Get a YAML field from an entity's data.
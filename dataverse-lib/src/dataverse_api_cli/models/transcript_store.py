@@ -0,0 +1,351 @@
+"""Local SQLite store of conversation transcripts."""
+
+import json
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from dataverse_api_cli.clients.dataverse import DataverseClient
+from dataverse_api_cli.models.transcripts import (
+    BOT_ID_FIELD, SyncStats, TranscriptSync, flatten_transcript, format_timestamp
+)
+from dataverse_api_cli.utils.export import Checkpoint
+
+# Roles of the user's side of a conversation in transcript activities
+USER_ROLES = {"1", "user"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS transcripts (
+    transcript_id TEXT PRIMARY KEY,
+    name TEXT,
+    conversation_id TEXT,
+    bot_id TEXT,
+    user_id TEXT,
+    conversation_start_time TEXT,
+    created_on TEXT,
+    modified_on TEXT,
+    content TEXT,
+    state_code INTEGER
+);
+CREATE INDEX IF NOT EXISTS transcripts_name ON transcripts (name);
+CREATE INDEX IF NOT EXISTS transcripts_conversation ON transcripts (conversation_id, modified_on);
+CREATE INDEX IF NOT EXISTS transcripts_bot ON transcripts (bot_id, conversation_start_time);
+CREATE INDEX IF NOT EXISTS transcripts_user ON transcripts (user_id, conversation_start_time);
+CREATE INDEX IF NOT EXISTS transcripts_start ON transcripts (conversation_start_time);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Full-text index of each transcript's name and activity text, keyed by
+# the rowid of the transcript
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS transcripts_fts USING fts5(name, text);
+"""
+
+TimeBound = Optional[Union[datetime, str]]
+
+def _bound(value: TimeBound) -> Optional[str]:
+    """Format a datetime bound like the stored Dataverse timestamps."""
+    return format_timestamp(value) if isinstance(value, datetime) else value
+
+class TranscriptStore:
+    """
+    Conversation transcripts kept in a local SQLite database.
+
+    Transcripts are indexed by name ({conversation_id}_{bot_id}),
+    conversation ID, bot ID, user ID and start time, so finding the
+    transcript of a previous conversation takes an index lookup instead of a
+    contains() scan in Dataverse. Activity text is indexed with FTS5 where
+    SQLite provides it. The store is filled by sync(), which applies the
+    changes since its last sync using Dataverse change tracking.
+
+    Lookups return records with the same columns as Dataverse
+    (conversationtranscriptid, name, content, conversationstarttime,
+    createdon, modifiedon, statecode and _bot_conversationtranscriptid_value).
+    """
+
+    def __init__(self, path: str):
+        """
+        Open the store, creating it if needed.
+
+        Args:
+            path (str): The database file, or ":memory:"
+        """
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.row_factory = sqlite3.Row
+        if path != ":memory:":
+            # Lets lookups read while a sync writes
+            self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(SCHEMA)
+        columns = {row["name"] for row in self.connection.execute("PRAGMA table_info(transcripts)")}
+        if "state_code" not in columns:
+            # Stores created before the state was kept; forget the delta link
+            # so the next sync reads every transcript's state
+            with self.connection:
+                self.connection.execute("ALTER TABLE transcripts ADD COLUMN state_code INTEGER")
+                self.connection.execute("DELETE FROM sync_state")
+        try:
+            self.connection.executescript(FTS_SCHEMA)
+            self.full_text = True
+        except sqlite3.OperationalError:
+            self.full_text = False
+
+    def __enter__(self) -> "TranscriptStore":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database."""
+        self.connection.close()
+
+    def upsert(self, transcript: Dict[str, Any]) -> int:
+        """
+        Add or replace a transcript.
+
+        Args:
+            transcript (Dict[str, Any]): A conversationtranscripts record
+                with the TRANSCRIPT_SELECT columns
+
+        Returns:
+            int: The number of activities indexed
+        """
+        transcript_id = transcript["conversationtranscriptid"]
+        name = transcript.get("name") or ""
+        try:
+            activities = flatten_transcript(transcript)
+        except ValueError:
+            activities = []
+        user_id = next(
+            (row["from_id"] for row in activities if row["from_role"] in USER_ROLES and row["from_id"]),
+            None
+        )
+        if activities:
+            conversation_id = activities[0]["conversation_id"]
+        else:
+            conversation_id = name.rsplit("_", 1)[0] if "_" in name else None
+
+        self.delete(transcript_id)
+        cursor = self.connection.execute(
+            "INSERT INTO transcripts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                transcript_id,
+                transcript.get("name"),
+                conversation_id,
+                (transcript.get(BOT_ID_FIELD) or "").lower() or None,
+                user_id,
+                transcript.get("conversationstarttime"),
+                transcript.get("createdon"),
+                transcript.get("modifiedon"),
+                transcript.get("content"),
+                transcript.get("statecode"),
+            )
+        )
+        if self.full_text:
+            text = "\n".join(row["text"] for row in activities if row["text"])
+            self.connection.execute(
+                "INSERT INTO transcripts_fts (rowid, name, text) VALUES (?, ?, ?)",
+                (cursor.lastrowid, name, text)
+            )
+        return len(activities)
+
+    def delete(self, transcript_id: str) -> None:
+        """Remove a transcript, if stored."""
+        row = self.connection.execute(
+            "SELECT rowid FROM transcripts WHERE transcript_id = ?", (transcript_id,)
+        ).fetchone()
+        if row is None:
+            return
+        self.connection.execute("DELETE FROM transcripts WHERE rowid = ?", (row[0],))
+        if self.full_text:
+            self.connection.execute("DELETE FROM transcripts_fts WHERE rowid = ?", (row[0],))
+
+    def apply(self, changes: Iterable[Tuple[str, Dict[str, Any]]], stats: Optional[SyncStats] = None) -> SyncStats:
+        """
+        Apply changes read by TranscriptSync.changes().
+
+        Changes are written in the current transaction; commit the
+        connection, or use it as a context manager, to keep them.
+
+        Args:
+            changes: ("upsert", transcript) and ("delete", record) pairs
+            stats (SyncStats, optional): Counts to add to
+
+        Returns:
+            SyncStats: The counts
+        """
+        stats = stats or SyncStats()
+        for change, transcript in changes:
+            if change == "delete":
+                self.delete(transcript["conversationtranscriptid"])
+                stats.deleted += 1
+            else:
+                stats.activities += self.upsert(transcript)
+                stats.upserted += 1
+        return stats
+
+    def sync(
+        self,
+        client: DataverseClient,
+        bot_id: Optional[str] = None,
+        page_size: int = 500,
+        full: bool = False
+    ) -> SyncStats:
+        """
+        Bring the store up to date with Dataverse.
+
+        The first sync reads every transcript; later ones only the changes
+        since the delta link saved with the previous one. The changes and
+        the new delta link are written in one transaction, so an interrupted
+        sync leaves the store as it was.
+
+        Args:
+            client (DataverseClient): The Dataverse client
+            bot_id (str, optional): Keep only this bot's transcripts
+            page_size (int): Transcripts per page
+            full (bool): Discard the stored transcripts and delta link and
+                read everything again
+
+        Returns:
+            SyncStats: What was synced
+
+        Raises:
+            ValueError: If the store was synced for a different bot and
+                full is not set
+        """
+        state = Checkpoint(None)
+        if not full:
+            state.state = self.sync_state()
+        sync = TranscriptSync(client, state, bot_id=bot_id, page_size=page_size)
+
+        with self.connection:
+            if full:
+                self.connection.execute("DELETE FROM transcripts")
+                self.connection.execute("DELETE FROM sync_state")
+                if self.full_text:
+                    self.connection.execute("DELETE FROM transcripts_fts")
+            stats = self.apply(sync.changes())
+            sync.commit()
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?)",
+                [(key, json.dumps(value)) for key, value in state.state.items()]
+            )
+        return stats
+
+    def sync_state(self) -> Dict[str, Any]:
+        """Get the delta link, bot ID and time of the last sync."""
+        rows = self.connection.execute("SELECT key, value FROM sync_state")
+        return {row["key"]: json.loads(row["value"]) for row in rows}
+
+    def _records(
+        self,
+        where: str,
+        params: Iterable[Any],
+        order: str,
+        limit: Optional[int],
+        join: str = ""
+    ) -> List[Dict[str, Any]]:
+        """Select transcripts, as t, as Dataverse records."""
+        query = (
+            "SELECT t.transcript_id AS conversationtranscriptid, t.name, t.content, "
+            "t.conversation_start_time AS conversationstarttime, t.created_on AS createdon, "
+            "t.modified_on AS modifiedon, t.state_code AS statecode, "
+            f"t.bot_id AS {BOT_ID_FIELD} "
+            f"FROM transcripts AS t {join} WHERE {where} ORDER BY {order}"
+        )
+        params = list(params)
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return [dict(row) for row in self.connection.execute(query, params)]
+
+    def get(self, transcript_id: str) -> Optional[Dict[str, Any]]:
+        """Get a transcript by its ID."""
+        records = self._records("transcript_id = ?", [transcript_id], "transcript_id", 1)
+        return records[0] if records else None
+
+    def find_by_conversation_id(self, conversation_id: str, bot_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Find the latest transcript of a conversation.
+
+        Args:
+            conversation_id (str): The conversation ID, or its beginning
+            bot_id (str, optional): Only match this bot's transcripts
+
+        Returns:
+            dict: The most recently modified match, or None
+        """
+        # A range instead of LIKE, so the index serves the prefix match
+        where = "conversation_id >= ? AND conversation_id < ?"
+        params = [conversation_id, conversation_id + "\U0010ffff"]
+        if bot_id:
+            where += " AND bot_id = ?"
+            params.append(bot_id.lower())
+        records = self._records(where, params, "modified_on DESC", 1)
+        return records[0] if records else None
+
+    def find(
+        self,
+        user_id: Optional[str] = None,
+        bot_id: Optional[str] = None,
+        since: TimeBound = None,
+        until: TimeBound = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Find transcripts by user, bot and conversation start time.
+
+        Args:
+            user_id (str, optional): The user's channel account ID
+            bot_id (str, optional): The bot ID
+            since (datetime or str, optional): Earliest start time
+            until (datetime or str, optional): Start time to stop before
+            limit (int, optional): Maximum number of transcripts
+
+        Returns:
+            List[Dict[str, Any]]: The transcripts, newest first
+        """
+        conditions = ["1 = 1"]
+        params: List[Any] = []
+        for condition, value in (
+            ("user_id = ?", user_id),
+            ("bot_id = ?", bot_id.lower() if bot_id else None),
+            ("conversation_start_time >= ?", _bound(since)),
+            ("conversation_start_time < ?", _bound(until)),
+        ):
+            if value is not None:
+                conditions.append(condition)
+                params.append(value)
+        return self._records(" AND ".join(conditions), params, "conversation_start_time DESC", limit)
+
+    def search(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Search transcript names and activity text.
+
+        Args:
+            query (str): An FTS5 query, e.g. "refund AND order"
+            limit (int): Maximum number of transcripts
+
+        Returns:
+            List[Dict[str, Any]]: The best matches first
+
+        Raises:
+            RuntimeError: If this SQLite build has no FTS5
+        """
+        if not self.full_text:
+            raise RuntimeError("Full-text search requires SQLite with FTS5")
+        return self._records(
+            "transcripts_fts MATCH ?",
+            [query],
+            "transcripts_fts.rank",
+            limit,
+            join="JOIN transcripts_fts ON transcripts_fts.rowid = t.rowid"
+        )
+
+    def count(self) -> int:
+        """Get the number of stored transcripts."""
+        return self.connection.execute("SELECT COUNT(*) FROM transcripts").fetchone()[0]
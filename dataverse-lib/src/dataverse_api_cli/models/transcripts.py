@@ -0,0 +1,507 @@
+"""Models for conversation transcript export and sync."""
+
+import asyncio
+import json
+import os
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from dataverse_api_cli.clients.dataverse import AsyncDataverseClient, DataverseClient, is_deleted
+from dataverse_api_cli.utils.console import console
+from dataverse_api_cli.utils.export import Checkpoint, open_writer
+
+TRANSCRIPT_ENTITY = "conversationtranscripts"
+
+# Lookup column holding the ID of a transcript's bot
+BOT_ID_FIELD = "_bot_conversationtranscriptid_value"
+
+# Columns read from each transcript
+TRANSCRIPT_SELECT = [
+    "conversationtranscriptid",
+    "name",
+    "content",
+    "conversationstarttime",
+    "createdon",
+    "modifiedon",
+    "statecode",
+    BOT_ID_FIELD,
+]
+
+# Columns of a flattened activity row and their Arrow types, in output order
+ACTIVITY_COLUMNS = {
+    "transcript_id": "string",
+    "transcript_name": "string",
+    "bot_id": "string",
+    "conversation_id": "string",
+    "conversation_start_time": "string",
+    "transcript_createdon": "string",
+    "transcript_modifiedon": "string",
+    "activity_index": "int64",
+    "activity_id": "string",
+    "activity_type": "string",
+    "timestamp": "string",
+    "channel_id": "string",
+    "from_id": "string",
+    "from_name": "string",
+    "from_role": "string",
+    "recipient_id": "string",
+    "recipient_role": "string",
+    "reply_to_id": "string",
+    "text": "string",
+    "name": "string",
+    "value_type": "string",
+    "value": "string",
+    "attachments": "string",
+}
+
+# Columns of a synced change row: the kind of change, then the activity columns
+CHANGE_COLUMNS = {"change": "string", **ACTIVITY_COLUMNS}
+
+def _timestamp(value: Any) -> Optional[str]:
+    """Normalize an activity timestamp, ISO string or epoch seconds, to ISO 8601."""
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, tz=timezone.utc).isoformat().replace("+00:00", "Z")
+    return value
+
+def _string(value: Any) -> Optional[str]:
+    """Coerce a scalar, such as a numeric role, to a string column."""
+    return None if value is None else str(value)
+
+def _json(value: Any) -> Optional[str]:
+    """Serialize a nested value as a JSON string column."""
+    if value is None:
+        return None
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+def flatten_transcript(transcript: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Flatten a conversation transcript into one row per activity.
+
+    Args:
+        transcript (Dict[str, Any]): A conversationtranscripts record with
+            the TRANSCRIPT_SELECT columns
+
+    Returns:
+        List[Dict[str, Any]]: A row with the ACTIVITY_COLUMNS per activity
+
+    Raises:
+        ValueError: If the content is not a JSON transcript
+    """
+    content = transcript.get("content")
+    if not content:
+        return []
+    document = json.loads(content)
+    if not isinstance(document, dict):
+        raise ValueError("Transcript content is not a JSON object")
+    activities = document.get("activities") or []
+
+    # Transcript names have the form {conversation_id}_{bot_id}
+    name = transcript.get("name") or ""
+    default_conversation_id = name.rsplit("_", 1)[0] if "_" in name else None
+
+    rows = []
+    for index, activity in enumerate(activities):
+        sender = activity.get("from") or {}
+        recipient = activity.get("recipient") or {}
+        conversation = activity.get("conversation") or {}
+        rows.append({
+            "transcript_id": transcript.get("conversationtranscriptid"),
+            "transcript_name": transcript.get("name"),
+            "bot_id": transcript.get(BOT_ID_FIELD),
+            "conversation_id": conversation.get("id", default_conversation_id),
+            "conversation_start_time": transcript.get("conversationstarttime"),
+            "transcript_createdon": transcript.get("createdon"),
+            "transcript_modifiedon": transcript.get("modifiedon"),
+            "activity_index": index,
+            "activity_id": activity.get("id"),
+            "activity_type": activity.get("type"),
+            "timestamp": _timestamp(activity.get("timestamp")),
+            "channel_id": activity.get("channelId"),
+            "from_id": sender.get("id"),
+            "from_name": sender.get("name"),
+            "from_role": _string(sender.get("role")),
+            "recipient_id": recipient.get("id"),
+            "recipient_role": _string(recipient.get("role")),
+            "reply_to_id": activity.get("replyToId"),
+            "text": activity.get("text"),
+            "name": activity.get("name"),
+            "value_type": activity.get("valueType"),
+            "value": _json(activity.get("value")),
+            "attachments": _json(activity.get("attachments")),
+        })
+    return rows
+
+def format_timestamp(value: datetime) -> str:
+    """Format a UTC datetime as an OData DateTimeOffset literal."""
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+def parse_timestamp(value: str) -> datetime:
+    """Parse a Dataverse timestamp such as 2024-05-01T12:00:00Z."""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+def bot_filter(bot_id: Optional[str]) -> Optional[str]:
+    """OData filter selecting the transcripts of a bot, or None for all bots."""
+    return f"{BOT_ID_FIELD} eq {bot_id}" if bot_id else None
+
+@dataclass
+class ExportStats:
+    """Counts from an export run."""
+    windows: int = 0
+    files: int = 0
+    transcripts: int = 0
+    activities: int = 0
+    skipped: int = 0
+
+class TranscriptExporter:
+    """
+    Export conversation transcripts to partitioned files of activity rows.
+
+    The time range is split into windows on a cursor column (modifiedon or
+    createdon). Windows are fetched concurrently, each following its own
+    @odata.nextLink pages, and written to one file per window under a
+    `date=YYYY-MM-DD` partition directory. The checkpoint records the end of
+    the last window before which every window is complete, so an interrupted
+    export resumes from there and rewrites any partial window.
+    """
+
+    def __init__(
+        self,
+        client: AsyncDataverseClient,
+        output_dir: str,
+        format: str = "jsonl",
+        bot_id: Optional[str] = None,
+        cursor_field: str = "modifiedon",
+        window: timedelta = timedelta(days=1),
+        page_size: int = 500,
+        concurrency: int = 4,
+        checkpoint: Optional[Checkpoint] = None
+    ):
+        """
+        Initialize the exporter.
+
+        Args:
+            client (AsyncDataverseClient): The Dataverse client
+            output_dir (str): Directory for the partitioned files
+            format (str): "jsonl" or "parquet"
+            bot_id (str, optional): Export only this bot's transcripts
+            cursor_field (str): "modifiedon" to also pick up updated
+                transcripts, or "createdon"
+            window (timedelta): Span of the cursor covered by each file
+            page_size (int): Transcripts per page
+            concurrency (int): Windows fetched at once
+            checkpoint (Checkpoint, optional): Where progress is saved
+        """
+        if cursor_field not in ("modifiedon", "createdon"):
+            raise ValueError("cursor_field must be 'modifiedon' or 'createdon'")
+        if window <= timedelta(0):
+            raise ValueError("window must be positive")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        self.client = client
+        self.output_dir = output_dir
+        self.format = format
+        self.bot_id = bot_id
+        self.cursor_field = cursor_field
+        self.window = window
+        self.page_size = page_size
+        self.concurrency = concurrency
+        self.checkpoint = checkpoint or Checkpoint(None)
+
+        saved = {key: self.checkpoint.get(key) for key in ("bot_id", "cursor_field")}
+        expected = {"bot_id": bot_id, "cursor_field": cursor_field}
+        if self.checkpoint.get("cursor") and saved != expected:
+            raise ValueError(
+                f"Checkpoint {self.checkpoint.path} belongs to a different export ({saved})"
+            )
+
+    async def resume_point(self) -> Optional[datetime]:
+        """
+        Get where the export starts: the checkpoint, else the start of the
+        day of the oldest transcript.
+
+        Returns:
+            datetime: The start, or None if there are no transcripts
+        """
+        cursor = self.checkpoint.get("cursor")
+        if cursor:
+            return parse_timestamp(cursor)
+
+        oldest = await self.client.get_entities(
+            entity_name=TRANSCRIPT_ENTITY,
+            select=[self.cursor_field],
+            filter=bot_filter(self.bot_id),
+            top=1,
+            order_by=f"{self.cursor_field} asc"
+        )
+        if not oldest:
+            return None
+        start = parse_timestamp(oldest[0][self.cursor_field])
+        return start.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def windows(self, start: datetime, end: datetime) -> List[Tuple[datetime, datetime]]:
+        """Split [start, end) into export windows."""
+        windows = []
+        while start < end:
+            windows.append((start, min(start + self.window, end)))
+            start += self.window
+        return windows
+
+    def partition_path(self, start: datetime) -> str:
+        """Path, without extension, of the file for the window starting at start."""
+        start = start.astimezone(timezone.utc)
+        return os.path.join(
+            self.output_dir,
+            f"date={start:%Y-%m-%d}",
+            f"transcripts-{start:%Y%m%dT%H%M%SZ}",
+        )
+
+    async def export_window(self, start: datetime, end: datetime, stats: ExportStats) -> None:
+        """
+        Export the transcripts whose cursor falls in [start, end).
+
+        Rows are written page by page, so memory stays bounded by the page size.
+        """
+        filters = [
+            f"{self.cursor_field} ge {format_timestamp(start)}",
+            f"{self.cursor_field} lt {format_timestamp(end)}",
+        ]
+        if self.bot_id:
+            filters.append(bot_filter(self.bot_id))
+
+        writer = None
+        rows: List[Dict[str, Any]] = []
+        try:
+            async for transcript in self.client.iter_entities(
+                entity_name=TRANSCRIPT_ENTITY,
+                select=TRANSCRIPT_SELECT,
+                filter=" and ".join(filters),
+                order_by=f"{self.cursor_field} asc",
+                page_size=self.page_size
+            ):
+                try:
+                    rows.extend(flatten_transcript(transcript))
+                except ValueError:
+                    console.print(
+                        f"[yellow]Skipping transcript {transcript.get('conversationtranscriptid')} "
+                        f"with unreadable content[/yellow]"
+                    )
+                    stats.skipped += 1
+                    continue
+                stats.transcripts += 1
+
+                if len(rows) >= self.page_size:
+                    if writer is None:
+                        writer = open_writer(self.format, self.partition_path(start), ACTIVITY_COLUMNS)
+                    writer.write(rows)
+                    stats.activities += len(rows)
+                    rows = []
+
+            if rows:
+                if writer is None:
+                    writer = open_writer(self.format, self.partition_path(start), ACTIVITY_COLUMNS)
+                writer.write(rows)
+                stats.activities += len(rows)
+        except BaseException:
+            if writer is not None:
+                writer.abort()
+            raise
+
+        if writer is not None:
+            writer.close()
+            stats.files += 1
+        stats.windows += 1
+
+    async def run(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> ExportStats:
+        """
+        Export every window from the resume point, or start, up to end.
+
+        Args:
+            start (datetime, optional): Start of the export, overriding the
+                checkpoint
+            end (datetime, optional): End of the export; defaults to now
+
+        Returns:
+            ExportStats: What was exported
+        """
+        stats = ExportStats()
+        end = end or datetime.now(timezone.utc).replace(microsecond=0)
+        start = start or await self.resume_point()
+        if start is None:
+            return stats
+
+        windows = self.windows(start, end)
+        done = [False] * len(windows)
+        next_pending = 0
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def export(index: int) -> None:
+            nonlocal next_pending
+            async with semaphore:
+                await self.export_window(*windows[index], stats)
+            done[index] = True
+            # Advance over the windows completed without gaps
+            advanced = False
+            while next_pending < len(windows) and done[next_pending]:
+                next_pending += 1
+                advanced = True
+            if advanced:
+                self.checkpoint.save(
+                    bot_id=self.bot_id,
+                    cursor_field=self.cursor_field,
+                    cursor=format_timestamp(windows[next_pending - 1][1]),
+                )
+
+        tasks = [asyncio.ensure_future(export(index)) for index in range(len(windows))]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        return stats
+
+@dataclass
+class SyncStats:
+    """Counts from a sync run."""
+    upserted: int = 0
+    deleted: int = 0
+    activities: int = 0
+    skipped: int = 0
+    files: int = 0
+
+class TranscriptSync:
+    """
+    Sync conversation transcripts incrementally with Dataverse change tracking.
+
+    The first sync reads every transcript; later ones read only those
+    created, updated or deleted since the delta link saved by the previous
+    sync. The delta link is saved only once the changes are written, so a
+    failed sync is repeated in full by the next one.
+    """
+
+    def __init__(
+        self,
+        client: DataverseClient,
+        state: Checkpoint,
+        bot_id: Optional[str] = None,
+        page_size: int = 500
+    ):
+        """
+        Initialize the sync.
+
+        Args:
+            client (DataverseClient): The Dataverse client
+            state (Checkpoint): Where the delta link is saved
+            bot_id (str, optional): Sync only this bot's transcripts. Change
+                tracking cannot filter on the server, so other bots'
+                transcripts are dropped as they arrive; deletions, which
+                carry only an ID, are always passed on.
+            page_size (int): Transcripts per page
+        """
+        bot_id = bot_id.lower() if bot_id else None
+        if state.get("delta_link") and state.get("bot_id") != bot_id:
+            raise ValueError(
+                f"Sync state {state.path} belongs to a different sync (bot {state.get('bot_id')})"
+            )
+        self.client = client
+        self.state = state
+        self.bot_id = bot_id
+        self.page_size = page_size
+        self._changes = None
+
+    def changes(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Read the changes since the last committed sync.
+
+        Yields:
+            tuple: ("upsert", transcript) for a created or updated transcript
+                with the TRANSCRIPT_SELECT columns, or ("delete",
+                {"conversationtranscriptid": id}) for a deleted one
+        """
+        self._changes = self.client.track_changes(
+            TRANSCRIPT_ENTITY,
+            select=TRANSCRIPT_SELECT,
+            delta_link=self.state.get("delta_link"),
+            page_size=self.page_size
+        )
+        for entity in self._changes:
+            if is_deleted(entity):
+                yield "delete", {"conversationtranscriptid": entity.get("id")}
+            elif self.bot_id and (entity.get(BOT_ID_FIELD) or "").lower() != self.bot_id:
+                continue
+            else:
+                yield "upsert", entity
+
+    def commit(self) -> None:
+        """Save the delta link reached by changes(), so the next sync starts there."""
+        if self._changes is None or not self._changes.delta_link:
+            raise RuntimeError("changes() must be read to the end before commit()")
+        self.state.save(
+            bot_id=self.bot_id,
+            delta_link=self._changes.delta_link,
+            synced_at=format_timestamp(datetime.now(timezone.utc)),
+        )
+
+    def run(self, output_dir: str, format: str = "jsonl") -> SyncStats:
+        """
+        Write the changes since the last sync to one file and commit.
+
+        Each upserted transcript contributes its activity rows, and each
+        deleted one a row with only its transcript_id, with the change
+        column set to "upsert" or "delete". The file goes to
+        OUTPUT/date=YYYY-MM-DD/changes-<time>; no file is written if
+        nothing changed.
+
+        Args:
+            output_dir (str): Directory for the change files
+            format (str): "jsonl" or "parquet"
+
+        Returns:
+            SyncStats: What was synced
+        """
+        stats = SyncStats()
+        started = datetime.now(timezone.utc)
+        path = os.path.join(
+            output_dir, f"date={started:%Y-%m-%d}", f"changes-{started:%Y%m%dT%H%M%SZ}"
+        )
+        writer = None
+        rows: List[Dict[str, Any]] = []
+        try:
+            for change, transcript in self.changes():
+                if change == "delete":
+                    rows.append({"change": change, "transcript_id": transcript["conversationtranscriptid"]})
+                    stats.deleted += 1
+                else:
+                    try:
+                        activity_rows = flatten_transcript(transcript)
+                    except ValueError:
+                        console.print(
+                            f"[yellow]Skipping transcript {transcript.get('conversationtranscriptid')} "
+                            f"with unreadable content[/yellow]"
+                        )
+                        stats.skipped += 1
+                        continue
+                    rows.extend({"change": change, **row} for row in activity_rows)
+                    stats.upserted += 1
+                    stats.activities += len(activity_rows)
+
+                if len(rows) >= self.page_size:
+                    writer = writer or open_writer(format, path, CHANGE_COLUMNS)
+                    writer.write(rows)
+                    rows = []
+
+            if rows:
+                writer = writer or open_writer(format, path, CHANGE_COLUMNS)
+                writer.write(rows)
+        except BaseException:
+            if writer is not None:
+                writer.abort()
+            raise
+
+        if writer is not None:
+            writer.close()
+            stats.files += 1
+        self.commit()
+        return stats
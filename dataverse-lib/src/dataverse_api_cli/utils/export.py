@@ -0,0 +1,150 @@
+"""File writers and checkpoints for exports."""
+
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+# Output formats and the extension of their files
+FORMATS = {"jsonl": ".jsonl", "parquet": ".parquet"}
+
+class JsonlWriter:
+    """
+    Write rows as JSON lines.
+
+    Rows go to a temporary file that replaces the target on close, so a
+    file is either complete or absent.
+    """
+
+    def __init__(self, path: str, columns: Dict[str, str]):
+        """
+        Initialize the writer.
+
+        Args:
+            path (str): The file to write
+            columns (Dict[str, str]): Column names and types, in output order
+        """
+        self.path = path
+        self.columns = list(columns)
+        self._temp_path = f"{path}.tmp"
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._file = open(self._temp_path, "w", encoding="utf-8")
+
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        """Append rows to the file."""
+        for row in rows:
+            record = {column: row.get(column) for column in self.columns}
+            self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def close(self) -> None:
+        """Finish the file and move it into place."""
+        self._file.close()
+        os.replace(self._temp_path, self.path)
+
+    def abort(self) -> None:
+        """Discard the file."""
+        self._file.close()
+        os.remove(self._temp_path)
+
+class ParquetWriter:
+    """
+    Write rows to a Parquet file, one row group per write.
+
+    Requires the `pyarrow` package. Like JsonlWriter, the file only
+    appears once it is complete.
+    """
+
+    def __init__(self, path: str, columns: Dict[str, str]):
+        """
+        Initialize the writer.
+
+        Args:
+            path (str): The file to write
+            columns (Dict[str, str]): Column names and their Arrow types
+                (e.g., "string", "int64"), in output order
+        """
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise RuntimeError(
+                "Parquet output requires pyarrow: pip install \"dataverse-api-cli[parquet]\""
+            ) from None
+
+        self.path = path
+        self._pyarrow = pyarrow
+        self._schema = pyarrow.schema(
+            [(name, pyarrow.type_for_alias(type_name)) for name, type_name in columns.items()]
+        )
+        self._temp_path = f"{path}.tmp"
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._writer = pyarrow.parquet.ParquetWriter(self._temp_path, self._schema)
+
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        """Append rows to the file as a row group."""
+        if rows:
+            self._writer.write_table(self._pyarrow.Table.from_pylist(rows, schema=self._schema))
+
+    def close(self) -> None:
+        """Finish the file and move it into place."""
+        self._writer.close()
+        os.replace(self._temp_path, self.path)
+
+    def abort(self) -> None:
+        """Discard the file."""
+        self._writer.close()
+        os.remove(self._temp_path)
+
+def open_writer(format: str, path: str, columns: Dict[str, str]):
+    """
+    Open a writer for an output format.
+
+    Args:
+        format (str): "jsonl" or "parquet"
+        path (str): The file to write, without extension
+        columns (Dict[str, str]): Column names and types, in output order
+
+    Returns:
+        JsonlWriter or ParquetWriter: The writer
+    """
+    if format not in FORMATS:
+        raise ValueError(f"Unknown format {format!r}, expected one of {', '.join(FORMATS)}")
+    writer_class = ParquetWriter if format == "parquet" else JsonlWriter
+    return writer_class(path + FORMATS[format], columns)
+
+class Checkpoint:
+    """
+    Progress of a resumable job, kept as a JSON file.
+    """
+
+    def __init__(self, path: Optional[str]):
+        """
+        Initialize the checkpoint, loading saved progress if the file exists.
+
+        Args:
+            path (str, optional): The checkpoint file; None keeps progress in memory only
+        """
+        self.path = path
+        self.state: Dict[str, Any] = {}
+        if path and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self.state = json.load(f)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a saved value."""
+        return self.state.get(key, default)
+
+    def save(self, **values: Any) -> None:
+        """
+        Update saved values and write them out atomically.
+
+        Args:
+            **values: The values to save
+        """
+        self.state.update(values)
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, indent=2)
+        os.replace(temp_path, self.path)
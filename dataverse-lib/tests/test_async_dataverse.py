@@ -0,0 +1,174 @@
+"""Tests for the asynchronous Dataverse client."""
+import asyncio
+import base64
+import json
+import threading
+import time
+import unittest
+from unittest.mock import patch, MagicMock, AsyncMock
+
+class TestAsyncDataverseClient(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.base_url = "https://test-instance.api.crm.dynamics.com/api/data/v9.2"
+        self.access_token = "dummy_token"
+
+        # Import the client
+        from dataverse_api_cli.clients.dataverse import AsyncDataverseClient
+
+        # Initialize the client with patched httpx.AsyncClient
+        with patch('httpx.AsyncClient') as mock_client:
+            self.client_instance = mock_client.return_value
+            self.client_instance.request = AsyncMock()
+            self.client_instance.aclose = AsyncMock()
+            self.dataverse_client = AsyncDataverseClient(
+                self.base_url, self.access_token, max_concurrency=3
+            )
+
+    async def test_request(self):
+        # Setup mock response
+        mock_response = MagicMock()
+        mock_response.content = b'{"value": "test"}'
+        mock_response.json.return_value = {"value": "test"}
+        self.client_instance.request.return_value = mock_response
+
+        # Test the request method
+        result = await self.dataverse_client.request("contacts")
+
+        # Assertions
+        self.assertEqual(result, {"value": "test"})
+        self.client_instance.request.assert_called_with(
+            "GET",
+            f"{self.base_url}/contacts",
+            json=None,
+            params=None,
+            headers={
+                "Authorization": f"Bearer {self.access_token}",
+                "Accept": "application/json",
+                "OData-MaxVersion": "4.0",
+                "OData-Version": "4.0",
+                "Content-Type": "application/json"
+            }
+        )
+
+    async def test_get_entities(self):
+        # Setup mock response
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"value": [{"id": "1", "name": "Test"}]}
+        self.client_instance.request.return_value = mock_response
+
+        # Test get_entities method
+        result = await self.dataverse_client.get_entities(
+            "contacts",
+            select=["fullname", "emailaddress1"],
+            filter="contains(emailaddress1, 'example.com')"
+        )
+
+        # Assertions
+        self.assertEqual(result, [{"id": "1", "name": "Test"}])
+        self.assertEqual(
+            self.client_instance.request.call_args.kwargs["params"],
+            {
+                "$select": "fullname,emailaddress1",
+                "$filter": "contains(emailaddress1, 'example.com')"
+            }
+        )
+
+    async def test_iter_entities_follows_next_link(self):
+        next_link = f"{self.base_url}/conversationtranscripts?$skiptoken=abc"
+        first_page = MagicMock()
+        first_page.json.return_value = {
+            "value": [{"id": "1"}, {"id": "2"}],
+            "@odata.nextLink": next_link
+        }
+        second_page = MagicMock()
+        second_page.json.return_value = {"value": [{"id": "3"}]}
+        self.client_instance.request.side_effect = [first_page, second_page]
+
+        # Test iter_entities method
+        result = [
+            entity["id"] async for entity in self.dataverse_client.iter_entities(
+                "conversationtranscripts", page_size=2
+            )
+        ]
+
+        # Assertions
+        self.assertEqual(result, ["1", "2", "3"])
+        first_call, second_call = self.client_instance.request.call_args_list
+        self.assertEqual(second_call.args[1], next_link)
+        self.assertIsNone(second_call.kwargs["params"])
+        for call in (first_call, second_call):
+            self.assertEqual(call.kwargs["headers"]["Prefer"], "odata.maxpagesize=2")
+
+    async def test_concurrency_limit(self):
+        in_flight = 0
+        peak = 0
+
+        async def slow_request(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            response = MagicMock()
+            response.content = b''
+            return response
+
+        self.client_instance.request.side_effect = slow_request
+
+        # Issue more updates than the limit allows at once
+        await asyncio.gather(*(
+            self.dataverse_client.update_entity("botcomponents", str(i), {"data": "x"})
+            for i in range(10)
+        ))
+
+        # Assertions
+        self.assertEqual(self.client_instance.request.await_count, 10)
+        self.assertEqual(peak, 3)
+
+    def test_invalid_concurrency(self):
+        from dataverse_api_cli.clients.dataverse import AsyncDataverseClient
+
+        with self.assertRaises(ValueError):
+            AsyncDataverseClient(self.base_url, self.access_token, max_concurrency=0)
+
+    async def test_token_provider_runs_off_the_event_loop(self):
+        payload = base64.urlsafe_b64encode(json.dumps({"exp": time.time() + 3600}).encode()).decode().rstrip("=")
+        jwt = f"header.{payload}.signature"
+        threads = []
+
+        def get_token():
+            threads.append(threading.current_thread())
+            return jwt
+
+        self.dataverse_client.access_token = get_token
+        response = MagicMock()
+        response.content = b''
+        self.client_instance.request.return_value = response
+
+        await asyncio.gather(*(self.dataverse_client.request("contacts") for _ in range(5)))
+
+        # Fetched once in a worker thread, then reused until near expiry
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.current_thread())
+        headers = self.client_instance.request.call_args.kwargs["headers"]
+        self.assertEqual(headers["Authorization"], f"Bearer {jwt}")
+
+    async def test_opaque_token_fetched_per_request(self):
+        get_token = AsyncMock(return_value="opaque")
+        self.dataverse_client.access_token = get_token
+        response = MagicMock()
+        response.content = b''
+        self.client_instance.request.return_value = response
+
+        await self.dataverse_client.request("contacts")
+        await self.dataverse_client.request("contacts")
+
+        self.assertEqual(get_token.await_count, 2)
+
+    async def asyncTearDown(self):
+        # Clean up
+        await self.dataverse_client.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,30 @@
 """Tests for the authentication client."""
+import os
+import tempfile
+import time
 import unittest
 from unittest.mock import patch, MagicMock
 
 class TestAuth(unittest.TestCase):
+
+    def setUp(self):
+        # Use a fresh in-memory cache so tests do not share tokens
+        from dataverse_api_cli.clients.auth import TokenCache
+        
+        patcher = patch('dataverse_api_cli.clients.auth._token_cache', TokenCache())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # Without this the real configuration would need credentials in the environment
+        config = {
+            "tenant_id": "tenant",
+            "client_id": "client",
+            "client_secret": "secret",
+            "scope": ["https://test-instance.api.crm.dynamics.com/.default"],
+            "authority": "https://login.microsoftonline.com/tenant",
+        }
+        patcher = patch('dataverse_api_cli.clients.auth.get_config', return_value=config)
+        patcher.start()
+        self.addCleanup(patcher.stop)
     
     @patch('dataverse_api_cli.clients.auth.msal.ConfidentialClientApplication')
     def test_get_access_token_success(self, mock_app):
@@ -40,5 +62,90 @@ class TestAuth(unittest.TestCase):
             
         self.assertTrue('Authentication failed' in str(context.exception))
 
+class TestTokenCache(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "token_cache.json")
+        self.scopes = ["https://x/.default"]
+        
+        patcher = patch('dataverse_api_cli.clients.auth.msal.ConfidentialClientApplication')
+        self.mock_app = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.acquire = self.mock_app.return_value.acquire_token_for_client
+        self.acquire.return_value = {'access_token': 'dummy_token', 'expires_in': 3600}
+    
+    def get_token(self, cache, client_secret="secret"):
+        return cache.get_token("tenant", "client", client_secret, self.scopes)
+    
+    def test_reuses_token_across_caches(self):
+        from dataverse_api_cli.clients.auth import TokenCache
+        
+        # Test
+        first = self.get_token(TokenCache(self.path))
+        second = self.get_token(TokenCache(self.path))
+        
+        # Assertions
+        self.assertEqual(first, 'dummy_token')
+        self.assertEqual(second, 'dummy_token')
+        self.acquire.assert_called_once_with(scopes=self.scopes)
+    
+    def test_file_is_encrypted(self):
+        from dataverse_api_cli.clients.auth import TokenCache
+        
+        self.get_token(TokenCache(self.path))
+        
+        with open(self.path, "r", encoding="utf-8") as f:
+            contents = f.read()
+        
+        # Assertions
+        self.assertNotIn('dummy_token', contents)
+        self.assertNotIn('tenant', contents)
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o600)
+        
+        # A different secret cannot read the entry and acquires a new token
+        self.get_token(TokenCache(self.path), client_secret="other")
+        self.assertEqual(self.acquire.call_count, 2)
+    
+    def test_refreshes_before_expiry(self):
+        from dataverse_api_cli.clients.auth import TokenCache
+        
+        cache = TokenCache(refresh_margin=300)
+        self.assertEqual(self.get_token(cache), 'dummy_token')
+        
+        # Within the refresh margin, so a new token is acquired
+        self.acquire.return_value = {'access_token': 'refreshed', 'expires_in': 3600}
+        with patch('dataverse_api_cli.clients.auth.time.time', return_value=time.time() + 3400):
+            self.assertEqual(self.get_token(cache), 'refreshed')
+            self.assertEqual(self.get_token(cache), 'refreshed')
+        
+        # Assertions
+        self.assertEqual(self.acquire.call_count, 2)
+        self.mock_app.assert_called_once()
+    
+    def test_short_lived_token_is_reused(self):
+        from dataverse_api_cli.clients.auth import TokenCache
+        
+        cache = TokenCache(refresh_margin=300)
+        self.acquire.return_value = {'access_token': 'short_lived', 'expires_in': 200}
+        
+        # The margin is capped at half the token's lifetime
+        self.assertEqual(self.get_token(cache), 'short_lived')
+        self.assertEqual(self.get_token(cache), 'short_lived')
+        self.acquire.assert_called_once()
+        with patch('dataverse_api_cli.clients.auth.time.time', return_value=time.time() + 150):
+            self.get_token(cache)
+        self.assertEqual(self.acquire.call_count, 2)
+    
+    def test_failed_write_removes_temporary_file(self):
+        from dataverse_api_cli.clients.auth import TokenCache
+        
+        with patch('dataverse_api_cli.clients.auth.os.replace', side_effect=OSError("disk full")):
+            self.assertEqual(self.get_token(TokenCache(self.path)), 'dummy_token')
+        
+        # Assertions
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["token_cache.json.lock"])
+
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
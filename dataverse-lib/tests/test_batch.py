@@ -0,0 +1,180 @@
+"""Tests for the OData $batch builder."""
+import json
+import unittest
+from unittest.mock import patch, MagicMock
+
+from dataverse_api_cli.clients.batch import BatchRequest
+
+BASE_URL = "https://test-instance.api.crm.dynamics.com/api/data/v9.2"
+
+def http_part(status, reason, body=None, content_id=None):
+    """Build one application/http part of a $batch response"""
+    lines = ["Content-Type: application/http", "Content-Transfer-Encoding: binary"]
+    if content_id is not None:
+        lines.append(f"Content-ID: {content_id}")
+    lines += ["", f"HTTP/1.1 {status} {reason}"]
+    if body is not None:
+        lines += ["Content-Type: application/json; odata.metadata=minimal", "", json.dumps(body)]
+    else:
+        lines += [""]
+    return "\r\n".join(lines)
+
+def multipart(boundary, parts):
+    """Build a multipart/mixed body from already encoded parts"""
+    lines = []
+    for part in parts:
+        lines.append(f"--{boundary}")
+        lines.append(part)
+    lines.append(f"--{boundary}--")
+    return "\r\n".join(lines) + "\r\n"
+
+def change_set(boundary, parts):
+    """Build a change set part of a $batch response"""
+    return (
+        f"Content-Type: multipart/mixed; boundary={boundary}\r\n\r\n"
+        + multipart(boundary, parts)
+    )
+
+class TestBatchRequest(unittest.TestCase):
+
+    def test_encode_operations(self):
+        batch = BatchRequest(BASE_URL)
+        batch.get_entities("bots", select=["name", "botid"], filter="name eq 'Test'")
+        with batch.change_set():
+            batch.create_entity("botcomponents", {"name": "New"})
+            batch.delete_entity("botcomponents", "1")
+
+        (payload,) = batch.payloads()
+        body = payload.body
+
+        # Assertions
+        self.assertEqual(len(batch), 3)
+        self.assertEqual(payload.content_type, f'multipart/mixed; boundary="{payload.boundary}"')
+        self.assertIn(
+            f"GET {BASE_URL}/bots?$select=name,botid&$filter=name%20eq%20'Test' HTTP/1.1\r\n",
+            body
+        )
+        self.assertIn("Content-ID: 1\r\n\r\nPOST " + f"{BASE_URL}/botcomponents HTTP/1.1", body)
+        self.assertIn('Content-Type: application/json; type=entry\r\n\r\n{"name": "New"}', body)
+        self.assertIn(f"Content-ID: 2\r\n\r\nDELETE {BASE_URL}/botcomponents(1) HTTP/1.1", body)
+        self.assertTrue(body.endswith(f"--{payload.boundary}--\r\n"))
+
+    def test_split_at_operation_limit(self):
+        batch = BatchRequest(BASE_URL, max_operations=3)
+        batch.delete_entity("botcomponents", "1")
+        batch.delete_entity("botcomponents", "2")
+        with batch.change_set():
+            batch.delete_entity("botcomponents", "3")
+            batch.delete_entity("botcomponents", "4")
+        batch.delete_entity("botcomponents", "5")
+
+        # Change sets are never split across requests
+        payloads = batch.payloads()
+        self.assertEqual([len(payload.items) for payload in payloads], [2, 2])
+        self.assertEqual(len(payloads[1].items[0]), 2)
+
+    def test_change_set_validation(self):
+        batch = BatchRequest(BASE_URL, max_operations=1)
+
+        with self.assertRaises(ValueError):
+            with batch.change_set():
+                batch.get_entities("bots")
+
+        with self.assertRaises(ValueError):
+            with batch.change_set():
+                batch.delete_entity("botcomponents", "1")
+                batch.delete_entity("botcomponents", "2")
+
+    def test_parse_response(self):
+        batch = BatchRequest(BASE_URL)
+        batch.get_entity_by_id("bots", "1")
+        with batch.change_set():
+            batch.update_entity("botcomponents", "1", {"data": "a"})
+            batch.update_entity("botcomponents", "2", {"data": "b"})
+        with batch.change_set():
+            batch.delete_entity("botcomponents", "3")
+        batch.get_entity_by_id("bots", "2")
+
+        (payload,) = batch.payloads()
+        text = multipart("batchresponse_1", [
+            http_part(200, "OK", {"botid": "1"}),
+            # Responses in a change set may come back in any order
+            change_set("changesetresponse_1", [
+                http_part(204, "No Content", content_id=2),
+                http_part(204, "No Content", content_id=1),
+            ]),
+            # A failed change set returns a single error response
+            http_part(404, "Not Found", {"error": {"code": "0x80040217"}}),
+        ])
+        results = payload.parse_response("multipart/mixed; boundary=batchresponse_1", text)
+
+        # Assertions
+        self.assertEqual([result.status for result in results], [200, 204, 204, 404, None])
+        self.assertEqual(results[0].body, {"botid": "1"})
+        self.assertTrue(results[1].ok)
+        self.assertEqual(results[2].operation.url, f"{BASE_URL}/botcomponents(2)")
+        self.assertEqual(results[3].body["error"]["code"], "0x80040217")
+        self.assertFalse(results[4].ok)
+
+class TestExecuteBatch(unittest.TestCase):
+
+    def setUp(self):
+        # Import the client
+        from dataverse_api_cli.clients.dataverse import DataverseClient
+
+        # Initialize the client with patched httpx.Client
+        with patch('httpx.Client') as mock_client:
+            self.client_instance = mock_client.return_value
+            self.dataverse_client = DataverseClient(BASE_URL, "dummy_token")
+
+    def test_execute_batch(self):
+        responses = []
+        for status in (204, 204):
+            mock_response = MagicMock()
+            mock_response.headers = {"Content-Type": "multipart/mixed; boundary=b"}
+            mock_response.text = multipart("b", [http_part(status, "No Content")])
+            responses.append(mock_response)
+        self.client_instance.request.side_effect = responses
+
+        batch = self.dataverse_client.batch()
+        batch.max_operations = 1
+        batch.delete_entity("botcomponents", "1")
+        batch.delete_entity("botcomponents", "2")
+        results = self.dataverse_client.execute_batch(batch)
+
+        # Assertions
+        self.assertEqual([result.status for result in results], [204, 204])
+        self.assertEqual(self.client_instance.request.call_count, 2)
+        call = self.client_instance.request.call_args
+        self.assertEqual(call.args, ("POST", f"{BASE_URL}/$batch"))
+        self.assertTrue(call.kwargs["headers"]["Content-Type"].startswith("multipart/mixed"))
+        self.assertEqual(call.kwargs["headers"]["Prefer"], "odata.continue-on-error")
+        self.assertEqual(call.kwargs["headers"]["Authorization"], "Bearer dummy_token")
+
+    def test_update_yaml_fields(self):
+        from dataverse_api_cli.models.entities import EntityManager
+
+        reads = MagicMock()
+        reads.headers = {"Content-Type": "multipart/mixed; boundary=b"}
+        reads.text = multipart("b", [
+            http_part(200, "OK", {"data": "kind: AdaptiveDialog\r\nmodelDescription: old\r\n"}),
+            http_part(200, "OK", {"data": "kind: AdaptiveDialog\r\n"}),
+        ])
+        writes = MagicMock()
+        writes.headers = reads.headers
+        writes.text = multipart("b", [http_part(204, "No Content"), http_part(204, "No Content")])
+        self.client_instance.request.side_effect = [reads, writes]
+
+        results = EntityManager(self.dataverse_client).update_yaml_fields(
+            "botcomponents", ["1", "2"], "modelDescription", "new"
+        )
+
+        # Assertions
+        self.assertEqual([result.status for result in results], [204, 204])
+        body = self.client_instance.request.call_args.kwargs["content"].decode("utf-8")
+        self.assertEqual(body.count(" HTTP/1.1"), 2)
+        self.assertIn("PATCH " + f"{BASE_URL}/botcomponents(2) HTTP/1.1", body)
+        self.assertIn("modelDescription: new", body)
+
+if __name__ == '__main__':
+    unittest.main()
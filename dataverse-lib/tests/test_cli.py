@@ -0,0 +1,51 @@
+"""Tests for the command-line interface."""
+import os
+import subprocess
+import sys
+import unittest
+
+from click.testing import CliRunner
+
+from dataverse_api_cli.cli import LAZY_SUBCOMMANDS, cli
+
+class TestCli(unittest.TestCase):
+
+    def test_help_does_not_import_commands(self):
+        code = (
+            "import sys\n"
+            "from dataverse_api_cli.cli import cli\n"
+            "try:\n"
+            "    cli(['--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(sorted(m for m in ('msal', 'httpx', 'yaml', 'rich', 'dotenv') if m in sys.modules))\n"
+        )
+        # No configuration is needed to show help
+        env = {k: v for k, v in os.environ.items() if k not in ("CLIENT_ID", "CLIENT_SECRET")}
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True
+        )
+
+        self.assertIn("entity-definition", result.stdout)
+        self.assertTrue(result.stdout.rstrip().endswith("[]"))
+
+    def test_lazy_help_matches_commands(self):
+        for name, (_, short_help) in LAZY_SUBCOMMANDS.items():
+            with self.subTest(name=name):
+                command = cli.get_command(None, name)
+                self.assertEqual(command.get_short_help_str(200), short_help)
+
+    def test_subcommand_help(self):
+        result = CliRunner().invoke(cli, ["bot", "--help"])
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn("get-component-field", result.output)
+
+    def test_unknown_command(self):
+        result = CliRunner().invoke(cli, ["nope"])
+
+        self.assertNotEqual(result.exit_code, 0)
+        self.assertIn("No such command", result.output)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -52,6 +52,72 @@ class TestDataverseClient(unittest.TestCase):
         # Assertions
         self.assertEqual(result, [{"id": "1", "name": "Test"}])
         
+    def test_iter_entities_follows_next_link(self):
+        next_link = f"{self.base_url}/conversationtranscripts?$skiptoken=abc"
+        first_page = MagicMock()
+        first_page.json.return_value = {
+            "value": [{"id": "1"}, {"id": "2"}],
+            "@odata.nextLink": next_link
+        }
+        second_page = MagicMock()
+        second_page.json.return_value = {"value": [{"id": "3"}]}
+        self.client_instance.request.side_effect = [first_page, second_page]
+        
+        # Test iter_entities method
+        result = self.dataverse_client.iter_entities(
+            "conversationtranscripts",
+            filter="_bot_conversationtranscriptid_value eq 'bot'",
+            page_size=2
+        )
+        
+        # Assertions - nothing is fetched until the iterator is consumed
+        self.client_instance.request.assert_not_called()
+        self.assertEqual([e["id"] for e in result], ["1", "2", "3"])
+        first_call, second_call = self.client_instance.request.call_args_list
+        self.assertEqual(first_call.args[1], f"{self.base_url}/conversationtranscripts")
+        self.assertEqual(
+            first_call.kwargs["params"],
+            {"$filter": "_bot_conversationtranscriptid_value eq 'bot'"}
+        )
+        self.assertEqual(second_call.args[1], next_link)
+        self.assertIsNone(second_call.kwargs["params"])
+        for call in (first_call, second_call):
+            self.assertEqual(call.kwargs["headers"]["Prefer"], "odata.maxpagesize=2")
+            self.assertEqual(call.kwargs["headers"]["Authorization"], "Bearer dummy_token")
+        
+    def test_get_entities_collects_every_page(self):
+        first_page = MagicMock()
+        first_page.json.return_value = {
+            "value": [{"id": "1"}],
+            "@odata.nextLink": f"{self.base_url}/contacts?$skiptoken=abc"
+        }
+        second_page = MagicMock()
+        second_page.json.return_value = {"value": [{"id": "2"}]}
+        self.client_instance.request.side_effect = [first_page, second_page]
+        
+        # Test get_entities method
+        result = self.dataverse_client.get_entities("contacts")
+        
+        # Assertions
+        self.assertEqual(result, [{"id": "1"}, {"id": "2"}])
+        
+    def test_token_provider_called_per_request(self):
+        from dataverse_api_cli.clients.dataverse import DataverseClient
+        
+        tokens = iter(["first_token", "second_token"])
+        with patch('httpx.Client') as mock_client:
+            client = DataverseClient(self.base_url, lambda: next(tokens))
+        mock_client.return_value.request.return_value.content = b''
+        
+        # Test the request method
+        client.request("contacts")
+        client.request("contacts")
+        
+        # Assertions
+        first_call, second_call = mock_client.return_value.request.call_args_list
+        self.assertEqual(first_call.kwargs["headers"]["Authorization"], "Bearer first_token")
+        self.assertEqual(second_call.kwargs["headers"]["Authorization"], "Bearer second_token")
+        
     def tearDown(self):
         # Clean up
         self.dataverse_client.close()
@@ -0,0 +1,125 @@
+"""Tests for the session command."""
+import io
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from dataverse_api_cli.cli import cli
+from dataverse_api_cli.commands.session import read_batches
+from dataverse_api_cli.config import get_config
+
+class TestReadBatches(unittest.TestCase):
+
+    def test_wait_splits_batches(self):
+        script = io.StringIO(
+            "# export contacts\n"
+            "entity list contacts --filter=\"contains(fullname, 'a b')\"\n"
+            "\n"
+            "bot list\n"
+            "wait\n"
+            "bot get 'My Bot'\n"
+        )
+
+        self.assertEqual(list(read_batches(script)), [
+            [["entity", "list", "contacts", "--filter=contains(fullname, 'a b')"], ["bot", "list"]],
+            [["bot", "get", "My Bot"]],
+        ])
+
+    def test_sequential_commands_are_not_batched(self):
+        script = io.StringIO("bot list\nbot get b1\n")
+
+        self.assertEqual(
+            list(read_batches(script, concurrent=False)),
+            [[["bot", "list"]], [["bot", "get", "b1"]]],
+        )
+
+class TestSession(unittest.TestCase):
+
+    def setUp(self):
+        # Without this the real configuration would need credentials in the environment
+        config = {"dataverse_endpoint": "https://test-instance.api.crm.dynamics.com/api/data/v9.2"}
+        get_config.cache_clear()
+        self.addCleanup(get_config.cache_clear)
+        for target in ('dataverse_api_cli.config.get_config', 'dataverse_api_cli.clients.shared.get_config'):
+            patcher = patch(target, return_value=config)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = patch('dataverse_api_cli.commands.session.get_access_token')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch('dataverse_api_cli.clients.shared.DataverseClient')
+        self.mock_client_class = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = self.mock_client_class.return_value
+
+    def test_commands_share_one_client(self):
+        self.client.get_entities.return_value = [{"name": "a"}]
+
+        result = CliRunner().invoke(
+            cli,
+            ["session", "--http1"],
+            input="entity list contacts --format=json\nentity list accounts --format=json\n",
+        )
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.mock_client_class.assert_called_once()
+        self.assertFalse(self.mock_client_class.call_args.kwargs["http2"])
+        self.assertEqual(
+            [c.kwargs["entity_name"] for c in self.client.get_entities.call_args_list],
+            ["contacts", "accounts"],
+        )
+        self.client.close.assert_called_once()
+
+    def test_jobs_run_commands_concurrently(self):
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def get_entities(**kwargs):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+            return []
+
+        self.client.get_entities.side_effect = get_entities
+        script = "".join(f"entity list e{i} --format=json\n" for i in range(8))
+
+        result = CliRunner().invoke(cli, ["session", "--jobs=4", "--http1"], input=script)
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(self.client.get_entities.call_count, 8)
+        self.assertEqual(peak, 4)
+
+    def test_failures_are_counted(self):
+        self.client.get_entities.side_effect = RuntimeError("boom")
+
+        result = CliRunner().invoke(
+            cli,
+            ["session", "--http1"],
+            input="entity list contacts\nnope\nsession\nentity list accounts\n",
+        )
+
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn("4 command(s) failed", result.output)
+
+    def test_stop_on_error(self):
+        self.client.get_entities.side_effect = RuntimeError("boom")
+
+        result = CliRunner().invoke(
+            cli,
+            ["session", "--stop-on-error", "--http1"],
+            input="entity list contacts\nentity list accounts\n",
+        )
+
+        self.assertEqual(result.exit_code, 1)
+        self.assertEqual(self.client.get_entities.call_count, 1)
+
+if __name__ == '__main__':
+    unittest.main()
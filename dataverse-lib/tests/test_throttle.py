@@ -0,0 +1,157 @@
+"""Tests for rate governing and retries."""
+import threading
+import time
+import unittest
+from email.utils import formatdate
+
+import httpx
+
+from dataverse_api_cli.clients.dataverse import AsyncDataverseClient, DataverseClient
+from dataverse_api_cli.clients.throttle import (
+    BURST_REMAINING_HEADER, TIME_REMAINING_HEADER, RateGovernor, RetryPolicy, retry_after
+)
+
+BASE_URL = "https://dv.test/api/data/v9.2"
+
+def response(status_code, **headers):
+    return httpx.Response(status_code, headers=headers, request=httpx.Request("GET", BASE_URL))
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def test_retry_after(self):
+        self.assertEqual(retry_after(response(429, **{"Retry-After": "7"})), 7.0)
+        self.assertAlmostEqual(
+            retry_after(response(429, **{"Retry-After": formatdate(time.time() + 30, usegmt=True)})), 30, delta=2
+        )
+        self.assertIsNone(retry_after(response(429)))
+        self.assertIsNone(retry_after(response(429, **{"Retry-After": "soon"})))
+
+    def test_should_retry(self):
+        policy = RetryPolicy(max_attempts=3)
+
+        self.assertTrue(policy.should_retry("POST", 1, response=response(429)))
+        self.assertFalse(policy.should_retry("POST", 1, response=response(503)))
+        self.assertTrue(policy.should_retry("GET", 2, response=response(503)))
+        self.assertFalse(policy.should_retry("GET", 3, response=response(503)))
+        self.assertFalse(policy.should_retry("GET", 1, response=response(404)))
+        self.assertTrue(policy.should_retry("DELETE", 1, error=httpx.ConnectError("refused")))
+        self.assertFalse(policy.should_retry("GET", 1, error=ValueError("bad")))
+
+    def test_delay(self):
+        policy = RetryPolicy(backoff=1.0, max_backoff=10.0)
+
+        self.assertEqual(policy.delay(1, response(429, **{"Retry-After": "3"})), 3.0)
+        self.assertEqual(policy.delay(1, response(429, **{"Retry-After": "300"})), 10.0)
+        for attempt in range(1, 8):
+            self.assertTrue(0 <= policy.delay(attempt) <= min(10.0, 2 ** (attempt - 1)))
+
+class TestRateGovernor(unittest.TestCase):
+
+    def test_throttling_halves_limits_and_pauses(self):
+        governor = RateGovernor(rate=20, burst=10, max_concurrency=8)
+        governor.acquire()
+        governor.release(response(429, **{"Retry-After": "0.2"}))
+
+        self.assertEqual((governor.rate, governor.concurrency), (10, 4))
+        started = time.monotonic()
+        governor.acquire()
+        self.assertGreaterEqual(time.monotonic() - started, 0.15)
+
+    def test_success_recovers_limits(self):
+        governor = RateGovernor(rate=1000, burst=10, max_concurrency=8)
+        governor.acquire()
+        governor.release(response(429))
+        for _ in range(200):
+            governor.acquire()
+            governor.release(response(200))
+
+        self.assertEqual((governor.rate, governor.concurrency), (1000, 8))
+
+    def test_ratelimit_headers_slow_requests(self):
+        governor = RateGovernor(rate=1000, burst=50, max_concurrency=8)
+        governor.acquire()
+        governor.release(response(200, **{BURST_REMAINING_HEADER: "0", TIME_REMAINING_HEADER: "12.5"}))
+
+        self.assertLess(governor.concurrency, 8)
+        self.assertEqual(governor._tokens, 0)
+
+    def test_concurrency_limit_across_threads(self):
+        governor = RateGovernor(rate=1000, burst=100, max_concurrency=2)
+        lock = threading.Lock()
+        in_flight = peak = 0
+
+        def worker():
+            nonlocal in_flight, peak
+            governor.acquire()
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            governor.release(response(200))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(peak, 2)
+
+class TestClientRetries(unittest.TestCase):
+
+    def setUp(self):
+        self.responses = []
+        self.calls = 0
+        self.client = DataverseClient(BASE_URL, "token", governor=RateGovernor(), retry=RetryPolicy(backoff=0))
+        self.client.client.close()
+        self.client.client = httpx.Client(transport=httpx.MockTransport(self.handler))
+
+    def tearDown(self):
+        self.client.close()
+
+    def handler(self, request):
+        self.calls += 1
+        status_code, headers = self.responses.pop(0)
+        return httpx.Response(status_code, headers=headers, json={"value": [{"id": "1"}]})
+
+    def test_throttled_request_is_retried(self):
+        self.responses = [(429, {"Retry-After": "0"}), (503, {}), (200, {})]
+
+        self.assertEqual(self.client.get_entities("contacts"), [{"id": "1"}])
+        self.assertEqual(self.calls, 3)
+
+    def test_non_idempotent_request_is_not_retried_on_server_error(self):
+        self.responses = [(503, {}), (200, {})]
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            self.client.create_entity("contacts", {"fullname": "x"})
+        self.assertEqual(self.calls, 1)
+
+    def test_gives_up_after_max_attempts(self):
+        self.client.retry = RetryPolicy(max_attempts=2, backoff=0)
+        self.responses = [(429, {"Retry-After": "0"})] * 3
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            self.client.get_entities("contacts")
+        self.assertEqual(self.calls, 2)
+
+class TestAsyncClientRetries(unittest.IsolatedAsyncioTestCase):
+
+    async def test_throttled_request_is_retried(self):
+        responses = [(429, {"Retry-After": "0"}), (200, {})]
+
+        def handler(request):
+            status_code, headers = responses.pop(0)
+            return httpx.Response(status_code, headers=headers, json={"value": [{"id": "1"}]})
+
+        async with AsyncDataverseClient(BASE_URL, "token", governor=RateGovernor()) as client:
+            await client.client.aclose()
+            client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+            self.assertEqual(await client.get_entities("contacts"), [{"id": "1"}])
+        self.assertEqual(responses, [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+"""Tests for the local transcript store."""
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+
+import httpx
+
+from dataverse_api_cli.clients.dataverse import DataverseClient
+from dataverse_api_cli.models.transcript_store import TranscriptStore
+
+BOT_ID = "00000000-0000-0000-0000-0000000000b1"
+OTHER_BOT_ID = "00000000-0000-0000-0000-0000000000b2"
+BASE_URL = "https://dv.test/api/data/v9.2"
+
+def transcript(number, conversation_id, user_id, started, bot_id=BOT_ID, text="hi"):
+    return {
+        "conversationtranscriptid": f"t{number}",
+        "name": f"{conversation_id}_{bot_id}",
+        "conversationstarttime": started,
+        "createdon": started,
+        "modifiedon": started,
+        "statecode": 0,
+        "_bot_conversationtranscriptid_value": bot_id,
+        "content": json.dumps({"activities": [
+            {"id": f"a{number}-1", "type": "message", "from": {"id": bot_id, "role": 0}, "text": "Welcome"},
+            {"id": f"a{number}-2", "type": "message", "from": {"id": user_id, "role": 1},
+             "conversation": {"id": conversation_id}, "text": text},
+        ]}),
+    }
+
+class TestTranscriptStore(unittest.TestCase):
+
+    def setUp(self):
+        self.store = TranscriptStore(":memory:")
+        self.store.apply([
+            ("upsert", transcript(1, "convA", "user1", "2024-05-01T08:00:00Z", text="where is my refund")),
+            ("upsert", transcript(2, "convB", "user1", "2024-05-02T08:00:00Z")),
+            ("upsert", transcript(3, "convA", "user2", "2024-05-03T08:00:00Z", bot_id=OTHER_BOT_ID)),
+        ])
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_find_by_conversation_id(self):
+        found = self.store.find_by_conversation_id("convA", bot_id=BOT_ID.upper())
+
+        self.assertEqual(found["conversationtranscriptid"], "t1")
+        self.assertEqual(found["name"], f"convA_{BOT_ID}")
+        self.assertIn("refund", found["content"])
+        self.assertEqual(found["statecode"], 0)
+        self.assertEqual(self.store.find_by_conversation_id("conv")["conversationtranscriptid"], "t3")
+        self.assertIsNone(self.store.find_by_conversation_id("convC"))
+
+    def test_lookup_uses_index(self):
+        plan = self.store.connection.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM transcripts WHERE conversation_id >= ? AND conversation_id < ?",
+            ("a", "b")
+        ).fetchall()
+
+        self.assertIn("transcripts_conversation", " ".join(row[-1] for row in plan))
+
+    def test_find_by_user_bot_and_time(self):
+        ids = lambda records: [r["conversationtranscriptid"] for r in records]
+
+        self.assertEqual(ids(self.store.find(user_id="user1")), ["t2", "t1"])
+        self.assertEqual(ids(self.store.find(bot_id=OTHER_BOT_ID)), ["t3"])
+        self.assertEqual(ids(self.store.find(since="2024-05-02T00:00:00Z", until="2024-05-03T00:00:00Z")), ["t2"])
+
+    def test_upsert_replaces_and_delete_removes(self):
+        self.store.apply([
+            ("upsert", transcript(1, "convA", "user3", "2024-05-01T08:00:00Z")),
+            ("delete", {"conversationtranscriptid": "t2"}),
+        ])
+
+        self.assertEqual(self.store.count(), 2)
+        self.assertEqual(self.store.find(user_id="user3")[0]["conversationtranscriptid"], "t1")
+        self.assertIsNone(self.store.get("t2"))
+        if self.store.full_text:
+            self.assertEqual(self.store.search("refund"), [])
+
+    def test_search(self):
+        if not self.store.full_text:
+            self.skipTest("SQLite without FTS5")
+
+        self.assertEqual([r["conversationtranscriptid"] for r in self.store.search("refund")], ["t1"])
+
+class TestTranscriptStoreSync(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "transcripts.db")
+        self.pages = {}
+        self.client = DataverseClient(BASE_URL, "token")
+        self.client.client.close()
+        self.client.client = httpx.Client(transport=httpx.MockTransport(self.handler))
+
+    def tearDown(self):
+        self.client.close()
+        self.directory.cleanup()
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=self.pages[request.url.params.get("token", "start")])
+
+    def test_sync_applies_changes_since_last_sync(self):
+        self.pages = {
+            "start": {"value": [
+                transcript(1, "convA", "user1", "2024-05-01T08:00:00Z"),
+                transcript(2, "convB", "user1", "2024-05-02T08:00:00Z", bot_id=OTHER_BOT_ID),
+            ], "@odata.deltaLink": f"{BASE_URL}/conversationtranscripts?token=d1"},
+            "d1": {"value": [
+                transcript(3, "convC", "user2", "2024-05-03T08:00:00Z"),
+                {"@odata.context": f"{BASE_URL}/$metadata#conversationtranscripts/$deletedEntity",
+                 "id": "t1", "reason": "deleted"},
+            ], "@odata.deltaLink": f"{BASE_URL}/conversationtranscripts?token=d2"},
+        }
+
+        with TranscriptStore(self.path) as store:
+            stats = store.sync(self.client, bot_id=BOT_ID)
+            self.assertEqual((stats.upserted, store.count()), (1, 1))
+
+        with TranscriptStore(self.path) as store:
+            stats = store.sync(self.client, bot_id=BOT_ID)
+
+            self.assertEqual((stats.upserted, stats.deleted), (1, 1))
+            self.assertEqual([r["conversationtranscriptid"] for r in store.find()], ["t3"])
+            self.assertEqual(store.sync_state()["delta_link"], f"{BASE_URL}/conversationtranscripts?token=d2")
+
+    def test_interrupted_sync_leaves_store_unchanged(self):
+        self.pages = {
+            "start": {"value": [transcript(1, "convA", "user1", "2024-05-01T08:00:00Z")],
+                      "@odata.deltaLink": f"{BASE_URL}/conversationtranscripts?token=d1"},
+            "d1": {"value": [transcript(2, "convB", "user1", "2024-05-02T08:00:00Z")],
+                   "@odata.nextLink": f"{BASE_URL}/conversationtranscripts?token=missing"},
+        }
+
+        with TranscriptStore(self.path) as store:
+            store.sync(self.client)
+            with self.assertRaises(KeyError):
+                store.sync(self.client)
+
+            self.assertEqual(store.count(), 1)
+            self.assertEqual(store.sync_state()["delta_link"], f"{BASE_URL}/conversationtranscripts?token=d1")
+
+    def test_store_without_state_is_read_again(self):
+        connection = sqlite3.connect(self.path)
+        connection.executescript(
+            "CREATE TABLE transcripts (transcript_id TEXT PRIMARY KEY, name TEXT, conversation_id TEXT, "
+            "bot_id TEXT, user_id TEXT, conversation_start_time TEXT, created_on TEXT, modified_on TEXT, "
+            "content TEXT);"
+            "CREATE TABLE sync_state (key TEXT PRIMARY KEY, value TEXT);"
+            "INSERT INTO transcripts (transcript_id) VALUES ('t1');"
+            "INSERT INTO sync_state VALUES ('delta_link', '\"d1\"');"
+        )
+        connection.close()
+        self.pages = {"start": {"value": [transcript(1, "convA", "user1", "2024-05-01T08:00:00Z")],
+                                "@odata.deltaLink": f"{BASE_URL}/conversationtranscripts?token=d1"}}
+
+        with TranscriptStore(self.path) as store:
+            self.assertEqual(store.sync_state(), {})
+            store.sync(self.client)
+
+            self.assertEqual(store.get("t1")["statecode"], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,253 @@
+"""Tests for conversation transcript export and sync."""
+import json
+import os
+import re
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+
+import httpx
+
+from dataverse_api_cli.clients.dataverse import AsyncDataverseClient, DataverseClient
+from dataverse_api_cli.models.transcripts import (
+    ACTIVITY_COLUMNS, TranscriptExporter, TranscriptSync, flatten_transcript, parse_timestamp
+)
+from dataverse_api_cli.utils.export import Checkpoint
+
+BOT_ID = "00000000-0000-0000-0000-0000000000b1"
+
+def transcript(number, modifiedon):
+    return {
+        "conversationtranscriptid": f"t{number}",
+        "name": f"conv{number}_{BOT_ID}",
+        "modifiedon": modifiedon,
+        "createdon": modifiedon,
+        "_bot_conversationtranscriptid_value": BOT_ID,
+        "content": json.dumps({"activities": [
+            {"id": f"a{number}-1", "type": "message", "timestamp": 1714564800,
+             "from": {"id": "user1", "role": 1}, "text": "hi"},
+            {"id": f"a{number}-2", "type": "message", "timestamp": 1714564801,
+             "from": {"id": "bot", "role": 0}, "text": "hello",
+             "attachments": [{"contentType": "text/plain"}]},
+        ]}),
+    }
+
+class TestFlattenTranscript(unittest.TestCase):
+
+    def test_one_row_per_activity(self):
+        rows = flatten_transcript(transcript(1, "2024-05-01T12:00:00Z"))
+
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(set(rows[0]), set(ACTIVITY_COLUMNS))
+        self.assertEqual(rows[0]["conversation_id"], "conv1")
+        self.assertEqual(rows[0]["timestamp"], "2024-05-01T12:00:00Z")
+        self.assertEqual(rows[0]["from_role"], "1")
+        self.assertEqual(rows[1]["activity_index"], 1)
+        self.assertEqual(json.loads(rows[1]["attachments"]), [{"contentType": "text/plain"}])
+
+    def test_unreadable_content_raises(self):
+        with self.assertRaises(ValueError):
+            flatten_transcript({"content": "not json"})
+        with self.assertRaises(ValueError):
+            flatten_transcript({"content": "[]"})
+        self.assertEqual(flatten_transcript({"content": None}), [])
+
+class TestTranscriptExporter(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.output_dir = self.directory.name
+        self.transcripts = [
+            transcript(1, "2024-05-01T08:00:00Z"),
+            transcript(2, "2024-05-01T20:00:00Z"),
+            transcript(3, "2024-05-03T09:30:00Z"),
+        ]
+        self.filters = []
+        self.client = AsyncDataverseClient("https://dv.test/api/data/v9.2", "token")
+        await self.client.client.aclose()
+        self.client.client = httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+
+    async def asyncTearDown(self):
+        await self.client.close()
+        self.directory.cleanup()
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        query = request.url.params.get("$filter", "")
+        self.filters.append(query)
+        bounds = re.findall(r"modifiedon (ge|lt) (\S+)", query)
+        rows = self.transcripts
+        for operator, value in bounds:
+            bound = parse_timestamp(value)
+            if operator == "ge":
+                rows = [r for r in rows if parse_timestamp(r["modifiedon"]) >= bound]
+            else:
+                rows = [r for r in rows if parse_timestamp(r["modifiedon"]) < bound]
+        if request.url.params.get("$top") == "1":
+            rows = rows[:1]
+        return httpx.Response(200, json={"value": rows})
+
+    def exporter(self, **kwargs):
+        kwargs.setdefault("checkpoint", Checkpoint(os.path.join(self.output_dir, "_checkpoint.json")))
+        return TranscriptExporter(self.client, self.output_dir, bot_id=BOT_ID, **kwargs)
+
+    def read_rows(self):
+        rows = []
+        for root, _, files in os.walk(self.output_dir):
+            for name in sorted(files):
+                if name.endswith(".jsonl"):
+                    with open(os.path.join(root, name)) as f:
+                        rows.extend(json.loads(line) for line in f)
+        return rows
+
+    async def test_export_writes_daily_partitions(self):
+        end = datetime(2024, 5, 4, tzinfo=timezone.utc)
+        stats = await self.exporter(concurrency=2).run(end=end)
+
+        self.assertEqual((stats.windows, stats.files, stats.transcripts, stats.activities), (3, 2, 3, 6))
+        self.assertEqual(
+            sorted(os.listdir(self.output_dir)),
+            ["_checkpoint.json", "date=2024-05-01", "date=2024-05-03"],
+        )
+        self.assertEqual(
+            os.listdir(os.path.join(self.output_dir, "date=2024-05-01")),
+            ["transcripts-20240501T000000Z.jsonl"],
+        )
+        self.assertEqual(
+            sorted(row["activity_id"] for row in self.read_rows()),
+            ["a1-1", "a1-2", "a2-1", "a2-2", "a3-1", "a3-2"],
+        )
+        self.assertIn(f"_bot_conversationtranscriptid_value eq {BOT_ID}", self.filters[-1])
+        with open(os.path.join(self.output_dir, "_checkpoint.json")) as f:
+            self.assertEqual(json.load(f)["cursor"], "2024-05-04T00:00:00Z")
+
+    async def test_export_resumes_from_checkpoint(self):
+        await self.exporter().run(end=datetime(2024, 5, 2, tzinfo=timezone.utc))
+        self.transcripts.append(transcript(4, "2024-05-02T10:00:00Z"))
+        self.filters.clear()
+
+        stats = await self.exporter(window=timedelta(hours=12)).run(
+            end=datetime(2024, 5, 3, tzinfo=timezone.utc)
+        )
+
+        self.assertEqual((stats.windows, stats.transcripts), (2, 1))
+        self.assertIn("modifiedon ge 2024-05-02T00:00:00Z", self.filters[0])
+        self.assertEqual(len(self.read_rows()), 6)
+
+    async def test_failed_window_holds_back_checkpoint(self):
+        checkpoint = Checkpoint(os.path.join(self.output_dir, "_checkpoint.json"))
+        exporter = self.exporter(checkpoint=checkpoint, concurrency=1)
+        original = exporter.export_window
+
+        async def export_window(start, end, stats):
+            if start.day == 2:
+                raise RuntimeError("throttled")
+            await original(start, end, stats)
+
+        exporter.export_window = export_window
+        with self.assertRaises(RuntimeError):
+            await exporter.run(end=datetime(2024, 5, 4, tzinfo=timezone.utc))
+
+        self.assertEqual(checkpoint.get("cursor"), "2024-05-02T00:00:00Z")
+        self.assertFalse(any(name.endswith(".tmp") for _, _, files in os.walk(self.output_dir) for name in files))
+
+    def test_checkpoint_of_other_export_is_rejected(self):
+        checkpoint = Checkpoint(None)
+        checkpoint.save(bot_id="other", cursor_field="modifiedon", cursor="2024-05-01T00:00:00Z")
+
+        with self.assertRaises(ValueError):
+            self.exporter(checkpoint=checkpoint)
+
+class TestTranscriptSync(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.output_dir = self.directory.name
+        self.state_path = os.path.join(self.output_dir, "_sync_state.json")
+        self.requests = []
+        self.pages = {}
+        self.client = DataverseClient("https://dv.test/api/data/v9.2", "token")
+        self.client.client.close()
+        self.client.client = httpx.Client(transport=httpx.MockTransport(self.handler))
+
+    def tearDown(self):
+        self.client.close()
+        self.directory.cleanup()
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return httpx.Response(200, json=self.pages[str(request.url.params.get("token", "start"))])
+
+    def sync(self, **kwargs):
+        return TranscriptSync(self.client, Checkpoint(self.state_path), **kwargs)
+
+    def read_rows(self):
+        rows = []
+        for root, _, files in os.walk(self.output_dir):
+            for name in sorted(files):
+                if name.endswith(".jsonl"):
+                    with open(os.path.join(root, name)) as f:
+                        rows.extend(json.loads(line) for line in f)
+        return rows
+
+    def test_first_sync_reads_everything_and_saves_delta_link(self):
+        other_bot = dict(transcript(2, "2024-05-01T09:00:00Z"), _bot_conversationtranscriptid_value="other")
+        self.pages = {
+            "start": {"value": [transcript(1, "2024-05-01T08:00:00Z")],
+                      "@odata.nextLink": "https://dv.test/api/data/v9.2/conversationtranscripts?token=2"},
+            "2": {"value": [other_bot], "@odata.deltaLink": "https://dv.test/api/data/v9.2/conversationtranscripts?token=d1"},
+        }
+
+        stats = self.sync(bot_id=BOT_ID.upper(), page_size=100).run(self.output_dir)
+
+        self.assertEqual((stats.upserted, stats.deleted, stats.activities, stats.files), (1, 0, 2, 1))
+        self.assertEqual(self.requests[0].headers["Prefer"], "odata.track-changes,odata.maxpagesize=100")
+        self.assertNotIn("$filter", self.requests[0].url.params)
+        self.assertEqual({row["change"] for row in self.read_rows()}, {"upsert"})
+        with open(self.state_path) as f:
+            state = json.load(f)
+        self.assertEqual(state["delta_link"], "https://dv.test/api/data/v9.2/conversationtranscripts?token=d1")
+        self.assertEqual(state["bot_id"], BOT_ID)
+
+    def test_next_sync_starts_from_delta_link(self):
+        Checkpoint(self.state_path).save(
+            bot_id=None, delta_link="https://dv.test/api/data/v9.2/conversationtranscripts?token=d1"
+        )
+        self.pages = {
+            "d1": {"value": [
+                transcript(3, "2024-05-02T08:00:00Z"),
+                {"@odata.context": "https://dv.test/api/data/v9.2/$metadata#conversationtranscripts/$deletedEntity",
+                 "id": "t1", "reason": "deleted"},
+            ], "@odata.deltaLink": "https://dv.test/api/data/v9.2/conversationtranscripts?token=d2"},
+        }
+
+        stats = self.sync().run(self.output_dir)
+
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual((stats.upserted, stats.deleted), (1, 1))
+        self.assertIn({"change": "delete", "transcript_id": "t1"},
+                      [{k: v for k, v in row.items() if v is not None} for row in self.read_rows()])
+        self.assertEqual(Checkpoint(self.state_path).get("delta_link"),
+                         "https://dv.test/api/data/v9.2/conversationtranscripts?token=d2")
+
+    def test_failed_sync_keeps_previous_delta_link(self):
+        Checkpoint(self.state_path).save(
+            bot_id=None, delta_link="https://dv.test/api/data/v9.2/conversationtranscripts?token=d1"
+        )
+        self.pages = {"d1": {"value": [dict(transcript(3, "2024-05-02T08:00:00Z"), content="not json")]}}
+        self.pages["d1"]["@odata.nextLink"] = "https://dv.test/api/data/v9.2/conversationtranscripts?token=missing"
+
+        with self.assertRaises(KeyError):
+            self.sync().run(self.output_dir)
+
+        self.assertEqual(Checkpoint(self.state_path).get("delta_link"),
+                         "https://dv.test/api/data/v9.2/conversationtranscripts?token=d1")
+        self.assertFalse(any(name.startswith("changes-") for _, _, files in os.walk(self.output_dir) for name in files))
+
+    def test_state_of_other_bot_is_rejected(self):
+        Checkpoint(self.state_path).save(bot_id="other", delta_link="https://dv.test/delta")
+
+        with self.assertRaises(ValueError):
+            self.sync(bot_id=BOT_ID)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+"""Activities deserialized per second, via from_dict and via the API client.
+
+Usage, from directline-lib:
+
+    PYTHONPATH=. python benchmarks/deserialize_activities.py [activities per set] [rounds]
+"""
+import json
+import sys
+import time
+
+from direct_line.api_client import ApiClient
+from direct_line.models.activity_set import ActivitySet
+
+
+def activity(number):
+    return {
+        "type": "message",
+        "id": f"abc|{number:07d}",
+        "timestamp": "2024-05-01T12:00:00.123Z",
+        "channelId": "directline",
+        "from": {"id": "bot", "name": "Bot", "role": "bot"},
+        "conversation": {"id": "abc"},
+        "recipient": {"id": "user", "role": "user"},
+        "text": "Here is what I found.",
+        "attachments": [{
+            "contentType": "application/vnd.microsoft.card.hero",
+            "content": {"title": "Result", "buttons": [{"type": "imBack", "value": "more"}]},
+        }],
+        "entities": [{"type": "ClientCapabilities", "requiresBotState": True}],
+        "suggestedActions": {"to": ["user"], "actions": [{"type": "imBack", "title": "More", "value": "more"}]},
+        "replyToId": f"abc|{number - 1:07d}",
+    }
+
+
+def measure(name, deserialize, text, count, rounds):
+    deserialize(text)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        deserialize(text)
+    elapsed = time.perf_counter() - start
+    rate = count * rounds / elapsed
+    print(f"{name:<28} {rate:>12,.0f} activities/s")
+    return rate
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    text = json.dumps({"activities": [activity(i) for i in range(size)], "watermark": str(size)})
+    api_client = ApiClient()
+
+    before = measure(
+        "json.loads + from_dict", lambda t: ActivitySet.from_dict(json.loads(t)), text, size, rounds
+    )
+    after = measure(
+        "ApiClient.deserialize",
+        lambda t: api_client.deserialize(t, "ActivitySet", "application/json"),
+        text, size, rounds,
+    )
+    print(f"{'speedup':<28} {after / before:>12.1f}x")
+
+
+if __name__ == "__main__":
+    main()
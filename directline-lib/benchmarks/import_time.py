@@ -0,0 +1,53 @@
+"""Cold-start import time of the SDK, measured with ``python -X importtime``.
+
+Each statement runs in a fresh interpreter; the cumulative time of its
+top-level imports is reported as the median over several runs.
+
+Usage, from directline-lib:
+
+    PYTHONPATH=. python benchmarks/import_time.py [runs] [statement ...]
+
+The Bot Connector SDK can be measured the same way:
+
+    PYTHONPATH=../botconnector-lib python benchmarks/import_time.py 10 "import bot_connector"
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = [
+    "import direct_line",
+    "from direct_line import ApiClient",
+    "from direct_line import ActivitySet",
+    "from direct_line import ConversationsApi",
+]
+
+
+def import_time(statement):
+    """Microseconds spent importing for ``statement``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, check=True, env=os.environ,
+    )
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Nested imports are indented and already counted by their parent
+        if not name[1:].startswith(" "):
+            total += int(cumulative)
+    return total
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    statements = sys.argv[2:] or STATEMENTS
+    for statement in statements:
+        median = statistics.median(import_time(statement) for _ in range(runs))
+        print(f"{statement:<44} {median / 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
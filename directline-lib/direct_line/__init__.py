@@ -22,9 +22,33 @@ __all__ = [
     "ConversationsApi",
     "SessionApi",
     "TokensApi",
+    "AsyncConversationsApi",
+    "AsyncSessionApi",
+    "AsyncTokensApi",
     "ApiResponse",
     "ApiClient",
+    "AsyncApiClient",
+    "TokenBroker",
+    "TokenLease",
+    "ConversationStream",
+    "StreamManager",
+    "ActivityPoller",
+    "PolledConversation",
+    "ActivityIndex",
+    "ConversationCredential",
+    "bearer_auth",
+    "shared_api_client",
+    "shared_async_api_client",
+    "close_shared_api_clients",
+    "close_shared_async_api_clients",
+    "RequestTemplate",
     "Configuration",
+    "JsonCodec",
+    "OrjsonCodec",
+    "MsgspecCodec",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "CircuitOpenError",
     "OpenApiException",
     "ApiTypeError",
     "ApiValueError",
@@ -72,59 +96,176 @@ __all__ = [
     "VideoCard",
 ]
 
-# import apis into sdk package
-from direct_line.api.conversations_api import ConversationsApi
-from direct_line.api.session_api import SessionApi
-from direct_line.api.tokens_api import TokensApi
-
-# import ApiClient
-from direct_line.api_response import ApiResponse
-from direct_line.api_client import ApiClient
-from direct_line.configuration import Configuration
-from direct_line.exceptions import OpenApiException
-from direct_line.exceptions import ApiTypeError
-from direct_line.exceptions import ApiValueError
-from direct_line.exceptions import ApiKeyError
-from direct_line.exceptions import ApiAttributeError
-from direct_line.exceptions import ApiException
-
-# import models into sdk package
-from direct_line.models.activity import Activity
-from direct_line.models.activity_set import ActivitySet
-from direct_line.models.animation_card import AnimationCard
-from direct_line.models.attachment import Attachment
-from direct_line.models.audio_card import AudioCard
-from direct_line.models.basic_card import BasicCard
-from direct_line.models.card_action import CardAction
-from direct_line.models.card_image import CardImage
-from direct_line.models.channel_account import ChannelAccount
-from direct_line.models.conversation import Conversation
-from direct_line.models.conversation_account import ConversationAccount
-from direct_line.models.conversation_reference import ConversationReference
-from direct_line.models.entity import Entity
-from direct_line.models.error import Error
-from direct_line.models.error_response import ErrorResponse
-from direct_line.models.fact import Fact
-from direct_line.models.geo_coordinates import GeoCoordinates
-from direct_line.models.hero_card import HeroCard
-from direct_line.models.inner_http_error import InnerHttpError
-from direct_line.models.media_card import MediaCard
-from direct_line.models.media_url import MediaUrl
-from direct_line.models.mention import Mention
-from direct_line.models.message_reaction import MessageReaction
-from direct_line.models.o_auth_card import OAuthCard
-from direct_line.models.place import Place
-from direct_line.models.receipt_card import ReceiptCard
-from direct_line.models.receipt_item import ReceiptItem
-from direct_line.models.resource_response import ResourceResponse
-from direct_line.models.semantic_action import SemanticAction
-from direct_line.models.signin_card import SigninCard
-from direct_line.models.suggested_actions import SuggestedActions
-from direct_line.models.text_highlight import TextHighlight
-from direct_line.models.thing import Thing
-from direct_line.models.thumbnail_card import ThumbnailCard
-from direct_line.models.thumbnail_url import ThumbnailUrl
-from direct_line.models.token_parameters import TokenParameters
-from direct_line.models.token_request import TokenRequest
-from direct_line.models.token_response import TokenResponse
-from direct_line.models.video_card import VideoCard
+from typing import TYPE_CHECKING
+
+from direct_line.lazy_imports import lazy_exports
+
+# Exports are imported on first use rather than with the package
+__getattr__, __dir__ = lazy_exports(__name__, {
+    # import apis into sdk package
+    "ConversationsApi": "direct_line.api.conversations_api",
+    "SessionApi": "direct_line.api.session_api",
+    "TokensApi": "direct_line.api.tokens_api",
+    "AsyncConversationsApi": "direct_line.api.async_conversations_api",
+    "AsyncSessionApi": "direct_line.api.async_session_api",
+    "AsyncTokensApi": "direct_line.api.async_tokens_api",
+
+    # import ApiClient
+    "ApiResponse": "direct_line.api_response",
+    "ApiClient": "direct_line.api_client",
+    "AsyncApiClient": "direct_line.async_api_client",
+    "TokenBroker": "direct_line.token_broker",
+    "TokenLease": "direct_line.token_broker",
+    "ConversationStream": "direct_line.stream_manager",
+    "StreamManager": "direct_line.stream_manager",
+    "ActivityPoller": "direct_line.activity_poller",
+    "PolledConversation": "direct_line.activity_poller",
+    "ActivityIndex": "direct_line.activity_index",
+    "ConversationCredential": "direct_line.shared_client",
+    "bearer_auth": "direct_line.shared_client",
+    "shared_api_client": "direct_line.shared_client",
+    "shared_async_api_client": "direct_line.shared_client",
+    "close_shared_api_clients": "direct_line.shared_client",
+    "close_shared_async_api_clients": "direct_line.shared_client",
+    "RequestTemplate": "direct_line.request_template",
+    "MultipartStream": "direct_line.multipart",
+    "UploadFile": "direct_line.multipart",
+    "Configuration": "direct_line.configuration",
+    "JsonCodec": "direct_line.json_codec",
+    "OrjsonCodec": "direct_line.json_codec",
+    "MsgspecCodec": "direct_line.json_codec",
+    "RetryPolicy": "direct_line.resilience",
+    "CircuitBreaker": "direct_line.resilience",
+    "CircuitOpenError": "direct_line.resilience",
+    "OpenApiException": "direct_line.exceptions",
+    "ApiTypeError": "direct_line.exceptions",
+    "ApiValueError": "direct_line.exceptions",
+    "ApiKeyError": "direct_line.exceptions",
+    "ApiAttributeError": "direct_line.exceptions",
+    "ApiException": "direct_line.exceptions",
+
+    # import models into sdk package
+    "Activity": "direct_line.models.activity",
+    "ActivitySet": "direct_line.models.activity_set",
+    "AnimationCard": "direct_line.models.animation_card",
+    "Attachment": "direct_line.models.attachment",
+    "AudioCard": "direct_line.models.audio_card",
+    "BasicCard": "direct_line.models.basic_card",
+    "CardAction": "direct_line.models.card_action",
+    "CardImage": "direct_line.models.card_image",
+    "ChannelAccount": "direct_line.models.channel_account",
+    "Conversation": "direct_line.models.conversation",
+    "ConversationAccount": "direct_line.models.conversation_account",
+    "ConversationReference": "direct_line.models.conversation_reference",
+    "Entity": "direct_line.models.entity",
+    "Error": "direct_line.models.error",
+    "ErrorResponse": "direct_line.models.error_response",
+    "Fact": "direct_line.models.fact",
+    "GeoCoordinates": "direct_line.models.geo_coordinates",
+    "HeroCard": "direct_line.models.hero_card",
+    "InnerHttpError": "direct_line.models.inner_http_error",
+    "MediaCard": "direct_line.models.media_card",
+    "MediaUrl": "direct_line.models.media_url",
+    "Mention": "direct_line.models.mention",
+    "MessageReaction": "direct_line.models.message_reaction",
+    "OAuthCard": "direct_line.models.o_auth_card",
+    "Place": "direct_line.models.place",
+    "ReceiptCard": "direct_line.models.receipt_card",
+    "ReceiptItem": "direct_line.models.receipt_item",
+    "ResourceResponse": "direct_line.models.resource_response",
+    "SemanticAction": "direct_line.models.semantic_action",
+    "SigninCard": "direct_line.models.signin_card",
+    "SuggestedActions": "direct_line.models.suggested_actions",
+    "TextHighlight": "direct_line.models.text_highlight",
+    "Thing": "direct_line.models.thing",
+    "ThumbnailCard": "direct_line.models.thumbnail_card",
+    "ThumbnailUrl": "direct_line.models.thumbnail_url",
+    "TokenParameters": "direct_line.models.token_parameters",
+    "TokenRequest": "direct_line.models.token_request",
+    "TokenResponse": "direct_line.models.token_response",
+    "VideoCard": "direct_line.models.video_card",
+})
+
+if TYPE_CHECKING:
+    # import apis into sdk package
+    from direct_line.api.conversations_api import ConversationsApi
+    from direct_line.api.session_api import SessionApi
+    from direct_line.api.tokens_api import TokensApi
+    from direct_line.api.async_conversations_api import AsyncConversationsApi
+    from direct_line.api.async_session_api import AsyncSessionApi
+    from direct_line.api.async_tokens_api import AsyncTokensApi
+
+    # import ApiClient
+    from direct_line.api_response import ApiResponse
+    from direct_line.api_client import ApiClient
+    from direct_line.async_api_client import AsyncApiClient
+    from direct_line.token_broker import TokenBroker
+    from direct_line.token_broker import TokenLease
+    from direct_line.stream_manager import ConversationStream
+    from direct_line.stream_manager import StreamManager
+    from direct_line.activity_poller import ActivityPoller
+    from direct_line.activity_poller import PolledConversation
+    from direct_line.activity_index import ActivityIndex
+    from direct_line.shared_client import ConversationCredential
+    from direct_line.shared_client import bearer_auth
+    from direct_line.shared_client import shared_api_client
+    from direct_line.shared_client import shared_async_api_client
+    from direct_line.shared_client import close_shared_api_clients
+    from direct_line.shared_client import close_shared_async_api_clients
+    from direct_line.request_template import RequestTemplate
+    from direct_line.multipart import MultipartStream
+    from direct_line.multipart import UploadFile
+    from direct_line.configuration import Configuration
+    from direct_line.json_codec import JsonCodec
+    from direct_line.json_codec import OrjsonCodec
+    from direct_line.json_codec import MsgspecCodec
+    from direct_line.resilience import RetryPolicy
+    from direct_line.resilience import CircuitBreaker
+    from direct_line.resilience import CircuitOpenError
+    from direct_line.exceptions import OpenApiException
+    from direct_line.exceptions import ApiTypeError
+    from direct_line.exceptions import ApiValueError
+    from direct_line.exceptions import ApiKeyError
+    from direct_line.exceptions import ApiAttributeError
+    from direct_line.exceptions import ApiException
+
+    # import models into sdk package
+    from direct_line.models.activity import Activity
+    from direct_line.models.activity_set import ActivitySet
+    from direct_line.models.animation_card import AnimationCard
+    from direct_line.models.attachment import Attachment
+    from direct_line.models.audio_card import AudioCard
+    from direct_line.models.basic_card import BasicCard
+    from direct_line.models.card_action import CardAction
+    from direct_line.models.card_image import CardImage
+    from direct_line.models.channel_account import ChannelAccount
+    from direct_line.models.conversation import Conversation
+    from direct_line.models.conversation_account import ConversationAccount
+    from direct_line.models.conversation_reference import ConversationReference
+    from direct_line.models.entity import Entity
+    from direct_line.models.error import Error
+    from direct_line.models.error_response import ErrorResponse
+    from direct_line.models.fact import Fact
+    from direct_line.models.geo_coordinates import GeoCoordinates
+    from direct_line.models.hero_card import HeroCard
+    from direct_line.models.inner_http_error import InnerHttpError
+    from direct_line.models.media_card import MediaCard
+    from direct_line.models.media_url import MediaUrl
+    from direct_line.models.mention import Mention
+    from direct_line.models.message_reaction import MessageReaction
+    from direct_line.models.o_auth_card import OAuthCard
+    from direct_line.models.place import Place
+    from direct_line.models.receipt_card import ReceiptCard
+    from direct_line.models.receipt_item import ReceiptItem
+    from direct_line.models.resource_response import ResourceResponse
+    from direct_line.models.semantic_action import SemanticAction
+    from direct_line.models.signin_card import SigninCard
+    from direct_line.models.suggested_actions import SuggestedActions
+    from direct_line.models.text_highlight import TextHighlight
+    from direct_line.models.thing import Thing
+    from direct_line.models.thumbnail_card import ThumbnailCard
+    from direct_line.models.thumbnail_url import ThumbnailUrl
+    from direct_line.models.token_parameters import TokenParameters
+    from direct_line.models.token_request import TokenRequest
+    from direct_line.models.token_response import TokenResponse
+    from direct_line.models.video_card import VideoCard
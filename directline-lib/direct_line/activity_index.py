@@ -0,0 +1,70 @@
+# coding: utf-8
+
+"""Bounded index of recently seen activity IDs, used to drop duplicates."""
+
+import collections
+from typing import Optional
+
+from direct_line.models.activity_set import ActivitySet
+
+# IDs remembered per conversation; far more than a replay can repeat.
+DEFAULT_MAX_SIZE = 1024
+
+
+class ActivityIndex:
+    """Remembers the IDs of the most recent activities of a conversation.
+
+    The same activity may arrive twice when a WebSocket stream runs
+    alongside history GETs, or when a stream is replayed from a watermark
+    after reconnecting. Lookups and inserts are O(1) and the least recently
+    seen ID is evicted once ``max_size`` are held, so memory stays flat
+    however long the conversation runs.
+
+    One index can be shared by several consumers of the same conversation.
+
+    :param max_size: number of IDs remembered; 0 disables de-duplication.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        if max_size < 0:
+            raise ValueError("max_size must not be negative")
+        self.max_size = max_size
+        self.duplicates = 0
+        self._ids: "collections.OrderedDict[str, None]" = collections.OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, activity_id: str) -> bool:
+        return activity_id in self._ids
+
+    def add(self, activity_id: str) -> bool:
+        """Record an activity ID.
+
+        :return: False if the ID was already known.
+        """
+        if activity_id in self._ids:
+            self._ids.move_to_end(activity_id)
+            self.duplicates += 1
+            return False
+        if self.max_size:
+            self._ids[activity_id] = None
+            if len(self._ids) > self.max_size:
+                self._ids.popitem(last=False)
+        return True
+
+    def filter(self, activity_set: ActivitySet) -> Optional[ActivitySet]:
+        """Drop the activities already seen from an activity set.
+
+        Activities without an ID are always kept.
+
+        :return: the activity set itself when nothing was dropped, a copy
+            holding the new activities otherwise, or None if none are new.
+        """
+        activities = activity_set.activities or []
+        new = [a for a in activities if a.id is None or self.add(a.id)]
+        if len(new) == len(activities):
+            return activity_set
+        if not new:
+            return None
+        return activity_set.model_copy(update={"activities": new})
@@ -0,0 +1,347 @@
+# coding: utf-8
+
+"""Watermark-aware polling of many Direct Line conversations."""
+
+import asyncio
+import heapq
+import itertools
+from typing import Dict, List, Optional, Set, Tuple
+
+from direct_line.activity_index import DEFAULT_MAX_SIZE, ActivityIndex
+from direct_line.api.async_conversations_api import AsyncConversationsApi
+from direct_line.async_api_client import AsyncApiClient
+from direct_line.exceptions import ApiException
+from direct_line.models.activity import Activity
+from direct_line.models.resource_response import ResourceResponse
+from direct_line.resilience import is_transient_error
+from direct_line.stream_manager import FATAL_STATUSES, ConversationStream, TokenProvider
+
+
+class PolledConversation(ConversationStream):
+    """A conversation tracked by an :class:`ActivityPoller`.
+
+    Activity sets are delivered the same way as for a
+    :class:`ConversationStream`; :attr:`interval` is the current wait
+    between polls.
+    """
+
+    def __init__(
+        self,
+        conversation_id: str,
+        token: TokenProvider,
+        watermark: Optional[str] = None,
+        queue_size: int = 0,
+        interval: float = 1.0,
+        seen: Optional[ActivityIndex] = None,
+    ) -> None:
+        super().__init__(
+            conversation_id, token, watermark=watermark, queue_size=queue_size, seen=seen
+        )
+        self.interval = interval
+        self.polls = 0
+        self.failures = 0
+        # When the next poll is due (loop time); None while dispatched
+        self.due: Optional[float] = None
+        self.polling = False
+
+
+class ActivityPoller:
+    """Polls ``conversations_get_activities`` for any number of conversations.
+
+    Each conversation keeps its own watermark and is polled on its own
+    schedule. Due polls are handed to a fixed set of ``workers`` tasks, so
+    the number of requests in flight stays bounded however many
+    conversations are tracked. The interval adapts to the conversation:
+
+    * ``active_interval`` after a poll that returned activities,
+    * growing by ``backoff_factor`` after every empty poll, up to
+      ``idle_interval``,
+    * an extra poll ``send_delay`` seconds after :meth:`sent` or
+      :meth:`post_activity`, to pick up the bot's reply quickly.
+
+    A conversation ends when an ``endOfConversation`` activity is received,
+    the service rejects the token or conversation, or it is removed.
+
+    :param api_client: client to send requests through. Requests are
+        authenticated with each conversation's own token, so it must not
+        carry a default ``Authorization`` header.
+    :param workers: number of polls in flight at most.
+    :param active_interval: seconds between polls of an active conversation.
+    :param idle_interval: upper bound of the interval of an idle one.
+    :param send_delay: seconds between a send and the extra poll.
+    :param backoff_factor: growth of the interval after an empty poll.
+    :param queue_size: bound of every per-conversation queue; 0 is unbounded.
+    :param max_retries: failed polls in a row before a conversation gives
+        up; ``None`` retries forever.
+    :param dedup_size: activity IDs remembered per conversation to drop
+        duplicates; 0 disables de-duplication.
+    """
+
+    def __init__(
+        self,
+        api_client: Optional[AsyncApiClient] = None,
+        workers: int = 32,
+        active_interval: float = 1.0,
+        idle_interval: float = 10.0,
+        send_delay: float = 0.3,
+        backoff_factor: float = 2.0,
+        queue_size: int = 0,
+        max_retries: Optional[int] = None,
+        dedup_size: int = DEFAULT_MAX_SIZE,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if not 0 < active_interval <= idle_interval:
+            raise ValueError("active_interval must be positive and at most idle_interval")
+        if backoff_factor < 1:
+            raise ValueError("backoff_factor must be at least 1")
+
+        self._owns_client = api_client is None
+        self.api_client = api_client or AsyncApiClient()
+        self.conversations_api = AsyncConversationsApi(self.api_client)
+        self.workers = workers
+        self.active_interval = active_interval
+        self.idle_interval = idle_interval
+        self.send_delay = send_delay
+        self.backoff_factor = backoff_factor
+        self.queue_size = queue_size
+        self.max_retries = max_retries
+        self.dedup_size = dedup_size
+        self.conversations: Dict[str, PolledConversation] = {}
+
+        # (due, sequence, conversation) ordered by due time; entries whose
+        # due time no longer matches the conversation's are stale
+        self._schedule: List[Tuple[float, int, PolledConversation]] = []
+        self._sequence = itertools.count()
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self._closed = False
+        # Created on start so they bind to the running event loop; nothing
+        # uses them before then
+        self._wakeup: asyncio.Event
+        self._work: "asyncio.Queue[PolledConversation]"
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def __len__(self) -> int:
+        return len(self.conversations)
+
+    def __contains__(self, conversation_id: str) -> bool:
+        return conversation_id in self.conversations
+
+    def __getitem__(self, conversation_id: str) -> PolledConversation:
+        return self.conversations[conversation_id]
+
+    async def start(self) -> None:
+        """Start the scheduler and the worker tasks."""
+        if self._tasks:
+            return
+        self._closed = False
+        self._wakeup = asyncio.Event()
+        self._work = asyncio.Queue()
+        self._spawn(self._dispatch())
+        for _ in range(self.workers):
+            self._spawn(self._poll_forever())
+
+    async def close(self) -> None:
+        """End every conversation, stop polling and close the internal client."""
+        # wait_for() may swallow a cancellation that races with the wakeup
+        # event, so the scheduler also checks this flag
+        self._closed = True
+        for conversation_id in list(self.conversations):
+            self.remove(conversation_id)
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._owns_client:
+            await self.api_client.close()
+
+    async def add(
+        self,
+        conversation_id: str,
+        token: TokenProvider,
+        watermark: Optional[str] = None,
+        seen: Optional[ActivityIndex] = None,
+    ) -> PolledConversation:
+        """Start polling a conversation.
+
+        :param conversation_id: ID of the conversation.
+        :param token: the conversation's token, or a callable returning the
+            current one (for example ``lambda: lease.token``).
+        :param watermark: watermark to resume from; the whole history is
+            delivered when omitted.
+        :param seen: index of the activities already delivered, for example
+            the ``seen`` of the conversation's WebSocket stream, so activities
+            received on both channels are delivered once.
+        :return: the conversation, whose queue receives its activity sets.
+        """
+        if not self._tasks:
+            await self.start()
+
+        conversation = self.conversations.get(conversation_id)
+        if conversation is not None and not conversation.closed:
+            return conversation
+
+        if seen is None:
+            seen = ActivityIndex(self.dedup_size)
+        conversation = PolledConversation(
+            conversation_id, token, watermark, self.queue_size, self.active_interval, seen
+        )
+        self.conversations[conversation_id] = conversation
+        self._schedule_poll(conversation, 0)
+        return conversation
+
+    def remove(self, conversation_id: str) -> None:
+        """Stop polling a conversation and end its stream."""
+        conversation = self.conversations.pop(conversation_id, None)
+        if conversation is not None:
+            self._end(conversation)
+
+    def sent(self, conversation_id: str) -> None:
+        """Note that an activity was sent, so the reply is picked up quickly."""
+        conversation = self.conversations.get(conversation_id)
+        if conversation is None or conversation.closed:
+            return
+        conversation.interval = self.active_interval
+        due = asyncio.get_running_loop().time() + self.send_delay
+        if conversation.due is None or due < conversation.due:
+            self._schedule_poll(conversation, self.send_delay)
+
+    async def post_activity(self, conversation_id: str, activity: Activity) -> ResourceResponse:
+        """Send an activity with the conversation's token and poll for the reply.
+
+        :param conversation_id: ID of a conversation added to the poller.
+        :param activity: the activity to send.
+        :return: the ID of the sent activity.
+        """
+        conversation = self.conversations[conversation_id]
+        response = await self.conversations_api.conversations_post_activity(
+            conversation_id,
+            activity,
+            _headers={"Authorization": f"Bearer {conversation.token}"},
+        )
+        self.sent(conversation_id)
+        return response
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _schedule_poll(self, conversation: PolledConversation, delay: float) -> None:
+        conversation.due = asyncio.get_running_loop().time() + delay
+        heapq.heappush(self._schedule, (conversation.due, next(self._sequence), conversation))
+        self._wakeup.set()
+
+    def _end(self, conversation: PolledConversation) -> None:
+        conversation.closed = True
+        conversation.due = None
+        try:
+            conversation.queue.put_nowait(None)
+        except asyncio.QueueFull:
+            # Deliver the end of stream once the consumer catches up
+            asyncio.ensure_future(conversation.queue.put(None))
+
+    async def _dispatch(self) -> None:
+        loop = asyncio.get_running_loop()
+        while not self._closed:
+            self._wakeup.clear()
+
+            now = loop.time()
+            while self._schedule and self._schedule[0][0] <= now:
+                due, _, conversation = heapq.heappop(self._schedule)
+                if conversation.closed or conversation.due != due or conversation.polling:
+                    # Stale, or picked up again once the running poll ends
+                    continue
+                conversation.due = None
+                conversation.polling = True
+                self._work.put_nowait(conversation)
+
+            timeout = self._schedule[0][0] - now if self._schedule else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _poll_forever(self) -> None:
+        while True:
+            conversation = await self._work.get()
+            try:
+                await self._poll(conversation)
+            finally:
+                conversation.polling = False
+
+            if conversation.closed:
+                continue
+            delay = conversation.interval
+            if conversation.due is not None:
+                # A send during the poll asked for an earlier one
+                delay = min(delay, conversation.due - asyncio.get_running_loop().time())
+            self._schedule_poll(conversation, max(delay, 0))
+
+    async def _poll(self, conversation: PolledConversation) -> None:
+        try:
+            activity_set = await self.conversations_api.conversations_get_activities(
+                conversation.conversation_id,
+                watermark=conversation.watermark,
+                _headers={"Authorization": f"Bearer {conversation.token}"},
+            )
+        except ApiException as e:
+            if e.status in FATAL_STATUSES:
+                self._fail(conversation, e)
+                return
+            self._retry(conversation)
+            return
+        except Exception as e:
+            if not is_transient_error(e):
+                self._fail(conversation, e)
+                return
+            self._retry(conversation)
+            return
+
+        conversation.polls += 1
+        conversation.failures = 0
+        # A missing watermark must not overwrite a known one
+        if activity_set.watermark:
+            conversation.watermark = activity_set.watermark
+        if not activity_set.activities:
+            conversation.interval = min(
+                self.idle_interval, conversation.interval * self.backoff_factor
+            )
+            return
+
+        conversation.interval = self.active_interval
+        # Checked before de-duplication: the end of the conversation may
+        # already have been delivered through a shared index
+        ended = any(a.type == "endOfConversation" for a in activity_set.activities)
+        fresh = conversation.seen.filter(activity_set)
+        if fresh is not None:
+            await conversation.queue.put(fresh)
+        if ended:
+            self._stop(conversation)
+
+    def _retry(self, conversation: PolledConversation) -> None:
+        conversation.failures += 1
+        if self.max_retries is not None and conversation.failures > self.max_retries:
+            self._fail(conversation, ConnectionError(
+                f"Gave up polling {conversation.conversation_id} "
+                f"after {self.max_retries} retries"
+            ))
+            return
+        conversation.interval = min(
+            self.idle_interval, conversation.interval * self.backoff_factor
+        )
+
+    def _fail(self, conversation: PolledConversation, error: BaseException) -> None:
+        conversation.error = error
+        self._stop(conversation)
+
+    def _stop(self, conversation: PolledConversation) -> None:
+        if self.conversations.get(conversation.conversation_id) is conversation:
+            del self.conversations[conversation.conversation_id]
+        self._end(conversation)
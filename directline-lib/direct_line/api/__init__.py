@@ -1,7 +1,27 @@
 # flake8: noqa
 
-# import apis into api package
-from direct_line.api.conversations_api import ConversationsApi
-from direct_line.api.session_api import SessionApi
-from direct_line.api.tokens_api import TokensApi
+from typing import TYPE_CHECKING
 
+from direct_line.lazy_imports import lazy_exports
+
+# Exports are imported on first use rather than with the package
+_exports = {
+    # import apis into api package
+    "ConversationsApi": "direct_line.api.conversations_api",
+    "SessionApi": "direct_line.api.session_api",
+    "TokensApi": "direct_line.api.tokens_api",
+    "AsyncConversationsApi": "direct_line.api.async_conversations_api",
+    "AsyncSessionApi": "direct_line.api.async_session_api",
+    "AsyncTokensApi": "direct_line.api.async_tokens_api",
+}
+__getattr__, __dir__ = lazy_exports(__name__, _exports)
+__all__ = list(_exports)
+
+if TYPE_CHECKING:
+    # import apis into api package
+    from direct_line.api.conversations_api import ConversationsApi
+    from direct_line.api.session_api import SessionApi
+    from direct_line.api.tokens_api import TokensApi
+    from direct_line.api.async_conversations_api import AsyncConversationsApi
+    from direct_line.api.async_session_api import AsyncSessionApi
+    from direct_line.api.async_tokens_api import AsyncTokensApi
@@ -25,6 +25,7 @@ from direct_line.models.activity_set import ActivitySet
 from direct_line.models.conversation import Conversation
 from direct_line.models.resource_response import ResourceResponse
 from direct_line.models.token_parameters import TokenParameters
+from direct_line.multipart import DEFAULT_CHUNK_SIZE, MultipartStream, UploadFile
 
 from direct_line.api_client import ApiClient, RequestSerialized
 from direct_line.api_response import ApiResponse
@@ -278,6 +279,17 @@ class ConversationsApi:
         _host_index,
     ) -> RequestSerialized:
 
+        if not _headers:
+            return self.api_client.request_template(
+                'GET',
+                '/v3/directline/conversations/{conversationId}/activities',
+                accepts=('application/json', 'text/json', 'application/xml', 'text/xml'),
+            ).render(
+                {'conversationId': conversation_id},
+                query_params=[('watermark', watermark)] if watermark is not None else None,
+                request_auth=_request_auth,
+            )
+
         _host = None
 
         _collection_formats: Dict[str, str] = {
@@ -579,6 +591,24 @@ class ConversationsApi:
         _host_index,
     ) -> RequestSerialized:
 
+        if not _headers and not _content_type:
+            return self.api_client.request_template(
+                'POST',
+                '/v3/directline/conversations/{conversationId}/activities',
+                accepts=('application/json', 'text/json'),
+                content_types=(
+                    'application/json',
+                    'text/json',
+                    'application/xml',
+                    'text/xml',
+                    'application/x-www-form-urlencoded'
+                ),
+            ).render(
+                {'conversationId': conversation_id},
+                body=activity,
+                request_auth=_request_auth,
+            )
+
         _host = None
 
         _collection_formats: Dict[str, str] = {
@@ -1494,6 +1524,85 @@ class ConversationsApi:
         return response_data.response
 
 
+    def conversations_upload_stream(
+        self,
+        conversation_id: str,
+        files: Union[UploadFile, Any, List[Union[UploadFile, Any]]],
+        user_id: Optional[str] = None,
+        activity: Optional[Activity] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        _request_timeout: Union[None, float, Tuple[float, float]] = None,
+        _request_auth: Optional[Dict[str, Any]] = None,
+        _headers: Optional[Dict[str, Any]] = None,
+        _host_index: int = 0,
+    ) -> ResourceResponse:
+        """Upload file(s) and send as attachment(s), streaming their content
+
+        Unlike :meth:`conversations_upload`, the files are read chunk by
+        chunk while the request is sent instead of being loaded into memory.
+
+        :param conversation_id: (required)
+        :type conversation_id: str
+        :param files: the attachments, as :class:`UploadFile` or anything an
+                      :class:`UploadFile` accepts as source: a path, bytes,
+                      a binary file object or an iterable of bytes. (required)
+        :type files: UploadFile, list[UploadFile]
+        :param user_id:
+        :type user_id: str
+        :param activity: activity to send the attachments with.
+        :type activity: Activity
+        :param chunk_size: size of the reads from files.
+        :type chunk_size: int
+        :param _request_timeout: timeout setting for this request.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request.
+        :type _request_auth: dict, optional
+        :param _headers: set to override the headers for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        if not isinstance(files, list):
+            files = [files]
+        body = MultipartStream(
+            [f if isinstance(f, UploadFile) else UploadFile(f) for f in files],
+            activity=activity,
+            chunk_size=chunk_size,
+        )
+        method, url, header_params, _, _ = self._conversations_upload_serialize(
+            conversation_id=conversation_id,
+            file=None,
+            user_id=user_id,
+            _request_auth=_request_auth,
+            _content_type=body.content_type,
+            _headers=dict(_headers or {}),
+            _host_index=_host_index
+        )
+        if body.content_length is not None:
+            header_params['Content-Length'] = str(body.content_length)
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "ResourceResponse",
+            '202': None,
+            '204': None,
+        }
+        response_data = self.api_client.call_api(
+            method,
+            url,
+            header_params=header_params,
+            body=body,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        ).data
+
+
     def _conversations_upload_serialize(
         self,
         conversation_id,
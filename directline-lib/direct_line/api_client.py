@@ -17,6 +17,7 @@ import datetime
 from dateutil.parser import parse
 from enum import Enum
 import decimal
+import functools
 import json
 import mimetypes
 import os
@@ -24,13 +25,14 @@ import re
 import tempfile
 
 from urllib.parse import quote
-from typing import Tuple, Optional, List, Dict, Union
-from pydantic import SecretStr
+from typing import TYPE_CHECKING, Any, Iterator, Tuple, Optional, List, Dict, Union
+from pydantic import BaseModel, SecretStr, TypeAdapter
 
 from direct_line.configuration import Configuration
 from direct_line.api_response import ApiResponse, T as ApiResponseT
 import direct_line.models
 from direct_line import rest
+from direct_line.request_template import RequestTemplate
 from direct_line.exceptions import (
     ApiValueError,
     ApiException,
@@ -41,8 +43,43 @@ from direct_line.exceptions import (
     ServiceException
 )
 
+if TYPE_CHECKING:
+    from direct_line.httpx_rest import HttpxRESTClientObject
+
 RequestSerialized = Tuple[str, str, Dict[str, str], Optional[str], List[str]]
 
+_JSON_CONTENT_TYPE = re.compile(r'^application/(json|[\w!#$&.+-^_]+\+json)\s*(;|$)', re.IGNORECASE)
+
+
+def _model_type(klass: str):
+    """Resolve a type name to a model, or a List/Dict of models; None otherwise."""
+    m = re.match(r'List\[(.*)]$', klass)
+    if m:
+        item = _model_type(m.group(1))
+        return List[item] if item else None  # type: ignore[valid-type]
+    m = re.match(r'Dict\[([^,]*), (.*)]$', klass)
+    if m:
+        item = _model_type(m.group(2))
+        return Dict[str, item] if item else None  # type: ignore[valid-type]
+    model = getattr(direct_line.models, klass, None)
+    if isinstance(model, type) and issubclass(model, BaseModel):
+        return model
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _model_adapter(klass: str) -> Optional[TypeAdapter[Any]]:
+    """Build, once per type name, a validator for a model or a List/Dict of models.
+
+    The validator turns raw JSON (or already decoded data) into the model
+    and all its nested models in a single pass, instead of recursing
+    through every model's ``from_dict``. Returns None for other types,
+    which keep the generic deserialization.
+    """
+    model_type = _model_type(klass)
+    return TypeAdapter(Optional[model_type]) if model_type is not None else None
+
+
 class ApiClient:
     """Generic API client for OpenAPI client library builds.
 
@@ -85,7 +122,12 @@ class ApiClient:
             configuration = Configuration.get_default()
         self.configuration = configuration
 
-        self.rest_client = rest.RESTClientObject(configuration)
+        self.rest_client: Union[rest.RESTClientObject, "HttpxRESTClientObject"]
+        if configuration.http2:
+            from direct_line.httpx_rest import HttpxRESTClientObject
+            self.rest_client = HttpxRESTClientObject(configuration)
+        else:
+            self.rest_client = rest.RESTClientObject(configuration)
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
@@ -93,12 +135,17 @@ class ApiClient:
         # Set default User-Agent.
         self.user_agent = 'OpenAPI-Generator/1.0.0/python'
         self.client_side_validation = configuration.client_side_validation
+        self._request_templates: Dict[Tuple[Any, ...], RequestTemplate] = {}
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        pass
+        self.close()
+
+    def close(self):
+        """Closes the pooled connections."""
+        self.rest_client.close()
 
     @property
     def user_agent(self):
@@ -247,6 +294,63 @@ class ApiClient:
 
         return method, url, header_params, body, post_params
 
+    # Bound on cached templates, in case default headers change per request
+    _MAX_REQUEST_TEMPLATES = 64
+
+    def request_template(
+        self,
+        method,
+        resource_path,
+        accepts=(),
+        content_types=()
+    ) -> RequestTemplate:
+        """Returns the template of an operation's requests.
+
+        Templates are built on first use and cached until the host,
+        default headers or cookie change.
+
+        :param method: Method to call.
+        :param resource_path: Path to method endpoint.
+        :param accepts: tuple of response content types of the operation.
+        :param content_types: tuple of request content types of the
+            operation.
+        :return: the operation's RequestTemplate.
+        """
+        host = self.configuration.host
+        key = (
+            method,
+            resource_path,
+            accepts,
+            content_types,
+            host,
+            self.cookie,
+            tuple(self.default_headers.items()),
+        )
+        template = self._request_templates.get(key)
+        if template is None:
+            header_params = {}
+            accept = self.select_header_accept(list(accepts))
+            if accept:
+                header_params['Accept'] = accept
+            content_type = self.select_header_content_type(list(content_types))
+            if content_type:
+                header_params['Content-Type'] = content_type
+            header_params.update(self.default_headers)
+            if self.cookie:
+                header_params['Cookie'] = self.cookie
+            header_params = dict(
+                self.parameters_to_tuples(
+                    self.sanitize_for_serialization(header_params), None
+                )
+            )
+            template = RequestTemplate(
+                self, method, resource_path, host, header_params
+            )
+            if len(self._request_templates) >= self._MAX_REQUEST_TEMPLATES:
+                self._request_templates.clear()
+            self._request_templates[key] = template
+        return template
+
 
     def call_api(
         self,
@@ -316,8 +420,18 @@ class ApiClient:
                 if content_type is not None:
                     match = re.search(r"charset=([a-zA-Z\-\d]+)[\s;]?", content_type)
                 encoding = match.group(1) if match else "utf-8"
-                response_text = response_data.data.decode(encoding)
-                return_data = self.deserialize(response_text, response_type, content_type)
+                if (
+                    200 <= response_data.status <= 299
+                    and encoding.lower() in ("utf-8", "utf8")
+                    and content_type is not None
+                    and _JSON_CONTENT_TYPE.match(content_type)
+                ):
+                    # JSON parsers read UTF-8 bytes directly; skip the
+                    # decoded copy of the body
+                    return_data = self.deserialize(response_data.data, response_type, content_type)
+                else:
+                    response_text = response_data.data.decode(encoding)
+                    return_data = self.deserialize(response_text, response_type, content_type)
         finally:
             if not 200 <= response_data.status <= 299:
                 raise ApiException.from_response(
@@ -333,6 +447,34 @@ class ApiClient:
             raw_data = response_data.data
         )
 
+    def iter_content(self, response, chunk_size: int = 65536) -> Iterator[bytes]:
+        """Streams the body of a response without buffering it.
+
+        Use it with the ``*_without_preload_content`` methods, which return
+        the response before its body is read, to download large attachments
+        in constant memory. The connection is released once the body is
+        consumed.
+
+        :param response: response returned by a ``*_without_preload_content``
+            method.
+        :param chunk_size: maximum size of every chunk.
+        :raises ApiException: on the first iteration, if the status is not 2xx.
+        :return: iterator of body chunks.
+        """
+        if not isinstance(response, rest.RESTResponse):
+            response = rest.RESTResponse(response)
+        if not 200 <= response.status <= 299:
+            response.read()
+            raise ApiException.from_response(http_resp=response, body=None, data=None)
+        try:
+            yield from response.response.stream(chunk_size)
+        except BaseException:
+            # Stopped early; the rest of the body makes the connection unusable
+            response.response.close()
+            raise
+        finally:
+            response.response.release_conn()
+
     def sanitize_for_serialization(self, obj):
         """Builds a JSON POST object.
 
@@ -388,10 +530,11 @@ class ApiClient:
             for key, val in obj_dict.items()
         }
 
-    def deserialize(self, response_text: str, response_type: str, content_type: Optional[str]):
+    def deserialize(self, response_text: Union[str, bytes], response_type: str, content_type: Optional[str]):
         """Deserializes response into an object.
 
-        :param response: RESTResponse object to be deserialized.
+        :param response_text: response body; JSON may also be passed as
+            UTF-8 bytes.
         :param response_type: class literal for
             deserialized object, or string of class name.
         :param content_type: content type of response.
@@ -402,14 +545,18 @@ class ApiClient:
         # fetch data from response object
         if content_type is None:
             try:
-                data = json.loads(response_text)
+                data = self.configuration.json_codec.loads(response_text)
             except ValueError:
                 data = response_text
-        elif re.match(r'^application/(json|[\w!#$&.+-^_]+\+json)\s*(;|$)', content_type, re.IGNORECASE):
-            if response_text == "":
+        elif _JSON_CONTENT_TYPE.match(content_type):
+            if not response_text:
                 data = ""
             else:
-                data = json.loads(response_text)
+                adapter = _model_adapter(response_type) if isinstance(response_type, str) else None
+                if adapter is not None:
+                    # Parse and validate in one pass
+                    return adapter.validate_json(response_text)
+                data = self.configuration.json_codec.loads(response_text)
         elif re.match(r'^text\/[a-z.+-]+\s*(;|$)', content_type, re.IGNORECASE):
             data = response_text
         else:
@@ -432,6 +579,10 @@ class ApiClient:
             return None
 
         if isinstance(klass, str):
+            adapter = _model_adapter(klass)
+            if adapter is not None:
+                return adapter.validate_python(data)
+
             if klass.startswith('List['):
                 m = re.match(r'List\[(.*)]', klass)
                 assert m is not None, "Malformed List type definition"
@@ -621,11 +772,9 @@ class ApiClient:
         :body: A object representing the body of the HTTP request.
         The object type is the return value of sanitize_for_serialization().
         :param request_auth: if set, the provided settings will
-                             override the token in the configuration.
+                             override the token in the configuration, also
+                             for operations that declare no authentication.
         """
-        if not auth_settings:
-            return
-
         if request_auth:
             self._apply_auth_params(
                 headers,
@@ -635,7 +784,7 @@ class ApiClient:
                 body,
                 request_auth
             )
-        else:
+        elif auth_settings:
             for auth in auth_settings:
                 auth_setting = self.configuration.auth_settings().get(auth)
                 if auth_setting:
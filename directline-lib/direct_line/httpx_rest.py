@@ -0,0 +1,113 @@
+# coding: utf-8
+
+"""Synchronous REST client over httpx, for HTTP/2."""
+
+import httpx
+
+from direct_line.async_rest import HttpxRESTClientBase, _is_ssl_error, transport_args
+from direct_line.exceptions import ApiException
+from direct_line.resilience import is_replayable
+from direct_line.rest import RESTResponse
+
+
+class HttpxResponse:
+    """An httpx response with the parts of the urllib3 response API that
+    :class:`rest.RESTResponse` and :meth:`ApiClient.iter_content` use."""
+
+    def __init__(self, response: httpx.Response) -> None:
+        self.response = response
+        self.status = response.status_code
+        self.reason = response.reason_phrase
+        self.headers = response.headers
+
+    @property
+    def data(self) -> bytes:
+        try:
+            return self.response.read()
+        finally:
+            self.response.close()
+
+    def stream(self, chunk_size: int = 65536):
+        return self.response.iter_bytes(chunk_size)
+
+    def drain_conn(self) -> None:
+        pass
+
+    def release_conn(self) -> None:
+        self.response.close()
+
+    def close(self) -> None:
+        self.response.close()
+
+
+class HttpxRESTClientObject(HttpxRESTClientBase):
+    """Drop-in replacement for :class:`rest.RESTClientObject` over httpx.
+
+    :class:`ApiClient` uses it when :attr:`Configuration.http2` is set. Over
+    HTTP/2, concurrent requests from any number of threads to a host share
+    one multiplexed connection instead of holding a connection each.
+    """
+
+    client: httpx.Client
+
+    def __init__(self, configuration) -> None:
+        self.json_codec = configuration.json_codec
+        self.retry_policy = configuration.retry_policy
+        self.tls_server_name = configuration.tls_server_name
+
+        # urllib3 applies no timeout unless one is requested, mirror that
+        # instead of inheriting the httpx default of five seconds.
+        self.client = httpx.Client(
+            transport=httpx.HTTPTransport(**transport_args(configuration)),
+            timeout=None,
+        )
+
+    def close(self):
+        self.client.close()
+
+    def stream_content(self, body):
+        return body
+
+    def request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ):
+        """Perform requests, applying the configured retry policy.
+
+        Takes the same parameters as :meth:`build_request`.
+        """
+        if self.retry_policy is None:
+            return self._request(method, url, headers, body, post_params, _request_timeout)
+        # Each attempt gets its own headers, which build_request may modify
+        return self.retry_policy.send(
+            method,
+            url,
+            lambda: self._request(method, url, dict(headers or {}), body, post_params, _request_timeout),
+            replayable=is_replayable(body),
+        )
+
+    def _request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ):
+        """Perform a request once."""
+        request = self.build_request(method, url, headers, body, post_params, _request_timeout)
+        try:
+            r = self.client.send(request, stream=True)
+        except httpx.ConnectError as e:
+            if not _is_ssl_error(e):
+                raise
+            msg = "\n".join([type(e).__name__, str(e)])
+            raise ApiException(status=0, reason=msg)
+
+        return RESTResponse(HttpxResponse(r))
@@ -0,0 +1,100 @@
+# coding: utf-8
+
+"""JSON codecs for request and response bodies.
+
+The client encodes request bodies and decodes responses through the codec
+set on ``Configuration.json_codec``. By default the fastest installed
+library is used: orjson, then msgspec, then the standard library.
+
+This module is kept identical in the direct_line and bot_connector
+packages; change both copies together.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - optional dependency
+    _HAS_ORJSON = False
+
+try:
+    import msgspec
+    _HAS_MSGSPEC = True
+except ImportError:  # pragma: no cover - optional dependency
+    _HAS_MSGSPEC = False
+
+
+class JsonCodec:
+    """Encodes and decodes JSON with the standard library.
+
+    Subclass it and override :meth:`dumps` and :meth:`loads` to plug in
+    another library.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> Union[str, bytes]:
+        """Encode a JSON-compatible object."""
+        return json.dumps(obj)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """Decode a JSON document.
+
+        :raises ValueError: if the document is not valid JSON.
+        """
+        return json.loads(data)
+
+    def __deepcopy__(self, memo):
+        # Codecs are stateless; copies of a Configuration share them
+        return self
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.name}>"
+
+
+class OrjsonCodec(JsonCodec):
+    """Encodes and decodes JSON with orjson."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if not _HAS_ORJSON:
+            raise ImportError("OrjsonCodec requires the 'orjson' package")
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    """Encodes and decodes JSON with msgspec."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        if not _HAS_MSGSPEC:
+            raise ImportError("MsgspecCodec requires the 'msgspec' package")
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+
+def default_json_codec() -> JsonCodec:
+    """The codec of the fastest JSON library installed."""
+    if _HAS_ORJSON:
+        return OrjsonCodec()
+    if _HAS_MSGSPEC:
+        return MsgspecCodec()
+    return JsonCodec()
@@ -14,43 +14,94 @@
 """  # noqa: E501
 
 
-# import models into model package
-from direct_line.models.activity import Activity
-from direct_line.models.activity_set import ActivitySet
-from direct_line.models.animation_card import AnimationCard
-from direct_line.models.attachment import Attachment
-from direct_line.models.audio_card import AudioCard
-from direct_line.models.basic_card import BasicCard
-from direct_line.models.card_action import CardAction
-from direct_line.models.card_image import CardImage
-from direct_line.models.channel_account import ChannelAccount
-from direct_line.models.conversation import Conversation
-from direct_line.models.conversation_account import ConversationAccount
-from direct_line.models.conversation_reference import ConversationReference
-from direct_line.models.entity import Entity
-from direct_line.models.error import Error
-from direct_line.models.error_response import ErrorResponse
-from direct_line.models.fact import Fact
-from direct_line.models.geo_coordinates import GeoCoordinates
-from direct_line.models.hero_card import HeroCard
-from direct_line.models.inner_http_error import InnerHttpError
-from direct_line.models.media_card import MediaCard
-from direct_line.models.media_url import MediaUrl
-from direct_line.models.mention import Mention
-from direct_line.models.message_reaction import MessageReaction
-from direct_line.models.o_auth_card import OAuthCard
-from direct_line.models.place import Place
-from direct_line.models.receipt_card import ReceiptCard
-from direct_line.models.receipt_item import ReceiptItem
-from direct_line.models.resource_response import ResourceResponse
-from direct_line.models.semantic_action import SemanticAction
-from direct_line.models.signin_card import SigninCard
-from direct_line.models.suggested_actions import SuggestedActions
-from direct_line.models.text_highlight import TextHighlight
-from direct_line.models.thing import Thing
-from direct_line.models.thumbnail_card import ThumbnailCard
-from direct_line.models.thumbnail_url import ThumbnailUrl
-from direct_line.models.token_parameters import TokenParameters
-from direct_line.models.token_request import TokenRequest
-from direct_line.models.token_response import TokenResponse
-from direct_line.models.video_card import VideoCard
+from typing import TYPE_CHECKING
+
+from direct_line.lazy_imports import lazy_exports
+
+# Exports are imported on first use rather than with the package
+_exports = {
+    # import models into model package
+    "Activity": "direct_line.models.activity",
+    "ActivitySet": "direct_line.models.activity_set",
+    "AnimationCard": "direct_line.models.animation_card",
+    "Attachment": "direct_line.models.attachment",
+    "AudioCard": "direct_line.models.audio_card",
+    "BasicCard": "direct_line.models.basic_card",
+    "CardAction": "direct_line.models.card_action",
+    "CardImage": "direct_line.models.card_image",
+    "ChannelAccount": "direct_line.models.channel_account",
+    "Conversation": "direct_line.models.conversation",
+    "ConversationAccount": "direct_line.models.conversation_account",
+    "ConversationReference": "direct_line.models.conversation_reference",
+    "Entity": "direct_line.models.entity",
+    "Error": "direct_line.models.error",
+    "ErrorResponse": "direct_line.models.error_response",
+    "Fact": "direct_line.models.fact",
+    "GeoCoordinates": "direct_line.models.geo_coordinates",
+    "HeroCard": "direct_line.models.hero_card",
+    "InnerHttpError": "direct_line.models.inner_http_error",
+    "MediaCard": "direct_line.models.media_card",
+    "MediaUrl": "direct_line.models.media_url",
+    "Mention": "direct_line.models.mention",
+    "MessageReaction": "direct_line.models.message_reaction",
+    "OAuthCard": "direct_line.models.o_auth_card",
+    "Place": "direct_line.models.place",
+    "ReceiptCard": "direct_line.models.receipt_card",
+    "ReceiptItem": "direct_line.models.receipt_item",
+    "ResourceResponse": "direct_line.models.resource_response",
+    "SemanticAction": "direct_line.models.semantic_action",
+    "SigninCard": "direct_line.models.signin_card",
+    "SuggestedActions": "direct_line.models.suggested_actions",
+    "TextHighlight": "direct_line.models.text_highlight",
+    "Thing": "direct_line.models.thing",
+    "ThumbnailCard": "direct_line.models.thumbnail_card",
+    "ThumbnailUrl": "direct_line.models.thumbnail_url",
+    "TokenParameters": "direct_line.models.token_parameters",
+    "TokenRequest": "direct_line.models.token_request",
+    "TokenResponse": "direct_line.models.token_response",
+    "VideoCard": "direct_line.models.video_card",
+}
+__getattr__, __dir__ = lazy_exports(__name__, _exports)
+__all__ = list(_exports)
+
+if TYPE_CHECKING:
+    # import models into model package
+    from direct_line.models.activity import Activity
+    from direct_line.models.activity_set import ActivitySet
+    from direct_line.models.animation_card import AnimationCard
+    from direct_line.models.attachment import Attachment
+    from direct_line.models.audio_card import AudioCard
+    from direct_line.models.basic_card import BasicCard
+    from direct_line.models.card_action import CardAction
+    from direct_line.models.card_image import CardImage
+    from direct_line.models.channel_account import ChannelAccount
+    from direct_line.models.conversation import Conversation
+    from direct_line.models.conversation_account import ConversationAccount
+    from direct_line.models.conversation_reference import ConversationReference
+    from direct_line.models.entity import Entity
+    from direct_line.models.error import Error
+    from direct_line.models.error_response import ErrorResponse
+    from direct_line.models.fact import Fact
+    from direct_line.models.geo_coordinates import GeoCoordinates
+    from direct_line.models.hero_card import HeroCard
+    from direct_line.models.inner_http_error import InnerHttpError
+    from direct_line.models.media_card import MediaCard
+    from direct_line.models.media_url import MediaUrl
+    from direct_line.models.mention import Mention
+    from direct_line.models.message_reaction import MessageReaction
+    from direct_line.models.o_auth_card import OAuthCard
+    from direct_line.models.place import Place
+    from direct_line.models.receipt_card import ReceiptCard
+    from direct_line.models.receipt_item import ReceiptItem
+    from direct_line.models.resource_response import ResourceResponse
+    from direct_line.models.semantic_action import SemanticAction
+    from direct_line.models.signin_card import SigninCard
+    from direct_line.models.suggested_actions import SuggestedActions
+    from direct_line.models.text_highlight import TextHighlight
+    from direct_line.models.thing import Thing
+    from direct_line.models.thumbnail_card import ThumbnailCard
+    from direct_line.models.thumbnail_url import ThumbnailUrl
+    from direct_line.models.token_parameters import TokenParameters
+    from direct_line.models.token_request import TokenRequest
+    from direct_line.models.token_response import TokenResponse
+    from direct_line.models.video_card import VideoCard
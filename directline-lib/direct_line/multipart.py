@@ -0,0 +1,233 @@
+# coding: utf-8
+
+"""Streaming multipart/form-data bodies for attachment uploads."""
+
+import asyncio
+import io
+import json
+import mimetypes
+import os
+import uuid
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
+
+from direct_line.models.activity import Activity
+
+# Content type of the part carrying the activity the attachments are sent with.
+ACTIVITY_CONTENT_TYPE = "application/vnd.microsoft.activity"
+
+DEFAULT_CHUNK_SIZE = 65536
+
+
+class UploadFile:
+    """One attachment of a streamed upload.
+
+    The content is read chunk by chunk while the request is sent, so only
+    ``chunk_size`` bytes of it are held in memory at a time.
+
+    :param source: a file path, bytes, a binary file object opened for
+        reading, an iterable of bytes or, with :class:`AsyncApiClient` only,
+        an async iterable of bytes. File objects and iterables are consumed.
+    :param filename: name sent for the attachment; defaults to the name of
+        the file.
+    :param content_type: type of the attachment; guessed from the filename
+        when omitted.
+    :param size: length of the content in bytes, if it cannot be determined
+        from the source. Without it the request is sent chunked.
+    """
+
+    def __init__(
+        self,
+        source: Any,
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+        size: Optional[int] = None,
+    ) -> None:
+        if isinstance(source, (str, os.PathLike)):
+            source = os.fspath(source)
+            filename = filename or os.path.basename(source)
+            if size is None:
+                size = os.path.getsize(source)
+        elif isinstance(source, bytes):
+            size = len(source)
+        elif hasattr(source, "read"):
+            name = getattr(source, "name", None)
+            if not filename and isinstance(name, str):
+                filename = os.path.basename(name)
+            if size is None:
+                size = _remaining(source)
+        elif not hasattr(source, "__iter__") and not hasattr(source, "__aiter__"):
+            raise TypeError(f"Unsupported upload source: {type(source).__name__}")
+
+        self.source = source
+        self.filename = filename or "file"
+        self.content_type = (
+            content_type
+            or mimetypes.guess_type(self.filename)[0]
+            or "application/octet-stream"
+        )
+        self.size = size
+
+    def chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """Read the content synchronously."""
+        source = self.source
+        if isinstance(source, str):
+            with open(source, "rb") as f:
+                yield from _read_chunks(f, chunk_size)
+        elif isinstance(source, bytes):
+            yield source
+        elif hasattr(source, "read"):
+            yield from _read_chunks(source, chunk_size)
+        elif hasattr(source, "__iter__"):
+            yield from source
+        else:
+            raise TypeError("Async iterables can only be uploaded with AsyncApiClient")
+
+    async def achunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """Read the content without blocking the event loop on file I/O."""
+        source = self.source
+        if isinstance(source, str):
+            f = await asyncio.to_thread(open, source, "rb")
+            try:
+                async for chunk in _aread_chunks(f, chunk_size):
+                    yield chunk
+            finally:
+                await asyncio.to_thread(f.close)
+        elif isinstance(source, bytes):
+            yield source
+        elif hasattr(source, "read"):
+            async for chunk in _aread_chunks(source, chunk_size):
+                yield chunk
+        elif hasattr(source, "__aiter__"):
+            async for chunk in source:
+                yield chunk
+        else:
+            for chunk in source:
+                yield chunk
+
+
+class MultipartStream:
+    """A ``multipart/form-data`` body produced while it is sent.
+
+    Holds one part per file, all named ``file``, followed by an optional
+    activity part (``application/vnd.microsoft.activity``) the attachments
+    are sent with, as Direct Line expects for multiple attachments. Iterate
+    it synchronously for :class:`ApiClient`, or with ``async for`` for
+    :class:`AsyncApiClient`. A stream can be sent once.
+
+    :param files: the attachments.
+    :param activity: activity to attach the files to; an empty one is
+        created by the service when omitted.
+    :param boundary: multipart boundary; random when omitted.
+    :param chunk_size: size of the reads from files.
+    """
+
+    def __init__(
+        self,
+        files: List[UploadFile],
+        activity: Optional[Union[Activity, Dict[str, Any]]] = None,
+        boundary: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        self.files = files
+        self.boundary = boundary or uuid.uuid4().hex
+        self.chunk_size = chunk_size
+        self._activity: Optional[bytes] = None
+        if activity is not None:
+            if isinstance(activity, Activity):
+                activity = activity.to_dict()
+            self._activity = json.dumps(activity).encode("utf-8")
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    @property
+    def content_length(self) -> Optional[int]:
+        """Length of the body, or None if a file's size is unknown."""
+        length = len(self._closing())
+        for file in self.files:
+            if file.size is None:
+                return None
+            length += len(self._file_header(file)) + file.size + 2
+        if self._activity is not None:
+            length += len(self._activity_header()) + len(self._activity) + 2
+        return length
+
+    def __iter__(self) -> Iterator[bytes]:
+        for file in self.files:
+            yield self._file_header(file)
+            yield from file.chunks(self.chunk_size)
+            yield b"\r\n"
+        yield from self._tail()
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for file in self.files:
+            yield self._file_header(file)
+            async for chunk in file.achunks(self.chunk_size):
+                yield chunk
+            yield b"\r\n"
+        for chunk in self._tail():
+            yield chunk
+
+    def _file_header(self, file: UploadFile) -> bytes:
+        return (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="file"; filename="{_quote(file.filename)}"\r\n'
+            f"Content-Type: {file.content_type}\r\n\r\n"
+        ).encode("utf-8")
+
+    def _activity_header(self) -> bytes:
+        return (
+            f"--{self.boundary}\r\n"
+            'Content-Disposition: form-data; name="activity"\r\n'
+            f"Content-Type: {ACTIVITY_CONTENT_TYPE}\r\n\r\n"
+        ).encode("utf-8")
+
+    def _closing(self) -> bytes:
+        return f"--{self.boundary}--\r\n".encode("utf-8")
+
+    def _tail(self) -> Iterator[bytes]:
+        if self._activity is not None:
+            yield self._activity_header()
+            yield self._activity
+            yield b"\r\n"
+        yield self._closing()
+
+
+def _quote(filename: str) -> str:
+    # Percent-encode the characters that would break the header, as
+    # browsers do for form-data filenames
+    return filename.replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+
+def _remaining(f) -> Optional[int]:
+    """Bytes left to read from a file object, if it can tell."""
+    try:
+        return os.fstat(f.fileno()).st_size - f.tell()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        pass
+    try:
+        if f.seekable():
+            position = f.tell()
+            end = f.seek(0, io.SEEK_END)
+            f.seek(position)
+            return end - position
+    except (AttributeError, OSError):
+        pass
+    return None
+
+
+def _read_chunks(f, chunk_size: int) -> Iterator[bytes]:
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+async def _aread_chunks(f, chunk_size: int) -> AsyncIterator[bytes]:
+    while True:
+        chunk = await asyncio.to_thread(f.read, chunk_size)
+        if not chunk:
+            return
+        yield chunk
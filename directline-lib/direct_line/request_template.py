@@ -0,0 +1,94 @@
+# coding: utf-8
+
+"""Precomputed requests for hot operations."""
+
+import re
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+if TYPE_CHECKING:
+    from direct_line.api_client import ApiClient, RequestSerialized
+
+_PATH_PARAM = re.compile(r"\{(\w+)\}")
+
+
+class RequestTemplate:
+    """The parts of an operation's request that are the same on every call.
+
+    :meth:`ApiClient.param_serialize` selects the ``Accept`` and
+    ``Content-Type`` headers, merges and sanitizes the default headers and
+    resolves the host on every call. A template does that once, and
+    :meth:`render` only fills in the path parameters, auth, body and query.
+    Get templates from :meth:`ApiClient.request_template`, which rebuilds
+    them when the host, default headers or cookie change.
+
+    :param api_client: client the requests are made with.
+    :param method: HTTP method.
+    :param resource_path: path with ``{name}`` placeholders.
+    :param base_url: host the path is appended to.
+    :param headers: header parameters of every request, before auth.
+    """
+
+    __slots__ = ("api_client", "method", "resource_path", "base_url", "headers", "_parts")
+
+    def __init__(
+        self,
+        api_client: "ApiClient",
+        method: str,
+        resource_path: str,
+        base_url: str,
+        headers: Dict[str, str],
+    ) -> None:
+        self.api_client = api_client
+        self.method = method
+        self.resource_path = resource_path
+        self.base_url = base_url
+        self.headers = headers
+        # Literal segments at even indexes, parameter names at odd ones
+        self._parts = _PATH_PARAM.split(resource_path)
+
+    def render(
+        self,
+        path_params: Dict[str, object],
+        body=None,
+        query_params: Optional[List[Tuple[str, str]]] = None,
+        request_auth: Optional[Dict[str, str]] = None,
+    ) -> "RequestSerialized":
+        """Builds a request, as :meth:`ApiClient.param_serialize` would.
+
+        :param path_params: values of the path placeholders.
+        :param body: request body.
+        :param query_params: query parameters.
+        :param request_auth: auth setting of this request, see
+            :meth:`ApiClient.update_params_for_auth`.
+        """
+        api_client = self.api_client
+        safe = api_client.configuration.safe_chars_for_path_param
+        parts = self._parts[:]
+        for i in range(1, len(parts), 2):
+            value = path_params.get(parts[i])
+            if value is None:
+                parts[i] = "{%s}" % parts[i]
+            else:
+                parts[i] = quote(str(api_client.sanitize_for_serialization(value)), safe=safe)
+        resource_path = "".join(parts)
+
+        headers = dict(self.headers)
+        queries = list(query_params) if query_params else []
+        api_client.update_params_for_auth(
+            headers, queries, None, resource_path, self.method, body, request_auth=request_auth
+        )
+
+        if body:
+            body = api_client.sanitize_for_serialization(body)
+
+        url = self.base_url + resource_path
+        if queries:
+            url += "?" + api_client.parameters_to_url_query(
+                api_client.sanitize_for_serialization(queries), None
+            )
+
+        return self.method, url, headers, body, []
+
+    def __repr__(self) -> str:
+        return f"RequestTemplate({self.method} {self.base_url}{self.resource_path})"
@@ -0,0 +1,445 @@
+# coding: utf-8
+
+"""Retries, per-host circuit breakers and hedged GETs for REST clients."""
+
+import asyncio
+import collections
+import random
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from email.utils import parsedate_to_datetime
+from typing import Deque, Dict, FrozenSet, Optional
+from urllib.parse import urlsplit
+
+import urllib3
+
+from direct_line.exceptions import ApiException
+
+
+def is_transport_error(error: BaseException) -> bool:
+    """Whether an error means a request never produced a response."""
+    if isinstance(error, urllib3.exceptions.HTTPError):
+        return True
+    # httpx is only loaded by the async client
+    httpx = sys.modules.get("httpx")
+    return httpx is not None and isinstance(error, httpx.TransportError)
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Whether a connection error of a stream or poll is worth retrying."""
+    if isinstance(error, (OSError, asyncio.TimeoutError)):
+        return True
+    # Neither httpx nor websockets is loaded by the sync client
+    httpx = sys.modules.get("httpx")
+    if httpx is not None and isinstance(error, httpx.HTTPError):
+        return True
+    websockets = sys.modules.get("websockets.exceptions")
+    return websockets is not None and isinstance(error, websockets.WebSocketException)
+
+
+def is_replayable(body) -> bool:
+    """Whether a request body can be sent again, unlike a stream."""
+    return body is None or isinstance(body, (str, bytes, dict, list, bool, int, float))
+
+
+def retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header.
+
+    :param value: the header value, in seconds or as an HTTP date.
+    :return: the seconds to wait, or None if the value is missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class CircuitOpenError(ApiException):
+    """Raised instead of sending a request to a host whose circuit is open."""
+
+    def __init__(self, host: str, retry_in: float) -> None:
+        super().__init__(
+            status=0,
+            reason=f"Circuit open for {host}; retry in {retry_in:.1f}s",
+        )
+        self.host = host
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Stops requests to a host after consecutive failures.
+
+    After ``failure_threshold`` failures in a row the circuit opens and
+    requests fail fast with :class:`CircuitOpenError`. Once
+    ``reset_timeout`` seconds have passed one trial request is let
+    through: its success closes the circuit, its failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """``"closed"``, ``"open"`` or ``"half-open"``."""
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def before_request(self, host: str) -> bool:
+        """Check that a request may be sent.
+
+        :return: whether the request is the trial of a half-open circuit,
+            which must be followed by :meth:`end_trial` however it ends.
+        :raises CircuitOpenError: if the circuit is open, or half-open
+            with the trial request still in flight.
+        """
+        with self._lock:
+            if self.opened_at is None:
+                return False
+            waited = time.monotonic() - self.opened_at
+            if waited >= self.reset_timeout and not self._trial:
+                self._trial = True
+                return True
+            raise CircuitOpenError(host, max(0.0, self.reset_timeout - waited))
+
+    def end_trial(self) -> None:
+        """Let another trial through after one that neither succeeded nor
+        failed, e.g. was cancelled or raised a non-transport error."""
+        with self._lock:
+            self._trial = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self._trial or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self._trial = False
+
+
+class RetryPolicy:
+    """Retry, circuit breaker and hedging policy of a REST client.
+
+    Set it on :attr:`Configuration.retry_policy`. Responses with a status
+    in ``retry_statuses`` and connection errors are retried with jittered
+    exponential backoff, waiting for ``Retry-After`` when the response has
+    one. Methods outside ``idempotent_methods`` are only retried on 429,
+    which the service sends before doing any work. Requests whose body is
+    a stream are never retried.
+
+    Each host has a :class:`CircuitBreaker` counting server errors and
+    connection failures. With ``hedge`` enabled, a GET that has not
+    completed within the host's ``hedge_percentile`` latency is sent a
+    second time and the first response wins.
+
+    The policy keeps per-host state and is shared, not copied, between
+    copies of a configuration.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        retry_statuses: FrozenSet[int] = frozenset({429, 502, 503, 504}),
+        idempotent_methods: FrozenSet[str] = frozenset(
+            {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+        ),
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        hedge: bool = False,
+        hedge_percentile: float = 0.95,
+        hedge_min_samples: int = 20,
+        latency_window: int = 200,
+    ) -> None:
+        """
+        :param max_attempts: attempts per request, including the first.
+        :param backoff: base delay in seconds, doubled per attempt.
+        :param max_backoff: longest delay in seconds. A ``Retry-After``
+            beyond it is not waited for; the response is returned instead.
+        :param retry_statuses: response statuses that are retried.
+        :param idempotent_methods: methods retried on any retryable failure.
+        :param failure_threshold: consecutive failures that open a circuit.
+        :param reset_timeout: seconds before an open circuit lets a trial
+            request through.
+        :param hedge: hedge GET requests.
+        :param hedge_percentile: latency percentile after which a GET is hedged.
+        :param hedge_min_samples: latencies recorded for a host before
+            its GETs are hedged.
+        :param latency_window: latencies kept per host.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.idempotent_methods = frozenset(m.upper() for m in idempotent_methods)
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.hedge = hedge
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.latency_window = latency_window
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def __deepcopy__(self, memo):
+        # Breakers and latencies are shared by every copy of a configuration
+        return self
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        """Return the circuit breaker of a host."""
+        with self._lock:
+            if host not in self._breakers:
+                self._breakers[host] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            return self._breakers[host]
+
+    def record_latency(self, host: str, seconds: float) -> None:
+        """Record how long a successful GET to a host took."""
+        with self._lock:
+            if host not in self._latencies:
+                self._latencies[host] = collections.deque(maxlen=self.latency_window)
+            self._latencies[host].append(seconds)
+
+    def hedge_delay(self, host: str) -> Optional[float]:
+        """Return the seconds after which a GET to a host is hedged.
+
+        :return: the host's ``hedge_percentile`` latency, or None if
+            hedging is off or too few latencies are recorded.
+        """
+        if not self.hedge:
+            return None
+        with self._lock:
+            samples = sorted(self._latencies.get(host, ()))
+        if len(samples) < self.hedge_min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(len(samples) * self.hedge_percentile))]
+
+    def should_retry(
+        self,
+        method: str,
+        attempt: int,
+        status: Optional[int] = None,
+        error: Optional[BaseException] = None,
+    ) -> bool:
+        """Decide whether to send a failed request again.
+
+        :param method: the HTTP method.
+        :param attempt: the attempt that failed, starting at 1.
+        :param status: the response status, if there was a response.
+        :param error: the error raised instead of a response.
+        """
+        if attempt >= self.max_attempts:
+            return False
+        if status == 429:
+            return True
+        if method.upper() not in self.idempotent_methods:
+            return False
+        if error is not None:
+            return is_transport_error(error)
+        return status in self.retry_statuses
+
+    def delay(self, attempt: int, retry_after_seconds: Optional[float] = None) -> float:
+        """Return the seconds to wait before the next attempt.
+
+        :param attempt: the attempt that failed, starting at 1.
+        :param retry_after_seconds: the ``Retry-After`` of the response.
+        :return: the ``Retry-After``, or a random delay up to the
+            exponential backoff ("full jitter").
+        """
+        if retry_after_seconds is not None:
+            return retry_after_seconds
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+
+    def _is_failure(self, status: Optional[int]) -> bool:
+        """Whether a response counts against the host's circuit breaker."""
+        return status is None or (status >= 500 and status in self.retry_statuses)
+
+    def send(self, method: str, url: str, send, replayable: bool = True):
+        """Send a request with retries, circuit breaking and hedging.
+
+        :param method: the HTTP method.
+        :param url: the request URL.
+        :param send: callable sending the request once and returning a
+            :class:`RESTResponse`.
+        :param replayable: whether the request body can be sent again.
+        :return: the last response.
+        """
+        host = urlsplit(url).netloc
+        breaker = self.breaker(host)
+        attempt = 1
+        while True:
+            trial = breaker.before_request(host)
+            started = time.monotonic()
+            error = None
+            try:
+                if method.upper() == "GET":
+                    response = self._hedged(host, send)
+                else:
+                    response = send()
+            except Exception as e:
+                if is_transport_error(e):
+                    breaker.record_failure()
+                error = e
+            else:
+                status = response.status
+                if self._is_failure(status):
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                    if method.upper() == "GET" and status < 400:
+                        self.record_latency(host, time.monotonic() - started)
+            finally:
+                if trial:
+                    breaker.end_trial()
+
+            if error is not None:
+                if not replayable or not self.should_retry(method, attempt, error=error):
+                    raise error
+                time.sleep(self.delay(attempt))
+                attempt += 1
+                continue
+            if (
+                not replayable
+                or status < 400
+                or not self.should_retry(method, attempt, status=status)
+            ):
+                return response
+            seconds = retry_after(response.getheader("Retry-After"))
+            if seconds is not None and seconds > self.max_backoff:
+                return response
+            response.release_conn()
+            time.sleep(self.delay(attempt, seconds))
+            attempt += 1
+
+    def _hedged(self, host: str, send):
+        """Send a GET, sending it again if the first is slower than usual."""
+        deadline = self.hedge_delay(host)
+        if deadline is None:
+            return send()
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(thread_name_prefix="hedge")
+        first = self._executor.submit(send)
+        done, _ = wait([first], timeout=deadline)
+        if done:
+            return first.result()
+        pending = {first, self._executor.submit(send)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for other in done | pending:
+                        if other is not future:
+                            other.add_done_callback(_release_future)
+                    return future.result()
+        # Both failed
+        return first.result()
+
+    async def send_async(self, method: str, url: str, send, replayable: bool = True):
+        """Send a request with retries, circuit breaking and hedging.
+
+        Asynchronous counterpart of :meth:`send`.
+
+        :param send: coroutine function sending the request once and
+            returning an :class:`AsyncRESTResponse`.
+        """
+        host = urlsplit(url).netloc
+        breaker = self.breaker(host)
+        attempt = 1
+        while True:
+            trial = breaker.before_request(host)
+            started = time.monotonic()
+            error = None
+            try:
+                if method.upper() == "GET":
+                    response = await self._hedged_async(host, send)
+                else:
+                    response = await send()
+            except Exception as e:
+                if is_transport_error(e):
+                    breaker.record_failure()
+                error = e
+            else:
+                status = response.status
+                if self._is_failure(status):
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                    if method.upper() == "GET" and status < 400:
+                        self.record_latency(host, time.monotonic() - started)
+            finally:
+                if trial:
+                    breaker.end_trial()
+
+            if error is not None:
+                if not replayable or not self.should_retry(method, attempt, error=error):
+                    raise error
+                await asyncio.sleep(self.delay(attempt))
+                attempt += 1
+                continue
+            if (
+                not replayable
+                or status < 400
+                or not self.should_retry(method, attempt, status=status)
+            ):
+                return response
+            seconds = retry_after(response.getheader("Retry-After"))
+            if seconds is not None and seconds > self.max_backoff:
+                return response
+            await response.aclose()
+            await asyncio.sleep(self.delay(attempt, seconds))
+            attempt += 1
+
+    async def _hedged_async(self, host: str, send):
+        """Send a GET, sending it again if the first is slower than usual."""
+        deadline = self.hedge_delay(host)
+        if deadline is None:
+            return await send()
+        first = asyncio.ensure_future(send())
+        done, _ = await asyncio.wait({first}, timeout=deadline)
+        if done:
+            return first.result()
+        pending = {first, asyncio.ensure_future(send())}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winners = [task for task in done if task.exception() is None]
+                if winners:
+                    for other in winners[1:]:
+                        await other.result().aclose()
+                    return winners[0].result()
+            # Both failed
+            return first.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+def _release_future(future) -> None:
+    """Release the connection of a hedged request that lost the race."""
+    if not future.cancelled() and future.exception() is None:
+        future.result().release_conn()
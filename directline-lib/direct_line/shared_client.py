@@ -0,0 +1,128 @@
+# coding: utf-8
+
+"""Process-wide API clients shared by every conversation."""
+
+import asyncio
+import threading
+import weakref
+from typing import Dict, Optional
+
+from direct_line.api_client import ApiClient
+from direct_line.async_api_client import AsyncApiClient
+from direct_line.configuration import Configuration
+from direct_line.models.conversation import Conversation
+
+
+def bearer_auth(token: str) -> Dict[str, str]:
+    """Returns the ``_request_auth`` setting sending a bearer token."""
+    return {
+        "in": "header",
+        "type": "bearer",
+        "key": "Authorization",
+        "value": f"Bearer {token}",
+    }
+
+
+class ConversationCredential:
+    """The token of one conversation, for calls through a shared client.
+
+    Instead of building an API client per token, pass
+    :attr:`request_auth` with each call on a client from
+    :func:`shared_api_client` or :func:`shared_async_api_client`::
+
+        credential = ConversationCredential.from_conversation(conversation)
+        await api.conversations_post_activity(
+            credential.conversation_id, activity,
+            _request_auth=credential.request_auth,
+        )
+
+    The ``Authorization`` header it sets takes precedence over the client's
+    default headers. Call :meth:`update` with the result of a token refresh.
+    """
+
+    __slots__ = ("token", "conversation_id")
+
+    def __init__(self, token: str, conversation_id: Optional[str] = None) -> None:
+        self.token = token
+        self.conversation_id = conversation_id
+
+    @classmethod
+    def from_conversation(cls, conversation: Conversation) -> "ConversationCredential":
+        """Returns the credential of a started or reconnected conversation."""
+        if not conversation.token:
+            raise ValueError("Conversation has no token")
+        return cls(conversation.token, conversation.conversation_id)
+
+    @property
+    def request_auth(self) -> Dict[str, str]:
+        """The ``_request_auth`` setting of the current token."""
+        return bearer_auth(self.token)
+
+    def update(self, conversation: Conversation) -> None:
+        """Takes the token of a refreshed or reconnected conversation."""
+        if conversation.token:
+            self.token = conversation.token
+
+    def __repr__(self) -> str:
+        return f"ConversationCredential(conversation_id={self.conversation_id!r})"
+
+
+_clients: Dict[str, ApiClient] = {}
+# Async clients are bound to the event loop they were first used on
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, AsyncApiClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+_lock = threading.Lock()
+
+
+def shared_api_client(configuration: Optional[Configuration] = None) -> ApiClient:
+    """Returns the process-wide :class:`ApiClient` of a host.
+
+    Every caller gets the same client, and so the same connection pool, for
+    a host. The client carries no credentials; pass them per call with
+    ``_request_auth``, e.g. from a :class:`ConversationCredential`.
+
+    :param configuration: configuration of the client, used only when the
+        host's client is first created. Defaults to
+        :meth:`Configuration.get_default`.
+    """
+    configuration = configuration or Configuration.get_default()
+    with _lock:
+        client = _clients.get(configuration.host)
+        if client is None:
+            client = _clients[configuration.host] = ApiClient(configuration)
+        return client
+
+
+def shared_async_api_client(configuration: Optional[Configuration] = None) -> AsyncApiClient:
+    """Returns the :class:`AsyncApiClient` of a host for the running event loop.
+
+    Like :func:`shared_api_client`, with one client per event loop, since
+    the connections of an async client cannot move between loops. Close
+    them with :func:`close_shared_async_api_clients` before the loop ends.
+    """
+    configuration = configuration or Configuration.get_default()
+    loop = asyncio.get_running_loop()
+    with _lock:
+        clients = _async_clients.setdefault(loop, {})
+        client = clients.get(configuration.host)
+        if client is None:
+            client = clients[configuration.host] = AsyncApiClient(configuration)
+        return client
+
+
+def close_shared_api_clients() -> None:
+    """Closes the shared sync clients."""
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
+
+
+async def close_shared_async_api_clients() -> None:
+    """Closes the shared async clients of the running event loop."""
+    with _lock:
+        clients = list(_async_clients.pop(asyncio.get_running_loop(), {}).values())
+    for client in clients:
+        await client.close()
@@ -0,0 +1,319 @@
+# coding: utf-8
+
+"""Supervised WebSocket streams for many Direct Line conversations."""
+
+import asyncio
+import random
+from typing import Any, Callable, Dict, Optional, Union
+
+from direct_line.api.async_conversations_api import AsyncConversationsApi
+from direct_line.activity_index import DEFAULT_MAX_SIZE, ActivityIndex
+from direct_line.async_api_client import AsyncApiClient
+from direct_line.exceptions import ApiException
+from direct_line.models.activity_set import ActivitySet
+from direct_line.resilience import is_transient_error
+
+try:
+    from websockets.asyncio.client import connect as ws_connect
+    _HAS_WEBSOCKETS = True
+except ImportError:  # pragma: no cover - optional dependency
+    _HAS_WEBSOCKETS = False
+
+TokenProvider = Union[str, Callable[[], Optional[str]]]
+
+# Statuses after which reconnecting cannot succeed: the token is invalid
+# or expired, or the conversation no longer exists.
+FATAL_STATUSES = frozenset((400, 401, 403, 404))
+
+
+class ConversationStream:
+    """The activity stream of one conversation supervised by a :class:`StreamManager`.
+
+    Parsed :class:`ActivitySet` objects are delivered to :attr:`queue`. Once
+    the stream ends, for good, ``None`` is put on the queue and
+    :attr:`error` holds the exception that ended it, if any. Iterating the
+    stream with ``async for`` yields activity sets until then.
+
+    Activities already recorded in :attr:`seen` are dropped, so replays
+    after a reconnect are delivered once.
+    """
+
+    def __init__(
+        self,
+        conversation_id: str,
+        token: TokenProvider,
+        stream_url: Optional[str] = None,
+        watermark: Optional[str] = None,
+        queue_size: int = 0,
+        seen: Optional[ActivityIndex] = None,
+    ) -> None:
+        self.conversation_id = conversation_id
+        self._token = token
+        self.stream_url = stream_url
+        self.watermark = watermark
+        self.queue: "asyncio.Queue[Optional[ActivitySet]]" = asyncio.Queue(queue_size)
+        self.connected = False
+        # Event loop time the current socket opened at
+        self.connected_at: Optional[float] = None
+        self.reconnects = 0
+        self.closed = False
+        self.error: Optional[BaseException] = None
+        self.task: Optional["asyncio.Task[None]"] = None
+        self.seen = seen if seen is not None else ActivityIndex()
+
+    @property
+    def token(self) -> Optional[str]:
+        """The current token, resolved from the token provider."""
+        if callable(self._token):
+            return self._token()
+        return self._token
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> ActivitySet:
+        activity_set = await self.queue.get()
+        if activity_set is None:
+            # Leave the sentinel for any other consumer
+            self.queue.put_nowait(None)
+            raise StopAsyncIteration
+        return activity_set
+
+
+class StreamManager:
+    """Keeps WebSocket streams open for any number of conversations.
+
+    Every conversation is supervised by its own task on the running event
+    loop. When a socket drops, the task asks for a new stream URL with
+    ``conversations_reconnect_to_conversation``, passing the last watermark
+    seen so no activity is lost, and retries with jittered exponential
+    backoff. Even a socket the service closes cleanly is followed by the
+    initial backoff, and one that closes within ``stable_after`` seconds
+    counts as a failed attempt, so a stream URL or token the service keeps
+    rejecting does not reconnect in a tight loop. The stream ends when the
+    bot sends ``endOfConversation``, the service rejects the token or
+    conversation, or it is closed.
+
+    Requires the optional ``websockets`` package.
+
+    :param api_client: client used to request new stream URLs. Requests are
+        authenticated with each conversation's own token, so it must not
+        carry a default ``Authorization`` header.
+    :param queue_size: bound of every per-conversation queue; 0 is unbounded.
+    :param initial_backoff: seconds to wait before the first retry.
+    :param max_backoff: upper bound of the wait between retries.
+    :param max_retries: failed attempts in a row before a stream gives up;
+        ``None`` retries forever.
+    :param stable_after: seconds a socket must stay open for the backoff
+        to start over.
+    :param ping_interval: seconds between keepalive pings.
+    :param connect: WebSocket connect function; defaults to
+        ``websockets.asyncio.client.connect``.
+    :param dedup_size: activity IDs remembered per conversation to drop
+        duplicates; 0 disables de-duplication.
+    """
+
+    def __init__(
+        self,
+        api_client: Optional[AsyncApiClient] = None,
+        queue_size: int = 0,
+        initial_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        max_retries: Optional[int] = None,
+        stable_after: float = 30.0,
+        ping_interval: Optional[float] = 30.0,
+        connect: Optional[Callable[..., Any]] = None,
+        dedup_size: int = DEFAULT_MAX_SIZE,
+    ) -> None:
+        if connect is None:
+            if not _HAS_WEBSOCKETS:
+                raise ImportError(
+                    "StreamManager requires the 'websockets' package: "
+                    "pip install 'direct-line[websocket]'"
+                )
+            connect = ws_connect
+
+        self._owns_client = api_client is None
+        self.api_client = api_client or AsyncApiClient()
+        self.conversations_api = AsyncConversationsApi(self.api_client)
+        self.queue_size = queue_size
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.max_retries = max_retries
+        self.stable_after = stable_after
+        self.ping_interval = ping_interval
+        self._connect = connect
+        self.dedup_size = dedup_size
+        self.streams: Dict[str, ConversationStream] = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def __len__(self) -> int:
+        return len(self.streams)
+
+    def __contains__(self, conversation_id: str) -> bool:
+        return conversation_id in self.streams
+
+    def __getitem__(self, conversation_id: str) -> ConversationStream:
+        return self.streams[conversation_id]
+
+    def open(
+        self,
+        conversation_id: str,
+        token: TokenProvider,
+        stream_url: Optional[str] = None,
+        watermark: Optional[str] = None,
+        seen: Optional[ActivityIndex] = None,
+    ) -> ConversationStream:
+        """Start supervising the stream of a conversation.
+
+        :param conversation_id: ID of the conversation.
+        :param token: the conversation's token, or a callable returning the
+            current one (for example ``lambda: lease.token``).
+        :param stream_url: stream URL returned when the conversation was
+            started; a new one is requested when omitted.
+        :param watermark: watermark to resume from.
+        :param seen: index of the activities already delivered, to share
+            de-duplication with another consumer of the conversation.
+        :return: the stream, whose queue receives the conversation's
+            activity sets.
+        """
+        stream = self.streams.get(conversation_id)
+        if stream is not None and not stream.closed:
+            return stream
+
+        if seen is None:
+            seen = ActivityIndex(self.dedup_size)
+        stream = ConversationStream(
+            conversation_id, token, stream_url, watermark, self.queue_size, seen
+        )
+        self.streams[conversation_id] = stream
+        stream.task = asyncio.ensure_future(self._supervise(stream))
+        return stream
+
+    async def close_stream(self, conversation_id: str) -> None:
+        """Stop supervising the stream of a conversation."""
+        stream = self.streams.pop(conversation_id, None)
+        if stream is None or stream.task is None:
+            return
+        stream.task.cancel()
+        await asyncio.gather(stream.task, return_exceptions=True)
+
+    async def close(self) -> None:
+        """Close every stream and the internal client."""
+        tasks = [stream.task for stream in self.streams.values() if stream.task is not None]
+        self.streams.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._owns_client:
+            await self.api_client.close()
+
+    def _backoff(self, attempt: int) -> float:
+        # "Equal jitter": at least half the exponential delay, so thousands
+        # of streams dropped together do not reconnect in lockstep
+        delay = min(self.max_backoff, self.initial_backoff * 2 ** attempt)
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    async def _supervise(self, stream: ConversationStream) -> None:
+        loop = asyncio.get_running_loop()
+        attempt = 0
+        try:
+            while True:
+                stream.connected_at = None
+                closed = False
+                try:
+                    stream_url = stream.stream_url
+                    if stream_url is None:
+                        stream_url = await self._reconnect(stream)
+                    if await self._listen(stream, stream_url):
+                        return
+                    # Closed by the service
+                    closed = True
+                except ApiException as e:
+                    if e.status in FATAL_STATUSES:
+                        stream.error = e
+                        return
+                except Exception as e:
+                    if not is_transient_error(e):
+                        stream.error = e
+                        return
+                finally:
+                    stream.connected = False
+
+                stable = (
+                    stream.connected_at is not None
+                    and loop.time() - stream.connected_at >= self.stable_after
+                )
+                if stable:
+                    attempt = 0
+                # Only a socket that stayed open and then closed cleanly is
+                # not a failed attempt
+                if not (closed and stable):
+                    attempt += 1
+                # Stream URLs are single-use; ask for a new one next time
+                stream.stream_url = None
+                stream.reconnects += 1
+                if self.max_retries is not None and attempt > self.max_retries:
+                    stream.error = ConnectionError(
+                        f"Gave up on the stream of {stream.conversation_id} "
+                        f"after {self.max_retries} retries"
+                    )
+                    return
+                await asyncio.sleep(self._backoff(max(attempt - 1, 0)))
+        finally:
+            stream.closed = True
+            try:
+                stream.queue.put_nowait(None)
+            except asyncio.QueueFull:
+                # Deliver the end of stream once the consumer catches up
+                asyncio.ensure_future(stream.queue.put(None))
+
+    async def _reconnect(self, stream: ConversationStream) -> str:
+        conversation = await self.conversations_api.conversations_reconnect_to_conversation(
+            stream.conversation_id,
+            watermark=stream.watermark,
+            _headers={"Authorization": f"Bearer {stream.token}"},
+        )
+        if not conversation.stream_url:
+            # Retried like a dropped connection
+            raise ConnectionError(
+                f"No stream URL returned for {stream.conversation_id}"
+            )
+        stream.stream_url = conversation.stream_url
+        return conversation.stream_url
+
+    async def _listen(self, stream: ConversationStream, stream_url: str) -> bool:
+        """Relay one socket's messages; True once the conversation has ended."""
+        async with self._connect(
+            stream_url, ping_interval=self.ping_interval
+        ) as websocket:
+            stream.connected = True
+            stream.connected_at = asyncio.get_running_loop().time()
+            async for message in websocket:
+                # Empty messages are keepalives
+                if not message:
+                    continue
+                try:
+                    activity_set = ActivitySet.model_validate_json(message)
+                except ValueError:
+                    # Not an ActivitySet; other message types may be added
+                    continue
+                # A missing watermark must not overwrite a known one
+                if activity_set.watermark:
+                    stream.watermark = activity_set.watermark
+                if not activity_set.activities:
+                    continue
+                # Checked before de-duplication: the end of the conversation
+                # may already have been delivered through a shared index
+                ended = any(a.type == "endOfConversation" for a in activity_set.activities)
+                fresh = stream.seen.filter(activity_set)
+                if fresh is not None:
+                    await stream.queue.put(fresh)
+                if ended:
+                    return True
+        return False
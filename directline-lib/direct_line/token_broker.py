@@ -0,0 +1,272 @@
+# coding: utf-8
+
+"""Warm pool of Direct Line conversation tokens with proactive refresh."""
+
+import asyncio
+import collections
+import heapq
+import itertools
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+from direct_line.api.async_tokens_api import AsyncTokensApi
+from direct_line.async_api_client import AsyncApiClient
+from direct_line.configuration import Configuration
+from direct_line.models.conversation import Conversation
+from direct_line.models.token_parameters import TokenParameters
+from direct_line.shared_client import bearer_auth
+
+# Lifetime assumed when the service omits expires_in (the documented default).
+DEFAULT_EXPIRES_IN = 1800
+
+
+class TokenLease:
+    """A conversation token handed out by a :class:`TokenBroker`.
+
+    While the lease is held the broker keeps refreshing the token, so
+    :attr:`token` always returns the most recent one. Call
+    :meth:`release` when the conversation is over.
+    """
+
+    def __init__(self, conversation: Conversation) -> None:
+        self.conversation = conversation
+        self.leased = False
+        self.released = False
+        self.expired = False
+        self.refreshed_at = 0.0
+
+    @property
+    def token(self) -> Optional[str]:
+        """The current token of the conversation."""
+        return self.conversation.token
+
+    @property
+    def conversation_id(self) -> Optional[str]:
+        return self.conversation.conversation_id
+
+    @property
+    def expires_in(self) -> int:
+        return self.conversation.expires_in or DEFAULT_EXPIRES_IN
+
+    @property
+    def request_auth(self) -> Dict[str, str]:
+        """The ``_request_auth`` setting of the current token, for calls
+        through a shared client."""
+        token = self.token
+        if not token:
+            raise ValueError("Conversation has no token")
+        return bearer_auth(token)
+
+    def release(self) -> None:
+        """Stop refreshing the token."""
+        self.released = True
+
+
+class TokenBroker:
+    """Hands out Direct Line tokens from a bounded pool of pre-minted ones.
+
+    A background task keeps up to ``pool_size`` tokens minted with
+    ``tokens_generate_token_for_new_conversation`` and refreshes every
+    pooled or leased token with ``tokens_refresh_token`` once
+    ``refresh_fraction`` of its ``expires_in`` has elapsed. :meth:`acquire`
+    pops a pooled token in O(1) and only falls back to minting one inline
+    when the pool is empty.
+
+    :param secret: the Direct Line secret used to mint tokens.
+    :param configuration: .Configuration object for the internal client.
+    :param api_client: client to send requests through. It must not carry
+        a default ``Authorization`` header, since the broker authenticates
+        every request itself.
+    :param pool_size: number of tokens kept ready.
+    :param refresh_fraction: fraction of ``expires_in`` after which a token
+        is refreshed.
+    :param max_concurrent_requests: cap on mint/refresh calls in flight.
+    :param retry_interval: seconds to wait before retrying a failed refresh.
+    :param token_parameters: parameters sent when minting tokens.
+    """
+
+    def __init__(
+        self,
+        secret: str,
+        configuration: Optional[Configuration] = None,
+        api_client: Optional[AsyncApiClient] = None,
+        pool_size: int = 10,
+        refresh_fraction: float = 0.5,
+        max_concurrent_requests: int = 4,
+        retry_interval: float = 5.0,
+        token_parameters: Optional[TokenParameters] = None,
+    ) -> None:
+        if pool_size < 0:
+            raise ValueError("pool_size must not be negative")
+        if not 0 < refresh_fraction < 1:
+            raise ValueError("refresh_fraction must be between 0 and 1")
+        if max_concurrent_requests < 1:
+            raise ValueError("max_concurrent_requests must be at least 1")
+
+        self._secret = secret
+        self._owns_client = api_client is None
+        self.api_client = api_client or AsyncApiClient(configuration)
+        self.tokens_api = AsyncTokensApi(self.api_client)
+        self.pool_size = pool_size
+        self.refresh_fraction = refresh_fraction
+        self.max_concurrent_requests = max_concurrent_requests
+        self.retry_interval = retry_interval
+        self.token_parameters = token_parameters
+
+        self._pool: Deque[TokenLease] = collections.deque()
+        self._pooled = 0
+        self._minting = 0
+        # (refresh deadline, sequence, lease) ordered by deadline
+        self._schedule: List[Tuple[float, int, TokenLease]] = []
+        self._sequence = itertools.count()
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self._maintainer: Optional["asyncio.Task[None]"] = None
+        self._closed = False
+        # Created on start so they bind to the running event loop; nothing
+        # uses them before then
+        self._wakeup: asyncio.Event
+        self._semaphore: asyncio.Semaphore
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    @property
+    def available(self) -> int:
+        """Number of tokens ready to be handed out."""
+        return self._pooled
+
+    async def start(self) -> None:
+        """Start filling the pool and refreshing tokens in the background."""
+        if self._maintainer is not None:
+            return
+        self._closed = False
+        self._wakeup = asyncio.Event()
+        self._semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        self._maintainer = asyncio.ensure_future(self._maintain())
+
+    async def close(self) -> None:
+        """Stop the background work and close the internal client."""
+        # wait_for() may swallow a cancellation that races with the wakeup
+        # event, so the maintainer also checks this flag
+        self._closed = True
+        tasks = list(self._tasks)
+        if self._maintainer is not None:
+            tasks.append(self._maintainer)
+            self._maintainer = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._owns_client:
+            await self.api_client.close()
+
+    async def acquire(self) -> TokenLease:
+        """Take a token for a new conversation.
+
+        :return: a lease whose token is kept fresh until released.
+        """
+        if self._maintainer is None:
+            await self.start()
+
+        while self._pool:
+            lease = self._pool.popleft()
+            if lease.expired:
+                continue
+            self._pooled -= 1
+            lease.leased = True
+            self._wakeup.set()
+            return lease
+
+        # Pool ran dry; mint inline and let the maintainer catch up
+        self._wakeup.set()
+        lease = await self._mint()
+        lease.leased = True
+        return lease
+
+    async def _maintain(self) -> None:
+        loop = asyncio.get_running_loop()
+        while not self._closed:
+            self._wakeup.clear()
+
+            for _ in range(self.pool_size - self._pooled - self._minting):
+                self._minting += 1
+                self._spawn(self._fill())
+
+            now = loop.time()
+            while self._schedule and self._schedule[0][0] <= now:
+                _, _, lease = heapq.heappop(self._schedule)
+                if not lease.released and not lease.expired:
+                    self._spawn(self._refresh(lease))
+
+            timeout = self._schedule[0][0] - now if self._schedule else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _schedule_refresh(self, lease: TokenLease, delay: float) -> None:
+        deadline = asyncio.get_running_loop().time() + delay
+        heapq.heappush(self._schedule, (deadline, next(self._sequence), lease))
+        self._wakeup.set()
+
+    async def _mint(self) -> TokenLease:
+        async with self._semaphore:
+            conversation = await self.tokens_api.tokens_generate_token_for_new_conversation(
+                self.token_parameters,
+                _headers={"Authorization": f"Bearer {self._secret}"},
+            )
+        lease = TokenLease(conversation)
+        lease.refreshed_at = asyncio.get_running_loop().time()
+        self._schedule_refresh(lease, lease.expires_in * self.refresh_fraction)
+        return lease
+
+    async def _fill(self) -> None:
+        try:
+            lease = await self._mint()
+        except Exception:
+            # Back off instead of spinning on a failing service
+            await asyncio.sleep(self.retry_interval)
+            self._wakeup.set()
+            return
+        finally:
+            self._minting -= 1
+        self._pool.append(lease)
+        self._pooled += 1
+
+    async def _refresh(self, lease: TokenLease) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            async with self._semaphore:
+                conversation = await self.tokens_api.tokens_refresh_token(
+                    _headers={"Authorization": f"Bearer {lease.token}"},
+                )
+        except Exception:
+            # Whatever went wrong, a lease must be retried or expired, never
+            # left to lapse unnoticed
+            remaining = lease.refreshed_at + lease.expires_in - loop.time()
+            if remaining > self.retry_interval:
+                self._schedule_refresh(lease, self.retry_interval)
+            else:
+                self._expire(lease)
+            return
+
+        # The refresh response may omit the conversation ID
+        if conversation.conversation_id is None:
+            conversation.conversation_id = lease.conversation_id
+        lease.conversation = conversation
+        lease.refreshed_at = loop.time()
+        self._schedule_refresh(lease, lease.expires_in * self.refresh_fraction)
+
+    def _expire(self, lease: TokenLease) -> None:
+        lease.expired = True
+        if not lease.leased:
+            # Left in the deque and skipped by acquire()
+            self._pooled -= 1
+            self._wakeup.set()
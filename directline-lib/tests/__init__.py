@@ -0,0 +1 @@
+"""Hand-written tests for the Direct Line SDK."""
@@ -0,0 +1,62 @@
+"""Tests for the activity de-duplication index."""
+import unittest
+
+from direct_line.activity_index import ActivityIndex
+from direct_line.models.activity_set import ActivitySet
+
+
+def activity_set(*ids, watermark="1"):
+    return ActivitySet.from_dict({
+        "activities": [{"type": "message", "id": i} for i in ids],
+        "watermark": watermark,
+    })
+
+
+class TestActivityIndex(unittest.TestCase):
+
+    def test_add_reports_duplicates(self):
+        index = ActivityIndex()
+
+        self.assertTrue(index.add("a"))
+        self.assertFalse(index.add("a"))
+        self.assertEqual(index.duplicates, 1)
+
+    def test_least_recent_id_is_evicted(self):
+        index = ActivityIndex(max_size=2)
+        index.add("a")
+        index.add("b")
+        # Seeing "a" again makes "b" the least recent
+        index.add("a")
+        index.add("c")
+
+        self.assertEqual(len(index), 2)
+        self.assertIn("a", index)
+        self.assertNotIn("b", index)
+
+    def test_filter_drops_seen_activities(self):
+        index = ActivityIndex()
+        first = activity_set("a", "b")
+
+        self.assertIs(index.filter(first), first)
+        filtered = index.filter(activity_set("b", "c", watermark="2"))
+        self.assertEqual([a.id for a in filtered.activities], ["c"])
+        self.assertEqual(filtered.watermark, "2")
+        self.assertIsNone(index.filter(activity_set("a", "c")))
+
+    def test_activities_without_id_are_kept(self):
+        index = ActivityIndex()
+        without_id = ActivitySet.from_dict({"activities": [{"type": "typing"}]})
+
+        self.assertIs(index.filter(without_id), without_id)
+        self.assertIs(index.filter(without_id), without_id)
+
+    def test_zero_size_disables_deduplication(self):
+        index = ActivityIndex(max_size=0)
+        index.add("a")
+
+        self.assertTrue(index.add("a"))
+        self.assertEqual(len(index), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,172 @@
+"""Tests for the Direct Line activity poller."""
+import asyncio
+import unittest
+
+import httpx
+
+from direct_line.activity_index import ActivityIndex
+from direct_line.activity_poller import ActivityPoller
+from direct_line.async_api_client import AsyncApiClient
+from direct_line.configuration import Configuration
+from direct_line.exceptions import NotFoundException
+from direct_line.models.activity import Activity
+
+
+class TestActivityPoller(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.requests = []
+        # conversation ID -> activity sets returned by successive polls
+        self.pages = {}
+        self.api_client = AsyncApiClient(
+            configuration=Configuration(host="https://directline.test")
+        )
+        await self.api_client.rest_client.client.aclose()
+        self.api_client.rest_client.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(self.handler)
+        )
+
+    async def asyncTearDown(self):
+        await self.api_client.close()
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        conversation_id = request.url.path.split("/")[4]
+        if request.method == "POST":
+            return httpx.Response(200, json={"id": "sent"})
+        if conversation_id == "gone":
+            return httpx.Response(404, json={})
+        pages = self.pages.get(conversation_id)
+        if pages:
+            return httpx.Response(200, json=pages.pop(0))
+        watermark = request.url.params.get("watermark")
+        return httpx.Response(200, json={"activities": [], "watermark": watermark})
+
+    def polls_of(self, conversation_id):
+        return [
+            r for r in self.requests
+            if r.method == "GET" and f"/{conversation_id}/" in r.url.path
+        ]
+
+    def poller(self, **kwargs):
+        kwargs.setdefault("active_interval", 0.05)
+        kwargs.setdefault("idle_interval", 0.4)
+        kwargs.setdefault("send_delay", 0.01)
+        return ActivityPoller(self.api_client, **kwargs)
+
+    async def test_watermark_is_carried_between_polls(self):
+        self.pages["abc"] = [
+            {"activities": [{"type": "message", "id": "a1"}], "watermark": "1"},
+            {"activities": [{"type": "message", "id": "a2"}]},
+            {"activities": [{"type": "endOfConversation", "id": "a3"}], "watermark": "3"},
+        ]
+        async with self.poller() as poller:
+            conversation = await poller.add("abc", lambda: "t1")
+            received = await asyncio.wait_for(self.drain(conversation), 5)
+
+        self.assertEqual(
+            [a.id for activity_set in received for a in activity_set.activities],
+            ["a1", "a2", "a3"],
+        )
+        self.assertIsNone(conversation.error)
+        self.assertNotIn("abc", poller)
+        polls = self.polls_of("abc")
+        self.assertNotIn("watermark", polls[0].url.params)
+        # A missing watermark keeps the previous one
+        self.assertEqual(polls[1].url.params["watermark"], "1")
+        self.assertEqual(polls[2].url.params["watermark"], "1")
+        self.assertEqual(polls[0].headers["Authorization"], "Bearer t1")
+
+    async def test_idle_conversation_backs_off(self):
+        async with self.poller() as poller:
+            conversation = await poller.add("abc", "token")
+            await asyncio.sleep(1.2)
+
+            self.assertEqual(conversation.interval, 0.4)
+        # 0, 0.1, 0.3, 0.7, 1.1 instead of every 50ms
+        self.assertLessEqual(len(self.polls_of("abc")), 6)
+
+    async def test_send_triggers_early_poll(self):
+        async with self.poller(idle_interval=5.0) as poller:
+            conversation = await poller.add("abc", "token")
+            await asyncio.sleep(0.5)
+            conversation.interval = 5.0
+            count = len(self.polls_of("abc"))
+
+            self.pages["abc"] = [
+                {"activities": [{"type": "message", "id": "reply"}], "watermark": "1"},
+            ]
+            await poller.post_activity("abc", Activity(type="message", text="hi"))
+            activity_set = await asyncio.wait_for(conversation.queue.get(), 1)
+
+            self.assertEqual(activity_set.activities[0].id, "reply")
+            self.assertEqual(len(self.polls_of("abc")), count + 1)
+            self.assertEqual(conversation.interval, 0.05)
+
+    async def test_activities_seen_elsewhere_are_dropped(self):
+        seen = ActivityIndex()
+        # Already delivered by the conversation's WebSocket stream
+        seen.add("a1")
+        self.pages["abc"] = [
+            {"activities": [{"type": "message", "id": "a1"}], "watermark": "1"},
+            {"activities": [
+                {"type": "message", "id": "a1"},
+                {"type": "endOfConversation", "id": "a2"},
+            ], "watermark": "2"},
+        ]
+        async with self.poller() as poller:
+            conversation = await poller.add("abc", "token", seen=seen)
+            received = await asyncio.wait_for(self.drain(conversation), 5)
+
+        self.assertEqual(
+            [[a.id for a in activity_set.activities] for activity_set in received],
+            [["a2"]],
+        )
+        self.assertEqual(conversation.watermark, "2")
+        self.assertEqual(seen.duplicates, 2)
+
+    async def test_missing_conversation_ends_stream(self):
+        async with self.poller() as poller:
+            conversation = await poller.add("gone", "token")
+            received = await asyncio.wait_for(self.drain(conversation), 5)
+
+        self.assertEqual(received, [])
+        self.assertIsInstance(conversation.error, NotFoundException)
+
+    async def test_polls_share_bounded_workers(self):
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"activities": []})
+
+        await self.api_client.rest_client.client.aclose()
+        self.api_client.rest_client.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+        async with self.poller(workers=4) as poller:
+            for i in range(100):
+                await poller.add(f"c{i}", "token")
+            await asyncio.sleep(0.5)
+
+            self.assertEqual(len(poller), 100)
+            self.assertTrue(all(c.polls for c in poller.conversations.values()))
+        self.assertEqual(peak, 4)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            ActivityPoller(self.api_client, workers=0)
+        with self.assertRaises(ValueError):
+            ActivityPoller(self.api_client, active_interval=20, idle_interval=10)
+
+    async def drain(self, conversation):
+        return [activity_set async for activity_set in conversation]
+
+
+if __name__ == '__main__':
+    unittest.main()
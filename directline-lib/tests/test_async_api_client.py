@@ -0,0 +1,123 @@
+"""Tests for the asyncio transport of the Direct Line SDK."""
+import asyncio
+import json
+import unittest
+
+import httpx
+import urllib3
+
+from direct_line.api.async_conversations_api import AsyncConversationsApi
+from direct_line.api.async_tokens_api import AsyncTokensApi
+from direct_line.async_api_client import AsyncApiClient
+from direct_line.async_rest import AsyncRESTClientObject
+from direct_line.configuration import Configuration
+from direct_line.exceptions import NotFoundException
+from direct_line.models.activity import Activity
+from direct_line.models.activity_set import ActivitySet
+from direct_line.models.resource_response import ResourceResponse
+
+
+class TestAsyncApiClient(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.requests = []
+        self.api_client = AsyncApiClient(
+            configuration=Configuration(host="https://directline.test"),
+            header_name="Authorization",
+            header_value="Bearer token",
+        )
+        await self.api_client.rest_client.client.aclose()
+        self.api_client.rest_client.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(self.handler)
+        )
+        self.api = AsyncConversationsApi(self.api_client)
+
+    async def asyncTearDown(self):
+        await self.api_client.close()
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.url.path.endswith("/missing/activities"):
+            return httpx.Response(404, json={"error": {"code": "BadArgument"}})
+        if request.method == "POST":
+            return httpx.Response(200, json={"id": "act-1"})
+        return httpx.Response(
+            200,
+            json={
+                "activities": [{"type": "message", "id": "a1", "text": "hi"}],
+                "watermark": "1",
+            },
+        )
+
+    async def test_post_activity(self):
+        response = await self.api.conversations_post_activity(
+            conversation_id="abc",
+            activity=Activity(type="message", text="hello"),
+        )
+
+        self.assertIsInstance(response, ResourceResponse)
+        self.assertEqual(response.id, "act-1")
+        request = self.requests[0]
+        self.assertEqual(
+            str(request.url),
+            "https://directline.test/v3/directline/conversations/abc/activities",
+        )
+        self.assertEqual(request.headers["Authorization"], "Bearer token")
+        self.assertEqual(
+            json.loads(request.content), {"type": "message", "text": "hello"}
+        )
+
+    async def test_get_activities_with_http_info(self):
+        response = await self.api.conversations_get_activities_with_http_info(
+            conversation_id="abc", watermark="0"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIsInstance(response.data, ActivitySet)
+        self.assertEqual(response.data.watermark, "1")
+        self.assertEqual(response.data.activities[0].text, "hi")
+        self.assertEqual(self.requests[0].url.params["watermark"], "0")
+
+    async def test_error_status_raises(self):
+        with self.assertRaises(NotFoundException) as context:
+            await self.api.conversations_get_activities(conversation_id="missing")
+        self.assertEqual(context.exception.status, 404)
+
+    async def test_concurrent_requests_share_client(self):
+        tokens_api = AsyncTokensApi(self.api_client)
+        self.assertIs(tokens_api.api_client.rest_client, self.api.api_client.rest_client)
+
+        responses = await asyncio.gather(*(
+            self.api.conversations_post_activity(
+                conversation_id=f"c{i}", activity=Activity(type="typing")
+            )
+            for i in range(20)
+        ))
+
+        self.assertEqual(len(responses), 20)
+        self.assertEqual(len(self.requests), 20)
+
+    async def test_without_preload_content_returns_stream(self):
+        response = await self.api.conversations_get_activities_without_preload_content(
+            conversation_id="abc"
+        )
+
+        self.assertIsInstance(response, httpx.Response)
+        self.assertEqual(json.loads(await response.aread())["watermark"], "1")
+
+
+
+class TestAsyncRESTClientObject(unittest.IsolatedAsyncioTestCase):
+
+    async def test_connection_retries(self):
+        for retries, expected in ((3, 3), (urllib3.Retry(2), 2), (urllib3.Retry(False), 0)):
+            with self.subTest(retries=retries):
+                configuration = Configuration()
+                configuration.retries = retries
+                rest_client = AsyncRESTClientObject(configuration)
+                self.assertEqual(rest_client.client._transport._pool._retries, expected)
+                await rest_client.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
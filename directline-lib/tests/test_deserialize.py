@@ -0,0 +1,62 @@
+"""Tests for the single-pass model deserialization of the API client."""
+import json
+import unittest
+
+from pydantic import ValidationError
+
+from direct_line.api_client import ApiClient
+from direct_line.models.activity_set import ActivitySet
+
+ACTIVITY_SET = {
+    "activities": [{
+        "type": "message",
+        "id": "abc|0001",
+        "timestamp": "2024-05-01T12:00:00.123Z",
+        "from": {"id": "bot", "name": "Bot", "role": "bot"},
+        "conversation": {"id": "abc", "isGroup": False},
+        "text": "Pick one",
+        "attachments": [{"contentType": "application/vnd.microsoft.card.hero", "content": {"title": "Card"}}],
+        "entities": [{"type": "mention"}],
+        "suggestedActions": {"to": ["user"], "actions": [{"type": "imBack", "title": "Yes", "value": "yes"}]},
+        "channelData": {"custom": [1, 2]},
+        "unknownProperty": "ignored",
+    }],
+    "watermark": "1",
+}
+
+
+class TestDeserialize(unittest.TestCase):
+
+    def setUp(self):
+        self.api_client = ApiClient()
+
+    def deserialize(self, data, response_type):
+        return self.api_client.deserialize(json.dumps(data), response_type, "application/json")
+
+    def test_matches_from_dict(self):
+        activity_set = self.deserialize(ACTIVITY_SET, "ActivitySet")
+
+        self.assertEqual(activity_set, ActivitySet.from_dict(ACTIVITY_SET))
+        self.assertEqual(activity_set.to_dict(), ActivitySet.from_dict(ACTIVITY_SET).to_dict())
+        self.assertEqual(activity_set.activities[0].var_from.name, "Bot")
+
+    def test_list_of_models(self):
+        activity_sets = self.deserialize([ACTIVITY_SET, ACTIVITY_SET], "List[ActivitySet]")
+
+        self.assertEqual(len(activity_sets), 2)
+        self.assertIsInstance(activity_sets[1], ActivitySet)
+
+    def test_null_body(self):
+        self.assertIsNone(self.deserialize(None, "ActivitySet"))
+
+    def test_invalid_data_is_rejected(self):
+        with self.assertRaises(ValidationError):
+            self.deserialize({"activities": [{"type": 1}]}, "ActivitySet")
+
+    def test_other_types_are_unchanged(self):
+        self.assertEqual(self.deserialize(12, "str"), "12")
+        self.assertEqual(self.deserialize({"a": 1}, "object"), {"a": 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
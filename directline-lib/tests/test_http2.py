@@ -0,0 +1,100 @@
+"""Tests for the httpx REST client used for HTTP/2."""
+import importlib.util
+import json
+import unittest
+
+import httpx
+
+from direct_line.api.conversations_api import ConversationsApi
+from direct_line.api_client import ApiClient
+from direct_line.configuration import Configuration
+from direct_line.exceptions import ApiException
+from direct_line.httpx_rest import HttpxRESTClientObject
+from direct_line.models.activity import Activity
+from direct_line.multipart import UploadFile
+from direct_line.resilience import RetryPolicy
+
+HAS_H2 = importlib.util.find_spec("h2") is not None
+
+
+class TestHttpxRESTClient(unittest.TestCase):
+
+    def setUp(self):
+        self.requests = []
+        self.responses = []
+        configuration = Configuration(host="https://directline.test", retry_policy=RetryPolicy(backoff=0))
+        self.api_client = ApiClient(configuration, "Authorization", "Bearer token")
+        self.api_client.rest_client = HttpxRESTClientObject(configuration)
+        self.api_client.rest_client.client.close()
+        self.api_client.rest_client.client = httpx.Client(transport=httpx.MockTransport(self.handler))
+        self.api = ConversationsApi(self.api_client)
+
+    def tearDown(self):
+        self.api_client.close()
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append((request, request.read()))
+        if self.responses:
+            return self.responses.pop(0)
+        if request.method == "POST":
+            return httpx.Response(200, json={"id": "act-1"})
+        return httpx.Response(200, json={"activities": [{"type": "message", "text": "hi"}], "watermark": "7"})
+
+    def test_post_activity(self):
+        response = self.api.conversations_post_activity("abc", Activity(type="message", text="hello"))
+
+        self.assertEqual(response.id, "act-1")
+        request, body = self.requests[0]
+        self.assertEqual(request.url.path, "/v3/directline/conversations/abc/activities")
+        self.assertEqual(request.headers["Authorization"], "Bearer token")
+        self.assertEqual(json.loads(body), {"type": "message", "text": "hello"})
+
+    def test_get_activities(self):
+        activity_set = self.api.conversations_get_activities("abc", watermark="6")
+
+        self.assertEqual((activity_set.watermark, activity_set.activities[0].text), ("7", "hi"))
+        self.assertEqual(self.requests[0][0].url.params["watermark"], "6")
+
+    def test_error_status_raises(self):
+        self.responses = [httpx.Response(403, json={"error": {"code": "TokenExpired"}})]
+
+        with self.assertRaises(ApiException) as raised:
+            self.api.conversations_get_activities("abc")
+        self.assertEqual(raised.exception.status, 403)
+        self.assertIn("TokenExpired", raised.exception.body)
+
+    def test_throttled_request_is_retried(self):
+        self.responses = [httpx.Response(429, headers={"Retry-After": "0"})]
+
+        self.assertEqual(self.api.conversations_get_activities("abc").watermark, "7")
+        self.assertEqual(len(self.requests), 2)
+
+    def test_iter_content(self):
+        response = self.api.conversations_get_activities_without_preload_content("abc")
+
+        body = b"".join(self.api_client.iter_content(response, chunk_size=4))
+        self.assertEqual(json.loads(body)["watermark"], "7")
+
+    def test_upload_stream(self):
+        self.api.conversations_upload_stream("abc", UploadFile(iter([b"a" * 10, b"b"]), filename="data.bin"))
+
+        request, body = self.requests[0]
+        self.assertEqual(request.headers["Transfer-Encoding"], "chunked")
+        self.assertIn(b"a" * 10 + b"b", body)
+
+
+class TestHttp2Configuration(unittest.TestCase):
+
+    @unittest.skipUnless(HAS_H2, "h2 is not installed")
+    def test_api_client_uses_httpx(self):
+        with ApiClient(Configuration(http2=True)) as api_client:
+            self.assertIsInstance(api_client.rest_client, HttpxRESTClientObject)
+
+    @unittest.skipIf(HAS_H2, "h2 is installed")
+    def test_http2_requires_h2(self):
+        with self.assertRaises(ImportError):
+            ApiClient(Configuration(http2=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
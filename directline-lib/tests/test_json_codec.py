@@ -0,0 +1,77 @@
+"""Tests for the pluggable JSON codec."""
+import copy
+import json
+import unittest
+
+import httpx
+
+from direct_line.api.async_conversations_api import AsyncConversationsApi
+from direct_line.api_client import ApiClient
+from direct_line.async_api_client import AsyncApiClient
+from direct_line.configuration import Configuration
+from direct_line.json_codec import JsonCodec, OrjsonCodec, default_json_codec, orjson
+from direct_line.models.activity import Activity
+
+
+class RecordingCodec(JsonCodec):
+
+    name = "recording"
+
+    def __init__(self):
+        self.dumped = []
+        self.loaded = []
+
+    def dumps(self, obj):
+        self.dumped.append(obj)
+        return super().dumps(obj)
+
+    def loads(self, data):
+        self.loaded.append(data)
+        return super().loads(data)
+
+
+class TestJsonCodec(unittest.IsolatedAsyncioTestCase):
+
+    async def test_request_body_is_encoded_with_codec(self):
+        codec = RecordingCodec()
+        api_client = AsyncApiClient(
+            configuration=Configuration(host="https://directline.test", json_codec=codec)
+        )
+        await api_client.rest_client.client.aclose()
+        api_client.rest_client.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"id": "1"}))
+        )
+        async with api_client:
+            await AsyncConversationsApi(api_client).conversations_post_activity(
+                "abc", Activity(type="message", text="hello")
+            )
+
+        self.assertEqual(codec.dumped, [{"type": "message", "text": "hello"}])
+
+    def test_other_responses_are_decoded_with_codec(self):
+        codec = RecordingCodec()
+        api_client = ApiClient(Configuration(json_codec=codec))
+
+        self.assertEqual(api_client.deserialize('{"a": 1}', "object", "application/json"), {"a": 1})
+        self.assertEqual(codec.loaded, ['{"a": 1}'])
+
+    def test_invalid_json_raises_value_error(self):
+        for codec in (JsonCodec(), default_json_codec()):
+            with self.subTest(codec=codec), self.assertRaises(ValueError):
+                codec.loads("{")
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_orjson_is_preferred(self):
+        codec = Configuration().json_codec
+
+        self.assertIsInstance(codec, OrjsonCodec)
+        self.assertEqual(json.loads(codec.dumps({"a": [1, "é"]})), {"a": [1, "é"]})
+
+    def test_copies_share_codec(self):
+        configuration = Configuration(json_codec=JsonCodec())
+
+        self.assertIs(copy.deepcopy(configuration).json_codec, configuration.json_codec)
+
+
+if __name__ == '__main__':
+    unittest.main()
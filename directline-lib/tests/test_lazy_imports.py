@@ -0,0 +1,46 @@
+"""Tests for the lazily imported package exports."""
+import subprocess
+import sys
+import unittest
+
+import direct_line
+
+
+class TestLazyImports(unittest.TestCase):
+
+    def test_import_does_not_load_models(self):
+        code = (
+            "import sys, direct_line; "
+            "print('direct_line.models.activity' in sys.modules, 'direct_line.api_client' in sys.modules)"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+
+        self.assertEqual(output.split(), ["False", "False"])
+
+    def test_all_exports_resolve(self):
+        for name in direct_line.__all__:
+            with self.subTest(name=name):
+                self.assertEqual(getattr(direct_line, name).__name__, name)
+        self.assertIs(direct_line.ActivitySet, direct_line.models.ActivitySet)
+
+    def test_dir_lists_exports(self):
+        self.assertTrue(set(direct_line.__all__) <= set(dir(direct_line)))
+
+    def test_star_import(self):
+        for package, name in (("direct_line.models", "Conversation"), ("direct_line.api", "ConversationsApi")):
+            with self.subTest(package=package):
+                namespace = {}
+                exec(f"from {package} import *", namespace)
+                self.assertIn(name, namespace)
+
+    def test_unknown_name_raises_attribute_error(self):
+        with self.assertRaises(AttributeError):
+            direct_line.NoSuchModel
+        with self.assertRaises(AttributeError):
+            direct_line.models.NoSuchModel
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,207 @@
+"""Tests for streamed multipart uploads."""
+import email.parser
+import email.policy
+import http.server
+import io
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+import httpx
+
+from direct_line.api.async_conversations_api import AsyncConversationsApi
+from direct_line.api.conversations_api import ConversationsApi
+from direct_line.api_client import ApiClient
+from direct_line.async_api_client import AsyncApiClient
+from direct_line.configuration import Configuration
+from direct_line.models.activity import Activity
+from direct_line.multipart import MultipartStream, UploadFile
+
+CONTENT = bytes(range(256)) * 1024
+
+
+def parse(content_type, body):
+    """Split a multipart body into (name, filename, content type, payload)."""
+    message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+        b"Content-Type: " + content_type.encode() + b"\r\n\r\n" + body
+    )
+    return [
+        (
+            part.get_param("name", header="content-disposition"),
+            part.get_filename(),
+            part.get_content_type(),
+            part.get_payload(decode=True),
+        )
+        for part in message.iter_parts()
+    ]
+
+
+class TestMultipartStream(unittest.TestCase):
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".png")
+        with os.fdopen(handle, "wb") as f:
+            f.write(CONTENT)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_parts_and_length(self):
+        stream = MultipartStream(
+            [UploadFile(self.path), UploadFile(b"hello", filename="notes.txt")],
+            activity=Activity(type="message", text="Two files"),
+        )
+        body = b"".join(stream)
+
+        self.assertEqual(stream.content_length, len(body))
+        parts = parse(stream.content_type, body)
+        self.assertEqual(
+            [part[:3] for part in parts],
+            [
+                ("file", os.path.basename(self.path), "image/png"),
+                ("file", "notes.txt", "text/plain"),
+                ("activity", None, "application/vnd.microsoft.activity"),
+            ],
+        )
+        self.assertEqual(parts[0][3], CONTENT)
+        self.assertEqual(parts[1][3], b"hello")
+        self.assertEqual(json.loads(parts[2][3]), {"type": "message", "text": "Two files"})
+
+    def test_file_is_read_in_chunks(self):
+        with open(self.path, "rb") as f:
+            f.seek(1024)
+            upload = UploadFile(f)
+            chunks = list(upload.chunks(chunk_size=65536))
+
+        self.assertEqual(upload.size, len(CONTENT) - 1024)
+        self.assertEqual(max(len(c) for c in chunks), 65536)
+        self.assertEqual(b"".join(chunks), CONTENT[1024:])
+
+    def test_iterable_has_unknown_length(self):
+        upload = UploadFile(iter([b"a", b"b"]), filename="data.bin")
+        stream = MultipartStream([upload])
+
+        self.assertIsNone(stream.content_length)
+        self.assertEqual(parse(stream.content_type, b"".join(stream))[0][3], b"ab")
+
+    def test_filename_is_quoted(self):
+        stream = MultipartStream([UploadFile(b"", filename='a"b\r\n.txt')])
+
+        self.assertIn(b'filename="a%22b%0D%0A.txt"', b"".join(stream))
+
+    def test_async_iterable_needs_async_client(self):
+        async def source():
+            yield b"a"
+
+        with self.assertRaises(TypeError):
+            list(MultipartStream([UploadFile(source())]))
+
+    def test_unsupported_source(self):
+        with self.assertRaises(TypeError):
+            UploadFile(42)
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+
+    def do_POST(self):
+        if self.headers.get("Transfer-Encoding") == "chunked":
+            body = b""
+            while True:
+                size = int(self.rfile.readline().strip(), 16)
+                body += self.rfile.read(size)
+                self.rfile.readline()
+                if not size:
+                    break
+        else:
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.requests.append((self.path, dict(self.headers), body))
+        response = json.dumps({"id": "uploaded"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestConversationsUploadStream(unittest.TestCase):
+
+    def setUp(self):
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.requests = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        host = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.api = ConversationsApi(ApiClient(Configuration(host=host)))
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_upload_with_known_length(self):
+        response = self.api.conversations_upload_stream(
+            "abc", [io.BytesIO(CONTENT), b"second"], user_id="user1"
+        )
+
+        self.assertEqual(response.id, "uploaded")
+        path, headers, body = self.server.requests[0]
+        self.assertEqual(path, "/v3/directline/conversations/abc/upload?userId=user1")
+        self.assertEqual(int(headers["Content-Length"]), len(body))
+        parts = parse(headers["Content-Type"], body)
+        self.assertEqual([part[3] for part in parts], [CONTENT, b"second"])
+
+    def test_upload_of_unknown_length_is_chunked(self):
+        self.api.conversations_upload_stream(
+            "abc", UploadFile(iter([CONTENT, CONTENT]), filename="big.bin")
+        )
+
+        _, headers, body = self.server.requests[0]
+        self.assertEqual(headers["Transfer-Encoding"], "chunked")
+        self.assertEqual(parse(headers["Content-Type"], body)[0][3], CONTENT * 2)
+
+
+class TestAsyncConversationsUploadStream(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.requests = []
+        self.api_client = AsyncApiClient(
+            configuration=Configuration(host="https://directline.test")
+        )
+        await self.api_client.rest_client.client.aclose()
+        self.api_client.rest_client.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(self.handler)
+        )
+        self.api = AsyncConversationsApi(self.api_client)
+
+    async def asyncTearDown(self):
+        await self.api_client.close()
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append((request, await request.aread()))
+        return httpx.Response(200, json={"id": "uploaded"})
+
+    async def test_upload_async_iterable(self):
+        async def source():
+            for _ in range(4):
+                yield CONTENT
+
+        response = await self.api.conversations_upload_stream(
+            "abc",
+            UploadFile(source(), filename="big.bin"),
+            user_id="user1",
+            activity=Activity(type="message", text="Here you go"),
+        )
+
+        self.assertEqual(response.id, "uploaded")
+        request, body = self.requests[0]
+        self.assertEqual(request.headers["Transfer-Encoding"], "chunked")
+        parts = parse(request.headers["Content-Type"], body)
+        self.assertEqual(parts[0][3], CONTENT * 4)
+        self.assertEqual(parts[1][0], "activity")
+
+
+if __name__ == '__main__':
+    unittest.main()
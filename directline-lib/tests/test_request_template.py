@@ -0,0 +1,83 @@
+"""Tests for precomputed request templates."""
+import unittest
+
+from direct_line.api.conversations_api import ConversationsApi
+from direct_line.api_client import ApiClient
+from direct_line.configuration import Configuration
+from direct_line.models.activity import Activity
+from direct_line.models.channel_account import ChannelAccount
+from direct_line.shared_client import bearer_auth
+
+ACTIVITIES_PATH = '/v3/directline/conversations/{conversationId}/activities'
+
+
+class TestRequestTemplate(unittest.TestCase):
+
+    def setUp(self):
+        self.api_client = ApiClient(Configuration(host="https://directline.test"), "Authorization", "Bearer default")
+        self.api = ConversationsApi(self.api_client)
+        self.activity = Activity(type="message", var_from=ChannelAccount(id="user1"), text="hello")
+
+    def tearDown(self):
+        self.api_client.close()
+
+    def generic_post_activity(self, conversation_id, request_auth=None):
+        return self.api_client.param_serialize(
+            method='POST',
+            resource_path=ACTIVITIES_PATH,
+            path_params={'conversationId': conversation_id},
+            query_params=[],
+            header_params={'Accept': 'application/json', 'Content-Type': 'application/json'},
+            body=self.activity,
+            post_params=[],
+            files={},
+            auth_settings=[],
+            collection_formats={},
+            _request_auth=request_auth,
+        )
+
+    def test_post_activity_matches_param_serialize(self):
+        for request_auth in (None, bearer_auth("t1")):
+            self.assertEqual(
+                self.api._conversations_post_activity_serialize("a b/c", self.activity, request_auth, None, None, 0),
+                self.generic_post_activity("a b/c", request_auth),
+            )
+
+    def test_get_activities_query_and_auth(self):
+        method, url, headers, body, _ = self.api._conversations_get_activities_serialize(
+            "abc", "7", {"in": "query", "type": "api_key", "key": "code", "value": "x y"}, None, None, 0
+        )
+
+        self.assertEqual((method, body), ("GET", None))
+        self.assertEqual(url, "https://directline.test/v3/directline/conversations/abc/activities?watermark=7&code=x%20y")
+        self.assertEqual(headers["Accept"], "application/json")
+        self.assertNotIn("Content-Type", headers)
+
+    def test_request_auth_does_not_leak_into_template(self):
+        self.api._conversations_get_activities_serialize("abc", None, bearer_auth("t1"), None, None, 0)
+        _, url, headers, _, _ = self.api._conversations_get_activities_serialize("abc", None, None, None, None, 0)
+
+        self.assertEqual(headers["Authorization"], "Bearer default")
+        self.assertFalse(url.endswith("?"))
+
+    def test_rebuilt_when_host_or_default_headers_change(self):
+        template = self.api_client.request_template('GET', ACTIVITIES_PATH)
+        self.assertIs(self.api_client.request_template('GET', ACTIVITIES_PATH), template)
+
+        self.api_client.set_default_header("Authorization", "Bearer other")
+        self.api_client.configuration.host = "https://other.test"
+        _, url, headers, _, _ = self.api._conversations_get_activities_serialize("abc", None, None, None, None, 0)
+
+        self.assertTrue(url.startswith("https://other.test/"))
+        self.assertEqual(headers["Authorization"], "Bearer other")
+
+    def test_custom_headers_use_param_serialize(self):
+        _, _, headers, _, _ = self.api._conversations_post_activity_serialize(
+            "abc", self.activity, None, "text/json", {"X-Trace": "1"}, 0
+        )
+
+        self.assertEqual((headers["Content-Type"], headers["X-Trace"]), ("text/json", "1"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,256 @@
+"""Tests for retries, circuit breakers and hedged requests."""
+import asyncio
+import http.server
+import json
+import threading
+import time
+import unittest
+from typing import Dict, List, Tuple
+
+import httpx
+import urllib3
+
+from direct_line.api.async_conversations_api import AsyncConversationsApi
+from direct_line.api.conversations_api import ConversationsApi
+from direct_line.api_client import ApiClient
+from direct_line.async_api_client import AsyncApiClient
+from direct_line.configuration import Configuration
+from direct_line.exceptions import ApiException
+from direct_line.models.activity import Activity
+from direct_line.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    is_transient_error,
+    retry_after,
+)
+
+ACTIVITY_SET = {"activities": [], "watermark": "1"}
+
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def test_retry_after(self):
+        self.assertEqual(retry_after("3"), 3.0)
+        delay = retry_after(time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime(time.time() + 30)))
+        assert delay is not None
+        self.assertAlmostEqual(delay, 30, delta=2)
+        self.assertIsNone(retry_after(None))
+        self.assertIsNone(retry_after("soon"))
+
+    def test_should_retry(self):
+        policy = RetryPolicy(max_attempts=3)
+
+        self.assertTrue(policy.should_retry("POST", 1, status=429))
+        self.assertFalse(policy.should_retry("POST", 1, status=503))
+        self.assertTrue(policy.should_retry("GET", 2, status=503))
+        self.assertFalse(policy.should_retry("GET", 3, status=503))
+        self.assertFalse(policy.should_retry("GET", 1, status=404))
+        self.assertTrue(policy.should_retry("GET", 1, error=urllib3.exceptions.ProtocolError("reset")))
+        self.assertFalse(policy.should_retry("GET", 1, error=ValueError("bad")))
+
+    def test_is_transient_error(self):
+        self.assertTrue(is_transient_error(ConnectionResetError()))
+        self.assertTrue(is_transient_error(asyncio.TimeoutError()))
+        self.assertTrue(is_transient_error(httpx.ConnectError("refused")))
+        self.assertFalse(is_transient_error(ValueError("bad")))
+
+    def test_circuit_breaker(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+        breaker.record_failure()
+        breaker.before_request("host")
+        breaker.record_failure()
+
+        self.assertEqual(breaker.state, "open")
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request("host")
+        time.sleep(0.06)
+        breaker.before_request("host")
+        with self.assertRaises(CircuitOpenError):
+            # Only one trial request at a time
+            breaker.before_request("host")
+        breaker.record_success()
+        self.assertEqual(breaker.state, "closed")
+
+    def test_trial_ending_without_outcome_lets_next_trial_through(self):
+        policy = RetryPolicy(max_attempts=1, failure_threshold=1, reset_timeout=0.01)
+        ok = type("Response", (), {"status": 200})()
+
+        def fail(error):
+            raise error
+
+        with self.assertRaises(urllib3.exceptions.ProtocolError):
+            policy.send("POST", "https://host/a", lambda: fail(urllib3.exceptions.ProtocolError("reset")))
+        time.sleep(0.02)
+        with self.assertRaises(ValueError):
+            policy.send("POST", "https://host/a", lambda: fail(ValueError("bad body")))
+        self.assertIs(policy.send("POST", "https://host/a", lambda: ok), ok)
+        self.assertEqual(policy.breaker("host").state, "closed")
+
+    def test_cancelled_trial_lets_next_trial_through(self):
+        policy = RetryPolicy(max_attempts=1, failure_threshold=1, reset_timeout=0.01)
+        ok = type("Response", (), {"status": 200})()
+
+        async def send(error=None):
+            if error is not None:
+                raise error
+            return ok
+
+        async def main():
+            with self.assertRaises(urllib3.exceptions.ProtocolError):
+                await policy.send_async("POST", "https://host/a", lambda: send(urllib3.exceptions.ProtocolError("reset")))
+            await asyncio.sleep(0.02)
+            with self.assertRaises(asyncio.CancelledError):
+                await policy.send_async("POST", "https://host/a", lambda: send(asyncio.CancelledError()))
+            return await policy.send_async("POST", "https://host/a", send)
+
+        self.assertIs(asyncio.run(main()), ok)
+
+    def test_hedge_delay_is_latency_percentile(self):
+        policy = RetryPolicy(hedge=True, hedge_min_samples=10)
+        for i in range(1, 101):
+            policy.record_latency("host", i / 1000)
+
+        delay = policy.hedge_delay("host")
+        assert delay is not None
+        self.assertAlmostEqual(delay, 0.096)
+        self.assertIsNone(policy.hedge_delay("other"))
+        self.assertIsNone(RetryPolicy().hedge_delay("host"))
+
+
+class Server(http.server.ThreadingHTTPServer):
+    """Serves queued (status, headers, delay) responses and records methods."""
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), Handler)
+        self.requests: List[str] = []
+        self.responses: List[Tuple[int, Dict[str, str], float]] = []
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+
+    server: Server
+
+    def respond(self):
+        if self.command == "POST":
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.server.requests.append(self.command)
+        status, headers, delay = self.server.responses.pop(0)
+        time.sleep(delay)
+        body = json.dumps(ACTIVITY_SET if status < 400 else {"error": {"code": "Busy"}}).encode()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = respond
+
+    def log_message(self, *args):
+        pass
+
+
+class TestRetries(unittest.TestCase):
+
+    def setUp(self):
+        self.server = Server()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.host = f"127.0.0.1:{self.server.server_address[1]}"
+        self.policy = RetryPolicy(backoff=0, failure_threshold=2)
+        configuration = Configuration(host=f"http://{self.host}", retry_policy=self.policy)
+        self.api = ConversationsApi(ApiClient(configuration))
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_throttled_get_is_retried(self):
+        self.server.responses = [(429, {"Retry-After": "0"}, 0), (200, {}, 0)]
+
+        self.assertEqual(self.api.conversations_get_activities("abc").watermark, "1")
+        self.assertEqual(self.server.requests, ["GET", "GET"])
+
+    def test_long_retry_after_is_returned(self):
+        self.server.responses = [(429, {"Retry-After": "3600"}, 0)]
+
+        with self.assertRaises(ApiException) as raised:
+            self.api.conversations_get_activities("abc")
+        self.assertEqual(raised.exception.status, 429)
+
+    def test_post_is_not_retried_on_server_error(self):
+        self.server.responses = [(503, {}, 0), (200, {}, 0)]
+
+        with self.assertRaises(ApiException):
+            self.api.conversations_post_activity("abc", Activity(type="message", text="hi"))
+        self.assertEqual(self.server.requests, ["POST"])
+
+    def test_circuit_opens_after_failures(self):
+        self.policy.max_attempts = 1
+        self.server.responses = [(503, {}, 0), (503, {}, 0), (200, {}, 0)]
+
+        for _ in range(2):
+            with self.assertRaises(ApiException):
+                self.api.conversations_get_activities("abc")
+        with self.assertRaises(CircuitOpenError) as raised:
+            self.api.conversations_get_activities("abc")
+        self.assertEqual(raised.exception.host, self.host)
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_slow_get_is_hedged(self):
+        self.policy.hedge = True
+        self.policy.hedge_min_samples = 1
+        self.policy.record_latency(self.host, 0.01)
+        self.server.responses = [(200, {}, 1.0), (200, {}, 0)]
+
+        started = time.monotonic()
+        self.assertEqual(self.api.conversations_get_activities("abc").watermark, "1")
+        self.assertLess(time.monotonic() - started, 0.9)
+        self.assertEqual(self.server.requests, ["GET", "GET"])
+
+
+class TestAsyncRetries(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.responses = []
+        self.requests = []
+        self.policy = RetryPolicy(backoff=0)
+        self.api_client = AsyncApiClient(
+            configuration=Configuration(host="https://directline.test", retry_policy=self.policy)
+        )
+        await self.api_client.rest_client.client.aclose()
+        self.api_client.rest_client.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(self.handler)
+        )
+        self.api = AsyncConversationsApi(self.api_client)
+
+    async def asyncTearDown(self):
+        await self.api_client.close()
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request.method)
+        status, headers, delay = self.responses.pop(0)
+        await asyncio.sleep(delay)
+        return httpx.Response(status, headers=headers, json=ACTIVITY_SET)
+
+    async def test_throttled_get_is_retried(self):
+        self.responses = [(429, {"Retry-After": "0"}, 0), (503, {}, 0), (200, {}, 0)]
+
+        self.assertEqual((await self.api.conversations_get_activities("abc")).watermark, "1")
+        self.assertEqual(self.requests, ["GET"] * 3)
+
+    async def test_slow_get_is_hedged(self):
+        self.policy.hedge = True
+        self.policy.hedge_min_samples = 1
+        self.policy.record_latency("directline.test", 0.01)
+        self.responses = [(200, {}, 1.0), (200, {}, 0)]
+
+        started = time.monotonic()
+        self.assertEqual((await self.api.conversations_get_activities("abc")).watermark, "1")
+        self.assertLess(time.monotonic() - started, 0.9)
+        self.assertEqual(self.requests, ["GET", "GET"])
+
+
+if __name__ == '__main__':
+    unittest.main()
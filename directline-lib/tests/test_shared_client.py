@@ -0,0 +1,87 @@
+"""Tests for shared API clients and per-conversation credentials."""
+import unittest
+
+import httpx
+
+from direct_line.api.async_conversations_api import AsyncConversationsApi
+from direct_line.configuration import Configuration
+from direct_line.models.activity import Activity
+from direct_line.models.conversation import Conversation
+from direct_line.shared_client import (
+    ConversationCredential,
+    close_shared_api_clients,
+    close_shared_async_api_clients,
+    shared_api_client,
+    shared_async_api_client,
+)
+
+
+class TestConversationCredential(unittest.TestCase):
+
+    def test_from_conversation_and_update(self):
+        credential = ConversationCredential.from_conversation(Conversation(conversation_id="abc", token="t1"))
+        credential.update(Conversation(conversation_id="abc", token="t2"))
+        credential.update(Conversation(conversation_id="abc"))
+
+        self.assertEqual(credential.conversation_id, "abc")
+        self.assertEqual(credential.request_auth["value"], "Bearer t2")
+        with self.assertRaises(ValueError):
+            ConversationCredential.from_conversation(Conversation(conversation_id="abc"))
+
+
+class TestSharedApiClient(unittest.TestCase):
+
+    def tearDown(self):
+        close_shared_api_clients()
+
+    def test_one_client_per_host(self):
+        client = shared_api_client(Configuration(host="https://a.test"))
+
+        self.assertIs(shared_api_client(Configuration(host="https://a.test")), client)
+        self.assertIsNot(shared_api_client(Configuration(host="https://b.test")), client)
+        close_shared_api_clients()
+        self.assertIsNot(shared_api_client(Configuration(host="https://a.test")), client)
+
+
+class TestSharedAsyncApiClient(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.requests = []
+        self.api_client = shared_async_api_client(Configuration(host="https://directline.test"))
+        self.api_client.set_default_header("Authorization", "Bearer default")
+        await self.api_client.rest_client.client.aclose()
+        self.api_client.rest_client.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(self.handler)
+        )
+
+    async def asyncTearDown(self):
+        await close_shared_async_api_clients()
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return httpx.Response(200, json={"id": "act-1"})
+
+    async def test_same_client_within_loop(self):
+        self.assertIs(shared_async_api_client(Configuration(host="https://directline.test")), self.api_client)
+
+    async def test_calls_carry_their_conversation_token(self):
+        api = AsyncConversationsApi(shared_async_api_client(Configuration(host="https://directline.test")))
+        for token in ("t1", "t2"):
+            credential = ConversationCredential(token, conversation_id=f"conv-{token}")
+            await api.conversations_post_activity(
+                credential.conversation_id,
+                Activity(type="message", text="hi"),
+                _request_auth=credential.request_auth,
+            )
+
+        self.assertEqual(
+            [(r.url.path, r.headers["Authorization"]) for r in self.requests],
+            [
+                ("/v3/directline/conversations/conv-t1/activities", "Bearer t1"),
+                ("/v3/directline/conversations/conv-t2/activities", "Bearer t2"),
+            ],
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,183 @@
+"""Tests for the Direct Line WebSocket stream manager."""
+import asyncio
+import json
+import socket
+import unittest
+
+import httpx
+
+from direct_line.activity_index import ActivityIndex
+from direct_line.activity_poller import ActivityPoller
+from direct_line.async_api_client import AsyncApiClient
+from direct_line.configuration import Configuration
+from direct_line.exceptions import ForbiddenException
+
+try:
+    from websockets.asyncio.server import serve
+    HAS_WEBSOCKETS = True
+except ImportError:  # pragma: no cover - optional dependency
+    HAS_WEBSOCKETS = False
+
+from direct_line.stream_manager import StreamManager
+
+
+def activity_set(watermark, *activities):
+    return json.dumps({"activities": list(activities), "watermark": watermark})
+
+
+@unittest.skipUnless(HAS_WEBSOCKETS, "websockets is not installed")
+class TestStreamManager(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.requests = []
+        self.reconnect_status = 200
+        self.server = await serve(self.ws_handler, "127.0.0.1", 0)
+        self.ws_url = "ws://127.0.0.1:%d" % list(self.server.sockets)[0].getsockname()[1]
+        self.api_client = AsyncApiClient(
+            configuration=Configuration(host="https://directline.test")
+        )
+        await self.api_client.rest_client.client.aclose()
+        self.api_client.rest_client.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(self.http_handler)
+        )
+        self.manager = StreamManager(
+            self.api_client, initial_backoff=0.01, max_backoff=0.05, ping_interval=None
+        )
+
+    async def asyncTearDown(self):
+        await self.manager.close()
+        await self.api_client.close()
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def ws_handler(self, websocket):
+        path = websocket.request.path
+        if path == "/first":
+            await websocket.send("")
+            await websocket.send(activity_set("1", {"type": "message", "id": "a1"}))
+            # Keepalive without a watermark must not reset it
+            await websocket.send(json.dumps({"activities": []}))
+        elif path == "/second":
+            await websocket.send(activity_set("2", {"type": "message", "id": "a2"}))
+            await websocket.send(activity_set("3", {"type": "endOfConversation", "id": "a3"}))
+            await asyncio.sleep(1)
+
+    def http_handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.url.path.endswith("/activities"):
+            # Polled; the same activities as the second socket
+            return httpx.Response(200, content=activity_set(
+                "3", {"type": "message", "id": "a2"}, {"type": "endOfConversation", "id": "a3"}
+            ))
+        if self.reconnect_status != 200:
+            return httpx.Response(self.reconnect_status, json={})
+        return httpx.Response(200, json={
+            "conversationId": "abc",
+            "streamUrl": self.reconnect_url,
+        })
+
+    async def collect(self, stream):
+        return await asyncio.wait_for(self.drain(stream), 5)
+
+    async def drain(self, stream):
+        return [activity_set async for activity_set in stream]
+
+    async def test_reconnects_from_last_watermark(self):
+        self.reconnect_url = f"{self.ws_url}/second"
+        token = iter(["t1", "t2"])
+        stream = self.manager.open("abc", lambda: next(token), stream_url=f"{self.ws_url}/first")
+
+        received = await self.collect(stream)
+
+        self.assertEqual(
+            [a.id for activity_set in received for a in activity_set.activities],
+            ["a1", "a2", "a3"],
+        )
+        self.assertIsNone(stream.error)
+        self.assertTrue(stream.closed)
+        self.assertEqual(stream.watermark, "3")
+        self.assertEqual(stream.reconnects, 1)
+        request = self.requests[0]
+        self.assertEqual(request.url.path, "/v3/directline/conversations/abc")
+        self.assertEqual(request.url.params["watermark"], "1")
+        self.assertEqual(request.headers["Authorization"], "Bearer t1")
+
+    async def test_rejected_token_ends_stream(self):
+        self.reconnect_status = 403
+        stream = self.manager.open("abc", "token")
+
+        self.assertEqual(await self.collect(stream), [])
+        self.assertIsInstance(stream.error, ForbiddenException)
+        self.assertEqual(len(self.requests), 1)
+
+    async def test_gives_up_after_max_retries(self):
+        with socket.socket() as unused:
+            unused.bind(("127.0.0.1", 0))
+            self.reconnect_url = "ws://127.0.0.1:%d" % unused.getsockname()[1]
+
+            manager = StreamManager(
+                self.api_client, initial_backoff=0.01, max_retries=2, ping_interval=None
+            )
+            stream = manager.open("abc", "token")
+
+            self.assertEqual(await self.collect(stream), [])
+            await manager.close()
+
+        self.assertIsInstance(stream.error, ConnectionError)
+        self.assertEqual(len(self.requests), 3)
+
+    async def test_backs_off_when_service_closes_at_once(self):
+        # The handler returns straight away for unknown paths
+        self.reconnect_url = f"{self.ws_url}/closed"
+        manager = StreamManager(
+            self.api_client, initial_backoff=0.05, max_retries=3, ping_interval=None
+        )
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        stream = manager.open("abc", "token")
+
+        self.assertEqual(await self.collect(stream), [])
+        await manager.close()
+
+        self.assertIsInstance(stream.error, ConnectionError)
+        self.assertEqual(len(self.requests), 4)
+        # At least half of 0.05 + 0.1 + 0.2
+        self.assertGreaterEqual(loop.time() - started, 0.175)
+
+    async def test_many_streams_share_one_loop(self):
+        self.reconnect_url = f"{self.ws_url}/second"
+        streams = [self.manager.open(f"c{i}", "token") for i in range(50)]
+
+        results = await asyncio.gather(*(self.collect(stream) for stream in streams))
+
+        self.assertEqual(len(self.manager), 50)
+        self.assertTrue(all(len(received) == 2 for received in results))
+
+    async def test_poller_sharing_the_index_stops_after_the_stream(self):
+        self.reconnect_url = f"{self.ws_url}/second"
+        seen = ActivityIndex()
+        await self.collect(self.manager.open("abc", "token", seen=seen))
+
+        async with ActivityPoller(self.api_client) as poller:
+            conversation = await poller.add("abc", "token", seen=seen)
+            received = await self.collect(conversation)
+
+        self.assertEqual(received, [])
+        self.assertIsNone(conversation.error)
+
+    async def test_stream_sharing_the_index_stops_after_the_poller(self):
+        self.reconnect_url = f"{self.ws_url}/second"
+        seen = ActivityIndex()
+        async with ActivityPoller(self.api_client) as poller:
+            await self.collect(await poller.add("abc", "token", seen=seen))
+
+        stream = self.manager.open("abc", "token", seen=seen)
+        received = await self.collect(stream)
+
+        self.assertEqual(received, [])
+        self.assertIsNone(stream.error)
+        self.assertEqual(stream.reconnects, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+"""Tests for the Direct Line token broker."""
+import asyncio
+import itertools
+import unittest
+
+import httpx
+
+from direct_line.async_api_client import AsyncApiClient
+from direct_line.configuration import Configuration
+from direct_line.token_broker import TokenBroker
+
+
+class TestTokenBroker(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.requests = []
+        self.counter = itertools.count(1)
+        self.expires_in = 1800
+        self.fail_refresh = False
+        self.malformed = False
+        self.api_client = AsyncApiClient(
+            configuration=Configuration(host="https://directline.test")
+        )
+        await self.api_client.rest_client.client.aclose()
+        self.api_client.rest_client.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(self.handler)
+        )
+
+    async def asyncTearDown(self):
+        await self.api_client.close()
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        authorization = request.headers["Authorization"]
+        if self.malformed:
+            return httpx.Response(200, content=b"{", headers={"Content-Type": "application/json"})
+        if request.url.path.endswith("/tokens/generate"):
+            number = next(self.counter)
+            return httpx.Response(200, json={
+                "conversationId": f"c{number}",
+                "token": f"t{number}",
+                "expires_in": self.expires_in,
+            })
+        if self.fail_refresh:
+            return httpx.Response(403, json={"error": {"code": "TokenExpired"}})
+        # Refresh: derive the new token from the one being refreshed
+        return httpx.Response(200, json={
+            "token": authorization.split(" ", 1)[1] + "'",
+            "expires_in": self.expires_in,
+        })
+
+    def generated(self):
+        return [r for r in self.requests if r.url.path.endswith("/tokens/generate")]
+
+    def refreshed(self):
+        return [r for r in self.requests if r.url.path.endswith("/tokens/refresh")]
+
+    def refreshes_of(self, token):
+        return [
+            r for r in self.refreshed()
+            if r.headers["Authorization"].startswith(f"Bearer {token}")
+        ]
+
+    async def wait_until(self, predicate):
+        for _ in range(200):
+            if predicate():
+                return
+            await asyncio.sleep(0.01)
+        self.fail("condition not reached")
+
+    async def test_pool_is_filled_and_refilled(self):
+        async with TokenBroker("secret", api_client=self.api_client, pool_size=3) as broker:
+            await self.wait_until(lambda: broker.available == 3)
+            self.assertEqual(len(self.generated()), 3)
+            self.assertEqual(
+                self.generated()[0].headers["Authorization"], "Bearer secret"
+            )
+
+            lease = await broker.acquire()
+
+            # Handed out from the pool without a round trip
+            self.assertEqual(lease.conversation_id, "c1")
+            self.assertEqual(lease.token, "t1")
+            self.assertEqual(len(self.generated()), 3)
+            await self.wait_until(lambda: broker.available == 3)
+            self.assertEqual(len(self.generated()), 4)
+
+    async def test_acquire_mints_when_pool_is_empty(self):
+        async with TokenBroker("secret", api_client=self.api_client, pool_size=0) as broker:
+            lease = await broker.acquire()
+
+            self.assertEqual(lease.token, "t1")
+            self.assertEqual(broker.available, 0)
+
+    async def test_leased_token_is_refreshed(self):
+        self.expires_in = 1
+        async with TokenBroker(
+            "secret", api_client=self.api_client, pool_size=1, refresh_fraction=0.05
+        ) as broker:
+            lease = await broker.acquire()
+            await self.wait_until(lambda: lease.token == "t1''")
+
+            self.assertEqual(lease.conversation_id, "c1")
+            first, second = self.refreshes_of("t1")[:2]
+            self.assertEqual(first.headers["Authorization"], "Bearer t1")
+            self.assertEqual(second.headers["Authorization"], "Bearer t1'")
+
+            # Released leases are no longer refreshed
+            lease.release()
+            await asyncio.sleep(0.1)
+            count = len(self.refreshes_of("t1"))
+            await asyncio.sleep(0.1)
+            self.assertEqual(len(self.refreshes_of("t1")), count)
+
+    async def test_failed_refresh_expires_pooled_token(self):
+        self.expires_in = 1
+        self.fail_refresh = True
+        async with TokenBroker(
+            "secret", api_client=self.api_client, pool_size=1,
+            refresh_fraction=0.05, retry_interval=5.0,
+        ) as broker:
+            await self.wait_until(lambda: len(self.refreshed()) >= 1)
+            self.fail_refresh = False
+
+            # The failed token is dropped and replaced by a fresh one
+            await self.wait_until(lambda: len(self.generated()) >= 2)
+            await self.wait_until(lambda: broker.available == 1)
+            lease = await broker.acquire()
+            self.assertNotEqual(lease.conversation_id, "c1")
+
+    async def test_unexpected_errors_are_retried(self):
+        self.expires_in = 1
+        async with TokenBroker(
+            "secret", api_client=self.api_client, pool_size=1,
+            refresh_fraction=0.05, retry_interval=0.05,
+        ) as broker:
+            lease = await broker.acquire()
+            self.malformed = True
+            await self.wait_until(lambda: len(self.refreshed()) >= 2)
+            self.malformed = False
+
+            # Still refreshed once the service recovers
+            await self.wait_until(lambda: lease.token == "t1'")
+            self.assertFalse(lease.expired)
+            await self.wait_until(lambda: broker.available == 1)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            TokenBroker("secret", api_client=self.api_client, refresh_fraction=1.5)
+        with self.assertRaises(ValueError):
+            TokenBroker("secret", api_client=self.api_client, pool_size=-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
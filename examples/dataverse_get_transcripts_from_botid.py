@@ -269,6 +269,37 @@ def get_conversation_transcript_by_name(
         logger.warning(f"No conversation transcript found where '{filter_field}' contains '{partial_conversation_identifier}'")
         return None
 
+def get_conversation_transcript_from_store(
+    store_path: str,
+    partial_conversation_identifier: str,
+    bot_id: Optional[str] = None
+) -> Optional[ConversationTranscript]:
+    """
+    Resolve a conversation transcript from a local transcript store instead of Dataverse.
+    The store is a SQLite file kept current by `dataverse-api transcripts index <store_path>`
+    (from dataverse-lib); lookups use its conversation ID index and take well under a millisecond.
+    """
+    from dataverse_api_cli.models.transcript_store import TranscriptStore
+
+    if not os.path.exists(store_path):
+        logger.warning(f"Transcript store '{store_path}' not found. Run `dataverse-api transcripts index {store_path}` to create it.")
+        return None
+
+    with TranscriptStore(store_path) as store:
+        record = store.find_by_conversation_id(partial_conversation_identifier, bot_id=bot_id)
+
+    if not record:
+        logger.warning(f"No transcript for conversation '{partial_conversation_identifier}' in local store '{store_path}'")
+        return None
+    if record.get("statecode") is None:
+        logger.warning(f"Transcript store '{store_path}' predates transcript states. Run `dataverse-api transcripts index {store_path}` to update it.")
+        return None
+    logger.info(f"Found conversation transcript in local store. GUID: {record['conversationtranscriptid']}, name: {record['name']}")
+    return ConversationTranscript.model_validate({
+        **record,
+        "bot_conversationtranscriptid": record.get("_bot_conversationtranscriptid_value"),
+    })
+
 def minimal_get_conversation_transcript_by_guid(dv_client: DataverseClient, transcript_guid: str) -> Optional[Dict[str, Any]]:
     if not transcript_guid:
         logger.warning("Transcript GUID is empty, cannot fetch.")
@@ -333,11 +364,24 @@ def main():
         
         partial_conversation_id_from_user = get_conversation_id_from_prompt() 
         
-        logger.info(f"Attempting to fetch conversation transcript where a field CONTAINS: '{partial_conversation_id_from_user}'...")
-        transcript_by_name = get_conversation_transcript_by_name(
-            dv_client=dataverse_client,
-            partial_conversation_identifier=partial_conversation_id_from_user
-        )
+        # Resolve from the local transcript store when one is configured, avoiding a contains() scan in Dataverse
+        transcript_store_path: Optional[str] = os.getenv("TRANSCRIPT_STORE_PATH")
+        transcript_by_name: Optional[Dict[str, Any]] = None
+        if transcript_store_path:
+            local_transcript = get_conversation_transcript_from_store(
+                store_path=transcript_store_path,
+                partial_conversation_identifier=partial_conversation_id_from_user,
+                bot_id=bot_id_found
+            )
+            if local_transcript:
+                transcript_by_name = local_transcript.model_dump(by_alias=True, mode="json")
+
+        if not transcript_by_name:
+            logger.info(f"Attempting to fetch conversation transcript where a field CONTAINS: '{partial_conversation_id_from_user}'...")
+            transcript_by_name = get_conversation_transcript_by_name(
+                dv_client=dataverse_client,
+                partial_conversation_identifier=partial_conversation_id_from_user
+            )
 
         if transcript_by_name:
             transcript_guid = transcript_by_name.get('conversationtranscriptid', 'N/A')
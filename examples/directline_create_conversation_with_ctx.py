@@ -3,13 +3,12 @@ import os
 import json
 from dotenv import load_dotenv
 
-from direct_line.api_client import ApiClient
-from direct_line.configuration import Configuration
 from direct_line.api.conversations_api import ConversationsApi
 from direct_line.models.activity import Activity
 from direct_line.models.channel_account import ChannelAccount
 from direct_line.models.conversation import Conversation
 from direct_line.exceptions import ApiException
+from direct_line.shared_client import bearer_auth, shared_api_client
 
 from utilities.custom_rich_logger import setup_logger, truncate_text
 
@@ -27,18 +26,14 @@ def start_new_conversation_and_get_token(
         logger.error("Direct Line secret is missing.")
         return None, None
 
-    sdk_config = Configuration()
-    api_client_with_secret = ApiClient(
-        configuration=sdk_config,
-        header_name="Authorization",
-        header_value=f"Bearer {direct_line_secret}",
-    )
-    conversations_api = ConversationsApi(api_client=api_client_with_secret)
+    conversations_api = ConversationsApi(api_client=shared_api_client())
 
     logger.info("Starting a new conversation...")
     try:
         conversation_object: Conversation = (
-            conversations_api.conversations_start_conversation()
+            conversations_api.conversations_start_conversation(
+                _request_auth=bearer_auth(direct_line_secret)
+            )
         )
         conversation_id = conversation_object.conversation_id
         conversation_token = conversation_object.token
@@ -65,13 +60,9 @@ def send_custom_event_activity(
         logger.error("Missing token, conversation ID, or user ID to send event.")
         return
 
-    sdk_config = Configuration()
-    api_client_with_token = ApiClient(
-        configuration=sdk_config,
-        header_name="Authorization",
-        header_value=f"Bearer {direct_line_token}",
-    )
-    conversations_api = ConversationsApi(api_client=api_client_with_token)
+    # The pooled client is shared with start_new_conversation_and_get_token;
+    # only the token differs
+    conversations_api = ConversationsApi(api_client=shared_api_client())
 
     conversation_context_data_payload = {
         "deviceType": "PythonClient",
@@ -90,7 +81,9 @@ def send_custom_event_activity(
     logger.info(f"Sending event '{event_activity.name}' to conversation: {conversation_id}")
     try:
         resource_response = conversations_api.conversations_post_activity(
-            conversation_id=conversation_id, activity=event_activity
+            conversation_id=conversation_id,
+            activity=event_activity,
+            _request_auth=bearer_auth(direct_line_token),
         )
         logger.info(f"Event activity sent successfully. Response ID: {resource_response.id}")
     except ApiException as e:
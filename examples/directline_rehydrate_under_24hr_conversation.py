@@ -14,9 +14,7 @@ from websockets.exceptions import (
     InvalidURI,
 )
 
-from direct_line.api.conversations_api import ConversationsApi
-from direct_line.api_client import ApiClient
-from direct_line.configuration import Configuration
+from direct_line.api.async_conversations_api import AsyncConversationsApi
 from direct_line.exceptions import ApiException
 from direct_line.models.activity import Activity
 from direct_line.models.activity_set import ActivitySet
@@ -24,6 +22,12 @@ from direct_line.models.channel_account import ChannelAccount
 from direct_line.models.conversation import Conversation
 from direct_line.models.resource_response import ResourceResponse
 from direct_line.models.token_parameters import TokenParameters
+from direct_line.shared_client import (
+    ConversationCredential,
+    bearer_auth,
+    close_shared_async_api_clients,
+    shared_async_api_client,
+)
 from utilities.custom_rich_logger import setup_logger, truncate_text
 from utilities.get_transcript_from_conversation_id import get_transcript_from_conversation_id
 from models.user_context_data import ConversationContextData, use_default_conversation_data
@@ -69,20 +73,13 @@ async def start_conversation() -> Optional[Conversation]:
         logger.error("DIRECT_LINE_SECRET not found in environment variables.")
         return None
 
-    sdk_config: Configuration = Configuration()
-    api_client_secret: ApiClient = ApiClient(
-        configuration=sdk_config,
-        header_name="Authorization",
-        header_value=f"Bearer {DIRECT_LINE_SECRET}",
-    )
-    conversations_api: ConversationsApi = ConversationsApi(api_client=api_client_secret)
+    conversations_api: AsyncConversationsApi = AsyncConversationsApi(api_client=shared_async_api_client())
 
     logger.info("Starting a new conversation...")
     try:
-        # Run blocking API call in a separate thread
-        conversation_object: Conversation = await asyncio.to_thread(
-            conversations_api.conversations_start_conversation,
+        conversation_object: Conversation = await conversations_api.conversations_start_conversation(
             token_parameters=TokenParameters(),
+            _request_auth=bearer_auth(DIRECT_LINE_SECRET),
         )
         logger.info("Conversation started successfully!")
         logger.info(f"  Conversation ID: {conversation_object.conversation_id}")
@@ -190,8 +187,8 @@ async def websocket_listener(
 
 
 async def send_activity(
-    conversations_api: ConversationsApi,
-    conversation_id: str,
+    conversations_api: AsyncConversationsApi,
+    credential: ConversationCredential,
     activity: Activity,
     sent_activities_log: List[Dict[str, Any]],
 ) -> Optional[ResourceResponse]:
@@ -204,11 +201,10 @@ async def send_activity(
 
     logger.info(f"→ Sending {log_identifier}...")
     try:
-        # Run blocking API call in a separate thread
-        response: ResourceResponse = await asyncio.to_thread(
-            conversations_api.conversations_post_activity,
-            conversation_id=conversation_id,
+        response: ResourceResponse = await conversations_api.conversations_post_activity(
+            conversation_id=cast(str, credential.conversation_id),
             activity=activity,
+            _request_auth=credential.request_auth,
         )
         logger.info(f"  {log_identifier.capitalize()} sent successfully (ID: {response.id})")
         return response
@@ -240,6 +236,9 @@ async def example_usage(user_input: str, previous_conversation_id: str) -> None:
     conversation_info: Optional[Conversation] = None
     conv_id: Optional[str] = None
     ws_task: Optional[asyncio.Task[None]] = None
+    credential: Optional[ConversationCredential] = None
+    # One pooled client serves every conversation; each call carries its token
+    conversations_api: AsyncConversationsApi = AsyncConversationsApi(api_client=shared_async_api_client())
     sent_activities_log: List[Dict[str, Any]] = []
     received_activities_log: List[Dict[str, Any]] = []
 
@@ -254,13 +253,7 @@ async def example_usage(user_input: str, previous_conversation_id: str) -> None:
         conv_token: str = cast(str, conversation_info.token)
         stream_url: str = cast(str, conversation_info.stream_url)
 
-        sdk_config_token: Configuration = Configuration()
-        api_client_token: ApiClient = ApiClient(
-            configuration=sdk_config_token,
-            header_name="Authorization",
-            header_value=f"Bearer {conv_token}",
-        )
-        conversations_api_token: ConversationsApi = ConversationsApi(api_client=api_client_token)
+        credential = ConversationCredential.from_conversation(conversation_info)
 
         ws_task = asyncio.create_task(
             websocket_listener(
@@ -291,7 +284,7 @@ async def example_usage(user_input: str, previous_conversation_id: str) -> None:
             locale="en-AU",
             channel_id="directline",
         )
-        await send_activity(conversations_api_token, conv_id, initial_event_activity, sent_activities_log)
+        await send_activity(conversations_api, credential, initial_event_activity, sent_activities_log)
 
         # Fetch the transcript
         previous_conversation: Optional[Transcript] = get_transcript_from_conversation_id(
@@ -305,7 +298,7 @@ async def example_usage(user_input: str, previous_conversation_id: str) -> None:
             locale="en-AU",
             channel_id="directline",
         )
-        await send_activity(conversations_api_token, conv_id, initial_event_activity_for_previous_conversation, sent_activities_log)
+        await send_activity(conversations_api, credential, initial_event_activity_for_previous_conversation, sent_activities_log)
         
         
 
@@ -316,7 +309,7 @@ async def example_usage(user_input: str, previous_conversation_id: str) -> None:
             locale="en-AU",
             channel_id="directline",
         )
-        await send_activity(conversations_api_token, conv_id, greeting_activity, sent_activities_log)
+        await send_activity(conversations_api, credential, greeting_activity, sent_activities_log)
 
         logger.info("Listening for bot replies... (Press Ctrl+C to stop)")
         if ws_task:
@@ -331,7 +324,7 @@ async def example_usage(user_input: str, previous_conversation_id: str) -> None:
         logger.exception("An unexpected error occurred:")
     finally:
         # --- Politely close the chat (NEW) ---
-        if conv_id and "conversations_api_token" in locals() and conversations_api_token:
+        if credential:
             try:
                 end_activity = Activity(
                     type="endOfConversation",
@@ -341,8 +334,8 @@ async def example_usage(user_input: str, previous_conversation_id: str) -> None:
                     channel_id="directline",
                 )
                 await send_activity(
-                    conversations_api_token,
-                    conv_id,
+                    conversations_api,
+                    credential,
                     end_activity,
                     sent_activities_log,
                 )
@@ -361,6 +354,8 @@ async def example_usage(user_input: str, previous_conversation_id: str) -> None:
             except Exception:
                 logger.exception("Error during WebSocket task cleanup:")
 
+        await close_shared_async_api_clients()
+
         # --- Save Conversation Data ---
         logger.info("Attempting to save conversation data...")
         if conv_id: